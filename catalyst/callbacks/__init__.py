@@ -14,6 +14,7 @@ from catalyst.callbacks.checkpoint import (
 )
 from catalyst.callbacks.control_flow import ControlFlowCallback
 from catalyst.callbacks.criterion import CriterionCallback
+from catalyst.callbacks.dataset_cache import DatasetCacheCallback
 from catalyst.callbacks.early_stop import (
     EarlyStoppingCallback,
     CheckRunCallback,
@@ -42,12 +43,14 @@ from catalyst.callbacks.optimizer import (
     OptimizerCallback,
 )
 from catalyst.callbacks.periodic_loader import PeriodicLoaderCallback
+from catalyst.callbacks.profiler import ProfilerCallback
 from catalyst.callbacks.scheduler import (
     ISchedulerCallback,
     ILRUpdater,
     SchedulerCallback,
     LRFinder,
 )
+from catalyst.callbacks.swa import WeightsAveragingCallback
 from catalyst.callbacks.timer import TimerCallback
 from catalyst.callbacks.tracing import TracingCallback, TracerCallback
 from catalyst.callbacks.validation import ValidationManagerCallback
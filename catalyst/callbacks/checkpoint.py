@@ -1,21 +1,27 @@
 from typing import Callable, Dict, Tuple, TYPE_CHECKING, Union
 from collections import OrderedDict
+import logging
 import os
 from pathlib import Path
 
 from catalyst.core.callback import Callback, CallbackNode, CallbackOrder
+from catalyst.tools.async_writer import AsyncWriter
 from catalyst.utils.checkpoint import (
+    get_checkpoint_snapshot,
     load_checkpoint,
     pack_checkpoint,
     save_checkpoint,
     unpack_checkpoint,
 )
 from catalyst.utils.config import save_config
+from catalyst.utils.sharded_checkpoint import remove_unused_shards
 from catalyst.utils.misc import is_exception
 
 if TYPE_CHECKING:
     from catalyst.core.runner import IRunner
 
+logger = logging.getLogger(__name__)
+
 
 def _pack_runner(runner: "IRunner"):
     checkpoint = pack_checkpoint(
@@ -193,16 +199,22 @@ class ICheckpointCallback(Callback):
 class BaseCheckpointCallback(ICheckpointCallback):
     """Base class for all checkpoint callbacks."""
 
-    def __init__(self, metrics_filename: str = "_metrics.json"):
+    def __init__(
+        self, metrics_filename: str = "_metrics.json", sharded: bool = False
+    ):
         """
         Args:
             metrics_filename: filename to save metrics
                 in checkpoint folder. Must ends on ``.json`` or ``.yml``
+            sharded: if ``True`` then checkpoints are saved
+                in the sharded format, please follow
+                ``catalyst.utils.sharded_checkpoint`` for the details
         """
         super().__init__(
             order=CallbackOrder.external, node=CallbackNode.master
         )
         self.metrics_filename = metrics_filename
+        self.sharded = sharded
         self.metrics: dict = {}
 
     def _get_checkpoint_suffix(self, checkpoint: dict) -> str:
@@ -239,6 +251,7 @@ class BaseCheckpointCallback(ICheckpointCallback):
                 is_best=False,
                 is_last=False,
                 saver_fn=save,
+                sharded=self.sharded,
             )
             metrics = self.metrics
             metrics[suffix] = runner.valid_metrics
@@ -261,6 +274,9 @@ class CheckpointCallback(BaseCheckpointCallback):
         metrics_filename: str = "_metrics.json",
         load_on_stage_start: Union[str, Dict[str, str]] = None,
         load_on_stage_end: Union[str, Dict[str, str]] = None,
+        async_save: bool = False,
+        max_queue_size: int = 1,
+        sharded: bool = False,
     ):
         """
         Args:
@@ -336,8 +352,20 @@ class CheckpointCallback(BaseCheckpointCallback):
                 and will be used the last runner.
 
                 **NOTE:** Loading will be performed always at stage end.
-        """
-        super().__init__(metrics_filename)
+            async_save: if ``True``, epoch checkpoints are copied
+                to the (pinned) CPU memory and written to the disk
+                in the background thread, so the training is not blocked.
+                Pending checkpoints are flushed at stage end
+                and on exception.
+            max_queue_size: maximum number of the epoch checkpoints
+                waiting to be written in ``async_save`` mode,
+                the training waits for the writer if the queue is full
+            sharded: if ``True`` then checkpoints are saved
+                in the sharded format with lazy loading
+                and deduplication of the unchanged tensors,
+                please follow ``catalyst.utils.sharded_checkpoint``
+        """
+        super().__init__(metrics_filename, sharded=sharded)
         possible_states = {
             None,
             "best",
@@ -366,6 +394,9 @@ class CheckpointCallback(BaseCheckpointCallback):
 
         self._keys_from_state = ["resume", "resume_dir"]
         self._save_fn: Callable = None
+        self._writer = (
+            AsyncWriter(max_queue_size=max_queue_size) if async_save else None
+        )
 
     def _get_checkpoint_suffix(self, checkpoint: dict) -> str:
         """
@@ -436,6 +467,8 @@ class CheckpointCallback(BaseCheckpointCallback):
             )
             for filepath in last_filepaths:
                 os.remove(filepath)
+            if self.sharded:
+                remove_unused_shards(str(last_filepath.parent))
 
     def _save_checkpoint(
         self,
@@ -467,6 +500,7 @@ class CheckpointCallback(BaseCheckpointCallback):
             is_last=is_last,
             special_suffix="_full",
             saver_fn=self._save_fn,
+            sharded=self.sharded,
         )
         exclude = ["criterion", "optimizer", "scheduler"]
         checkpoint_path = save_checkpoint(
@@ -480,6 +514,7 @@ class CheckpointCallback(BaseCheckpointCallback):
             is_best=is_best,
             is_last=is_last,
             saver_fn=self._save_fn,
+            sharded=self.sharded,
         )
         return (full_checkpoint_path, checkpoint_path)
 
@@ -625,13 +660,37 @@ class CheckpointCallback(BaseCheckpointCallback):
 
         if self.save_n_best > 0:
             checkpoint = _pack_runner(runner)
-            self.process_checkpoint(
-                logdir=runner.logdir,
-                checkpoint=checkpoint,
-                is_best=runner.is_best_valid,
-                main_metric=runner.main_metric,
-                minimize_metric=runner.minimize_metric,
-            )
+            kwargs = {
+                "logdir": runner.logdir,
+                "is_best": runner.is_best_valid,
+                "main_metric": runner.main_metric,
+                "minimize_metric": runner.minimize_metric,
+            }
+            if self._writer is not None:
+                # all file operations are done in the writer thread,
+                # so they keep the submission order
+                checkpoint = get_checkpoint_snapshot(checkpoint)
+                self._writer.submit(
+                    self.process_checkpoint, checkpoint=checkpoint, **kwargs
+                )
+            else:
+                self.process_checkpoint(checkpoint=checkpoint, **kwargs)
+
+    def on_exception(self, runner: "IRunner"):
+        """
+        Flushes pending checkpoints and saves exception checkpoint.
+
+        Args:
+            runner: current runner
+        """
+        if self._writer is not None:
+            try:
+                self._writer.flush()
+            except Exception:
+                # the original exception is handled by the runner,
+                # so the failed write is reported, but not re-raised
+                logger.exception("Asynchronous checkpoint writing failed")
+        super().on_exception(runner)
 
     def on_stage_end(self, runner: "IRunner") -> None:
         """
@@ -641,6 +700,8 @@ class CheckpointCallback(BaseCheckpointCallback):
         Args:
             runner: current runner
         """
+        if self._writer is not None:
+            self._writer.flush()
         if runner.stage.startswith("infer") or runner.is_distributed_worker:
             return
         log_message = "Top best models:\n"
@@ -705,6 +766,7 @@ class IterationCheckpointCallback(BaseCheckpointCallback):
         stage_restart: bool = True,
         metrics_filename: str = "_metrics_iter.json",
         load_on_stage_end: str = "best_full",
+        sharded: bool = False,
     ):
         """
         Args:
@@ -718,8 +780,12 @@ class IterationCheckpointCallback(BaseCheckpointCallback):
                 You can use ``best``, ``best_full`` (default)
                 to load the best model according to validation metrics,
                 or ``last`` ``last_full`` to use just the last one.
+            sharded: if ``True`` then checkpoints are saved
+                in the sharded format with lazy loading
+                and deduplication of the unchanged tensors,
+                please follow ``catalyst.utils.sharded_checkpoint``
         """
-        super().__init__(metrics_filename)
+        super().__init__(metrics_filename, sharded=sharded)
         self.save_n_last = save_n_last
         self.period = period
         self.stage_restart = stage_restart
@@ -777,6 +843,8 @@ class IterationCheckpointCallback(BaseCheckpointCallback):
             item = self.last_checkpoints.pop(0)
             top_filepath = item[0]
             os.remove(top_filepath)
+            if self.sharded:
+                remove_unused_shards(os.path.dirname(top_filepath))
 
     def process_checkpoint(
         self,
@@ -799,6 +867,7 @@ class IterationCheckpointCallback(BaseCheckpointCallback):
             is_best=False,
             is_last=False,
             saver_fn=self._save_fn,
+            sharded=self.sharded,
         )
 
         self.last_checkpoints.append((filepath, batch_metrics))
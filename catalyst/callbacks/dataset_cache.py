@@ -0,0 +1,72 @@
+from typing import Dict, TYPE_CHECKING
+
+from catalyst.core.callback import Callback, CallbackNode, CallbackOrder
+from catalyst.data.dataset.cache import get_cached_datasets
+
+if TYPE_CHECKING:
+    from catalyst.core.runner import IRunner
+
+
+class DatasetCacheCallback(Callback):
+    """
+    Logs the hits and misses of the loaders
+    :py:class:`catalyst.data.dataset.CachedDataset`
+    (including the cached datasets wrapped into ``MergeDataset``)
+    as the loader metrics.
+
+    .. code-block:: python
+
+        from catalyst import data, dl
+
+        dataset = data.CachedDataset(
+            data.ListDataset(list_data, open_fn=open_fn),
+            capacity=16 * 2 ** 30,
+        )
+        runner = dl.SupervisedRunner()
+        runner.train(
+            ...
+            loaders={"train": DataLoader(dataset, num_workers=8)},
+            callbacks=[dl.DatasetCacheCallback()],
+        )
+    """
+
+    def __init__(self):
+        """Init."""
+        super().__init__(order=CallbackOrder.metric, node=CallbackNode.all)
+        self._start_stats: Dict[str, int] = {}
+
+    def _get_stats(self, runner: "IRunner") -> Dict[str, int]:
+        dataset = getattr(runner.loader, "dataset", None)
+        stats = {"hits": 0, "misses": 0, "items": 0, "used_bytes": 0}
+        for cached_dataset in get_cached_datasets(dataset):
+            for key, value in cached_dataset.get_stats().items():
+                stats[key] += value
+        return stats
+
+    def on_loader_start(self, runner: "IRunner") -> None:
+        """Loader start hook.
+
+        Args:
+            runner: current runner
+        """
+        self._start_stats = self._get_stats(runner)
+
+    def on_loader_end(self, runner: "IRunner") -> None:
+        """Loader end hook.
+
+        Args:
+            runner: current runner
+        """
+        stats = self._get_stats(runner)
+        hits = stats["hits"] - self._start_stats["hits"]
+        misses = stats["misses"] - self._start_stats["misses"]
+        runner.loader_metrics["_cache/hits"] = hits
+        runner.loader_metrics["_cache/misses"] = misses
+        runner.loader_metrics["_cache/hit_rate"] = hits / max(
+            hits + misses, 1
+        )
+        runner.loader_metrics["_cache/items"] = stats["items"]
+        runner.loader_metrics["_cache/used_bytes"] = stats["used_bytes"]
+
+
+__all__ = ["DatasetCacheCallback"]
@@ -1,13 +1,22 @@
 from typing import Dict, List, TYPE_CHECKING
+from functools import partial
 import logging
+import math
 import os
 import sys
 
+import numpy as np
 from tqdm import tqdm
 
 from catalyst.callbacks.formatters import TxtMetricsFormatter
 from catalyst.contrib.tools.tensorboard import SummaryWriter
 from catalyst.core.callback import Callback, CallbackNode, CallbackOrder
+from catalyst.tools.async_writer import AsyncWriter
+from catalyst.tools.metrics_writer import (
+    BufferedMetricsWriter,
+    CSVColumnsWriter,
+    ParquetColumnsWriter,
+)
 from catalyst.utils.misc import is_exception, split_dict_to_subdicts
 
 if TYPE_CHECKING:
@@ -73,13 +82,18 @@ class VerboseLogger(ILoggerCallback):
 
     def on_batch_end(self, runner: "IRunner"):
         """Update tqdm progress bar at the end of each batch."""
-        self.tqdm.set_postfix(
-            **{
-                k: "{:3.3f}".format(v) if v > 1e-3 else "{:1.3e}".format(v)
-                for k, v in sorted(runner.batch_metrics.items())
-                if self._need_show(k)
-            }
-        )
+        # batch metrics could be skipped for some batches,
+        # for example, by ``MetricManagerCallback(lazy_batch_metrics=True)``
+        if len(runner.batch_metrics) > 0:
+            self.tqdm.set_postfix(
+                **{
+                    k: "{:3.3f}".format(v)
+                    if v > 1e-3
+                    else "{:1.3e}".format(v)
+                    for k, v in sorted(runner.batch_metrics.items())
+                    if self._need_show(k)
+                }
+            )
         self.tqdm.update()
 
     def on_loader_end(self, runner: "IRunner"):
@@ -167,14 +181,36 @@ class ConsoleLogger(ILoggerCallback):
         self._clean_logger(self.logger)
 
 
+def _write_tensorboard_columns(
+    logger: SummaryWriter,
+    suffix: str,
+    steps: np.ndarray,
+    columns: Dict[str, np.ndarray],
+) -> None:
+    steps = steps.tolist()
+    for name, values in columns.items():
+        tag = f"{name}{suffix}"
+        for step, value in zip(steps, values.tolist()):
+            if not math.isnan(value):
+                logger.add_scalar(tag, value, step)
+
+
 class TensorboardLogger(ILoggerCallback):
-    """Logger callback, translates ``runner.metric_manager`` to tensorboard."""
+    """Logger callback, translates ``runner.metric_manager`` to tensorboard.
+
+    Batch metrics are buffered with the
+    :py:class:`catalyst.tools.metrics_writer.BufferedMetricsWriter`
+    and written to tensorboard in the background thread.
+    """
 
     def __init__(
         self,
         metric_names: List[str] = None,
         log_on_batch_end: bool = True,
         log_on_epoch_end: bool = True,
+        log_batch_period: int = 1,
+        batch_aggregation: str = "last",
+        buffer_size: int = 1024,
     ):
         """
         Args:
@@ -182,16 +218,27 @@ class TensorboardLogger(ILoggerCallback):
                 if none - logs everything
             log_on_batch_end: logs per-batch metrics if set True
             log_on_epoch_end: logs per-epoch metrics if set True
+            log_batch_period: number of batches per logged batch metrics
+            batch_aggregation: batch metrics aggregation
+                over the ``log_batch_period`` batches,
+                one of ``last``, ``mean``, ``min`` or ``max``
+            buffer_size: number of the logged batch metrics
+                to buffer before the write
         """
         super().__init__(order=CallbackOrder.logging, node=CallbackNode.master)
         self.metrics_to_log = metric_names
         self.log_on_batch_end = log_on_batch_end
         self.log_on_epoch_end = log_on_epoch_end
+        self.log_batch_period = log_batch_period
+        self.batch_aggregation = batch_aggregation
+        self.buffer_size = buffer_size
 
         if not (self.log_on_batch_end or self.log_on_epoch_end):
             raise ValueError("You have to log something!")
 
         self.loggers = {}
+        self.buffers: Dict[str, BufferedMetricsWriter] = {}
+        self._writer: AsyncWriter = None
 
     def _log_metrics(
         self, metrics: Dict[str, float], step: int, mode: str, suffix=""
@@ -224,20 +271,32 @@ class TensorboardLogger(ILoggerCallback):
         if runner.loader_key not in self.loggers:
             log_dir = os.path.join(runner.logdir, f"{runner.loader_key}_log")
             self.loggers[runner.loader_key] = SummaryWriter(log_dir)
+        if self.log_on_batch_end and runner.loader_key not in self.buffers:
+            if self._writer is None:
+                self._writer = AsyncWriter(max_queue_size=4)
+            self.buffers[runner.loader_key] = BufferedMetricsWriter(
+                partial(
+                    _write_tensorboard_columns,
+                    self.loggers[runner.loader_key],
+                    "/batch",
+                ),
+                buffer_size=self.buffer_size,
+                log_period=self.log_batch_period,
+                aggregation=self.batch_aggregation,
+                metric_names=self.metrics_to_log,
+                writer=self._writer,
+            )
 
     def on_batch_end(self, runner: "IRunner"):
         """Translate batch metrics to tensorboard."""
         if runner.logdir is None:
             return
 
-        if self.log_on_batch_end:
-            mode = runner.loader_key
-            metrics = runner.batch_metrics
-            self._log_metrics(
-                metrics=metrics,
-                step=runner.global_sample_step,
-                mode=mode,
-                suffix="/batch",
+        # batch metrics could be skipped for some batches,
+        # for example, by ``MetricManagerCallback(lazy_batch_metrics=True)``
+        if self.log_on_batch_end and len(runner.batch_metrics) > 0:
+            self.buffers[runner.loader_key].add(
+                runner.batch_metrics, step=runner.global_sample_step
             )
 
     def on_epoch_end(self, runner: "IRunner"):
@@ -245,6 +304,10 @@ class TensorboardLogger(ILoggerCallback):
         if runner.logdir is None:
             return
 
+        # batch metrics are written before the epoch ones
+        for buffer in self.buffers.values():
+            buffer.flush()
+
         if self.log_on_epoch_end:
             per_mode_metrics = split_dict_to_subdicts(
                 dct=runner.epoch_metrics,
@@ -264,31 +327,101 @@ class TensorboardLogger(ILoggerCallback):
         for logger in self.loggers.values():
             logger.flush()
 
+    def _close_loggers(self) -> None:
+        for buffer in self.buffers.values():
+            buffer.close()
+        if self._writer is not None:
+            self._writer.close()
+        self.buffers, self._writer = {}, None
+
+        for logger in self.loggers.values():
+            logger.close()
+
     def on_stage_end(self, runner: "IRunner"):
         """Close opened tensorboard writers."""
         if runner.logdir is None:
             return
 
-        for logger in self.loggers.values():
-            logger.close()
+        self._close_loggers()
+
+    def on_exception(self, runner: "IRunner"):
+        """Writes the buffered batch metrics and closes tensorboard writers,
+        so the metrics before the exception are kept."""
+        if runner.logdir is None:
+            return
+
+        self._close_loggers()
 
 
 class CSVLogger(ILoggerCallback):
-    """Logs metrics to csv file on epoch end"""
+    """Logs metrics to csv file on epoch end.
+
+    Optionally, batch metrics are logged to the
+    ``{loader_key}_log/batch_logs_{stage}.csv`` (or ``.parquet``) file
+    with the :py:class:`catalyst.tools.metrics_writer.BufferedMetricsWriter`
+    in the background thread, the columns are the first logged metrics.
+    """
 
     def __init__(
-        self, metric_names: List[str] = None,
+        self,
+        metric_names: List[str] = None,
+        log_on_batch_end: bool = False,
+        log_batch_period: int = 1,
+        batch_aggregation: str = "last",
+        buffer_size: int = 1024,
+        batch_file_format: str = "csv",
     ):
         """
         Args:
             metric_names: list of metric names to log,
                 if none - logs everything
+            log_on_batch_end: logs per-batch metrics if set True
+            log_batch_period: number of batches per logged batch metrics
+            batch_aggregation: batch metrics aggregation
+                over the ``log_batch_period`` batches,
+                one of ``last``, ``mean``, ``min`` or ``max``
+            buffer_size: number of the logged batch metrics
+                to buffer before the write
+            batch_file_format: batch metrics file format,
+                ``csv`` or ``parquet`` (requires ``pyarrow``)
+
+        Raises:
+            ValueError: if the batch file format is unknown
         """
         super().__init__(order=CallbackOrder.logging, node=CallbackNode.master)
+        if batch_file_format not in ("csv", "parquet"):
+            raise ValueError("batch_file_format should be csv or parquet")
         self.metrics_to_log = metric_names
+        self.log_on_batch_end = log_on_batch_end
+        self.log_batch_period = log_batch_period
+        self.batch_aggregation = batch_aggregation
+        self.buffer_size = buffer_size
+        self.batch_file_format = batch_file_format
 
         self.loggers = {}
         self.header_created = {}
+        self.buffers: Dict[str, BufferedMetricsWriter] = {}
+        self._writer: AsyncWriter = None
+
+    def _get_batch_buffer(self, runner: "IRunner") -> BufferedMetricsWriter:
+        log_dir = os.path.join(runner.logdir, f"{runner.loader_key}_log")
+        path = os.path.join(
+            log_dir, f"batch_logs_{runner.stage}.{self.batch_file_format}"
+        )
+        if self.batch_file_format == "parquet":
+            write_fn = ParquetColumnsWriter(path, self.metrics_to_log)
+        else:
+            write_fn = CSVColumnsWriter(path, self.metrics_to_log)
+        if self._writer is None:
+            self._writer = AsyncWriter(max_queue_size=4)
+        return BufferedMetricsWriter(
+            write_fn,
+            buffer_size=self.buffer_size,
+            log_period=self.log_batch_period,
+            aggregation=self.batch_aggregation,
+            metric_names=self.metrics_to_log,
+            writer=self._writer,
+        )
 
     def on_loader_start(self, runner: "IRunner") -> None:
         """
@@ -297,42 +430,49 @@ class CSVLogger(ILoggerCallback):
         Args:
             runner: current runner
         """
+        if runner.logdir is None:
+            return
         if runner.loader_key not in self.loggers:
             log_dir = os.path.join(runner.logdir, f"{runner.loader_key}_log")
             os.makedirs(log_dir, exist_ok=True)
             self.loggers[runner.loader_key] = open(
                 os.path.join(log_dir, "logs.csv"), "a+"
             )
-            self.header_created[runner.loader_key] = False
+            self.header_created.setdefault(runner.loader_key, False)
+        if self.log_on_batch_end and runner.loader_key not in self.buffers:
+            self.buffers[runner.loader_key] = self._get_batch_buffer(runner)
+
+    def on_batch_end(self, runner: "IRunner") -> None:
+        """
+        Logs batch metrics here
+
+        Args:
+            runner: runner for experiment
+        """
+        if runner.logdir is None or not self.log_on_batch_end:
+            return
+        # batch metrics could be skipped for some batches,
+        # for example, by ``MetricManagerCallback(lazy_batch_metrics=True)``
+        if len(runner.batch_metrics) > 0:
+            self.buffers[runner.loader_key].add(
+                runner.batch_metrics, step=runner.global_sample_step
+            )
+
+    def _get_metrics_to_log(self, metrics: Dict[str, float]) -> List[str]:
+        if self.metrics_to_log is None:
+            return sorted(metrics.keys())
+        return self.metrics_to_log
 
     def _log_metrics(
         self, metrics: Dict[str, float], step: int, loader_key: str
     ):
-        if self.metrics_to_log is None:
-            metrics_to_log = sorted(metrics.keys())
-        else:
-            metrics_to_log = self.metrics_to_log
-
-        log_line_csv = f"{step},"
-        for metric in metrics_to_log:
-            log_line_csv += str(metrics[metric]) + ","
-        log_line_csv = (
-            log_line_csv[:-1] + "\n"
-        )  # replace last "," with new line
-        self.loggers[loader_key].write(log_line_csv)
+        names = self._get_metrics_to_log(metrics)
+        values = [str(metrics[name]) for name in names]
+        self.loggers[loader_key].write(",".join([str(step)] + values) + "\n")
 
     def _make_header(self, metrics: Dict[str, float], loader_key: str):
-        if self.metrics_to_log is None:
-            metrics_to_log = sorted(metrics.keys())
-        else:
-            metrics_to_log = self.metrics_to_log
-        log_line_header = "step,"
-        for metric in metrics_to_log:
-            log_line_header += metric + ","
-        log_line_header = (
-            log_line_header[:-1] + "\n"
-        )  # replace last "," with new line
-        self.loggers[loader_key].write(log_line_header)
+        names = self._get_metrics_to_log(metrics)
+        self.loggers[loader_key].write(",".join(["step"] + names) + "\n")
 
     def on_epoch_end(self, runner: "IRunner"):
         """
@@ -361,6 +501,7 @@ class CSVLogger(ILoggerCallback):
                 step=runner.global_epoch,
                 loader_key=loader_key,
             )
+            self.loggers[loader_key].flush()
 
     def on_stage_end(self, runner: "IRunner") -> None:
         """
@@ -369,8 +510,28 @@ class CSVLogger(ILoggerCallback):
         Args:
             runner: runner for experiment
         """
+        self._close_loggers()
+
+    def on_exception(self, runner: "IRunner") -> None:
+        """
+        Writes the buffered batch metrics and closes loggers,
+        so the metrics before the exception are kept
+
+        Args:
+            runner: runner for experiment
+        """
+        self._close_loggers()
+
+    def _close_loggers(self) -> None:
+        for buffer in self.buffers.values():
+            buffer.close()
+        if self._writer is not None:
+            self._writer.close()
+        self.buffers, self._writer = {}, None
+
         for _k, logger in self.loggers.items():
             logger.close()
+        self.loggers = {}
 
 
 __all__ = [
@@ -1,15 +1,21 @@
-from typing import Any, Callable, Dict, List, TYPE_CHECKING, Union
+from typing import Any, Callable, Dict, List, Tuple, TYPE_CHECKING, Union
 from abc import ABC, abstractmethod
 from collections import defaultdict
 import logging
 
-import numpy as np
-
 import torch
 
 from catalyst.core.callback import Callback, CallbackNode, CallbackOrder
 from catalyst.tools.meters.averagevaluemeter import AverageValueMeter
-from catalyst.utils.distributed import get_distributed_mean
+from catalyst.tools.meters.tensoraveragevaluemeter import (
+    TensorAverageValueMeter,
+)
+from catalyst.tools.tensor_buffer import TensorBuffer
+from catalyst.utils.distributed import (
+    get_distributed_sum,
+    MetricsReduction,
+    reduce_metrics,
+)
 from catalyst.utils.misc import get_dictkey_auto_fn
 
 if TYPE_CHECKING:
@@ -163,23 +169,67 @@ class ILoaderMetricCallback(IMetricCallback):
     Loader-based metric callback.
     Stores input/output values during loaders run
     and computes metric in the end.
+
+    Values are accumulated into the preallocated ``TensorBuffer``
+    with ``runner.loader_len * runner.loader_batch_size`` capacity,
+    so there are no per-batch host copies for the device storage.
+    In the distributed mode the values of all nodes could be gathered
+    before the metric computation with ``gather_distributed=True``.
     """
 
-    def __init__(self, **kwargs):
+    def __init__(
+        self,
+        storage_device: Union[str, torch.device] = "cpu",
+        pin_memory: bool = False,
+        memmap_dir: str = None,
+        gather_distributed: bool = False,
+        **kwargs,
+    ):
         """Init.
 
         Args:
+            storage_device: device to accumulate values on,
+                if None, the values' device is used (no host copies)
+            pin_memory: flag to accumulate values in the pinned CPU memory,
+                so the copies from the GPU are asynchronous
+            memmap_dir: directory to spill accumulated values
+                to the memory-mapped files, for the loaders,
+                that do not fit into the RAM
+            gather_distributed: if True, the values of all nodes
+                are gathered (one ``all_gather`` per dtype)
+                and the metric is computed on the whole loader,
+                otherwise on the current node values
             **kwargs: `IMetricCallback` params.
         """
         super().__init__(**kwargs)
-
-        self.input = defaultdict(lambda: [])
-        self.output = defaultdict(lambda: [])
+        self.storage_device = storage_device
+        self.pin_memory = pin_memory
+        self.memmap_dir = memmap_dir
+        self.gather_distributed = gather_distributed
+
+        self._capacity: int = None
+        self.input: Dict[str, TensorBuffer] = defaultdict(self._get_buffer)
+        self.output: Dict[str, TensorBuffer] = defaultdict(self._get_buffer)
+
+    def _get_buffer(self) -> TensorBuffer:
+        return TensorBuffer(
+            capacity=self._capacity,
+            device=self.storage_device,
+            pin_memory=self.pin_memory,
+            memmap_dir=self.memmap_dir,
+        )
 
     def on_loader_start(self, runner: "IRunner"):
         """Reinitialises internal storage."""
-        self.input = defaultdict(lambda: [])
-        self.output = defaultdict(lambda: [])
+        self._capacity = (
+            runner.loader_len * runner.loader_batch_size
+            if runner.loader_batch_size is not None
+            else None
+        )
+        # buffers are reused between the loaders
+        for storage in (self.input, self.output):
+            for buffer in storage.values():
+                buffer.reset(capacity=self._capacity)
 
     def on_batch_end(self, runner: "IRunner") -> None:
         """Stores new input/output for the metric computation."""
@@ -189,9 +239,9 @@ class ILoaderMetricCallback(IMetricCallback):
         for data, storage in zip((input, output), (self.input, self.output)):
             if isinstance(data, dict):
                 for key, value in data.items():
-                    storage[key].append(value.detach().cpu().numpy())
+                    storage[key].append(value)
             else:
-                storage["_data"].append(data.detach().cpu().numpy())
+                storage["_data"].append(data)
 
     def on_loader_end(self, runner: "IRunner"):
         """Computes loader-based metric.
@@ -200,13 +250,23 @@ class ILoaderMetricCallback(IMetricCallback):
             runner: current runner
         """
         input = {
-            key: torch.from_numpy(np.concatenate(self.input[key], axis=0))
-            for key in self.input
+            key: buffer.get()
+            for key, buffer in self.input.items()
+            if len(buffer) > 0
         }
         output = {
-            key: torch.from_numpy(np.concatenate(self.output[key], axis=0))
-            for key in self.output
+            key: buffer.get()
+            for key, buffer in self.output.items()
+            if len(buffer) > 0
         }
+        if self.gather_distributed:
+            values = {f"input/{key}": value for key, value in input.items()}
+            values.update(
+                {f"output/{key}": value for key, value in output.items()}
+            )
+            values = reduce_metrics(values, modes="concat")
+            input = {key: values[f"input/{key}"] for key in input}
+            output = {key: values[f"output/{key}"] for key in output}
 
         input = {self.input_key: input["_data"]} if len(input) == 1 else input
         output = (
@@ -271,6 +331,10 @@ class LoaderMetricCallback(ILoaderMetricCallback):
         input_key: Union[str, List[str], Dict[str, str]] = "targets",
         output_key: Union[str, List[str], Dict[str, str]] = "logits",
         multiplier: float = 1.0,
+        storage_device: Union[str, torch.device] = "cpu",
+        pin_memory: bool = False,
+        memmap_dir: str = None,
+        gather_distributed: bool = False,
         **metric_kwargs,
     ):
         """Init.
@@ -283,6 +347,13 @@ class LoaderMetricCallback(ILoaderMetricCallback):
             output_key: output key to use for metric calculation;
                 specifies our `y_pred`
             multiplier: scalar for metric reweighting
+            storage_device: device to accumulate values on,
+                if None, the values' device is used (no host copies)
+            pin_memory: flag to accumulate values in the pinned CPU memory
+            memmap_dir: directory to spill accumulated values
+                to the memory-mapped files
+            gather_distributed: flag to gather the values of all nodes
+                before the metric computation
             **metrics_kwargs: extra metric params
                 to pass for metric computation
         """
@@ -291,6 +362,10 @@ class LoaderMetricCallback(ILoaderMetricCallback):
             input_key=input_key,
             output_key=output_key,
             multiplier=multiplier,
+            storage_device=storage_device,
+            pin_memory=pin_memory,
+            memmap_dir=memmap_dir,
+            gather_distributed=gather_distributed,
             **metric_kwargs,
         )
         self.metric = metric_fn
@@ -422,14 +497,52 @@ class MetricAggregationCallback(Callback):
 class MetricManagerCallback(Callback):
     """
     Prepares metrics for logging, transferring values from PyTorch to numpy.
+
+    With ``lazy_batch_metrics=True`` batch metrics are kept
+    as device tensors and accumulated on the device
+    with ``TensorAverageValueMeter``,
+    so there is no device-host synchronization on every batch.
+    Batch metrics are transferred to ``runner.batch_metrics`` as floats
+    only every ``batch_metrics_period`` batches and on the last loader batch
+    (without distributed averaging, so they are the current node values),
+    otherwise ``runner.batch_metrics`` is empty for the loggers.
+    Loader metrics are reduced among all nodes once per loader.
+
+    Otherwise all batch metrics are averaged among all nodes
+    with one collective call per batch (see
+    :py:func:`catalyst.utils.distributed.reduce_metrics`).
+    With ``async_reduction=True`` the reduction overlaps
+    with the next batch, so ``runner.batch_metrics``
+    are the previous batch metrics.
     """
 
-    def __init__(self):
-        """Init."""
+    def __init__(
+        self,
+        lazy_batch_metrics: bool = False,
+        batch_metrics_period: int = 10,
+        async_reduction: bool = False,
+    ):
+        """Init.
+
+        Args:
+            lazy_batch_metrics: if True, accumulates batch metrics
+                on the device and transfers them to the host only
+                every ``batch_metrics_period`` batches
+            batch_metrics_period: period (in batches) for batch metrics
+                transfer in the ``lazy_batch_metrics`` mode
+            async_reduction: if True, batch metrics are reduced
+                asynchronously and are available on the next batch
+        """
         super().__init__(
             order=CallbackOrder.logging - 1, node=CallbackNode.all,
         )
+        if batch_metrics_period < 1:
+            raise ValueError("batch_metrics_period should be positive")
+        self.lazy_batch_metrics = lazy_batch_metrics
+        self.batch_metrics_period = batch_metrics_period
+        self.async_reduction = async_reduction
         self.meters: Dict[str, AverageValueMeter] = None
+        self._pending_reduction: Tuple[MetricsReduction, int] = None
 
     @staticmethod
     def to_single_value(value: Any) -> float:
@@ -449,13 +562,83 @@ class MetricManagerCallback(Callback):
 
     @staticmethod
     def _process_metrics(metrics: Dict[str, Any]):
-        output = {}
+        metrics = reduce_metrics(metrics, modes="mean")
+        return MetricManagerCallback._materialize_metrics(metrics)
+
+    def _wait_pending_reduction(self) -> Dict[str, float]:
+        """Waits for the previous batch metrics and updates the meters."""
+        if self._pending_reduction is None:
+            return defaultdict(None)
+        reduction, batch_size = self._pending_reduction
+        self._pending_reduction = None
+        metrics = self._materialize_metrics(reduction.wait())
         for key, value in metrics.items():
-            value = get_distributed_mean(value)
-            value = MetricManagerCallback.to_single_value(value)
-            output[key] = value
+            self.meters[key].add(value, batch_size)
+        return metrics
+
+    @staticmethod
+    def _materialize_metrics(metrics: Dict[str, Any]) -> Dict[str, float]:
+        """Transfers all metrics to the host with one synchronization."""
+        tensor_keys = [
+            key for key, value in metrics.items() if torch.is_tensor(value)
+        ]
+        output = {
+            key: MetricManagerCallback.to_single_value(value)
+            for key, value in metrics.items()
+            if not torch.is_tensor(value)
+        }
+        if len(tensor_keys) > 0:
+            device = metrics[tensor_keys[0]].device
+            values = torch.stack(
+                [
+                    metrics[key]
+                    .detach()
+                    .to(device=device, dtype=torch.float64)
+                    .reshape(())
+                    for key in tensor_keys
+                ]
+            ).tolist()
+            output.update(zip(tensor_keys, values))
         return output
 
+    def _reduce_meters(self) -> Dict[str, float]:
+        """Reduces meters among all nodes with one collective call
+        and transfers their means to the host."""
+        keys = sorted(self.meters.keys())
+        if len(keys) == 0:
+            return {}
+        stats = [
+            (
+                self.meters[key].sum,
+                self.meters[key].sum_sq,
+                self.meters[key].n_samples,
+            )
+            for key in keys
+        ]
+        device = next(
+            (
+                value.device
+                for stat in stats
+                for value in stat
+                if torch.is_tensor(value)
+            ),
+            torch.device("cpu"),
+        )
+        stats = torch.stack(
+            [
+                torch.as_tensor(value, dtype=torch.float64, device=device)
+                for stat in stats
+                for value in stat
+            ]
+        ).view(len(keys), 3)
+        stats = get_distributed_sum(stats)
+        for key, (sum_, sum_sq, n_samples) in zip(keys, stats):
+            self.meters[key].sum = sum_
+            self.meters[key].sum_sq = sum_sq
+            self.meters[key].n_samples = n_samples
+        means = (stats[:, 0] / stats[:, 2]).tolist()
+        return dict(zip(keys, means))
+
     def on_epoch_start(self, runner: "IRunner") -> None:
         """Epoch start hook.
 
@@ -471,7 +654,10 @@ class MetricManagerCallback(Callback):
             runner: current runner
         """
         runner.loader_metrics = defaultdict(None)
-        self.meters = defaultdict(AverageValueMeter)
+        if self.lazy_batch_metrics:
+            self.meters = defaultdict(TensorAverageValueMeter)
+        else:
+            self.meters = defaultdict(AverageValueMeter)
 
     def on_batch_start(self, runner: "IRunner") -> None:
         """Batch start hook.
@@ -487,9 +673,32 @@ class MetricManagerCallback(Callback):
         Args:
             runner: current runner
         """
-        runner.batch_metrics = self._process_metrics(runner.batch_metrics)
-        for key, value in runner.batch_metrics.items():
-            self.meters[key].add(value, runner.batch_size)
+        if self.lazy_batch_metrics:
+            for key, value in runner.batch_metrics.items():
+                self.meters[key].add(value, runner.batch_size)
+            batch_step = runner.loader_batch_step + 1
+            need_materialize = (
+                batch_step % self.batch_metrics_period == 0
+                or batch_step == runner.loader_len
+            )
+            if need_materialize:
+                runner.batch_metrics = self._materialize_metrics(
+                    runner.batch_metrics
+                )
+            else:
+                runner.batch_metrics = defaultdict(None)
+        elif self.async_reduction:
+            reduction = reduce_metrics(
+                runner.batch_metrics, modes="mean", async_op=True
+            )
+            runner.batch_metrics = self._wait_pending_reduction()
+            self._pending_reduction = (reduction, runner.batch_size)
+        else:
+            runner.batch_metrics = self._process_metrics(
+                runner.batch_metrics
+            )
+            for key, value in runner.batch_metrics.items():
+                self.meters[key].add(value, runner.batch_size)
 
     def on_loader_end(self, runner: "IRunner") -> None:
         """Loader end hook.
@@ -497,9 +706,13 @@ class MetricManagerCallback(Callback):
         Args:
             runner: current runner
         """
-        for key, value in self.meters.items():
-            value = value.mean
-            runner.loader_metrics[key] = value
+        if self.lazy_batch_metrics:
+            runner.loader_metrics.update(self._reduce_meters())
+        else:
+            self._wait_pending_reduction()
+            for key, value in self.meters.items():
+                value = value.mean
+                runner.loader_metrics[key] = value
         for key, value in runner.loader_metrics.items():
             runner.epoch_metrics[f"{runner.loader_key}_{key}"] = value
 
@@ -19,6 +19,9 @@ from catalyst.callbacks.metrics.iou import (
     JaccardCallback,
 )
 from catalyst.callbacks.metrics.mrr import MRRCallback
+from catalyst.callbacks.metrics.multiclass_statistics import (
+    MulticlassPrecisionRecallF1Callback,
+)
 from catalyst.callbacks.metrics.perplexity import (
     PerplexityMetricCallback,
     PerplexityCallback,
@@ -31,3 +34,4 @@ from catalyst.callbacks.metrics.precision import (
     PrecisionCallback,
 )
 from catalyst.callbacks.metrics.recall import RecallCallback
+from catalyst.callbacks.metrics.recsys import RecSysMetricsCallback
@@ -1,16 +1,25 @@
-from typing import List
+from typing import List, TYPE_CHECKING
 
 from catalyst.callbacks.metric import LoaderMetricCallback
-from catalyst.metrics.auc import auc
+from catalyst.metrics.auc import auc, auc_from_histograms, get_auc_histograms
 from catalyst.metrics.functional import (
     wrap_class_metric2dict,
     wrap_metric_fn_with_activation,
 )
+from catalyst.utils.distributed import get_distributed_sum
+from catalyst.utils.torch import get_activation_fn
+
+if TYPE_CHECKING:
+    from catalyst.core.runner import IRunner
 
 
 class AUCCallback(LoaderMetricCallback):
     """Calculates the AUC  per class for each loader.
 
+    With ``num_bins`` the AUC is approximated with per-class
+    scores histograms, that are updated on every batch,
+    so the loader outputs are not stored.
+
     .. note::
         Currently, supports binary and multilabel cases.
     """
@@ -23,6 +32,7 @@ class AUCCallback(LoaderMetricCallback):
         activation: str = "Sigmoid",
         per_class: bool = False,
         class_args: List[str] = None,
+        num_bins: int = None,
         **kwargs,
     ):
         """
@@ -38,6 +48,10 @@ class AUCCallback(LoaderMetricCallback):
                 or use mean/macro statistics otherwise
             class_args: class names to display in the logs.
                 If None, defaults to indices for each class, starting from 0
+            num_bins: number of histogram bins for the streaming AUC
+                approximation, if None, the exact AUC is computed
+                on the whole loader outputs.
+                Activated outputs should be in [0; 1] range.
             **kwargs: key-value params to pass to the metric
 
         .. note::
@@ -58,6 +72,56 @@ class AUCCallback(LoaderMetricCallback):
             output_key=output_key,
             **kwargs,
         )
+        self.num_bins = num_bins
+        self._activation_fn = get_activation_fn(activation)
+        self._histogram_metric_fn = wrap_class_metric2dict(
+            auc_from_histograms, per_class=per_class, class_args=class_args
+        )
+        self._positives = None
+        self._negatives = None
+
+    def on_loader_start(self, runner: "IRunner"):
+        """Reinitialises internal storage."""
+        if self.num_bins is None:
+            super().on_loader_start(runner)
+        else:
+            self._positives = None
+            self._negatives = None
+
+    def on_batch_end(self, runner: "IRunner") -> None:
+        """Stores new input/output for the metric computation."""
+        if self.num_bins is None:
+            super().on_batch_end(runner)
+            return
+
+        outputs = self._get_output(runner.output, self.output_key)
+        targets = self._get_input(runner.input, self.input_key)
+        positives, negatives = get_auc_histograms(
+            outputs=self._activation_fn(outputs.detach()),
+            targets=targets.detach(),
+            num_bins=self.num_bins,
+        )
+        if self._positives is None:
+            self._positives, self._negatives = positives, negatives
+        else:
+            self._positives += positives
+            self._negatives += negatives
+
+    def on_loader_end(self, runner: "IRunner"):
+        """Computes loader-based metric.
+
+        Args:
+            runner: current runner
+        """
+        if self.num_bins is None:
+            super().on_loader_end(runner)
+            return
+
+        positives = get_distributed_sum(self._positives)
+        negatives = get_distributed_sum(self._negatives)
+        metrics = self._histogram_metric_fn(positives, negatives)
+        metrics = self._process_computed_metric(metrics)
+        runner.loader_metrics.update(**metrics)
 
 
 __all__ = ["AUCCallback"]
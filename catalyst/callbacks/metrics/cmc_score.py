@@ -1,11 +1,12 @@
-from typing import List, TYPE_CHECKING
+from typing import List, TYPE_CHECKING, Union
 
 import torch
 
 from catalyst.core.callback import Callback, CallbackOrder
 from catalyst.data.dataset.metric_learning import QueryGalleryDataset
-from catalyst.metrics.cmc_score import cmc_score
 from catalyst.metrics.functional import get_default_topk_args
+from catalyst.metrics.retrieval import retrieval_metrics
+from catalyst.tools.tensor_buffer import TensorBuffer
 
 if TYPE_CHECKING:
     from catalyst.core.runner import IRunner
@@ -35,6 +36,14 @@ class CMCScoreCallback(Callback):
         prefix: str = "cmc",
         topk_args: List[int] = None,
         num_classes: int = None,
+        storage_device: Union[str, torch.device] = "cpu",
+        pin_memory: bool = False,
+        query_tile_size: int = 1024,
+        gallery_tile_size: int = 65536,
+        num_workers: int = 1,
+        compute_device: Union[str, torch.device] = None,
+        precision_prefix: str = None,
+        map_prefix: str = None,
     ):
         """
         This callback was designed to count
@@ -58,66 +67,70 @@ class CMCScoreCallback(Callback):
                 [1, 3, 5] - cmc@1, cmc@3 and cmc@5
             num_classes: number of classes to calculate ``accuracy_args``
                 if ``topk_args`` is None
-
+            storage_device: device to accumulate embeddings on,
+                if None, the embeddings' device is used (no host copies)
+            pin_memory: flag to accumulate embeddings
+                in the pinned CPU memory
+            query_tile_size: number of queries per tile
+                for the distances computation
+            gallery_tile_size: number of gallery items per tile
+                for the distances computation
+            num_workers: number of threads to process query tiles with
+                for the CPU computation
+            compute_device: device for the distances computation,
+                if None, the embeddings' storage device is used
+            precision_prefix: key for the precision@k metric's name,
+                if None, precision@k is not logged
+            map_prefix: key for the mAP@k metric's name,
+                if None, mAP@k is not logged
+
+        .. note::
+            Only top-k closest gallery items are kept for every query,
+            so the full query-gallery distance matrix is never allocated,
+            please follow ``catalyst.metrics.retrieval.retrieval_metrics``
+            for the details.
         """
         super().__init__(order=CallbackOrder.Metric)
         self.list_args = topk_args or get_default_topk_args(num_classes)
-        self._metric_fn = cmc_score
         self._prefix = prefix
+        self._prefixes = {
+            "cmc": prefix,
+            "precision": precision_prefix,
+            "map": map_prefix,
+        }
+        self._retrieval_params = {
+            "query_tile_size": query_tile_size,
+            "gallery_tile_size": gallery_tile_size,
+            "num_workers": num_workers,
+            "device": compute_device,
+        }
         self.embeddings_key = embeddings_key
         self.labels_key = labels_key
         self.is_query_key = is_query_key
-        self._gallery_embeddings: torch.Tensor = None
-        self._query_embeddings: torch.Tensor = None
-        self._gallery_labels: torch.Tensor = None
-        self._query_labels: torch.Tensor = None
-        self._gallery_idx = None
-        self._query_idx = None
+        self._buffer_params = {
+            "device": storage_device,
+            "pin_memory": pin_memory,
+        }
+        self._gallery_embeddings = TensorBuffer(**self._buffer_params)
+        self._query_embeddings = TensorBuffer(**self._buffer_params)
+        self._gallery_labels = TensorBuffer(**self._buffer_params)
+        self._query_labels = TensorBuffer(**self._buffer_params)
         self._query_size = None
         self._gallery_size = None
 
-    def _accumulate(
-        self,
-        query_embeddings: torch.Tensor,
-        gallery_embeddings: torch.Tensor,
-        query_labels: torch.LongTensor,
-        gallery_labels: torch.LongTensor,
-    ) -> None:
-        if query_embeddings.shape[0] > 0:
-            add_indices = self._query_idx + torch.arange(
-                query_embeddings.shape[0]
-            )
-            self._query_embeddings[add_indices] = query_embeddings
-            self._query_labels[add_indices] = query_labels
-            self._query_idx += query_embeddings.shape[0]
-        if gallery_embeddings.shape[0] > 0:
-            add_indices = self._gallery_idx + torch.arange(
-                gallery_embeddings.shape[0]
-            )
-            self._gallery_embeddings[add_indices] = gallery_embeddings
-            self._gallery_labels[add_indices] = gallery_labels
-            self._gallery_idx += gallery_embeddings.shape[0]
-
     def on_batch_end(self, runner: "IRunner"):
         """On batch end action"""
         query_mask = runner.input[self.is_query_key]
         # bool mask
         query_mask = query_mask.type(TORCH_BOOL)
         gallery_mask = ~query_mask
-        query_embeddings = runner.output[self.embeddings_key][query_mask].cpu()
-        gallery_embeddings = runner.output[self.embeddings_key][
-            gallery_mask
-        ].cpu()
-        query_labels = runner.input[self.labels_key][query_mask].cpu()
-        gallery_labels = runner.input[self.labels_key][gallery_mask].cpu()
-
-        if self._query_embeddings is None:
-            emb_dim = query_embeddings.shape[1]
-            self._query_embeddings = torch.empty(self._query_size, emb_dim)
-            self._gallery_embeddings = torch.empty(self._gallery_size, emb_dim)
-        self._accumulate(
-            query_embeddings, gallery_embeddings, query_labels, gallery_labels,
-        )
+        embeddings = runner.output[self.embeddings_key]
+        labels = runner.input[self.labels_key]
+
+        self._query_embeddings.append(embeddings[query_mask])
+        self._gallery_embeddings.append(embeddings[gallery_mask])
+        self._query_labels.append(labels[query_mask])
+        self._gallery_labels.append(labels[gallery_mask])
 
     def on_loader_start(self, runner: "IRunner"):
         """On loader start action"""
@@ -125,36 +138,42 @@ class CMCScoreCallback(Callback):
         assert isinstance(dataset, QueryGalleryDataset)
         self._query_size = dataset.query_size
         self._gallery_size = dataset.gallery_size
-        self._query_labels = torch.empty(self._query_size, dtype=torch.long)
-        self._gallery_labels = torch.empty(
-            self._gallery_size, dtype=torch.long
-        )
-        self._gallery_idx = 0
-        self._query_idx = 0
+        for buffer, size in (
+            (self._query_embeddings, self._query_size),
+            (self._query_labels, self._query_size),
+            (self._gallery_embeddings, self._gallery_size),
+            (self._gallery_labels, self._gallery_size),
+        ):
+            buffer.reset(capacity=size)
 
     def on_loader_end(self, runner: "IRunner"):
         """On loader end action"""
         assert (
-            self._gallery_idx == self._gallery_size
+            len(self._gallery_embeddings) == self._gallery_size
         ), "An error occurred during the accumulation process."
 
         assert (
-            self._query_idx == self._query_size
+            len(self._query_embeddings) == self._query_size
         ), "An error occurred during the accumulation process."
 
-        conformity_matrix = self._gallery_labels == self._query_labels.reshape(
-            -1, 1
+        query_embeddings = self._query_embeddings.get().float()
+        gallery_embeddings = self._gallery_embeddings.get().float()
+        query_labels = self._query_labels.get()
+        gallery_labels = self._gallery_labels.get()
+
+        metrics = retrieval_metrics(
+            query_embeddings=query_embeddings,
+            gallery_embeddings=gallery_embeddings,
+            query_labels=query_labels,
+            gallery_labels=gallery_labels,
+            topk_args=self.list_args,
+            **self._retrieval_params,
         )
-        for key in self.list_args:
-            metric = self._metric_fn(
-                query_embeddings=self._query_embeddings,
-                gallery_embeddings=self._gallery_embeddings,
-                conformity_matrix=conformity_matrix,
-                topk=key,
-            )
-            runner.loader_metrics[f"{self._prefix}{key:02}"] = metric
-        self._gallery_embeddings = None
-        self._query_embeddings = None
+        for name, prefix in self._prefixes.items():
+            if prefix is None:
+                continue
+            for key, metric in zip(self.list_args, metrics[name]):
+                runner.loader_metrics[f"{prefix}{key:02}"] = metric
 
 
 __all__ = ["CMCScoreCallback"]
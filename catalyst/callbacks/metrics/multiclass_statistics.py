@@ -0,0 +1,92 @@
+from typing import List, TYPE_CHECKING
+
+from catalyst.core.callback import Callback, CallbackNode, CallbackOrder
+from catalyst.metrics.classification import _precision_recall_fbeta
+from catalyst.metrics.functional import wrap_class_metric2dict
+from catalyst.tools.meters.multiclass_statistics_meter import (
+    MulticlassStatisticsMeter,
+)
+
+if TYPE_CHECKING:
+    from catalyst.core.runner import IRunner
+
+
+class MulticlassPrecisionRecallF1Callback(Callback):
+    """
+    Calculates the global precision, recall and F-beta score
+    per class for each loader in multiclass case.
+
+    The confusion matrix is updated on every batch on the device
+    and reduced among the distributed nodes once per loader,
+    so the loader outputs are not stored.
+    """
+
+    def __init__(
+        self,
+        num_classes: int,
+        input_key: str = "targets",
+        output_key: str = "logits",
+        beta: float = 1.0,
+        eps: float = 1e-7,
+        argmax_dim: int = -1,
+        per_class: bool = False,
+        class_args: List[str] = None,
+    ):
+        """
+        Args:
+            num_classes: number of classes
+            input_key: input key to use for metrics calculation
+                specifies our ``y_true``
+            output_key: output key to use for metrics calculation;
+                specifies our ``y_pred``
+            beta: beta param for f_score
+            eps: epsilon to avoid zero division
+            argmax_dim: int, that specifies dimension for argmax transformation
+                in case of scores/probabilities in ``outputs``
+            per_class: boolean flag to log per class metrics,
+                or use mean/macro statistics otherwise
+            class_args: class names to display in the logs.
+                If None, defaults to indices for each class, starting from 0
+        """
+        super().__init__(order=CallbackOrder.metric, node=CallbackNode.all)
+        self.input_key = input_key
+        self.output_key = output_key
+        self.beta = beta
+        self.eps = eps
+        self.meter = MulticlassStatisticsMeter(
+            num_classes=num_classes, argmax_dim=argmax_dim
+        )
+        self._class_metric2dict = wrap_class_metric2dict(
+            lambda value: value, per_class=per_class, class_args=class_args
+        )
+
+    def on_loader_start(self, runner: "IRunner") -> None:
+        """Resets the confusion matrix."""
+        self.meter.reset()
+
+    def on_batch_end(self, runner: "IRunner") -> None:
+        """Updates the confusion matrix with the batch predictions."""
+        self.meter.add(
+            outputs=runner.output[self.output_key],
+            targets=runner.input[self.input_key],
+        )
+
+    def on_loader_end(self, runner: "IRunner") -> None:
+        """Computes loader-based metrics."""
+        self.meter.synchronize()
+        _, fp, fn, tp, _ = self.meter.value()
+        precision, recall, fbeta = _precision_recall_fbeta(
+            fp=fp, fn=fn, tp=tp, beta=self.beta, eps=self.eps
+        )
+        for prefix, value in (
+            ("precision", precision),
+            ("recall", recall),
+            ("f1_score" if self.beta == 1 else "fbeta_score", fbeta),
+        ):
+            metrics = self._class_metric2dict(value)
+            runner.loader_metrics.update(
+                {f"{prefix}{key}": metric for key, metric in metrics.items()}
+            )
+
+
+__all__ = ["MulticlassPrecisionRecallF1Callback"]
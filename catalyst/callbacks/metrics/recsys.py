@@ -0,0 +1,129 @@
+from typing import List, Sequence, TYPE_CHECKING
+
+import torch
+
+from catalyst.core.callback import Callback, CallbackNode, CallbackOrder
+from catalyst.metrics.recsys import RECSYS_METRICS, recsys_metrics
+from catalyst.utils.distributed import reduce_metrics
+
+if TYPE_CHECKING:
+    from catalyst.core.runner import IRunner
+
+
+class RecSysMetricsCallback(Callback):
+    """
+    Computes HR@k, MRR@k, NDCG@k and MAP@k over the loader
+    with the single ``torch.topk`` per batch for all metrics and ``k``.
+
+    All metrics are the means over the users,
+    so only the per-batch sums of the metrics are accumulated
+    (on the outputs device, without per-batch synchronizations)
+    instead of the whole loader slates.
+    In the distributed mode the sums are reduced among all nodes.
+
+    Metrics are logged as ``{metric}{k:02}``,
+    e.g. ``hitrate01`` or ``ndcg10``, with the optional prefix.
+
+    Example:
+        >>> runner.train(
+        >>>     ...
+        >>>     callbacks=[
+        >>>         dl.RecSysMetricsCallback(topk_args=[1, 5, 10, 50]),
+        >>>     ],
+        >>> )
+    """
+
+    def __init__(
+        self,
+        input_key: str = "targets",
+        output_key: str = "logits",
+        topk_args: Sequence[int] = (1, 3, 5),
+        metrics: Sequence[str] = RECSYS_METRICS,
+        gain_function: str = "exp_rank",
+        prefix: str = "",
+    ):
+        """
+        Args:
+            input_key: input key with the ``[batch_size; slate_length]``
+                ground truth relevance, specifies our ``y_true``
+            output_key: output key with the ``[batch_size; slate_length]``
+                model scores, specifies our ``y_pred``
+            topk_args: list of ``k`` to compute metrics for
+            metrics: metrics to compute,
+                subset of ``hitrate``, ``mrr``, ``ndcg`` and ``map``
+            gain_function: NDCG gain function,
+                ``exp_rank`` or ``linear_rank``
+            prefix: metrics names prefix
+
+        Raises:
+            ValueError: if the metric is unknown
+        """
+        super().__init__(order=CallbackOrder.Metric, node=CallbackNode.All)
+        unknown_metrics = set(metrics) - set(RECSYS_METRICS)
+        if unknown_metrics:
+            raise ValueError(f"unknown metrics {sorted(unknown_metrics)}")
+        self.input_key = input_key
+        self.output_key = output_key
+        self.topk_args = list(topk_args)
+        self.metrics = list(metrics)
+        self.gain_function = gain_function
+        self.prefix = prefix
+
+        self._sums: torch.Tensor = None
+        self._num_users: int = 0
+
+    def _get_names(self) -> List[str]:
+        return [
+            f"{self.prefix}{metric}{k:02}"
+            for metric in self.metrics
+            for k in self.topk_args
+        ]
+
+    def on_loader_start(self, runner: "IRunner") -> None:
+        """Resets the accumulated metrics.
+
+        Args:
+            runner: current runner
+        """
+        self._sums = None
+        self._num_users = 0
+
+    def on_batch_end(self, runner: "IRunner") -> None:
+        """Accumulates the batch metrics sums.
+
+        Args:
+            runner: current runner
+        """
+        outputs = runner.output[self.output_key].detach()
+        targets = runner.input[self.input_key].detach()
+        values = recsys_metrics(
+            outputs,
+            targets,
+            self.topk_args,
+            metrics=self.metrics,
+            gain_function=self.gain_function,
+            reduction="sum",
+        )
+        sums = torch.stack(
+            [value for metric in self.metrics for value in values[metric]]
+        )
+        self._sums = sums if self._sums is None else self._sums + sums
+        self._num_users += outputs.shape[0]
+
+    def on_loader_end(self, runner: "IRunner") -> None:
+        """Computes the loader metrics.
+
+        Args:
+            runner: current runner
+        """
+        if self._sums is None:
+            return
+        reduced = reduce_metrics(
+            {"sums": self._sums, "num_users": self._num_users}, modes="sum"
+        )
+        means = reduced["sums"] / max(reduced["num_users"], 1)
+        for name, value in zip(self._get_names(), means.tolist()):
+            runner.loader_metrics[name] = value
+
+
+__all__ = ["RecSysMetricsCallback"]
@@ -0,0 +1,360 @@
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TYPE_CHECKING,
+    Union,
+)
+from collections import defaultdict
+import functools
+import json
+import os
+import time
+
+import numpy as np
+
+import torch
+
+from catalyst.core.callback import Callback, CallbackNode, CallbackOrder
+from catalyst.core.functional import get_callbacks_dispatch_table
+
+if TYPE_CHECKING:
+    from catalyst.core.runner import IRunner
+
+_Timestamp = Union[float, "torch.cuda.Event"]
+
+
+class ProfilerCallback(Callback):
+    """
+    Profiles the runner hot path per batch:
+    every callback event handler (as ``{callback_name}/{event}``),
+    ``batch`` (the whole ``_run_batch``), ``handle_device``,
+    ``handle_batch``, ``forward`` (the model forward hooks),
+    ``backward`` and ``optimizer_step``.
+
+    The spans durations (in seconds) are aggregated per loader
+    into the ``_profiler/{span}/p{percentile}`` loader metrics.
+    Optionally, the spans of the ``trace_num_batches`` batches window
+    are written as the Chrome trace (``chrome://tracing``
+    or https://ui.perfetto.dev) to the ``trace_path``.
+
+    On GPU the spans are timed with the CUDA events,
+    so the profiling does not synchronize the device per span,
+    the events are resolved as soon as they are completed.
+    Note that the CUDA events measure the device stream time,
+    so the span includes the kernels launched within the span.
+
+    The runner and optimizers methods are patched
+    (and the ``torch.autograd.backward`` for the ``backward`` span)
+    during the stage only and restored on the stage end.
+
+    Example:
+        >>> runner.train(
+        >>>     ...
+        >>>     callbacks=[
+        >>>         dl.ProfilerCallback(
+        >>>             trace_path="./logs/trace.json",
+        >>>             trace_start_batch=10,
+        >>>             trace_num_batches=5,
+        >>>         ),
+        >>>     ],
+        >>> )
+    """
+
+    def __init__(
+        self,
+        percentiles: Sequence[float] = (50, 90, 99),
+        trace_path: Optional[str] = None,
+        trace_loader: Optional[str] = None,
+        trace_start_batch: int = 10,
+        trace_num_batches: int = 10,
+        use_cuda_events: bool = True,
+    ):
+        """
+        Args:
+            percentiles: spans durations percentiles to log
+            trace_path: path to write the Chrome trace to,
+                the trace is not recorded if None
+            trace_loader: loader to trace,
+                the first profiled loader if None
+            trace_start_batch: first batch (of the loader) to trace
+            trace_num_batches: number of batches to trace
+            use_cuda_events: flag to use the CUDA events
+                if the runner device is GPU
+        """
+        # right before the MetricManagerCallback,
+        # so the loader metrics are logged in the same epoch
+        super().__init__(
+            order=CallbackOrder.logging - 2, node=CallbackNode.all
+        )
+        self.percentiles = list(percentiles)
+        self.trace_path = trace_path
+        self.trace_loader = trace_loader
+        self.trace_start_batch = trace_start_batch
+        self.trace_num_batches = trace_num_batches
+        self.use_cuda_events = use_cuda_events
+
+        self._runner: "IRunner" = None
+        self._patches: List[Tuple[Any, str, Any]] = []
+        self._hooks: List[Any] = []
+        self._dispatch_table: Dict[str, List[Callable]] = None
+        self._is_active = False
+        self._use_cuda = False
+        self._free_events: List["torch.cuda.Event"] = []
+        self._origin: _Timestamp = None
+        self._forward_starts: List[_Timestamp] = []
+        # (name, batch step, start, end) of the not resolved spans
+        self._pending: List[Tuple[str, int, _Timestamp, _Timestamp]] = []
+        self._durations: Dict[str, List[float]] = defaultdict(list)
+        self._is_tracing = False
+        self._is_traced = False
+        self._trace_events: List[Dict[str, Any]] = []
+
+    def _now(self) -> _Timestamp:
+        if not self._use_cuda:
+            return time.perf_counter()
+        if self._free_events:
+            event = self._free_events.pop()
+        else:
+            event = torch.cuda.Event(enable_timing=True)
+        event.record()
+        return event
+
+    def _add_span(self, name: str, start: _Timestamp) -> None:
+        end = self._now()
+        step = self._runner.loader_batch_step
+        self._pending.append((name, step, start, end))
+
+    def _wrap(self, name: str, fn: Callable) -> Callable:
+        @functools.wraps(fn)
+        def _profiled_fn(*args, **kwargs):
+            if not self._is_active:
+                return fn(*args, **kwargs)
+            start = self._now()
+            result = fn(*args, **kwargs)
+            self._add_span(name, start)
+            return result
+
+        return _profiled_fn
+
+    def _patch(self, obj: Any, attr: str, name: str) -> None:
+        # instance attributes are restored, others are deleted
+        previous = obj.__dict__.get(attr)
+        self._patches.append((obj, attr, previous))
+        setattr(obj, attr, self._wrap(name, getattr(obj, attr)))
+
+    def _on_forward_start(self, *args) -> None:
+        if self._is_active:
+            self._forward_starts.append(self._now())
+
+    def _on_forward_end(self, *args) -> None:
+        if self._is_active and self._forward_starts:
+            self._add_span("forward", self._forward_starts.pop())
+
+    def _get_models(self) -> List[torch.nn.Module]:
+        model = self._runner.model
+        if isinstance(model, dict):
+            return list(model.values())
+        return [model] if isinstance(model, torch.nn.Module) else []
+
+    def _get_optimizers(self) -> List[torch.optim.Optimizer]:
+        optimizer = self._runner.optimizer
+        if isinstance(optimizer, dict):
+            return list(optimizer.values())
+        return [optimizer] if optimizer is not None else []
+
+    def _wrap_dispatch_table(self) -> None:
+        runner = self._runner
+        self._dispatch_table = getattr(
+            runner, "_callbacks_dispatch_table", None
+        )
+        dispatch_table = self._dispatch_table or get_callbacks_dispatch_table(
+            runner.callbacks
+        )
+        names = {
+            id(callback): name for name, callback in runner.callbacks.items()
+        }
+        profiled_table = {}
+        for event, handlers in dispatch_table.items():
+            profiled_handlers = []
+            for handler in handlers:
+                callback = getattr(handler, "__self__", None)
+                if callback is self or id(callback) not in names:
+                    profiled_handlers.append(handler)
+                    continue
+                name = f"{names[id(callback)]}/{event}"
+                profiled_handlers.append(self._wrap(name, handler))
+            profiled_table[event] = profiled_handlers
+        runner._callbacks_dispatch_table = profiled_table
+
+    def _restore(self) -> None:
+        self._is_active = False
+        for handle in self._hooks:
+            handle.remove()
+        for obj, attr, previous in reversed(self._patches):
+            if previous is None:
+                delattr(obj, attr)
+            else:
+                setattr(obj, attr, previous)
+        if self._runner is not None and self._patches:
+            self._runner._callbacks_dispatch_table = self._dispatch_table
+        self._hooks, self._patches = [], []
+        self._dispatch_table = None
+        self._runner = None
+
+    def _get_elapsed(
+        self, start: _Timestamp, end: _Timestamp
+    ) -> Tuple[float, float]:
+        # span offset from the loader start and duration, in seconds
+        if self._use_cuda:
+            offset = self._origin.elapsed_time(start) / 1e3
+            duration = start.elapsed_time(end) / 1e3
+            self._free_events.extend((start, end))
+        else:
+            offset, duration = start - self._origin, end - start
+        return offset, duration
+
+    def _resolve(self, blocking: bool = False) -> None:
+        num_resolved = 0
+        if blocking and self._use_cuda:
+            torch.cuda.synchronize()
+        for name, step, start, end in self._pending:
+            # CUDA events complete in the stream order
+            if self._use_cuda and not blocking and not end.query():
+                break
+            offset, duration = self._get_elapsed(start, end)
+            self._durations[name].append(duration)
+            is_traced = (
+                self.trace_start_batch
+                <= step
+                < self.trace_start_batch + self.trace_num_batches
+            )
+            if self._is_tracing and is_traced:
+                self._trace_events.append(
+                    {
+                        "name": name,
+                        "ph": "X",
+                        "ts": offset * 1e6,
+                        "dur": duration * 1e6,
+                        "pid": 0,
+                        "tid": 0,
+                        "args": {"batch": step},
+                    }
+                )
+            num_resolved += 1
+        del self._pending[:num_resolved]
+
+    def _write_trace(self, runner: "IRunner") -> None:
+        process_name = {
+            "name": "process_name",
+            "ph": "M",
+            "pid": 0,
+            "tid": 0,
+            "args": {"name": f"{runner.stage}/{runner.loader_key}"},
+        }
+        dirname = os.path.dirname(self.trace_path)
+        if dirname:
+            os.makedirs(dirname, exist_ok=True)
+        with open(self.trace_path, "w") as fout:
+            json.dump(
+                {
+                    "traceEvents": [process_name] + self._trace_events,
+                    "displayTimeUnit": "ms",
+                },
+                fout,
+            )
+        self._trace_events = []
+        self._is_traced = True
+
+    def on_stage_start(self, runner: "IRunner") -> None:
+        """Patches the runner methods and callbacks handlers.
+
+        Args:
+            runner: current runner
+        """
+        self._restore()
+        self._runner = runner
+        self._wrap_dispatch_table()
+        self._patch(runner, "_run_batch", "batch")
+        self._patch(runner, "_handle_device", "handle_device")
+        self._patch(runner, "_handle_batch", "handle_batch")
+        self._patch(torch.autograd, "backward", "backward")
+        for optimizer in self._get_optimizers():
+            self._patch(optimizer, "step", "optimizer_step")
+        for model in self._get_models():
+            self._hooks.append(
+                model.register_forward_pre_hook(self._on_forward_start)
+            )
+            self._hooks.append(
+                model.register_forward_hook(self._on_forward_end)
+            )
+
+    def on_loader_start(self, runner: "IRunner") -> None:
+        """Starts the loader profiling.
+
+        Args:
+            runner: current runner
+        """
+        device = torch.device(runner.device)
+        self._use_cuda = (
+            self.use_cuda_events
+            and device.type == "cuda"
+            and torch.cuda.is_available()
+        )
+        self._pending, self._forward_starts = [], []
+        self._durations = defaultdict(list)
+        self._is_tracing = (
+            self.trace_path is not None
+            and not self._is_traced
+            and self.trace_loader in (None, runner.loader_key)
+        )
+        self._origin = self._now()
+        self._is_active = True
+
+    def on_batch_end(self, runner: "IRunner") -> None:
+        """Resolves the completed spans.
+
+        Args:
+            runner: current runner
+        """
+        self._resolve(blocking=False)
+
+    def on_loader_end(self, runner: "IRunner") -> None:
+        """Logs the spans durations percentiles.
+
+        Args:
+            runner: current runner
+        """
+        self._is_active = False
+        self._resolve(blocking=True)
+        for name, durations in self._durations.items():
+            values = np.percentile(durations, self.percentiles)
+            for percentile, value in zip(self.percentiles, values):
+                key = f"_profiler/{name}/p{percentile:g}"
+                runner.loader_metrics[key] = float(value)
+        if self._is_tracing and self._trace_events:
+            self._write_trace(runner)
+        self._free_events = []
+
+    def on_stage_end(self, runner: "IRunner") -> None:
+        """Restores the patched methods.
+
+        Args:
+            runner: current runner
+        """
+        self._restore()
+
+    def on_exception(self, runner: "IRunner") -> None:
+        """Restores the patched methods.
+
+        Args:
+            runner: current runner
+        """
+        self._restore()
+
+
+__all__ = ["ProfilerCallback"]
@@ -0,0 +1,120 @@
+from typing import TYPE_CHECKING, Union
+import os
+
+import torch
+
+from catalyst.core.callback import Callback, CallbackNode, CallbackOrder
+from catalyst.utils.distributed import get_nn_from_ddp_module
+from catalyst.utils.swa import WeightsAverager
+
+if TYPE_CHECKING:
+    from catalyst.core.runner import IRunner
+
+
+class WeightsAveragingCallback(Callback):
+    """
+    Averages model weights during the training
+    (Stochastic Weight Averaging or EMA of the weights)
+    without writing the intermediate checkpoints.
+
+    The running average is kept in float64 on the ``storage_device``
+    and saved to ``{logdir}/checkpoints/{filename}`` at the stage end.
+
+    .. note::
+        BatchNorm statistics are averaged like the other buffers,
+        you may need to recompute them for the averaged model.
+    """
+
+    def __init__(
+        self,
+        mode: str = "mean",
+        decay: float = None,
+        start_epoch: int = 1,
+        period: int = 1,
+        update_on_batch: bool = False,
+        model_key: str = None,
+        storage_device: Union[str, torch.device] = "cpu",
+        filename: str = "swa.pth",
+        load_on_stage_end: bool = False,
+    ):
+        """
+        Args:
+            mode: averaging mode, ``"mean"`` or ``"ema"``
+            decay: EMA decay, required for ``"ema"`` mode
+            start_epoch: first epoch of the stage to average weights from
+            period: update the average every ``period`` epochs
+                (or train batches if ``update_on_batch``)
+            update_on_batch: flag to update the average
+                on train batches instead of epochs
+            model_key: key of the model to average
+                if ``runner.model`` is a dict
+            storage_device: device to keep the running average on
+            filename: checkpoint filename to save the averaged weights to,
+                if None, the weights are not saved
+            load_on_stage_end: flag to load the averaged weights
+                to the model at the stage end
+        """
+        super().__init__(order=CallbackOrder.external, node=CallbackNode.all)
+        if period < 1:
+            raise ValueError(f"period should be positive, got {period}")
+        self.start_epoch = start_epoch
+        self.period = period
+        self.update_on_batch = update_on_batch
+        self.model_key = model_key
+        self.filename = filename
+        self.load_on_stage_end = load_on_stage_end
+        self.averager = WeightsAverager(
+            mode=mode, decay=decay, device=storage_device
+        )
+        self._counter = 0
+
+    def _get_model(self, runner: "IRunner") -> torch.nn.Module:
+        model = runner.model
+        if self.model_key is not None:
+            model = model[self.model_key]
+        return get_nn_from_ddp_module(model)
+
+    def _update(self, runner: "IRunner") -> None:
+        if runner.epoch < self.start_epoch:
+            return
+        self._counter += 1
+        if self._counter % self.period == 0:
+            self.averager.update(self._get_model(runner).state_dict())
+
+    def on_stage_start(self, runner: "IRunner") -> None:
+        """Resets the running average."""
+        self.averager.reset()
+        self._counter = 0
+
+    def on_batch_end(self, runner: "IRunner") -> None:
+        """Updates the average on train batches."""
+        if self.update_on_batch and runner.is_train_loader:
+            self._update(runner)
+
+    def on_epoch_end(self, runner: "IRunner") -> None:
+        """Updates the average on epoch end."""
+        if not self.update_on_batch:
+            self._update(runner)
+
+    def on_stage_end(self, runner: "IRunner") -> None:
+        """Saves and loads the averaged weights."""
+        if self.averager.num_updates == 0:
+            return
+        weights = self.averager.get_weights()
+        need_save = (
+            self.filename is not None
+            and runner.logdir is not None
+            and not runner.is_distributed_worker
+        )
+        if need_save:
+            checkpoints_dir = f"{runner.logdir}/checkpoints"
+            os.makedirs(checkpoints_dir, exist_ok=True)
+            torch.save(
+                {"model_state_dict": weights},
+                f"{checkpoints_dir}/{self.filename}",
+            )
+        if self.load_on_stage_end:
+            self._get_model(runner).load_state_dict(weights)
+
+
+__all__ = ["WeightsAveragingCallback"]
@@ -284,3 +284,68 @@ def test_load_on_stage_start_with_empty_dict():
     assert os.path.isfile(checkpoint + "/last_full.pth")
 
     shutil.rmtree(logdir, ignore_errors=True)
+
+
+def test_async_save():
+    # experiment_setup
+    logdir = "./logs/checkpoint_callback_async"
+    checkpoint = logdir + "/checkpoints"
+
+    # data
+    num_samples, num_features = int(1e3), int(1e1)
+    X = torch.rand(num_samples, num_features)
+    y = torch.randint(0, 5, size=[num_samples])
+    dataset = TensorDataset(X, y)
+    loader = DataLoader(dataset, batch_size=32, num_workers=1)
+    loaders = {"train": loader, "valid": loader}
+
+    # model, criterion, optimizer, scheduler
+    model = torch.nn.Linear(num_features, 5)
+    criterion = torch.nn.CrossEntropyLoss()
+    optimizer = torch.optim.Adam(model.parameters())
+    runner = dl.SupervisedRunner()
+
+    n_epochs = 3
+    runner.train(
+        model=model,
+        criterion=criterion,
+        optimizer=optimizer,
+        loaders=loaders,
+        logdir=logdir,
+        num_epochs=n_epochs,
+        verbose=False,
+        callbacks=[
+            dl.CheckpointCallback(
+                save_n_best=2, load_on_stage_end="last", async_save=True
+            ),
+            dl.CheckRunCallback(num_epoch_steps=n_epochs),
+        ],
+    )
+
+    assert os.path.isfile(checkpoint + "/train.3.pth")
+    assert os.path.isfile(checkpoint + "/train.3_full.pth")
+    assert os.path.isfile(checkpoint + "/best.pth")
+    assert os.path.isfile(checkpoint + "/best_full.pth")
+    assert os.path.isfile(checkpoint + "/last_full.pth")
+    assert not any(
+        filename.endswith(".tmp") for filename in os.listdir(checkpoint)
+    )
+    last_state = torch.load(checkpoint + "/last.pth")["model_state_dict"]
+    assert torch.equal(last_state["weight"], model.weight.detach())
+
+    shutil.rmtree(logdir, ignore_errors=True)
+
+
+def test_async_save_exception_is_logged(caplog):
+    def failed_write():
+        raise IOError("disk is full")
+
+    class _Runner:
+        exception = None  # not an exception, so only the writer is flushed
+
+    callback = dl.CheckpointCallback(async_save=True)
+    callback._writer.submit(failed_write)
+    callback.on_exception(_Runner())
+
+    assert "Asynchronous checkpoint writing failed" in caplog.text
+    assert "disk is full" in caplog.text
@@ -1,5 +1,6 @@
 # flake8: noqa
 import os
+import shutil
 
 import pytest
 
@@ -7,6 +8,7 @@ import torch
 from torch.utils.data import DataLoader, TensorDataset
 
 from catalyst.callbacks.logging import CSVLogger
+from catalyst.core.callback import Callback, CallbackOrder
 from catalyst.dl import SupervisedRunner
 
 
@@ -46,3 +48,87 @@ def test_logger():
                 assert "step,loss" in line
             length += 1
         assert length == 9
+
+
+def test_batch_logger():
+    logdir = "./logdir/test_csv_batch"
+    num_samples, num_features = 320, 10
+    X, y = torch.rand(num_samples, num_features), torch.rand(num_samples)
+    loader = DataLoader(TensorDataset(X, y), batch_size=32)
+    loaders = {"train": loader, "valid": loader}
+
+    model = torch.nn.Linear(num_features, 1)
+    criterion = torch.nn.MSELoss()
+    optimizer = torch.optim.Adam(model.parameters())
+
+    runner = SupervisedRunner()
+    runner.train(
+        model=model,
+        criterion=criterion,
+        optimizer=optimizer,
+        callbacks=[
+            CSVLogger(
+                log_on_batch_end=True,
+                log_batch_period=2,
+                batch_aggregation="mean",
+                buffer_size=3,
+            )
+        ],
+        loaders=loaders,
+        logdir=logdir,
+        num_epochs=2,
+        verbose=False,
+    )
+    path = os.path.join(logdir, "train_log", f"batch_logs_{runner.stage}.csv")
+    with open(path) as fin:
+        lines = fin.read().splitlines()
+    assert lines[0].startswith("step,") and "loss" in lines[0]
+    # 10 batches per epoch, every 2 batches are logged as one row
+    assert len(lines) == 1 + 2 * 5
+    steps = [int(line.split(",")[0]) for line in lines[1:]]
+    assert steps[:5] == [64, 128, 192, 256, 320]
+    assert steps == sorted(steps)
+    shutil.rmtree(logdir, ignore_errors=True)
+
+
+def test_batch_logger_exception():
+    class _FailingCallback(Callback):
+        def __init__(self):
+            super().__init__(CallbackOrder.external)
+
+        def on_batch_end(self, runner):
+            if runner.loader_batch_step == 4:
+                raise RuntimeError("training failed")
+
+    logdir = "./logdir/test_csv_batch_exception"
+    num_samples, num_features = 320, 10
+    X, y = torch.rand(num_samples, num_features), torch.rand(num_samples)
+    loader = DataLoader(TensorDataset(X, y), batch_size=32)
+    loaders = {"train": loader, "valid": loader}
+
+    model = torch.nn.Linear(num_features, 1)
+    criterion = torch.nn.MSELoss()
+    optimizer = torch.optim.Adam(model.parameters())
+
+    runner = SupervisedRunner()
+    with pytest.raises(RuntimeError, match="training failed"):
+        runner.train(
+            model=model,
+            criterion=criterion,
+            optimizer=optimizer,
+            callbacks=[
+                CSVLogger(log_on_batch_end=True, buffer_size=1024),
+                _FailingCallback(),
+            ],
+            loaders=loaders,
+            logdir=logdir,
+            num_epochs=2,
+            verbose=False,
+        )
+
+    path = os.path.join(logdir, "train_log", f"batch_logs_{runner.stage}.csv")
+    with open(path) as fin:
+        lines = fin.read().splitlines()
+    # the batch metrics before the exception are written
+    assert len(lines) == 1 + 5
+    shutil.rmtree(logdir, ignore_errors=True)
@@ -0,0 +1,66 @@
+# flake8: noqa
+import shutil
+
+import torch
+from torch.utils.data import DataLoader, TensorDataset
+
+from catalyst.callbacks.metric import MetricManagerCallback
+from catalyst.core.callback import Callback, CallbackOrder
+from catalyst.dl import SupervisedRunner
+
+
+class BatchMetricsCheckerCallback(Callback):
+    def __init__(self):
+        super().__init__(CallbackOrder.logging)
+        self.materialized_steps = []
+
+    def on_loader_start(self, runner):
+        self.materialized_steps = []
+
+    def on_batch_end(self, runner):
+        if len(runner.batch_metrics) > 0:
+            assert isinstance(runner.batch_metrics["loss"], float)
+            self.materialized_steps.append(runner.loader_batch_step)
+
+    def on_loader_end(self, runner):
+        # 10 batches with period 4 -> 4th, 8th and the last batches
+        assert self.materialized_steps == [3, 7, 9]
+        assert isinstance(runner.loader_metrics["loss"], float)
+
+
+def test_lazy_batch_metrics():
+    logdir = "./logs/metric_manager"
+    num_samples, num_features = int(320), int(1e1)
+    X, y = torch.rand(num_samples, num_features), torch.rand(num_samples, 1)
+    dataset = TensorDataset(X, y)
+    loader = DataLoader(dataset, batch_size=32, num_workers=1)
+    loaders = {"train": loader, "valid": loader}
+
+    model = torch.nn.Linear(num_features, 1)
+    criterion = torch.nn.MSELoss()
+    optimizer = torch.optim.Adam(model.parameters())
+
+    runner = SupervisedRunner()
+    runner.train(
+        model=model,
+        criterion=criterion,
+        optimizer=optimizer,
+        loaders=loaders,
+        logdir=logdir,
+        num_epochs=2,
+        callbacks={
+            "_metrics": MetricManagerCallback(
+                lazy_batch_metrics=True, batch_metrics_period=4
+            ),
+            "checker": BatchMetricsCheckerCallback(),
+        },
+    )
+
+    # valid loader runs without gradients,
+    # so lazy loader mean should be equal to the usual one
+    valid_loss = runner.epoch_metrics["valid_loss"]
+    with torch.no_grad():
+        expected_loss = criterion(model(X), y).item()
+    assert abs(valid_loss - expected_loss) < 1e-5
+
+    shutil.rmtree(logdir, ignore_errors=True)
@@ -0,0 +1,81 @@
+# flake8: noqa
+import json
+import os
+import shutil
+
+import torch
+from torch.utils.data import DataLoader, TensorDataset
+
+import catalyst.dl as dl
+
+
+def test_profiler_callback():
+    logdir = "./logs/profiler_callback"
+    trace_path = os.path.join(logdir, "trace.json")
+
+    num_samples, num_features = 320, 10
+    X = torch.rand(num_samples, num_features)
+    y = torch.randint(0, 5, size=[num_samples])
+    loader = DataLoader(TensorDataset(X, y), batch_size=32)
+    loaders = {"train": loader, "valid": loader}
+
+    model = torch.nn.Linear(num_features, 5)
+    criterion = torch.nn.CrossEntropyLoss()
+    optimizer = torch.optim.Adam(model.parameters())
+    backward_fn = torch.autograd.backward
+
+    runner = dl.SupervisedRunner()
+    runner.train(
+        model=model,
+        criterion=criterion,
+        optimizer=optimizer,
+        loaders=loaders,
+        logdir=logdir,
+        num_epochs=1,
+        verbose=False,
+        callbacks=[
+            dl.ProfilerCallback(
+                trace_path=trace_path,
+                trace_loader="train",
+                trace_start_batch=2,
+                trace_num_batches=3,
+            )
+        ],
+    )
+
+    metrics = runner.epoch_metrics
+    for span in (
+        "batch",
+        "handle_device",
+        "handle_batch",
+        "forward",
+        "backward",
+        "optimizer_step",
+        "_criterion/on_batch_end",
+        "_optimizer/on_batch_end",
+    ):
+        for percentile in (50, 90, 99):
+            assert metrics[f"train__profiler/{span}/p{percentile}"] >= 0
+    assert metrics["train__profiler/batch/p50"] >= (
+        metrics["train__profiler/forward/p50"]
+    )
+    # no backward and optimizer step for the valid loader
+    assert "valid__profiler/forward/p50" in metrics
+    assert "valid__profiler/backward/p50" not in metrics
+
+    # patched methods are restored after the stage
+    assert torch.autograd.backward is backward_fn
+    assert "step" not in optimizer.__dict__
+    assert "_run_batch" not in runner.__dict__
+    assert not model._forward_hooks and not model._forward_pre_hooks
+
+    with open(trace_path) as fin:
+        trace = json.load(fin)
+    spans = [
+        event for event in trace["traceEvents"] if event["ph"] == "X"
+    ]
+    assert {span["args"]["batch"] for span in spans} == {2, 3, 4}
+    assert sum(span["name"] == "batch" for span in spans) == 3
+    assert all(span["dur"] >= 0 for span in spans)
+
+    shutil.rmtree(logdir, ignore_errors=True)
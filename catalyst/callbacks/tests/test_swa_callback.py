@@ -0,0 +1,27 @@
+# flake8: noqa
+from unittest.mock import MagicMock
+
+import torch
+
+from catalyst.callbacks import WeightsAveragingCallback
+
+
+def test_weights_averaging_callback():
+    """Tests WeightsAveragingCallback."""
+    model = torch.nn.Linear(2, 1)
+    runner = MagicMock()
+    runner.model = model
+    runner.is_distributed_worker = False
+    runner.logdir = None
+
+    callback = WeightsAveragingCallback(start_epoch=2, load_on_stage_end=True)
+    callback.on_stage_start(runner)
+    for epoch, value in enumerate([1.0, 2.0, 4.0], start=1):
+        runner.epoch = epoch
+        with torch.no_grad():
+            model.weight.fill_(value)
+        callback.on_epoch_end(runner)
+    callback.on_stage_end(runner)
+
+    assert callback.averager.num_updates == 2
+    assert torch.allclose(model.weight, torch.full_like(model.weight, 3.0))
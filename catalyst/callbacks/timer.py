@@ -1,4 +1,5 @@
 from typing import TYPE_CHECKING
+from time import time
 
 from catalyst.core.callback import Callback, CallbackNode, CallbackOrder
 from catalyst.tools.time_manager import TimeManager
@@ -16,6 +17,7 @@ class TimerCallback(Callback):
         """Initialisation for TimerCallback."""
         super().__init__(order=CallbackOrder.metric + 1, node=CallbackNode.all)
         self.timer = TimeManager()
+        self._loader_start_time = None
 
     def on_loader_start(self, runner: "IRunner") -> None:
         """Loader start hook.
@@ -26,6 +28,7 @@ class TimerCallback(Callback):
         self.timer.reset()
         self.timer.start("_timer/batch_time")
         self.timer.start("_timer/data_time")
+        self._loader_start_time = time()
 
     def on_loader_end(self, runner: "IRunner") -> None:
         """Loader end hook.
@@ -41,6 +44,12 @@ class TimerCallback(Callback):
         Args:
             runner: current runner
         """
+        if runner.loader_batch_step == 0:
+            # loader workers startup and the first batch loading,
+            # near zero for the persistent workers
+            runner.loader_metrics["_timer/loader_startup_time"] = (
+                time() - self._loader_start_time
+            )
         self.timer.stop("_timer/data_time")
         self.timer.start("_timer/model_time")
 
@@ -68,6 +68,19 @@ Examples:
             --batch-size=8 \\
             --num-workers=16 \\
             --verbose
+
+    6. **pack-records** packs the dataset files into the shard files
+    for the random-access ``catalyst.data.RecordDataset``
+
+    .. code:: bash
+
+        $ catalyst-contrib pack-records \\
+            --in-csv=./data/dataset.csv \\
+            --file-cols=filepath \\
+            --rootpath=./data/dataset \\
+            --out-dir=./data/records \\
+            --shard-size=1024 \\
+            --num-workers=8
 """
 
 from argparse import ArgumentParser, RawTextHelpFormatter
@@ -109,11 +122,13 @@ try:
     import scipy  # noqa: F401 F811
     from catalyst.contrib.scripts import (
         find_thresholds,
+        pack_records,
         tag2label,
         split_dataframe,
     )
 
     COMMANDS["find-thresholds"] = find_thresholds
+    COMMANDS["pack-records"] = pack_records
     COMMANDS["tag2label"] = tag2label
     COMMANDS["split-dataframe"] = split_dataframe
 except ModuleNotFoundError as ex:
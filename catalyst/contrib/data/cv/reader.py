@@ -38,7 +38,10 @@ class ImageReader(IReader):
         Returns:
             np.ndarray: Image
         """
-        image_name = str(element[self.input_key])
+        image_name = element[self.input_key]
+        # packed records contain the encoded image instead of the path
+        if not isinstance(image_name, bytes):
+            image_name = str(image_name)
         img = imread(
             image_name, rootpath=self.rootpath, grayscale=self.grayscale
         )
@@ -82,7 +85,9 @@ class MaskReader(IReader):
         Returns:
             np.ndarray: Mask
         """
-        mask_name = str(element[self.input_key])
+        mask_name = element[self.input_key]
+        if not isinstance(mask_name, bytes):
+            mask_name = str(mask_name)
         mask = mimread(mask_name, rootpath=self.rootpath, clip_range=self.clip)
 
         output = {self.output_key: mask}
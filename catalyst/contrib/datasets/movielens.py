@@ -1,16 +1,14 @@
-import itertools
 import os
 
 import numpy as np
-import scipy.sparse as sp
 
 import torch
-from torch.utils.data import Dataset
 
 from catalyst.contrib.datasets.functional import download_and_extract_archive
+from catalyst.data.dataset.interactions import InteractionsDataset
 
 
-class MovieLens(Dataset):
+class MovieLens(InteractionsDataset):
     """
     MovieLens data sets were collected by the GroupLens Research Project
     at the University of Minnesota.
@@ -48,6 +46,12 @@ class MovieLens(Dataset):
     If you have any further questions or comments, please contact GroupLens
     <grouplens-info@cs.umn.edu>.
     http://files.grouplens.org/datasets/movielens/ml-100k-README.txt
+
+    The interaction matrices are stored as the sparse tensors
+    and the users rows are served as the sparse slices,
+    please follow :py:class:`catalyst.data.InteractionsDataset` docs
+    and use :py:class:`catalyst.data.InteractionsCollateFn`
+    for the batching.
     """
 
     resources = (
@@ -94,22 +98,20 @@ class MovieLens(Dataset):
         else:
             data_file = self.test_file
 
-        self.data = torch.load(os.path.join(self.processed_folder, data_file))
-
-    def __getitem__(self, user_index):
-        """
-        Args:
-            user_index (int): User index [0, 942]
-        Returns:
-            tensor: (items) item's ranking for the user with index user_index
-        """
-        return self.data[user_index]
-
-    def __len__(self):
-        """@TODO: Docs. Contribution is welcome.
-        The length of the loader
-        """
-        return self.dimensions[0]
+        data = torch.load(os.path.join(self.processed_folder, data_file))
+        if not data.is_sparse:
+            # processed files of the previous versions are dense,
+            # the missing interactions are zeros there
+            data = data.to_sparse()
+        interactions = InteractionsDataset.from_sparse_tensor(data)
+        # only the CSR arrays are kept
+        del data
+        super().__init__(
+            interactions.indptr,
+            interactions.indices,
+            interactions.values,
+            num_items=interactions.num_items,
+        )
 
     @property
     def raw_folder(self):
@@ -181,29 +183,21 @@ class MovieLens(Dataset):
         Args:
             rows (int): rows of the oevrall dataset
             cols (int): columns of the overall dataset
-            data (generator object): generator of
-            the data object
+            data (np.ndarray): [num_ratings; 4] parsed
+                (uid, iid, rating, timestamp) data
         Returns:
             interaction_matrix (torch.sparse.Float):
             sparse user2item interaction matrix
         """
-        mat = sp.lil_matrix((rows, cols), dtype=np.int32)
-
-        for uid, iid, rating, _ in data:
-            if rating >= self.min_rating:
-                mat[uid, iid] = rating
-        coo = mat.tocoo()
-        values = coo.data
-        indices = np.vstack((coo.row, coo.col))
-
-        i = torch.LongTensor(indices)
-        v = torch.FloatTensor(values)
-        shape = coo.shape
-
-        interaction_matrix = torch.sparse.FloatTensor(
-            i, v, torch.Size(shape)
-        ).to_dense()
-        return interaction_matrix
+        interactions = InteractionsDataset.from_coo(
+            users=data[:, 0],
+            items=data[:, 1],
+            values=data[:, 2],
+            num_users=rows,
+            num_items=cols,
+            min_value=self.min_rating,
+        )
+        return interactions.to_sparse_tensor()
 
     def _parse(self, data):
         """
@@ -212,36 +206,28 @@ class MovieLens(Dataset):
         Args:
             data: raw data of the dataset
         Returns:
-            Generator iterator for parsed data
+            np.ndarray: [num_ratings; 4] parsed data
         """
-        for line in data:
-
-            if not line:
-                continue
-
-            uid, iid, rating, timestamp = [int(x) for x in line.split("\t")]
-            yield uid - 1, iid - 1, rating, timestamp
+        lines = [line for line in data if line]
+        parsed = np.array(
+            "\t".join(lines).split("\t"), dtype=np.int64
+        ).reshape(-1, 4)
+        parsed[:, :2] -= 1
+        return parsed
 
     def _get_dimensions(self, train_data, test_data):
         """
         Get the dimensions of the raw dataset
         Args:
-            train_data: (uid, iid, rating, timestamp)
-                Genrator for training data
-            test_data: (uid, iid, rating, timestamp)
-                Genrator for testing data
+            train_data: [num_ratings; 4] (uid, iid, rating, timestamp)
+                parsed training data
+            test_data: [num_ratings; 4] (uid, iid, rating, timestamp)
+                parsed testing data
         Returns:
             The total dimension of the dataset
         """
-        uids = set()
-        iids = set()
-
-        for uid, iid, _, _ in itertools.chain(train_data, test_data):
-            uids.add(uid)
-            iids.add(iid)
-
-        rows = max(uids) + 1
-        cols = max(iids) + 1
+        data = np.concatenate([train_data, test_data])
+        rows, cols = (data[:, :2].max(axis=0) + 1).tolist()
 
         self.dimensions = (rows, cols)
 
@@ -262,16 +248,13 @@ class MovieLens(Dataset):
             genres_raw,
         ) = self._read_raw_movielens_data()
 
-        num_users, num_items = self._get_dimensions(
-            self._parse(train_raw), self._parse(test_raw)
-        )
+        train_data, test_data = self._parse(train_raw), self._parse(test_raw)
+        num_users, num_items = self._get_dimensions(train_data, test_data)
 
         train = self._build_interaction_matrix(
-            num_users, num_items, self._parse(train_raw)
-        )
-        test = self._build_interaction_matrix(
-            num_users, num_items, self._parse(test_raw)
+            num_users, num_items, train_data
         )
+        test = self._build_interaction_matrix(num_users, num_items, test_data)
         assert train.shape == test.shape
 
         with open(
@@ -0,0 +1,114 @@
+import argparse
+
+import pandas as pd
+
+from catalyst.contrib.utils.pandas import (
+    create_dataframe,
+    create_dataset,
+    dataframe_to_list,
+)
+from catalyst.data.dataset.records import write_records
+from catalyst.utils.misc import boolean_flag
+
+
+def build_args(parser):
+    """
+    Constructs the command-line arguments
+    for ``catalyst-contrib pack-records``.
+
+    Args:
+        parser: current parser
+
+    Returns:
+        updated parser
+    """
+    parser.add_argument(
+        "--in-csv", type=str, default=None, help="Path to data in `.csv`."
+    )
+    parser.add_argument(
+        "--in-dir",
+        type=str,
+        default=None,
+        help="Path to directory with dataset, "
+        + "the subdirectories names are used as the tags",
+    )
+    parser.add_argument(
+        "--out-dir",
+        type=str,
+        required=True,
+        help="Path to directory to write the records to",
+    )
+    parser.add_argument(
+        "--file-cols",
+        type=str,
+        default="filepath",
+        help="Columns with the files paths to pack, separated by commas",
+    )
+    parser.add_argument(
+        "--rootpath",
+        type=str,
+        default=None,
+        help="Path to the dataset root directory "
+        + "for the relative files paths",
+    )
+    parser.add_argument(
+        "--tag-column",
+        type=str,
+        default="tag",
+        help="Tag column name for the `--in-dir` dataset",
+    )
+    parser.add_argument(
+        "--shard-size",
+        type=int,
+        default=1024,
+        help="Maximum shard size in megabytes",
+    )
+    parser.add_argument(
+        "--num-workers",
+        "-j",
+        type=int,
+        default=1,
+        help="Number of processes to read the files",
+    )
+    boolean_flag(
+        parser, "recursive", default=False, help="Include subdirs in dataset",
+    )
+    boolean_flag(parser, "verbose", default=False)
+
+    return parser
+
+
+def parse_args():
+    """Parses the command line arguments for the main method."""
+    parser = argparse.ArgumentParser()
+    build_args(parser)
+    args = parser.parse_args()
+    return args
+
+
+def main(args, _=None):
+    """Run the ``catalyst-contrib pack-records`` script."""
+    if args.in_csv is not None:
+        df = pd.read_csv(args.in_csv)
+    elif args.in_dir is not None:
+        dataset = create_dataset(
+            f"{args.in_dir.rstrip('/')}/**", recursive=args.recursive
+        )
+        df = create_dataframe(dataset, columns=[args.tag_column, "filepath"])
+    else:
+        raise ValueError("--in-csv or --in-dir should be specified")
+
+    write_records(
+        dataframe_to_list(df),
+        out_dir=args.out_dir,
+        file_columns=args.file_cols.strip(",").split(","),
+        rootpath=args.rootpath,
+        shard_size=args.shard_size * 2 ** 20,
+        num_workers=args.num_workers,
+        verbose=args.verbose,
+    )
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    main(args)
@@ -1,7 +1,10 @@
 # flake8: noqa
 from catalyst.contrib.tools.tensorboard import (
     EventReadingException,
+    EventsFileIndex,
     EventsFileReader,
+    get_events_file_index,
+    read_scalars,
     SummaryItem,
     SummaryReader,
     SummaryWriter,
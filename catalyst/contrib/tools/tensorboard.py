@@ -1,6 +1,20 @@
-from typing import BinaryIO, Optional, Union
+from typing import (
+    Any,
+    BinaryIO,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TYPE_CHECKING,
+    Union,
+)
 from collections import namedtuple
 from collections.abc import Iterable
+from functools import partial
+import hashlib
+import mmap
+import os
 from pathlib import Path
 import struct
 
@@ -10,8 +24,28 @@ from tensorboardX import SummaryWriter as tensorboardX_SummaryWriter
 from tensorboardX.crc32c import crc32c
 from tensorboardX.proto.event_pb2 import Event
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 SummaryWriter = tensorboardX_SummaryWriter
 
+SCALARS_DTYPE = np.dtype(
+    [("step", np.int64), ("wall_time", np.float64), ("value", np.float64)]
+)
+# summary value field number -> value type
+_VALUE_TYPES = {
+    2: "scalar",
+    4: "image",
+    5: "histogram",
+    6: "audio",
+    8: "tensor",
+}
+_INDEX_VERSION = 2
+# number of the indexed head and tail bytes to detect the file rewrite
+_FINGERPRINT_SIZE = 1024
+_INDEX_CACHE: Dict[str, "EventsFileIndex"] = {}
+_Path = Union[str, Path]
+
 
 def _u32(x):
     return x & 0xFFFFFFFF
@@ -224,9 +258,439 @@ class SummaryReader(Iterable):
                 )
 
 
+def _read_varint(buffer: Any, pos: int) -> Tuple[int, int]:
+    result, shift = 0, 0
+    while True:
+        byte = buffer[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift  # noqa: WPS362
+        if not byte & 0x80:  # noqa: WPS465
+            return result, pos
+        shift += 7
+
+
+def _skip_field(buffer: Any, pos: int, wire_type: int) -> int:
+    if wire_type == 0:
+        return _read_varint(buffer, pos)[1]
+    elif wire_type == 1:
+        return pos + 8
+    elif wire_type == 2:
+        length, pos = _read_varint(buffer, pos)
+        return pos + length
+    elif wire_type == 5:
+        return pos + 4
+    raise EventReadingException(f"Unsupported wire type {wire_type}")
+
+
+def _scan_summary_value(buffer: Any, pos: int, end: int) -> Tuple[str, str]:
+    tag, value_type = "", "unknown"
+    while pos < end:
+        key, pos = _read_varint(buffer, pos)
+        field, wire_type = key >> 3, key & 0x07  # noqa: WPS465
+        if field == 1 and wire_type == 2:
+            length, pos = _read_varint(buffer, pos)
+            tag = bytes(buffer[pos : pos + length]).decode("utf-8")
+            pos += length
+            continue
+        value_type = _VALUE_TYPES.get(field, value_type)
+        pos = _skip_field(buffer, pos, wire_type)
+    return tag, value_type
+
+
+def _scan_event(buffer: Any, pos: int, end: int) -> List[Tuple[str, str]]:
+    """Lists ``(tag, type)`` of the event summary values
+    with the protobuf wire format scan, without the event decoding."""
+    values = []
+    while pos < end:
+        key, pos = _read_varint(buffer, pos)
+        field, wire_type = key >> 3, key & 0x07  # noqa: WPS465
+        # Event.summary
+        if field != 5 or wire_type != 2:
+            pos = _skip_field(buffer, pos, wire_type)
+            continue
+        length, pos = _read_varint(buffer, pos)
+        summary_end = pos + length
+        while pos < summary_end:
+            key, pos = _read_varint(buffer, pos)
+            # Summary.value
+            if key != 0x0A:
+                pos = _skip_field(buffer, pos, key & 0x07)  # noqa: WPS465
+                continue
+            length, pos = _read_varint(buffer, pos)
+            values.append(_scan_summary_value(buffer, pos, pos + length))
+            pos += length
+    return values
+
+
+def _check_crc(buffer: Any, start: int, end: int) -> None:
+    checksum = struct.unpack_from("<I", buffer, end)[0]
+    checksum_computed = _masked_crc32c(bytes(buffer[start:end]))
+    if checksum != checksum_computed:
+        raise EventReadingException(
+            f"Invalid checksum. {checksum} != {checksum_computed}"
+        )
+
+
+class EventsFileIndex(object):
+    """
+    Offsets index of the Tensorboard events file records
+    keyed by the summary values tag and type,
+    so only the records of the requested tags are decoded.
+
+    The file is memory-mapped and the records are scanned
+    without the protobuf decoding.
+    ``update`` indexes only the records appended since the last update,
+    the incomplete last record (of the file being written) is skipped
+    till the next update.
+    The file is reindexed if it was replaced (its inode changed)
+    or rewritten (the indexed head or tail bytes changed).
+
+    Example:
+        >>> index = EventsFileIndex("./logs/train_log/events.out.tfevents.1")
+        >>> index.update().get_tags("scalar")
+        ['loss/batch', 'loss/epoch', 'lr/batch']
+        >>> index.read_scalars(["loss/epoch"])["loss/epoch"]["value"]
+        array([0.61, 0.43, 0.37])
+    """
+
+    def __init__(self, path: _Path, verify_checksums: bool = False):
+        """
+        Args:
+            path: events file path
+            verify_checksums: flag to verify the records checksums
+                on the indexing, the checksums computation is slow,
+                so the verification is skipped by default
+        """
+        self.path = str(path)
+        self.verify_checksums = verify_checksums
+        self._reset()
+
+    def _reset(self) -> None:
+        # number of the indexed bytes
+        self.end = 0
+        # file inode and md5 of the indexed head and tail bytes
+        self.inode = -1
+        self.fingerprint = ""
+        self.keys: List[Tuple[str, str]] = []
+        self._key_ids: Dict[Tuple[str, str], int] = {}
+        # record data offset and size, key and value position in summary
+        self.offsets = np.empty(0, dtype=np.int64)
+        self.sizes = np.empty(0, dtype=np.int64)
+        self.key_ids = np.empty(0, dtype=np.int32)
+        self.value_ids = np.empty(0, dtype=np.int32)
+
+    def _get_key_id(self, key: Tuple[str, str]) -> int:
+        key_id = self._key_ids.get(key)
+        if key_id is None:
+            key_id = self._key_ids[key] = len(self.keys)
+            self.keys.append(key)
+        return key_id
+
+    def _scan(self, buffer: Any, size: int) -> None:
+        offsets, sizes, key_ids, value_ids = [], [], [], []
+        pos = self.end
+        while pos + 12 <= size:
+            data_size = struct.unpack_from("<Q", buffer, pos)[0]
+            data_start = pos + 12
+            data_end = data_start + data_size
+            if data_end + 4 > size:
+                break
+            if self.verify_checksums:
+                _check_crc(buffer, pos, pos + 8)
+                _check_crc(buffer, data_start, data_end)
+            values = _scan_event(buffer, data_start, data_end)
+            for value_id, key in enumerate(values):
+                offsets.append(data_start)
+                sizes.append(data_size)
+                key_ids.append(self._get_key_id(key))
+                value_ids.append(value_id)
+            pos = data_end + 4
+        self.end = pos
+        self.offsets = np.concatenate([self.offsets, offsets]).astype(np.int64)
+        self.sizes = np.concatenate([self.sizes, sizes]).astype(np.int64)
+        self.key_ids = np.concatenate([self.key_ids, key_ids]).astype(np.int32)
+        self.value_ids = np.concatenate([self.value_ids, value_ids]).astype(
+            np.int32
+        )
+
+    def _get_fingerprint(self, buffer: Any) -> str:
+        head_end = min(self.end, _FINGERPRINT_SIZE)
+        tail_start = max(self.end - _FINGERPRINT_SIZE, head_end)
+        return hashlib.md5(  # noqa: S303
+            buffer[:head_end] + buffer[tail_start : self.end]
+        ).hexdigest()
+
+    def update(self) -> "EventsFileIndex":
+        """Indexes the records appended since the last update.
+
+        Returns:
+            EventsFileIndex: self
+        """
+        stat = os.stat(self.path)
+        size = stat.st_size
+        if stat.st_ino != self.inode or size < self.end:
+            # the file was replaced or truncated
+            self._reset()
+            self.inode = stat.st_ino
+        if size == 0:
+            return self
+        with open(self.path, "rb") as fin:
+            with mmap.mmap(fin.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                if self.end > 0 and (
+                    self.fingerprint != self._get_fingerprint(buffer)
+                ):
+                    # the file was rewritten with the same or larger size
+                    self._reset()
+                    self.inode = stat.st_ino
+                if size > self.end:
+                    self._scan(buffer, size)
+                    self.fingerprint = self._get_fingerprint(buffer)
+        return self
+
+    def get_tags(self, value_type: Optional[str] = None) -> List[str]:
+        """
+        Args:
+            value_type: type of the values, e.g. ``scalar``,
+                all the tags if None
+
+        Returns:
+            List[str]: indexed tags
+        """
+        return [
+            tag
+            for tag, tag_type in self.keys
+            if value_type is None or tag_type == value_type
+        ]
+
+    def read_scalars(
+        self, tags: Optional[Sequence[str]] = None
+    ) -> Dict[str, np.ndarray]:
+        """Decodes the scalars of the tags.
+
+        Args:
+            tags: tags to read, all the scalars if None
+
+        Returns:
+            Dict[str, np.ndarray]: tag -> ``SCALARS_DTYPE`` array
+            of the steps, wall times and values
+        """
+        if tags is None:
+            tags = self.get_tags("scalar")
+        key_ids = {
+            tag: self._key_ids[(tag, "scalar")]
+            for tag in tags
+            if (tag, "scalar") in self._key_ids
+        }
+        if not key_ids:
+            return {}
+        with open(self.path, "rb") as fin:
+            with mmap.mmap(fin.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                return {
+                    tag: self._read_key_scalars(buffer, key_id)
+                    for tag, key_id in key_ids.items()
+                }
+
+    def _read_key_scalars(self, buffer: Any, key_id: int) -> np.ndarray:
+        (positions,) = np.nonzero(self.key_ids == key_id)
+        scalars = np.empty(len(positions), dtype=SCALARS_DTYPE)
+        records = zip(
+            self.offsets[positions].tolist(),
+            self.sizes[positions].tolist(),
+            self.value_ids[positions].tolist(),
+        )
+        for row, (offset, size, value_id) in enumerate(records):
+            event = Event.FromString(buffer[offset : offset + size])
+            scalars[row] = (
+                event.step,
+                event.wall_time,
+                event.summary.value[value_id].simple_value,
+            )
+        return scalars
+
+    def state_dict(self) -> Dict[str, np.ndarray]:
+        """
+        Returns:
+            Dict[str, np.ndarray]: index arrays to save
+        """
+        return {
+            "version": np.array(_INDEX_VERSION),
+            "end": np.array(self.end),
+            "inode": np.array(self.inode),
+            "fingerprint": np.array(self.fingerprint),
+            "tags": np.array([tag for tag, _ in self.keys], dtype=str),
+            "types": np.array([type_ for _, type_ in self.keys], dtype=str),
+            "offsets": self.offsets,
+            "sizes": self.sizes,
+            "key_ids": self.key_ids,
+            "value_ids": self.value_ids,
+        }
+
+    def load_state_dict(self, state_dict: Dict[str, np.ndarray]) -> None:
+        """Loads the saved index, the unknown versions are ignored.
+
+        Args:
+            state_dict: index arrays
+        """
+        if int(state_dict["version"]) != _INDEX_VERSION:
+            return
+        self._reset()
+        keys = zip(state_dict["tags"].tolist(), state_dict["types"].tolist())
+        for key in keys:
+            self._get_key_id(key)
+        self.end = int(state_dict["end"])
+        self.inode = int(state_dict["inode"])
+        self.fingerprint = str(state_dict["fingerprint"])
+        self.offsets = state_dict["offsets"]
+        self.sizes = state_dict["sizes"]
+        self.key_ids = state_dict["key_ids"]
+        self.value_ids = state_dict["value_ids"]
+
+
+def _get_index_cache_path(path: _Path, cache_dir: _Path) -> str:
+    path_hash = hashlib.md5(  # noqa: S303
+        os.path.abspath(str(path)).encode("utf-8")
+    ).hexdigest()
+    return os.path.join(str(cache_dir), f"{path_hash}.npz")
+
+
+def get_events_file_index(
+    path: _Path,
+    verify_checksums: bool = False,
+    cache_dir: Optional[_Path] = None,
+) -> EventsFileIndex:
+    """
+    Returns the up-to-date events file index,
+    the index is cached in the process memory
+    and, optionally, in the ``cache_dir``.
+
+    Args:
+        path: events file path
+        verify_checksums: flag to verify the new records checksums
+        cache_dir: directory to cache the indices in
+
+    Returns:
+        EventsFileIndex: events file index
+    """
+    key = os.path.abspath(str(path))
+    index = _INDEX_CACHE.get(key)
+    if index is None:
+        index = EventsFileIndex(path, verify_checksums=verify_checksums)
+        if cache_dir is not None:
+            cache_path = _get_index_cache_path(path, cache_dir)
+            if os.path.isfile(cache_path):
+                with np.load(cache_path) as state_dict:
+                    index.load_state_dict(dict(state_dict))
+        _INDEX_CACHE[key] = index
+    index.verify_checksums = verify_checksums
+
+    fingerprint = index.fingerprint
+    index.update()
+    if cache_dir is not None and index.fingerprint != fingerprint:
+        os.makedirs(str(cache_dir), exist_ok=True)
+        cache_path = _get_index_cache_path(path, cache_dir)
+        with open(cache_path, "wb") as fout:
+            np.savez(fout, **index.state_dict())
+    return index
+
+
+def _read_run_scalars(
+    logdir: _Path,
+    tags: Optional[Sequence[str]],
+    verify_checksums: bool,
+    cache_dir: Optional[_Path],
+) -> Dict[str, np.ndarray]:
+    logdir = Path(logdir)
+    if logdir.is_file():
+        log_files = [logdir]
+    else:
+        log_files = sorted(f for f in logdir.glob("*") if f.is_file())
+
+    chunks: Dict[str, List[np.ndarray]] = {}
+    for file_path in log_files:
+        index = get_events_file_index(
+            file_path, verify_checksums=verify_checksums, cache_dir=cache_dir
+        )
+        for tag, scalars in index.read_scalars(tags).items():
+            chunks.setdefault(tag, []).append(scalars)
+    return {tag: np.concatenate(arrays) for tag, arrays in chunks.items()}
+
+
+def read_scalars(
+    logdirs: Union[_Path, Sequence[_Path], Dict[str, _Path]],
+    tags: Optional[Sequence[str]] = None,
+    verify_checksums: bool = False,
+    cache_dir: Optional[_Path] = None,
+    num_workers: int = 0,
+    as_dataframe: bool = False,
+) -> Union[Dict[str, Dict[str, np.ndarray]], "pd.DataFrame"]:
+    """
+    Reads the scalars of the runs logs with the cached
+    :py:class:`EventsFileIndex`, so only the requested tags are decoded
+    and the next reads of the growing logs index only the new records.
+
+    Args:
+        logdirs: run directory (or the events file),
+            list of the runs or dict with the runs names
+        tags: tags to read, all the scalars if None
+        verify_checksums: flag to verify the records checksums
+        cache_dir: directory to cache the events files indices in
+        num_workers: number of processes to read the runs in parallel
+        as_dataframe: flag to return the ``pandas.DataFrame``
+            with the ``run``, ``tag``, ``step``, ``wall_time``
+            and ``value`` columns
+
+    Returns:
+        run -> tag -> ``SCALARS_DTYPE`` array of the steps,
+        wall times and values, or the ``pandas.DataFrame``
+
+    Example:
+        >>> scalars = read_scalars(
+        >>>     {"baseline": "./logs/baseline/train_log",
+        >>>      "resnet": "./logs/resnet/train_log"},
+        >>>     tags=["loss/epoch"],
+        >>>     num_workers=2,
+        >>> )
+        >>> scalars["resnet"]["loss/epoch"]["value"]
+        array([0.61, 0.43, 0.37])
+    """
+    from catalyst.contrib.utils.parallel import get_pool
+
+    if isinstance(logdirs, dict):
+        runs = {str(name): logdir for name, logdir in logdirs.items()}
+    elif isinstance(logdirs, (str, Path)):
+        runs = {str(logdirs): logdirs}
+    else:
+        runs = {str(logdir): logdir for logdir in logdirs}
+    read_fn = partial(
+        _read_run_scalars,
+        tags=list(tags) if tags is not None else None,
+        verify_checksums=verify_checksums,
+        cache_dir=cache_dir,
+    )
+    with get_pool(min(num_workers, len(runs))) as pool:
+        results = dict(zip(runs.keys(), pool.imap(read_fn, runs.values())))
+    if not as_dataframe:
+        return results
+
+    import pandas as pd
+
+    frames = [
+        pd.DataFrame(scalars).assign(run=run, tag=tag)
+        for run, run_scalars in results.items()
+        for tag, scalars in run_scalars.items()
+    ]
+    columns = ["run", "tag"] + list(SCALARS_DTYPE.names)
+    if not frames:
+        return pd.DataFrame(columns=columns)
+    return pd.concat(frames, ignore_index=True)[columns]
+
+
 # __all__ = [
 #     "EventReadingException",
+#     "EventsFileIndex",
 #     "EventsFileReader",
+#     "get_events_file_index",
+#     "read_scalars",
 #     "SummaryItem",
 #     "SummaryReader",
 #     "SummaryWriter",
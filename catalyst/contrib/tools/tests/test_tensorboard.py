@@ -1,15 +1,20 @@
 # flake8: noqa
 
 from io import BytesIO
+import os
 from pathlib import Path
 from unittest.mock import patch
 
 import numpy as np
 import pytest
 
+from catalyst.contrib.tools import tensorboard
 from catalyst.contrib.tools.tensorboard import (
     EventReadingException,
+    EventsFileIndex,
     EventsFileReader,
+    get_events_file_index,
+    read_scalars,
     SummaryReader,
 )
 
@@ -175,3 +180,124 @@ def test_summary_reader_invalid_type():
     """@TODO: Docs. Contribution is welcome."""
     with pytest.raises(ValueError):
         SummaryReader(".", types=["unknown-type"])
+
+
+def _write_test_data(path, data=None):
+    if data is None:
+        data, _ = _get_test_data()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(str(path), "wb") as fout:
+        fout.write(data)
+    return str(path)
+
+
+def test_events_file_index(tmp_path):
+    """Index and scalars of the test events file."""
+    path = _write_test_data(tmp_path / "events.out.tfevents.1")
+    index = EventsFileIndex(path, verify_checksums=True).update()
+
+    assert index.keys == [("x", "scalar"), ("y", "scalar"), ("z", "image")]
+    assert index.get_tags("scalar") == ["x", "y"]
+    assert index.end == len(_get_test_data()[0])
+
+    scalars = index.read_scalars(["x", "z", "unknown"])
+    assert list(scalars.keys()) == ["x"]
+    assert scalars["x"]["step"].tolist() == [1, 2]
+    assert scalars["x"]["value"].tolist() == [1.0, 2.0]
+    assert np.all(scalars["x"]["wall_time"] > 1557489465)
+    assert index.read_scalars()["y"]["value"].tolist() == [-1.0]
+
+
+def test_events_file_index_checksums(tmp_path):
+    """Checksums are verified only if requested."""
+    data, _ = _get_test_data()
+    data = bytearray(data)
+    data[123] = (data[123] + 1) % 256
+    path = _write_test_data(tmp_path / "events.out.tfevents.1", data)
+
+    with pytest.raises(EventReadingException):
+        EventsFileIndex(path, verify_checksums=True).update()
+    index = EventsFileIndex(path, verify_checksums=False).update()
+    assert index.end == len(data)
+
+
+def test_events_file_index_update(tmp_path):
+    """Only the complete records are indexed, the new ones are appended."""
+    data, _ = _get_test_data()
+    path = _write_test_data(tmp_path / "events.out.tfevents.1", data[:-5])
+    index = EventsFileIndex(path).update()
+    assert index.get_tags() == ["x", "y"]
+    assert index.end < len(data) - 5
+
+    _write_test_data(tmp_path / "events.out.tfevents.1", data)
+    index.update()
+    assert index.get_tags() == ["x", "y", "z"]
+    assert index.read_scalars(["x"])["x"]["value"].tolist() == [1.0, 2.0]
+
+
+def test_events_file_index_rewrite(tmp_path):
+    """Rewritten and replaced files are reindexed."""
+    data, _ = _get_test_data()
+    path = _write_test_data(tmp_path / "events.out.tfevents.1", data)
+    index = EventsFileIndex(path).update()
+    assert index.get_tags() == ["x", "y", "z"]
+
+    # the same size, but another tag
+    rewritten = data.replace(b"\n\x01x\x15", b"\n\x01w\x15")
+    _write_test_data(tmp_path / "events.out.tfevents.1", rewritten)
+    index.update()
+    assert index.get_tags() == ["w", "y", "z"]
+    assert index.read_scalars(["w"])["w"]["value"].tolist() == [1.0, 2.0]
+
+    # new file with the same path
+    os.remove(path)
+    _write_test_data(tmp_path / "events.out.tfevents.1", data)
+    index.update()
+    assert index.get_tags() == ["x", "y", "z"]
+    assert index.read_scalars(["x"])["x"]["value"].tolist() == [1.0, 2.0]
+
+
+def test_events_file_index_cache(tmp_path):
+    """Index is saved to and loaded from the cache directory."""
+    path = _write_test_data(tmp_path / "run" / "events.out.tfevents.1")
+    cache_dir = tmp_path / "cache"
+    index = get_events_file_index(path, cache_dir=cache_dir)
+    assert len(list(cache_dir.glob("*.npz"))) == 1
+
+    tensorboard._INDEX_CACHE.clear()
+    with patch.object(EventsFileIndex, "_scan") as scan:
+        cached_index = get_events_file_index(path, cache_dir=cache_dir)
+        scan.assert_not_called()
+    assert cached_index is not index
+    assert cached_index.keys == index.keys
+    assert np.all(cached_index.offsets == index.offsets)
+    assert cached_index.read_scalars(["y"])["y"]["value"].tolist() == [-1.0]
+
+    # the cached index of the rewritten file is not used
+    data, _ = _get_test_data()
+    rewritten = data.replace(b"\n\x01x\x15", b"\n\x01w\x15")
+    _write_test_data(tmp_path / "run" / "events.out.tfevents.1", rewritten)
+    tensorboard._INDEX_CACHE.clear()
+    rewritten_index = get_events_file_index(path, cache_dir=cache_dir)
+    assert rewritten_index.get_tags("scalar") == ["w", "y"]
+
+
+def test_read_scalars(tmp_path):
+    """Scalars of the several runs and events files."""
+    for run in ("run1", "run2"):
+        for name in ("events.out.tfevents.1", "events.out.tfevents.2"):
+            _write_test_data(tmp_path / run / name)
+
+    scalars = read_scalars(
+        {"first": tmp_path / "run1", "second": tmp_path / "run2"},
+        tags=["x"],
+    )
+    assert list(scalars.keys()) == ["first", "second"]
+    for run_scalars in scalars.values():
+        assert list(run_scalars.keys()) == ["x"]
+        assert run_scalars["x"]["step"].tolist() == [1, 2, 1, 2]
+        assert run_scalars["x"]["value"].tolist() == [1.0, 2.0, 1.0, 2.0]
+
+    scalars = read_scalars(tmp_path / "run1" / "events.out.tfevents.1")
+    run_scalars = scalars[str(tmp_path / "run1" / "events.out.tfevents.1")]
+    assert sorted(run_scalars.keys()) == ["x", "y"]
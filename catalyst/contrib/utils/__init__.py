@@ -54,6 +54,7 @@ try:
 
     from catalyst.contrib.utils.pandas import (
         dataframe_to_list,
+        dataframe_to_columnar,
         folds_to_list,
         split_dataframe_train_test,
         split_dataframe_on_folds,
@@ -63,16 +63,22 @@ def imread(
     Returns:
         np.ndarray: image
     """
-    uri = str(uri)
-
-    if rootpath is not None:
-        rootpath = str(rootpath)
-        uri = uri if uri.startswith(rootpath) else os.path.join(rootpath, uri)
-
-    if SETTINGS.use_libjpeg_turbo and uri.endswith(
-        ("jpg", "JPG", "jpeg", "JPEG")
-    ):
-        img = jpeg.JPEG(uri).decode()
+    if isinstance(uri, bytes):
+        # encoded image content, e.g. from ``RecordDataset``
+        is_jpeg = uri.startswith(b"\xff\xd8")
+        jpeg_source = np.frombuffer(uri, dtype=np.uint8)
+    else:
+        uri = str(uri)
+        if rootpath is not None:
+            rootpath = str(rootpath)
+            uri = (
+                uri if uri.startswith(rootpath) else os.path.join(rootpath, uri)
+            )
+        is_jpeg = uri.endswith(("jpg", "JPG", "jpeg", "JPEG"))
+        jpeg_source = uri
+
+    if SETTINGS.use_libjpeg_turbo and is_jpeg:
+        img = jpeg.JPEG(jpeg_source).decode()
     else:
         # @TODO: add tiff support, currently – jpg and png
         img = imageio.imread(uri, as_gray=grayscale, pilmode="RGB", **kwargs)
@@ -144,7 +150,7 @@ def mimread(
     Returns:
         np.ndarray: image
     """
-    if rootpath is not None:
+    if rootpath is not None and not isinstance(uri, bytes):
         uri = uri if uri.startswith(rootpath) else os.path.join(rootpath, uri)
 
     image = np.dstack(imageio.mimread(uri, **kwargs))
@@ -1,6 +1,14 @@
 # flake8: noqa
 # TODO: add docs and refactor for pure contrib
-from typing import Callable, Dict, List, Optional, Tuple, Union
+from typing import (
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    TYPE_CHECKING,
+    Union,
+)
 from collections import defaultdict
 import glob
 import itertools
@@ -13,6 +21,9 @@ from sklearn.utils import shuffle
 
 from catalyst.utils.misc import args_are_not_none
 
+if TYPE_CHECKING:
+    from catalyst.data.dataset.columnar import ColumnarData
+
 DictDataset = Dict[str, object]
 
 
@@ -144,6 +155,21 @@ def dataframe_to_list(dataframe: pd.DataFrame) -> List[dict]:
     return result
 
 
+def dataframe_to_columnar(dataframe: pd.DataFrame) -> "ColumnarData":
+    """Converts dataframe to a columnar rows storage (without indexes).
+
+    Args:
+        dataframe: input dataframe
+
+    Returns:
+        ColumnarData: columnar rows storage,
+        see :class:`catalyst.data.dataset.ColumnarData`
+    """
+    from catalyst.data.dataset.columnar import ColumnarData
+
+    return ColumnarData.from_dataframe(dataframe)
+
+
 def folds_to_list(folds: Union[list, str, pd.Series]) -> List[int]:
     """This function formats string or either list of numbers
     into a list of unique int.
@@ -539,6 +565,7 @@ def read_csv_data(
     tag2class: Optional[Dict[str, int]] = None,
     class_column: str = None,
     tag_column: str = None,
+    columnar: bool = False,
 ) -> Tuple[pd.DataFrame, List[dict], List[dict], List[dict]]:
     """
     From giving path ``in_csv`` reads a dataframe
@@ -574,6 +601,10 @@ def read_csv_data(
         tag_column: column with label names
         class_column: column to use for split
 
+        columnar: if True, train/valid/infer data are returned
+            as :class:`catalyst.data.dataset.ColumnarData`
+            instead of the lists of dicts
+
     Returns:
         Tuple[pd.DataFrame, List[dict], List[dict], List[dict]]:
             tuple with 4 elements
@@ -622,11 +653,12 @@ def read_csv_data(
         if data is not None and "fold" in data.columns:
             del data["fold"]
 
+    to_data_fn = dataframe_to_columnar if columnar else dataframe_to_list
     result = (
         dataframe,
-        dataframe_to_list(df_train) if df_train is not None else None,
-        dataframe_to_list(df_valid) if df_valid is not None else None,
-        dataframe_to_list(df_infer) if df_infer is not None else None,
+        to_data_fn(df_train) if df_train is not None else None,
+        to_data_fn(df_valid) if df_valid is not None else None,
+        to_data_fn(df_infer) if df_infer is not None else None,
     )
 
     return result
@@ -698,6 +730,7 @@ def balance_classes(
 
 __all__ = [
     "dataframe_to_list",
+    "dataframe_to_columnar",
     "folds_to_list",
     "split_dataframe",
     "split_dataframe_on_column_folds",
@@ -21,6 +21,10 @@ class DumbPool:
         """@TODO: Docs. Contribution is welcome."""
         return map(func, args)
 
+    def imap(self, func, args):
+        """Sequential ordered ``map``, same as ``Pool.imap``."""
+        return map(func, args)
+
     def __enter__(self):
         """Enter the runtime context related to ``DumbPool`` object."""
         return self
@@ -4,30 +4,31 @@ from typing import Dict, List, Optional, Union
 from collections import defaultdict
 from pathlib import Path
 
+import numpy as np
 import plotly.graph_objs as go
 from plotly.offline import init_notebook_mode, iplot
 
-from catalyst.contrib.tools.tensorboard import SummaryItem, SummaryReader
+from catalyst.contrib.tools.tensorboard import (
+    get_events_file_index,
+    read_scalars,
+)
 
 
 def _get_tensorboard_scalars(
     logdir: Union[str, Path], metrics: Optional[List[str]], step: str
-) -> Dict[str, List]:
-    summary_reader = SummaryReader(logdir, types=["scalar"])
-
-    items = defaultdict(list)
-    for item in summary_reader:
-        if step in item.tag and (
-            metrics is None or any(m in item.tag for m in metrics)
-        ):
-            items[item.tag].append(item)
-    return items
-
-
-def _get_scatter(scalars: List[SummaryItem], name: str) -> go.Scatter:
-    xs = [s.step for s in scalars]
-    ys = [s.value for s in scalars]
-    return go.Scatter(x=xs, y=ys, name=name)
+) -> Dict[str, np.ndarray]:
+    tags = {
+        tag
+        for log_file in Path(logdir).glob("*")
+        if log_file.is_file()
+        for tag in get_events_file_index(log_file).get_tags("scalar")
+        if step in tag and (metrics is None or any(m in tag for m in metrics))
+    }
+    return read_scalars(logdir, tags=sorted(tags))[str(logdir)]
+
+
+def _get_scatter(scalars: np.ndarray, name: str) -> go.Scatter:
+    return go.Scatter(x=scalars["step"], y=scalars["value"], name=name)
 
 
 def plot_tensorboard_log(
@@ -1,7 +1,12 @@
-from typing import Dict, List, Union
+from typing import Callable, Dict, List, Union
 from collections import OrderedDict
 
-from catalyst.core.callback import Callback, CallbackNode, CallbackWrapper
+from catalyst.core.callback import (
+    Callback,
+    CallbackNode,
+    CallbackWrapper,
+    ICallback,
+)
 from catalyst.utils.distributed import get_rank
 
 
@@ -98,7 +103,48 @@ def filter_callbacks_by_node(
     return output
 
 
+def get_callback_events() -> List[str]:
+    """Lists all event names supported by ``ICallback``.
+
+    Returns:
+        List[str]: event names, like ``on_batch_start``
+    """
+    return [name for name in vars(ICallback) if name.startswith("on_")]
+
+
+def get_callbacks_dispatch_table(
+    callbacks: Union[Dict, OrderedDict]
+) -> Dict[str, List[Callable]]:
+    """
+    Creates an event-to-handlers table for the callbacks.
+    Each event maps to the list of bound callbacks' methods,
+    that are really overridden by the callbacks,
+    so the default no-op ``ICallback`` handlers are skipped.
+    Callbacks order is preserved.
+
+    Args:
+        callbacks (Union[Dict, OrderedDict]): callbacks
+
+    Returns:
+        Dict[str, List[Callable]]: event name -> list of handlers
+    """
+    dispatch_table = {}
+    for event in get_callback_events():
+        base_handler = getattr(ICallback, event)
+        handlers = []
+        for callback in callbacks.values():
+            handler = getattr(callback, event)
+            # bound method with the ``ICallback`` implementation does nothing
+            if getattr(handler, "__func__", None) is base_handler:
+                continue
+            handlers.append(handler)
+        dispatch_table[event] = handlers
+    return dispatch_table
+
+
 __all__ = [
+    "get_callback_events",
+    "get_callbacks_dispatch_table",
     "sort_callbacks_by_order",
     "filter_callbacks_by_node",
     "get_original_callback",
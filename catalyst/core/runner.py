@@ -1,7 +1,6 @@
-from typing import Any, Dict, Mapping, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Mapping, Optional, Union
 from abc import ABC, abstractmethod
 from collections import defaultdict, OrderedDict
-from functools import lru_cache
 from pathlib import Path
 
 import torch
@@ -12,6 +11,8 @@ from catalyst.core.callback import Callback, CallbackScope, ICallback
 from catalyst.core.experiment import IExperiment
 from catalyst.core.functional import (
     filter_callbacks_by_node,
+    get_callback_events,
+    get_callbacks_dispatch_table,
     sort_callbacks_by_order,
 )
 from catalyst.core.legacy import IRunnerLegacy
@@ -31,9 +32,16 @@ from catalyst.utils.misc import maybe_recursive_call, set_global_seed
 from catalyst.utils.torch import any2device
 
 
-@lru_cache(maxsize=42)
-def _is_substring(origin_string: str, strings: Tuple):
-    return any(x in origin_string for x in strings)
+# runner handles ``*start`` and ``exception`` events before the callbacks
+# and ``*end`` events after them
+_RUNNER_FIRST_EVENTS = frozenset(
+    event
+    for event in get_callback_events()
+    if "start" in event or "exception" in event
+)
+_RUNNER_LAST_EVENTS = frozenset(
+    event for event in get_callback_events() if "end" in event
+)
 
 
 class RunnerException(Exception):
@@ -404,6 +412,9 @@ class IRunner(ABC, ICallback, IRunnerLegacy):
         self.scheduler: RunnerScheduler = scheduler
         # and callbacks
         self.callbacks: Dict[str, "Callback"] = callbacks or {}
+        # event -> callbacks handlers table,
+        # use `_prepare_callbacks_dispatch_table` to setup it
+        self._callbacks_dispatch_table: Dict[str, List[Callable]] = None
 
         # the data
         self.loader = None
@@ -656,6 +667,10 @@ class IRunner(ABC, ICallback, IRunnerLegacy):
 
         if isinstance(self.loader.sampler, DistributedSampler):
             self.loader.sampler.set_epoch(self.epoch)
+        # e.g. catalyst.data.DistributedBucketBatchSampler
+        batch_sampler = getattr(self.loader, "batch_sampler", None)
+        if hasattr(batch_sampler, "set_epoch"):
+            batch_sampler.set_epoch(self.epoch)
 
         set_global_seed(self.experiment.initial_seed + self.global_epoch + 1)
 
@@ -740,6 +755,30 @@ class IRunner(ABC, ICallback, IRunnerLegacy):
         if not _exception_handler_check(getattr(self, "callbacks", None)):
             raise self.exception
 
+    def _prepare_callbacks_dispatch_table(self) -> None:
+        """Inner method to build event -> handlers table
+        for the current Runners' callbacks.
+
+        Only the handlers, overridden by the callbacks, are stored,
+        so the no-op events are skipped during the run.
+
+        .. note::
+            The table should be rebuilt after any ``runner.callbacks`` change.
+        """
+        self._callbacks_dispatch_table = get_callbacks_dispatch_table(
+            self.callbacks
+        )
+
+    def _get_event_handlers(self, event: str) -> List[Callable]:
+        dispatch_table = getattr(self, "_callbacks_dispatch_table", None)
+        if dispatch_table is not None and event in dispatch_table:
+            return dispatch_table[event]
+        # events outside of the table (or no table at all)
+        # are dispatched with the dynamic lookup
+        return [
+            getattr(callback, event) for callback in self.callbacks.values()
+        ]
+
     def _run_event(self, event: str) -> None:
         """Inner method to run specified event on Runners' callbacks.
 
@@ -752,11 +791,13 @@ class IRunner(ABC, ICallback, IRunnerLegacy):
 
         """
         # @TODO: how to remove self duplication? and does it really matter?
-        if _is_substring(event, ("start", "exception")):
+        if event in _RUNNER_FIRST_EVENTS:
             getattr(self, event)(self)
-        for callback in self.callbacks.values():
-            getattr(callback, event)(self)
-        if _is_substring(event, ("end",)):
+        # handlers are requested after the runner's event,
+        # as ``on_stage_start`` could update the callbacks
+        for handler in self._get_event_handlers(event):
+            handler(self)
+        if event in _RUNNER_LAST_EVENTS:
             getattr(self, event)(self)
 
     def _handle_device(self, batch: Mapping[str, Any]):
@@ -911,6 +952,7 @@ class IStageBasedRunner(IRunner):
             loaders=loaders,
             **migrating_params,
         )
+        self._prepare_callbacks_dispatch_table()
 
 
 __all__ = ["IRunner", "IStageBasedRunner", "RunnerException"]
@@ -1,13 +1,18 @@
 # flake8: noqa
-from catalyst.data.collate_fn import FilteringCollateFn
+from catalyst.data.collate_fn import FilteringCollateFn, InteractionsCollateFn
 from catalyst.data.dataset import (
+    CachedDataset,
+    ColumnarData,
     DatasetFromSampler,
+    InteractionsDataset,
     ListDataset,
     MergeDataset,
     NumpyDataset,
     PathsDataset,
     MetricLearningTrainDataset,
     QueryGalleryDataset,
+    RecordDataset,
+    write_records,
 )
 from catalyst.data.loader import (
     ILoaderWrapper,
@@ -17,16 +22,20 @@ from catalyst.data.loader import (
 from catalyst.data.sampler import (
     BalanceClassSampler,
     BalanceBatchSampler,
+    BucketBatchSampler,
+    DistributedBucketBatchSampler,
     DistributedSamplerWrapper,
     DynamicLenBatchSampler,
     DynamicBalanceClassSampler,
     MiniEpochSampler,
+    ShardShuffleSampler,
 )
 from catalyst.data.sampler_inbatch import (
     IInbatchTripletSampler,
     InBatchTripletsSampler,
     AllTripletsSampler,
     HardTripletsSampler,
+    SemiHardTripletsSampler,
     HardClusterSampler,
 )
 
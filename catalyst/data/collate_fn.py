@@ -1,5 +1,9 @@
+from typing import Any, Dict, List
 import collections
 
+import numpy as np
+
+import torch
 from torch.utils.data.dataloader import default_collate
 
 
@@ -40,4 +44,93 @@ class FilteringCollateFn:
             return default_collate(batch)
 
 
-__all__ = ["FilteringCollateFn"]
+class InteractionsCollateFn:
+    """
+    Collates the sparse user rows of the
+    :py:class:`catalyst.data.InteractionsDataset`
+    into the sparse ``[batch_size; num_items]`` targets
+    and samples the negative items, that the users did not interact with.
+
+    Batch keys:
+
+    - ``users`` - ``[batch_size]`` users indices
+    - ``targets`` - ``[batch_size; num_items]`` sparse (COO) ratings,
+      or dense ones with ``dense=True``
+    - ``negatives`` - ``[batch_size; num_negatives]`` negative items,
+      if ``num_negatives > 0``
+
+    Negatives are sampled with the ``torch`` random generator,
+    so they are different for the ``DataLoader`` workers.
+    """
+
+    def __init__(
+        self,
+        num_items: int,
+        num_negatives: int = 0,
+        dense: bool = False,
+        max_resample_iterations: int = 10,
+    ):
+        """
+        Args:
+            num_items: number of items
+            num_negatives: number of negative items per user
+            dense: flag to return the dense targets
+            max_resample_iterations: maximum number of resamples
+                of the negatives, that hit the user items,
+                the remaining ones are kept (for the very active users)
+        """
+        self.num_items = num_items
+        self.num_negatives = num_negatives
+        self.dense = dense
+        self.max_resample_iterations = max_resample_iterations
+
+    def _sample_negatives(
+        self, rows: np.ndarray, items: np.ndarray, batch_size: int
+    ) -> torch.Tensor:
+        positive_keys = rows * self.num_items + items
+        negatives = torch.randint(
+            self.num_items, (batch_size, self.num_negatives)
+        ).numpy()
+        batch_rows = np.arange(batch_size).reshape(-1, 1)
+        for _ in range(self.max_resample_iterations):
+            is_positive = np.isin(
+                batch_rows * self.num_items + negatives, positive_keys
+            )
+            num_positives = int(is_positive.sum())
+            if num_positives == 0:
+                break
+            negatives[is_positive] = torch.randint(
+                self.num_items, (num_positives,)
+            ).numpy()
+        return torch.from_numpy(negatives)
+
+    def __call__(self, batch: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Args:
+            batch: sparse user rows
+
+        Returns:
+            Dict[str, Any]: users, targets and negatives
+        """
+        lengths = np.asarray([len(row["items"]) for row in batch])
+        rows = np.repeat(np.arange(len(batch)), lengths)
+        items = torch.cat([torch.as_tensor(row["items"]) for row in batch])
+        values = torch.cat([torch.as_tensor(row["values"]) for row in batch])
+
+        targets = torch.sparse_coo_tensor(
+            torch.stack([torch.from_numpy(rows), items.long()]),
+            values.float(),
+            (len(batch), self.num_items),
+        )
+        result = {
+            "users": torch.as_tensor([row["users"] for row in batch]),
+            "targets": targets.to_dense() if self.dense else targets,
+        }
+        if self.num_negatives > 0:
+            result["negatives"] = self._sample_negatives(
+                rows, items.numpy(), len(batch)
+            )
+        return result
+
+
+__all__ = ["FilteringCollateFn", "InteractionsCollateFn"]
@@ -1,4 +1,8 @@
 # flake8: noqa
+from catalyst.data.dataset.cache import CachedDataset, get_cached_datasets
+from catalyst.data.dataset.columnar import ColumnarData
+from catalyst.data.dataset.interactions import InteractionsDataset
+from catalyst.data.dataset.records import RecordDataset, write_records
 from catalyst.data.dataset.torch import (
     DatasetFromSampler,
     ListDataset,
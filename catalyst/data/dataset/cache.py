@@ -0,0 +1,325 @@
+from typing import Any, Callable, Dict, Iterator, List, Optional
+import multiprocessing
+import os
+import pickle
+import tempfile
+import weakref
+
+import numpy as np
+
+from torch.utils.data import Dataset, get_worker_info
+
+_NUM_COUNTERS_SLOTS = 256
+# clock, number of free pages
+_NUM_STATE_VALUES = 2
+_ARENA_ATTRIBUTES = (
+    "_buffer",
+    "_state",
+    "_counters",
+    "_item_head",
+    "_item_size",
+    "_item_access",
+    "_next_page",
+    "_free_pages",
+    "_pages",
+    "_finalizer",
+)
+
+
+def _get_default_cache_dir() -> str:
+    return "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+
+
+def _remove_arena(path: str, owner_pid: int) -> None:
+    # forked workers share the finalizer, but do not own the arena
+    if os.getpid() == owner_pid and os.path.exists(path):
+        os.remove(path)
+
+
+class CachedDataset(Dataset):
+    """
+    Dataset wrapper, that caches the dataset items
+    in the single shared-memory arena, so the items are decoded once
+    for all epochs and all ``DataLoader`` workers.
+
+    The arena is the memory-mapped file
+    (in ``/dev/shm`` by default, so it is stored in RAM),
+    that is shared by all workers both for the ``fork``
+    and ``spawn`` start methods.
+    Items are pickled (so the numpy arrays of any shapes are supported)
+    into the fixed size pages, the item pages are linked into the list,
+    so there is no fragmentation for the variable size items.
+
+    Cache policies:
+
+    - ``freeze`` - items are cached until the arena is full,
+      then the cache is frozen, the reads are lock-free
+    - ``lru`` - the least recently used items are evicted
+      to free the pages for the new ones
+
+    Random augmentations should be passed as the ``dict_transform``,
+    so they are applied to the cached items.
+
+    Example:
+        >>> dataset = CachedDataset(
+        >>>     ListDataset(list_data, open_fn=open_fn),
+        >>>     capacity=16 * 2 ** 30,
+        >>>     dict_transform=augmentations,
+        >>> )
+        >>> dataset = MergeDataset(dataset, NumpyDataset(features))
+    """
+
+    def __init__(
+        self,
+        dataset: Dataset,
+        capacity: int,
+        policy: str = "freeze",
+        page_size: int = 4096,
+        cache_dir: Optional[str] = None,
+        dict_transform: Optional[Callable] = None,
+    ):
+        """
+        Args:
+            dataset: dataset to cache
+            capacity: cache size in bytes
+            policy: cache policy, ``freeze`` or ``lru``
+            page_size: size of the arena page in bytes
+            cache_dir: directory for the arena file,
+                ``/dev/shm`` by default (or the temporary directory
+                if there is no ``/dev/shm``), use the disk directory
+                for the memory-mapped cache larger than RAM
+            dict_transform: transforms to use on the cached items
+
+        Raises:
+            ValueError: if the policy is unknown
+        """
+        if policy not in ("freeze", "lru"):
+            raise ValueError(
+                f"policy should be 'freeze' or 'lru', got '{policy}'"
+            )
+        self.dataset = dataset
+        self.policy = policy
+        self.page_size = page_size
+        self.num_pages = max(capacity // page_size, 1)
+        self.num_items = len(dataset)
+        self.dict_transform = dict_transform
+
+        fd, self.path = tempfile.mkstemp(
+            prefix="catalyst-cache-", dir=cache_dir or _get_default_cache_dir()
+        )
+        os.ftruncate(fd, self._get_layout()[-1][1])
+        os.close(fd)
+        self._finalizer = weakref.finalize(
+            self, _remove_arena, self.path, os.getpid()
+        )
+        self._lock = multiprocessing.Lock()
+        self._open()
+        self._state[:] = [0, self.num_pages]
+        self._item_head[:] = -1
+        self._free_pages[:] = np.arange(self.num_pages)
+
+    def _get_layout(self) -> List[tuple]:
+        """Returns (start, end) bytes of the arena arrays."""
+        int64_sizes = [
+            _NUM_STATE_VALUES,
+            _NUM_COUNTERS_SLOTS * 2,
+            # items heads, sizes and last access times
+            self.num_items,
+            self.num_items,
+            self.num_items,
+            # pages next page and free pages stack
+            self.num_pages,
+            self.num_pages,
+        ]
+        layout, start = [], 0
+        for size in int64_sizes:
+            layout.append((start, start + size * 8))
+            start += size * 8
+        layout.append((start, start + self.num_pages * self.page_size))
+        return layout
+
+    def _open(self) -> None:
+        self._buffer = np.memmap(self.path, dtype=np.uint8, mode="r+")
+        arrays = [
+            self._buffer[start:end].view(np.int64)
+            for start, end in self._get_layout()[:-1]
+        ]
+        (
+            self._state,
+            counters,
+            self._item_head,
+            self._item_size,
+            self._item_access,
+            self._next_page,
+            self._free_pages,
+        ) = arrays
+        self._counters = counters.reshape(_NUM_COUNTERS_SLOTS, 2)
+        start, end = self._get_layout()[-1]
+        self._pages = self._buffer[start:end].reshape(
+            self.num_pages, self.page_size
+        )
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # workers reopen the arena by the path
+        return {
+            key: value
+            for key, value in self.__dict__.items()
+            if key not in _ARENA_ATTRIBUTES
+        }
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._open()
+
+    def _count(self, column: int) -> None:
+        """Increments the hits (0) or misses (1) counter of the process."""
+        worker_info = get_worker_info()
+        slot = 0 if worker_info is None else worker_info.id + 1
+        self._counters[slot % _NUM_COUNTERS_SLOTS, column] += 1
+
+    def _get_item_pages(self, index: int) -> Iterator[int]:
+        num_pages = -(-self._item_size[index] // self.page_size)
+        page = self._item_head[index]
+        for _ in range(num_pages):
+            yield page
+            page = self._next_page[page]
+
+    def _read(self, index: int) -> Optional[bytes]:
+        size = self._item_size[index]
+        if size == 0:
+            return None
+        pages = np.fromiter(self._get_item_pages(index), dtype=np.int64)
+        return self._pages[pages].reshape(-1)[:size].tobytes()
+
+    def _evict(self, num_pages: int) -> None:
+        """Frees at least ``num_pages`` pages of the least recently used."""
+        cached = np.flatnonzero(self._item_size > 0)
+        cached = cached[np.argsort(self._item_access[cached], kind="stable")]
+        item_pages = -(-self._item_size[cached] // self.page_size)
+        num_evicted = np.searchsorted(np.cumsum(item_pages), num_pages) + 1
+        for index in cached[:num_evicted].tolist():
+            pages = np.fromiter(self._get_item_pages(index), dtype=np.int64)
+            num_free = self._state[1]
+            self._free_pages[num_free : num_free + len(pages)] = pages
+            self._state[1] = num_free + len(pages)
+            self._item_size[index] = 0
+            self._item_head[index] = -1
+
+    def _write(self, index: int, data: bytes) -> None:
+        num_pages = -(-len(data) // self.page_size)
+        if num_pages > self.num_pages or len(data) == 0:
+            return
+        if self._state[1] < num_pages and self.policy == "freeze":
+            return
+
+        with self._lock:
+            if self._item_size[index] > 0:  # cached by another worker
+                return
+            if self._state[1] < num_pages:
+                if self.policy == "freeze":
+                    return
+                self._evict(num_pages - self._state[1])
+
+            num_free = self._state[1] - num_pages
+            pages = self._free_pages[num_free : num_free + num_pages].copy()
+            self._state[1] = num_free
+            self._next_page[pages[:-1]] = pages[1:]
+            self._next_page[pages[-1]] = -1
+
+            padded = np.zeros(num_pages * self.page_size, dtype=np.uint8)
+            padded[: len(data)] = np.frombuffer(data, dtype=np.uint8)
+            self._pages[pages] = padded.reshape(num_pages, self.page_size)
+
+            self._item_head[index] = pages[0]
+            self._item_access[index] = self._state[0]
+            self._state[0] += 1
+            # the item is visible for the lock-free readers
+            # only after its data is written
+            self._item_size[index] = len(data)
+
+    def _get_cached(self, index: int) -> Optional[bytes]:
+        if self.policy == "freeze":
+            return self._read(index)
+        if self._item_size[index] == 0:
+            return None
+        with self._lock:
+            data = self._read(index)
+            if data is not None:
+                self._item_access[index] = self._state[0]
+                self._state[0] += 1
+        return data
+
+    def __getitem__(self, index: int) -> Any:
+        """Gets element of the dataset from the cache or the dataset.
+
+        Args:
+            index: index of the element in the dataset
+
+        Returns:
+            Single element by index
+        """
+        data = self._get_cached(index)
+        if data is not None:
+            self._count(0)
+            item = pickle.loads(data)  # noqa: S301
+        else:
+            self._count(1)
+            item = self.dataset[index]
+            self._write(
+                index, pickle.dumps(item, protocol=pickle.HIGHEST_PROTOCOL)
+            )
+
+        if self.dict_transform is not None:
+            item = self.dict_transform(item)
+        return item
+
+    def __len__(self) -> int:
+        """
+        Returns:
+            int: length of the dataset
+        """
+        return self.num_items
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Returns:
+            Dict[str, int]: cache hits and misses of all processes,
+            number of the cached items and the used bytes
+        """
+        hits, misses = self._counters.sum(axis=0).tolist()
+        return {
+            "hits": hits,
+            "misses": misses,
+            "items": int(np.count_nonzero(self._item_size)),
+            "used_bytes": int(self.num_pages - self._state[1])
+            * self.page_size,
+        }
+
+    def close(self) -> None:
+        """Removes the arena file, it is also removed
+        when the dataset is garbage collected."""
+        finalizer = getattr(self, "_finalizer", None)
+        if finalizer is not None:
+            finalizer()
+
+
+def get_cached_datasets(dataset: Dataset) -> List[CachedDataset]:
+    """Finds all ``CachedDataset`` in the dataset wrappers.
+
+    Args:
+        dataset: dataset, e.g. ``MergeDataset`` with cached datasets
+
+    Returns:
+        List[CachedDataset]: found cached datasets
+    """
+    if isinstance(dataset, CachedDataset):
+        return [dataset]
+    children = list(getattr(dataset, "datasets", []))
+    if hasattr(dataset, "dataset"):
+        children.append(dataset.dataset)
+    return [
+        cached for child in children for cached in get_cached_datasets(child)
+    ]
+
+
+__all__ = ["CachedDataset", "get_cached_datasets"]
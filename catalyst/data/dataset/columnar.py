@@ -0,0 +1,235 @@
+from typing import Any, Dict, Iterable, Mapping, Sequence
+from abc import ABC, abstractmethod
+from collections.abc import Sequence as SequenceABC
+import pickle
+
+import numpy as np
+
+_NUMERIC_KINDS = "biufc"
+_NUMERIC_TYPES = (bool, int, float, complex, np.number, np.bool_)
+
+
+class _PackedColumn(ABC):
+    """
+    Variable-length values packed into the single bytes buffer
+    with the values offsets.
+    """
+
+    def __init__(self, buffer: np.ndarray, offsets: np.ndarray):
+        """
+        Args:
+            buffer: uint8 array with the encoded values
+            offsets: int64 array of ``len(values) + 1`` values offsets
+        """
+        self.buffer = buffer
+        self.offsets = offsets
+
+    @staticmethod
+    @abstractmethod
+    def _encode(value: Any) -> bytes:
+        pass
+
+    @staticmethod
+    @abstractmethod
+    def _decode(data: bytes) -> Any:
+        pass
+
+    @classmethod
+    def from_values(cls, values: Sequence[Any]) -> "_PackedColumn":
+        """Packs the values into the single buffer.
+
+        Args:
+            values: values to pack
+
+        Returns:
+            packed column
+        """
+        encoded = [cls._encode(value) for value in values]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(data) for data in encoded], out=offsets[1:])
+        buffer = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+        return cls(buffer=buffer, offsets=offsets)
+
+    def __getitem__(self, index: int) -> Any:
+        start, end = self.offsets[index], self.offsets[index + 1]
+        return self._decode(self.buffer[start:end].tobytes())
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+
+class _StringColumn(_PackedColumn):
+    """Strings packed into the utf-8 buffer."""
+
+    @staticmethod
+    def _encode(value: str) -> bytes:
+        return value.encode("utf-8")
+
+    @staticmethod
+    def _decode(data: bytes) -> str:
+        return data.decode("utf-8")
+
+
+class _ObjectColumn(_PackedColumn):
+    """Arbitrary python objects packed into the buffer of pickles."""
+
+    @staticmethod
+    def _encode(value: Any) -> bytes:
+        return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @staticmethod
+    def _decode(data: bytes) -> Any:
+        return pickle.loads(data)  # noqa: S301
+
+
+def _get_column(values: Any) -> Any:
+    """Converts the column values to the array or packed column.
+
+    Args:
+        values: column values
+
+    Returns:
+        numpy array for the numeric values,
+        packed column for the strings and the other objects
+    """
+    if isinstance(values, _PackedColumn):
+        return values
+    if isinstance(values, np.ndarray) and values.dtype.kind in _NUMERIC_KINDS:
+        if values.ndim != 1:
+            raise ValueError("only one-dimensional columns are supported")
+        return values
+
+    values = list(values)
+    if all(type(value) is str for value in values):  # noqa: WPS516
+        return _StringColumn.from_values(values)
+    if values and all(isinstance(value, _NUMERIC_TYPES) for value in values):
+        array = np.asarray(values)
+        if array.dtype.kind in _NUMERIC_KINDS:
+            return array
+    return _ObjectColumn.from_values(values)
+
+
+class ColumnarData(SequenceABC):
+    """
+    Columnar storage for the dataset annotations,
+    a drop-in replacement of the list of dicts
+    for :class:`catalyst.data.dataset.ListDataset`.
+
+    Numeric columns are stored as numpy arrays,
+    strings and the other objects are packed into the single bytes buffer
+    per column, the rows dicts are created on the fly in ``__getitem__``.
+    So the annotations are stored in the handful of the big arrays
+    instead of the millions of the python objects,
+    that takes less memory and, what is more important,
+    the annotations are not copied to the every ``DataLoader`` worker
+    by the reference counting after the fork.
+
+    Example:
+        >>> data = ColumnarData.from_records(
+        >>>     [{"image": "img1.jpg", "targets": 0},
+        >>>      {"image": "img2.jpg", "targets": 1}]
+        >>> )
+        >>> data[1]
+        {'image': 'img2.jpg', 'targets': 1}
+        >>> dataset = ListDataset(data, open_fn=open_fn)
+    """
+
+    def __init__(self, columns: Mapping[str, Any]):
+        """
+        Args:
+            columns: mapping from the column name to the column values
+        """
+        self.columns: Dict[str, Any] = {
+            key: _get_column(values) for key, values in columns.items()
+        }
+        lengths = {len(column) for column in self.columns.values()}
+        if len(lengths) > 1:
+            raise ValueError("all columns should have the same length")
+        self._length = lengths.pop() if lengths else 0
+
+    @classmethod
+    def from_records(cls, records: Iterable[Mapping]) -> "ColumnarData":
+        """Creates columnar data from the list of dicts.
+
+        Args:
+            records: list of dicts with the same keys
+
+        Returns:
+            ColumnarData: columnar data
+
+        Raises:
+            ValueError: if the records have different keys
+        """
+        columns: Dict[str, list] = {}
+        for index, record in enumerate(records):
+            if index == 0:
+                columns = {key: [] for key in record}
+            elif record.keys() != columns.keys():
+                raise ValueError(
+                    f"record {index} keys {list(record)} differ from "
+                    f"the first record keys {list(columns)}"
+                )
+            for key, value in record.items():
+                columns[key].append(value)
+        return cls(columns)
+
+    @classmethod
+    def from_dataframe(cls, dataframe) -> "ColumnarData":
+        """Creates columnar data from the ``pandas.DataFrame`` columns
+        (without indexes).
+
+        Args:
+            dataframe: input dataframe
+
+        Returns:
+            ColumnarData: columnar data
+        """
+        return cls(
+            {
+                column: dataframe[column].to_numpy()
+                for column in dataframe.columns
+            }
+        )
+
+    def to_list(self) -> list:
+        """
+        Returns:
+            list: list of rows dicts
+        """
+        return list(self)
+
+    def __getitem__(self, index: int) -> Dict[str, Any]:
+        """Creates the row dict.
+
+        Args:
+            index: index of the row
+
+        Returns:
+            Dict[str, Any]: row
+
+        Raises:
+            IndexError: if index is out of range
+        """
+        index = int(index)
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("ColumnarData index out of range")
+
+        row = {}
+        for key, column in self.columns.items():
+            value = column[index]
+            if isinstance(value, np.generic):
+                value = value.item()
+            row[key] = value
+        return row
+
+    def __len__(self) -> int:
+        """
+        Returns:
+            int: number of rows
+        """
+        return self._length
+
+
+__all__ = ["ColumnarData"]
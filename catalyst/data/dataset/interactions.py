@@ -0,0 +1,198 @@
+from typing import Any, Dict, Tuple, Union
+
+import numpy as np
+
+import torch
+from torch.utils.data import Dataset
+
+_Array = Union[np.ndarray, list]
+
+
+class InteractionsDataset(Dataset):
+    """
+    User-item interactions dataset in the CSR format:
+    the user ``i`` interacted with the items
+    ``indices[indptr[i]:indptr[i + 1]]`` with the
+    ``values[indptr[i]:indptr[i + 1]]`` ratings,
+    so only the interactions are stored
+    instead of the dense ``num_users x num_items`` matrix.
+
+    Every item of the dataset is the sparse user row
+    with ``users``, ``items`` and ``values`` keys,
+    use :py:class:`catalyst.data.InteractionsCollateFn`
+    to get the sparse targets batch and the negative items.
+
+    Example:
+        >>> dataset = InteractionsDataset.from_coo(
+        >>>     users=ratings["user_id"].values,
+        >>>     items=ratings["item_id"].values,
+        >>>     values=ratings["rating"].values,
+        >>>     min_value=4,
+        >>> )
+        >>> loader = DataLoader(
+        >>>     dataset,
+        >>>     batch_size=256,
+        >>>     collate_fn=InteractionsCollateFn(
+        >>>         dataset.num_items, num_negatives=100
+        >>>     ),
+        >>> )
+    """
+
+    def __init__(
+        self,
+        indptr: _Array,
+        indices: _Array,
+        values: _Array = None,
+        num_items: int = None,
+    ):
+        """
+        Args:
+            indptr: [num_users + 1] offsets of the users interactions
+            indices: items of the interactions
+            values: ratings of the interactions, ones if None
+            num_items: number of items,
+                if None, the largest item index plus one is used
+        """
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.indices = np.asarray(indices, dtype=np.int64)
+        self.values = (
+            np.ones(len(self.indices), dtype=np.float32)
+            if values is None
+            else np.asarray(values, dtype=np.float32)
+        )
+        self.num_users = len(self.indptr) - 1
+        self.num_items = (
+            int(self.indices.max(initial=-1)) + 1
+            if num_items is None
+            else num_items
+        )
+
+    @classmethod
+    def from_coo(
+        cls,
+        users: _Array,
+        items: _Array,
+        values: _Array = None,
+        num_users: int = None,
+        num_items: int = None,
+        min_value: float = None,
+    ) -> "InteractionsDataset":
+        """
+        Creates the dataset from the interactions list (COO format)
+        with the vectorized sort, the last of the duplicated
+        interactions is kept.
+
+        Args:
+            users: user of every interaction
+            items: item of every interaction
+            values: rating of every interaction, ones if None
+            num_users: number of users,
+                if None, the largest user index plus one is used
+            num_items: number of items,
+                if None, the largest item index plus one is used
+            min_value: minimum rating to keep the interaction
+
+        Returns:
+            InteractionsDataset: dataset
+        """
+        users = np.asarray(users, dtype=np.int64).reshape(-1)
+        items = np.asarray(items, dtype=np.int64).reshape(-1)
+        values = (
+            np.ones(len(users), dtype=np.float32)
+            if values is None
+            else np.asarray(values, dtype=np.float32).reshape(-1)
+        )
+        if num_users is None:
+            num_users = int(users.max(initial=-1)) + 1
+        if num_items is None:
+            num_items = int(items.max(initial=-1)) + 1
+        if min_value is not None:
+            mask = values >= min_value
+            users, items, values = users[mask], items[mask], values[mask]
+
+        # stable sort keeps the duplicates in the input order
+        order = np.lexsort((items, users))
+        users, items, values = users[order], items[order], values[order]
+        is_last = np.ones(len(users), dtype=bool)
+        is_last[:-1] = (users[1:] != users[:-1]) | (items[1:] != items[:-1])
+        users, items, values = users[is_last], items[is_last], values[is_last]
+
+        counts = np.bincount(users, minlength=num_users)
+        indptr = np.concatenate([[0], np.cumsum(counts)])
+        return cls(indptr, items, values, num_items=num_items)
+
+    @classmethod
+    def from_sparse_tensor(cls, tensor: torch.Tensor) -> "InteractionsDataset":
+        """
+        Creates the dataset from the sparse
+        ``[num_users; num_items]`` tensor.
+
+        Args:
+            tensor: sparse (COO) interactions matrix
+
+        Returns:
+            InteractionsDataset: dataset
+        """
+        tensor = tensor.coalesce()
+        users, items = tensor.indices().cpu().numpy()
+        num_users, num_items = tensor.shape
+        return cls.from_coo(
+            users,
+            items,
+            tensor.values().cpu().numpy(),
+            num_users=num_users,
+            num_items=num_items,
+        )
+
+    def to_sparse_tensor(self) -> torch.Tensor:
+        """
+        Returns:
+            torch.Tensor: sparse (COO) ``[num_users; num_items]``
+            interactions matrix
+        """
+        users = np.repeat(
+            np.arange(self.num_users, dtype=np.int64), np.diff(self.indptr)
+        )
+        indices = torch.from_numpy(np.stack([users, self.indices]))
+        return torch.sparse_coo_tensor(
+            indices,
+            torch.from_numpy(self.values),
+            (self.num_users, self.num_items),
+        ).coalesce()
+
+    def get_user_items(self, user: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Args:
+            user: user index
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: user items and ratings
+        """
+        start, end = self.indptr[user], self.indptr[user + 1]
+        return self.indices[start:end], self.values[start:end]
+
+    def __getitem__(self, user: int) -> Dict[str, Any]:
+        """Gets the sparse user row.
+
+        Args:
+            user: user index
+
+        Returns:
+            Dict[str, Any]: user index, user items and ratings
+        """
+        items, values = self.get_user_items(user)
+        return {
+            "users": user,
+            "items": torch.from_numpy(items),
+            "values": torch.from_numpy(values),
+        }
+
+    def __len__(self) -> int:
+        """
+        Returns:
+            int: number of users
+        """
+        return self.num_users
+
+
+__all__ = ["InteractionsDataset"]
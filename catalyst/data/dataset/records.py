@@ -0,0 +1,245 @@
+from typing import Any, Callable, Dict, Optional, Sequence, Union
+from functools import partial
+import json
+import mmap
+import os
+from pathlib import Path
+import pickle
+
+import numpy as np
+
+from torch.utils.data import Dataset
+
+RECORDS_FORMAT_VERSION = 1
+RECORDS_INDEX_DTYPE = np.dtype(
+    [("shard", np.int32), ("offset", np.int64), ("size", np.int64)]
+)
+_Path = Union[str, Path]
+
+
+def _get_shard_path(path: _Path, shard: int) -> str:
+    return os.path.join(str(path), f"shard-{shard:05d}.rec")
+
+
+def _encode_record(
+    row: Dict[str, Any],
+    file_columns: Sequence[str] = (),
+    rootpath: Optional[str] = None,
+) -> bytes:
+    """Replaces the files paths with the files content and pickles the row."""
+    row = dict(row)
+    for column in file_columns:
+        filepath = str(row[column])
+        if rootpath is not None:
+            filepath = os.path.join(rootpath, filepath)
+        with open(filepath, "rb") as fin:
+            row[column] = fin.read()
+    return pickle.dumps(row, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def write_records(
+    rows: Sequence[Dict[str, Any]],
+    out_dir: _Path,
+    file_columns: Sequence[str] = (),
+    rootpath: Optional[str] = None,
+    shard_size: int = 2 ** 30,
+    num_workers: int = 0,
+    verbose: bool = False,
+) -> None:
+    """
+    Packs the dataset annotations and files
+    into the shard files with the records offsets index
+    for :py:class:`RecordDataset`.
+
+    Every record is the pickled annotations row,
+    where the ``file_columns`` paths are replaced with the files content,
+    so the readers (e.g. ``ImageReader``) decode them from the bytes.
+    Files are read and packed in parallel,
+    the records are written in the rows order.
+
+    Args:
+        rows: dataset annotations,
+            e.g. ``catalyst.contrib.utils.pandas.dataframe_to_list``
+        out_dir: directory to write the records to
+        file_columns: columns with the files paths to pack
+        rootpath: root directory for the relative files paths
+        shard_size: maximum shard file size in bytes
+            (shard contains at least one record)
+        num_workers: number of processes to read the files
+        verbose: flag to show the progress bar
+    """
+    from tqdm import tqdm
+
+    from catalyst.contrib.utils.parallel import get_pool
+
+    os.makedirs(str(out_dir), exist_ok=True)
+    index = np.zeros(len(rows), dtype=RECORDS_INDEX_DTYPE)
+    encode_fn = partial(
+        _encode_record, file_columns=list(file_columns), rootpath=rootpath
+    )
+
+    shard, offset, fout = -1, 0, None
+    with get_pool(num_workers) as pool:
+        records = pool.imap(encode_fn, rows)
+        if verbose:
+            records = tqdm(records, total=len(rows))
+        try:
+            for record_index, record in enumerate(records):
+                is_full = offset > 0 and offset + len(record) > shard_size
+                if fout is None or is_full:
+                    if fout is not None:
+                        fout.close()
+                    shard, offset = shard + 1, 0
+                    fout = open(_get_shard_path(out_dir, shard), "wb")
+                fout.write(record)
+                index[record_index] = (shard, offset, len(record))
+                offset += len(record)
+        finally:
+            if fout is not None:
+                fout.close()
+
+    np.save(os.path.join(str(out_dir), "index.npy"), index)
+    meta = {
+        "version": RECORDS_FORMAT_VERSION,
+        "num_records": len(rows),
+        "num_shards": shard + 1,
+        "file_columns": list(file_columns),
+    }
+    with open(os.path.join(str(out_dir), "meta.json"), "w") as fout:
+        json.dump(meta, fout, indent=2)
+
+
+class RecordDataset(Dataset):
+    """
+    Random-access dataset over the records packed with
+    :py:func:`write_records` (or ``catalyst-contrib pack-records``).
+
+    Shards are memory-mapped, so the sample reading is the memory copy
+    instead of the filesystem open/stat/read calls.
+    Records are the annotations rows with the files content
+    instead of the paths, so the same ``open_fn``
+    (e.g. ``ReaderCompose`` with ``ImageReader``, ``MaskReader``
+    and ``ScalarReader``) works as for the ``ListDataset``.
+
+    Use ``ShardShuffleSampler(dataset.shard_ids)``
+    to read the shards one by one in the random order.
+
+    Example:
+        >>> open_fn = ReaderCompose(
+        >>>     [ImageReader(input_key="filepath", output_key="image"),
+        >>>      ScalarReader(input_key="label", output_key="targets")]
+        >>> )
+        >>> # ListDataset(list_data, open_fn=open_fn) ->
+        >>> dataset = RecordDataset("./data/records", open_fn=open_fn)
+    """
+
+    def __init__(
+        self,
+        path: _Path,
+        open_fn: Optional[Callable] = None,
+        dict_transform: Optional[Callable] = None,
+        readahead: int = 0,
+    ):
+        """
+        Args:
+            path: directory with the records
+            open_fn: function, that can open your record dict
+                and transfer it to data, needed by your network,
+                records are returned as is if None
+            dict_transform: transforms to use on dict
+            readahead: number of bytes after the read record
+                to prefetch into the page cache (``madvise``),
+                useful for the network storages
+                and the sequential shards reading
+
+        Raises:
+            ValueError: if the records format version is not supported
+        """
+        self.path = str(path)
+        with open(os.path.join(self.path, "meta.json")) as fin:
+            self.meta: Dict[str, Any] = json.load(fin)
+        if self.meta["version"] > RECORDS_FORMAT_VERSION:
+            raise ValueError(
+                f"records format version {self.meta['version']} "
+                "is not supported, please update catalyst"
+            )
+        self.index = np.load(os.path.join(self.path, "index.npy"))
+        self.open_fn = open_fn
+        self.dict_transform = dict_transform
+        self.readahead = readahead
+        self._shards: Dict[int, mmap.mmap] = {}
+        self._readahead_ends: Dict[int, int] = {}
+
+    @property
+    def shard_ids(self) -> np.ndarray:
+        """
+        Returns:
+            np.ndarray: shard of every record
+        """
+        return self.index["shard"]
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # memory maps are reopened by the loader workers
+        state = self.__dict__.copy()
+        state["_shards"] = {}
+        state["_readahead_ends"] = {}
+        return state
+
+    def _get_shard(self, shard: int) -> mmap.mmap:
+        if shard not in self._shards:
+            with open(_get_shard_path(self.path, shard), "rb") as fin:
+                self._shards[shard] = mmap.mmap(
+                    fin.fileno(), 0, access=mmap.ACCESS_READ
+                )
+        return self._shards[shard]
+
+    def _prefetch(self, shard: int, buffer: mmap.mmap, end: int) -> None:
+        if end + self.readahead // 2 < self._readahead_ends.get(shard, 0):
+            return
+        start = end - end % mmap.PAGESIZE
+        length = min(self.readahead, len(buffer) - start)
+        if length > 0:
+            buffer.madvise(mmap.MADV_WILLNEED, start, length)
+        self._readahead_ends[shard] = start + length
+
+    def get_record(self, index: int) -> Dict[str, Any]:
+        """Reads the record.
+
+        Args:
+            index: index of the record
+
+        Returns:
+            Dict[str, Any]: annotations row with the files content
+        """
+        shard, offset, size = self.index[index].tolist()
+        buffer = self._get_shard(shard)
+        record = pickle.loads(buffer[offset : offset + size])  # noqa: S301
+        if self.readahead > 0 and hasattr(buffer, "madvise"):
+            self._prefetch(shard, buffer, offset + size)
+        return record
+
+    def __getitem__(self, index: int) -> Any:
+        """Gets element of the dataset.
+
+        Args:
+            index: index of the element in the dataset
+
+        Returns:
+            Single element by index
+        """
+        item = self.get_record(index)
+        if self.open_fn is not None:
+            item = self.open_fn(item)
+        if self.dict_transform is not None:
+            item = self.dict_transform(item)
+        return item
+
+    def __len__(self) -> int:
+        """
+        Returns:
+            int: length of the dataset
+        """
+        return len(self.index)
+
+
+__all__ = ["RecordDataset", "write_records"]
@@ -5,6 +5,7 @@ import numpy as np
 
 from torch.utils.data import Dataset, Sampler
 
+from catalyst.data.dataset.columnar import ColumnarData
 from catalyst.utils.misc import merge_dicts
 
 _Path = Union[str, Path]
@@ -48,7 +49,7 @@ class ListDataset(Dataset):
 
     def __init__(
         self,
-        list_data: List[Dict],
+        list_data: Union[List[Dict], ColumnarData],
         open_fn: Callable,
         dict_transform: Optional[Callable] = None,
     ):
@@ -57,6 +58,9 @@ class ListDataset(Dataset):
             list_data: list of dicts, that stores
                 you data annotations,
                 (for example path to images, labels, bboxes, etc.)
+                or :class:`catalyst.data.dataset.ColumnarData`
+                with the same annotations, that is recommended
+                for the large datasets and many loader workers
             open_fn: function, that can open your
                 annotations dict and
                 transfer it to data, needed by your network
@@ -223,10 +227,13 @@ class PathsDataset(ListDataset):
             list_dataset_params: base class initialization
                 parameters.
         """
-        list_data = [
-            {features_key: filename, target_key: label_fn(filename)}
-            for filename in filenames
-        ]
+        filenames = list(filenames)
+        list_data = ColumnarData(
+            {
+                features_key: filenames,
+                target_key: [label_fn(filename) for filename in filenames],
+            }
+        )
 
         super().__init__(
             list_data=list_data, open_fn=open_fn, **list_dataset_params
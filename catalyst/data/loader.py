@@ -1,4 +1,4 @@
-from typing import Any, Callable, Iterable, Union
+from typing import Any, Iterable, Iterator, List, Tuple, Union
 import queue
 import sys
 import threading
@@ -138,81 +138,209 @@ class BatchLimitLoaderWrapper(ILoaderWrapper):
         return batch
 
 
-def _any2cuda_non_blocking(value: Any):
-    # based on catalyst.utils.torch.any2device
-    # but with cuda non_blocking trick
-    if isinstance(value, dict):
-        return {k: _any2cuda_non_blocking(v) for k, v in value.items()}
-    elif isinstance(value, (tuple, list)):
-        return [_any2cuda_non_blocking(v) for v in value]
-    elif torch.is_tensor(value):
-        return value.cuda(non_blocking=True)
-    elif (
-        isinstance(value, (np.ndarray, np.void))
-        and value.dtype.fields is not None
+class _ExceptionInfo(object):
+    """Exception raised in the prefetch thread."""
+
+    def __init__(self, exc_info):
+        self.exc_info = exc_info
+
+
+_END = object()
+
+
+class _StagingSlot(object):
+    """Pinned staging buffers of one prefetched batch."""
+
+    def __init__(self):
+        self.buffers: List[torch.Tensor] = []
+        self.event = None
+
+    def get_buffer(self, index: int, tensor: torch.Tensor) -> torch.Tensor:
+        """Returns pinned buffer with ``tensor`` shape and dtype,
+        buffers are reallocated only if the batch grows.
+
+        Args:
+            index: index of the tensor in the batch
+            tensor: tensor to stage
+
+        Returns:
+            pinned tensor
+        """
+        if index == len(self.buffers):
+            self.buffers.append(None)
+        buffer = self.buffers[index]
+        numel = tensor.numel()
+        if (
+            buffer is None
+            or buffer.dtype != tensor.dtype
+            or buffer.numel() < numel
+        ):
+            buffer = torch.empty(numel, dtype=tensor.dtype).pin_memory()
+            self.buffers[index] = buffer
+        return buffer[:numel].view(tensor.shape)
+
+
+class _BatchPrefetcher(object):
+    """
+    Iterates over the loader in the background thread
+    and copies batches to the device
+    with pinned staging buffers and dedicated CUDA streams.
+    """
+
+    def __init__(
+        self,
+        loader: Iterable,
+        num_prefetches: int,
+        device: torch.device,
+        num_streams: int,
     ):
-        return {
-            k: _any2cuda_non_blocking(value[k])
-            for k in value.dtype.fields.keys()
-        }
-    elif isinstance(value, np.ndarray):
-        return torch.tensor(value).cuda(non_blocking=True)
-
-
-def _map_loop(
-    func: Callable,
-    iterable: Iterable,
-    result_queue: queue.Queue,
-    error_queue: queue.Queue,
-    done_event: threading.Event,
-):
-    try:
-        for x in iterable:
-            result = func(x)
-            result_queue.put(result)
-    except BaseException:  # noqa: WPS424
-        error_queue.put(sys.exc_info())
-    finally:
-        done_event.set()
-
-
-def _prefetch_map(
-    func: Callable,
-    iterable: Iterable,
-    num_prefetches: int = 1,
-    timeout: int = 2,
-) -> Iterable:
-    result_queue = queue.Queue(num_prefetches)
-    error_queue = queue.Queue(1)
-    done_event = threading.Event()
-    map_thread = threading.Thread(
-        target=_map_loop,
-        args=(func, iterable, result_queue, error_queue, done_event),
-    )
-    map_thread.daemon = True
-    map_thread.start()
-    while not (done_event.is_set() and result_queue.empty()):
+        """
+        Args:
+            loader: iterable to prefetch batches from
+            num_prefetches: number of batches to prefetch
+            device: device to copy batches to,
+                for the cpu device batches are only prefetched
+            num_streams: number of CUDA streams for the copies
+        """
+        self.device = device
+        self.is_cuda = device.type == "cuda"
+        # staging buffers are reused after the copy event completes,
+        # one more slot is filled, while the queue is full
+        self._slots = [_StagingSlot() for _ in range(num_prefetches + 1)]
+        self._streams = (
+            [torch.cuda.Stream(device) for _ in range(num_streams)]
+            if self.is_cuda
+            else []
+        )
+        self._queue = queue.Queue(num_prefetches)
+        self._stop_event = threading.Event()
+        self._finished = False
+        self._thread = threading.Thread(
+            target=self._run, args=(iter(loader),), daemon=True
+        )
+        self._thread.start()
+
+    def _stage(self, value: Any, slot: _StagingSlot, counter: List[int]):
+        if isinstance(value, dict):
+            return {
+                k: self._stage(v, slot, counter) for k, v in value.items()
+            }
+        elif isinstance(value, (tuple, list)):
+            return type(value)(self._stage(v, slot, counter) for v in value)
+        elif (
+            isinstance(value, (np.ndarray, np.void))
+            and value.dtype.fields is not None
+        ):
+            return {
+                k: self._stage(np.ascontiguousarray(value[k]), slot, counter)
+                for k in value.dtype.fields.keys()
+            }
+        elif isinstance(value, np.ndarray) and value.dtype.kind in "biufc":
+            value = torch.from_numpy(np.ascontiguousarray(value))
+
+        if not torch.is_tensor(value) or value.device.type != "cpu":
+            return value
+        if not value.is_pinned():
+            buffer = slot.get_buffer(counter[0], value)
+            counter[0] += 1
+            value = buffer.copy_(value)
+        return value.to(self.device, non_blocking=True)
+
+    def _to_device(self, batch: Any, batch_index: int) -> Tuple[Any, Any]:
+        slot = self._slots[batch_index % len(self._slots)]
+        if slot.event is not None:
+            slot.event.synchronize()
+        stream = self._streams[batch_index % len(self._streams)]
+        with torch.cuda.device(self.device), torch.cuda.stream(stream):
+            batch = self._stage(batch, slot, [0])
+            slot.event = torch.cuda.Event()
+            slot.event.record(stream)
+        return batch, slot.event
+
+    def _run(self, iterator: Iterator) -> None:
+        try:
+            for batch_index, batch in enumerate(iterator):
+                if self._stop_event.is_set():
+                    return
+                if self.is_cuda:
+                    self._queue.put(self._to_device(batch, batch_index))
+                else:
+                    self._queue.put((batch, None))
+        except BaseException:  # noqa: WPS424
+            self._queue.put(_ExceptionInfo(sys.exc_info()))
+        finally:
+            self._queue.put(_END)
+
+    def __iter__(self) -> Iterator:
         try:
-            result = result_queue.get(timeout=timeout)
-        except queue.Empty:
-            continue
-        yield result
-    if error_queue.full():
-        raise error_queue.get()[1]
-
-
-def _prefetch_loader(loader: DataLoader, num_prefetches: int) -> Iterable:
-    if torch.cuda.is_available():
-        return _prefetch_map(
-            _any2cuda_non_blocking, loader, num_prefetches=num_prefetches,
+            while True:
+                item = self._queue.get()
+                if item is _END:
+                    self._finished = True
+                    return
+                elif isinstance(item, _ExceptionInfo):
+                    raise item.exc_info[1]
+                batch, event = item
+                if event is not None:
+                    stream = torch.cuda.current_stream(self.device)
+                    stream.wait_event(event)
+                    _record_stream(batch, stream)
+                yield batch
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Stops the prefetch thread."""
+        if self._finished:
+            return
+        self._finished = True
+        self._stop_event.set()
+        # unblocks the prefetch thread, it puts at most one more batch
+        while self._queue.get() is not _END:
+            pass
+        self._thread.join()
+
+
+def _record_stream(value: Any, stream) -> None:
+    # tensors were allocated on the copy stream, so the memory
+    # should not be reused until the current stream is done with them
+    if isinstance(value, dict):
+        for v in value.values():
+            _record_stream(v, stream)
+    elif isinstance(value, (tuple, list)):
+        for v in value:
+            _record_stream(v, stream)
+    elif torch.is_tensor(value) and value.is_cuda:
+        value.record_stream(stream)
+
+
+def _prefetch_loader(
+    loader: DataLoader,
+    num_prefetches: int,
+    device: torch.device,
+    num_streams: int = 1,
+) -> Iterator:
+    return iter(
+        _BatchPrefetcher(
+            loader,
+            num_prefetches=num_prefetches,
+            device=device,
+            num_streams=num_streams,
         )
-    else:
-        return iter(loader)
+    )
 
 
 class BatchPrefetchLoaderWrapper(ILoaderWrapper):
     """Loader wrapper. Prefetches specified number of batches on the GPU.
 
+    Batches are copied in the background thread
+    through the reusable pinned staging buffers
+    on the dedicated CUDA streams, so the copies overlap
+    with the computations, the current stream waits for the copy events.
+    Structured numpy arrays are converted to the dicts of tensors.
+    Without GPU batches are still collated and prefetched
+    in the background thread.
+
     Base usage:
 
     .. code-block:: python
@@ -298,15 +426,30 @@ class BatchPrefetchLoaderWrapper(ILoaderWrapper):
 
     """
 
-    def __init__(self, loader: DataLoader, num_prefetches: int = None):
+    def __init__(
+        self,
+        loader: DataLoader,
+        num_prefetches: int = None,
+        device: Union[str, torch.device] = None,
+        num_streams: int = 1,
+    ):
         """Loader wrapper. Prefetches specified number of batches on the GPU.
 
         Args:
             loader: torch dataloader.
             num_prefetches: number of batches to prefetch on the GPU.
+            device: device to prefetch batches to,
+                if None, uses cuda if available.
+                For the cpu device batches are prefetched
+                in the background thread without the copies.
+            num_streams: number of CUDA streams for the batches copies.
         """
         super().__init__(loader)
         self.num_prefetches = num_prefetches or 1
+        if device is None:
+            device = "cuda" if torch.cuda.is_available() else "cpu"
+        self.device = torch.device(device)
+        self.num_streams = num_streams
 
     def __iter__(self):
         """Iterator.
@@ -314,7 +457,12 @@ class BatchPrefetchLoaderWrapper(ILoaderWrapper):
         Returns:
             iterator object
         """
-        return _prefetch_loader(self.origin, self.num_prefetches)
+        return _prefetch_loader(
+            self.origin,
+            num_prefetches=self.num_prefetches,
+            device=self.device,
+            num_streams=self.num_streams,
+        )
 
 
 __all__ = ["BatchLimitLoaderWrapper", "BatchPrefetchLoaderWrapper"]
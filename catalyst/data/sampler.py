@@ -1,8 +1,16 @@
-from typing import Iterator, List, Optional, Union
-from collections import Counter
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Union,
+)
+from contextlib import contextmanager
 import logging
-from operator import itemgetter
-from random import choices, sample
+import random
 
 import numpy as np
 
@@ -11,7 +19,115 @@ from torch.utils.data import DistributedSampler
 from torch.utils.data.sampler import BatchSampler, Sampler
 
 from catalyst.data.dataset.torch import DatasetFromSampler
-from catalyst.utils.misc import find_value_ids
+
+
+class _LabelIndex(object):
+    """
+    CSR index of the labels: samples indices sorted by the label
+    and the offsets of every class in them,
+    so the class ``i`` samples are
+    ``indices[offsets[i]:offsets[i + 1]]``.
+    """
+
+    def __init__(self, labels: Union[List[int], np.ndarray]):
+        """
+        Args:
+            labels: label of every sample in the dataset
+        """
+        self.classes, inverse, self.counts = np.unique(
+            np.asarray(labels), return_inverse=True, return_counts=True
+        )
+        self.indices = np.argsort(inverse.reshape(-1), kind="stable")
+        self.offsets = np.concatenate([[0], np.cumsum(self.counts)])
+
+    def __len__(self) -> int:
+        return len(self.classes)
+
+    def get_class_indices(self, class_index: int) -> np.ndarray:
+        """
+        Args:
+            class_index: position of the class in the ``classes``
+
+        Returns:
+            np.ndarray: indices of the class samples
+        """
+        start, end = self.offsets[class_index], self.offsets[class_index + 1]
+        return self.indices[start:end]
+
+
+def _get_label_to_indices(label_index: _LabelIndex) -> Dict[Any, List[int]]:
+    """
+    Args:
+        label_index: labels index
+
+    Returns:
+        mapping from the label to the indices of its samples
+    """
+    return {
+        label: label_index.get_class_indices(class_index).tolist()
+        for class_index, label in enumerate(label_index.classes.tolist())
+    }
+
+
+def _get_ranges(starts: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """Concatenates ``arange(start, start + length)`` ranges."""
+    ends = np.cumsum(lengths)
+    return np.repeat(starts - ends + lengths, lengths) + np.arange(
+        ends[-1] if len(ends) else 0
+    )
+
+
+def _sample_from_classes(
+    label_index: _LabelIndex,
+    class_indices: np.ndarray,
+    num_samples: np.ndarray,
+    replace: np.ndarray,
+) -> np.ndarray:
+    """
+    Samples ``num_samples[i]`` indices of the ``class_indices[i]`` class
+    for all classes at once.
+
+    Args:
+        label_index: labels index
+        class_indices: positions of the classes in the ``label_index``
+        num_samples: number of samples for every class
+        replace: flags to sample with replacement for every class,
+            classes without replacement should have enough samples
+
+    Returns:
+        np.ndarray: sampled indices, grouped by the classes
+        in the ``class_indices`` order
+    """
+    class_indices = np.asarray(class_indices, dtype=np.int64)
+    num_samples = np.asarray(num_samples, dtype=np.int64)
+    replace = np.asarray(replace, dtype=bool)
+    starts = label_index.offsets[class_indices]
+    counts = label_index.counts[class_indices]
+    positions = np.empty(num_samples.sum(), dtype=np.int64)
+    output_starts = np.cumsum(num_samples) - num_samples
+
+    if replace.any():
+        sample_starts = np.repeat(starts[replace], num_samples[replace])
+        sample_counts = np.repeat(counts[replace], num_samples[replace])
+        output_ids = _get_ranges(output_starts[replace], num_samples[replace])
+        positions[output_ids] = sample_starts + (
+            np.random.random_sample(len(output_ids)) * sample_counts
+        ).astype(np.int64)
+
+    keep = ~replace
+    if keep.any():
+        # random ranks inside every class: sort by (class, random key)
+        class_positions = _get_ranges(starts[keep], counts[keep])
+        groups = np.repeat(np.arange(keep.sum()), counts[keep])
+        order = np.lexsort(
+            (np.random.random_sample(len(class_positions)), groups)
+        )
+        group_starts = np.cumsum(counts[keep]) - counts[keep]
+        selected = _get_ranges(group_starts, num_samples[keep])
+        output_ids = _get_ranges(output_starts[keep], num_samples[keep])
+        positions[output_ids] = class_positions[order[selected]]
+
+    return label_index.indices[positions]
 
 
 class BalanceClassSampler(Sampler):
@@ -30,46 +146,57 @@ class BalanceClassSampler(Sampler):
         super().__init__(labels)
 
         labels = np.array(labels)
-        samples_per_class = {
-            label: (labels == label).sum() for label in set(labels)
-        }
-
-        self.lbl2idx = {
-            label: np.arange(len(labels))[labels == label].tolist()
-            for label in set(labels)
-        }
+        self._label_index = _LabelIndex(labels)
+        class_sizes = self._label_index.counts
 
         if isinstance(mode, str):
             assert mode in ["downsampling", "upsampling"]
 
         if isinstance(mode, int) or mode == "upsampling":
             samples_per_class = (
-                mode
-                if isinstance(mode, int)
-                else max(samples_per_class.values())
+                mode if isinstance(mode, int) else int(class_sizes.max())
             )
         else:
-            samples_per_class = min(samples_per_class.values())
+            samples_per_class = int(class_sizes.min())
 
+        # built on the first access, sampling uses the labels index
+        self._lbl2idx = None
         self.labels = labels
         self.samples_per_class = samples_per_class
-        self.length = self.samples_per_class * len(set(labels))
+        self.length = self.samples_per_class * len(self._label_index)
 
-    def __iter__(self) -> Iterator[int]:
+    @property
+    def lbl2idx(self) -> Dict[Any, List[int]]:
         """
-        Yields:
-            indices of stratified sample
+        Returns:
+            mapping from the label to the indices of its samples
         """
-        indices = []
-        for key in sorted(self.lbl2idx):
-            replace_flag = self.samples_per_class > len(self.lbl2idx[key])
-            indices += np.random.choice(
-                self.lbl2idx[key], self.samples_per_class, replace=replace_flag
-            ).tolist()
+        if self._lbl2idx is None:
+            self._lbl2idx = _get_label_to_indices(self._label_index)
+        return self._lbl2idx
+
+    def get_indices(self) -> np.ndarray:
+        """
+        Returns:
+            np.ndarray: indices of stratified sample
+        """
+        num_samples = np.full(len(self._label_index), self.samples_per_class)
+        indices = _sample_from_classes(
+            self._label_index,
+            class_indices=np.arange(len(self._label_index)),
+            num_samples=num_samples,
+            replace=num_samples > self._label_index.counts,
+        )
         assert len(indices) == self.length
         np.random.shuffle(indices)
+        return indices
 
-        return iter(indices)
+    def __iter__(self) -> Iterator[int]:
+        """
+        Yields:
+            indices of stratified sample
+        """
+        return iter(self.get_indices().tolist())
 
     def __len__(self) -> int:
         """
@@ -123,12 +250,12 @@ class BalanceBatchSampler(Sampler):
     def __init__(self, labels: Union[List[int], np.ndarray], p: int, k: int):
         """Sampler initialisation."""
         super().__init__(self)
-        classes = set(labels)
+        self._label_index = _LabelIndex(labels)
 
         assert isinstance(p, int) and isinstance(k, int)
-        assert (1 < p <= len(classes)) and (1 < k)
-        assert all(
-            n > 1 for n in Counter(labels).values()
+        assert (1 < p <= len(self._label_index)) and (1 < k)
+        assert np.all(
+            self._label_index.counts > 1
         ), "Each class shoud contain at least 2 instances to fit (1)"
 
         self._labels = labels
@@ -136,10 +263,9 @@ class BalanceBatchSampler(Sampler):
         self._k = k
 
         self._batch_size = self._p * self._k
-        self._classes = classes
 
         # to satisfy statement (1)
-        num_classes = len(self._classes)
+        num_classes = len(self._label_index)
         if num_classes % self._p == 1:
             self._num_epoch_classes = num_classes - 1
         else:
@@ -168,29 +294,37 @@ class BalanceBatchSampler(Sampler):
         """
         return self._num_epoch_classes * self._k
 
+    def get_indices(self) -> np.ndarray:
+        """
+        Returns:
+            np.ndarray: indeces for sampling dataset elems during an epoch
+        """
+        class_indices = np.random.choice(
+            len(self._label_index), self._num_epoch_classes, replace=False
+        )
+        # all instances of the small classes are selected
+        # and the rest are chosen with repetition
+        num_existing = np.minimum(
+            self._label_index.counts[class_indices], self._k
+        )
+        num_samples = np.concatenate([num_existing, self._k - num_existing])
+        indices = _sample_from_classes(
+            self._label_index,
+            class_indices=np.concatenate([class_indices, class_indices]),
+            num_samples=num_samples,
+            replace=np.repeat([False, True], len(class_indices)),
+        )
+        groups = np.repeat(
+            np.tile(np.arange(len(class_indices)), 2), num_samples
+        )
+        return indices[np.argsort(groups, kind="stable")]
+
     def __iter__(self) -> Iterator[int]:
         """
         Returns:
             indeces for sampling dataset elems during an epoch
         """
-        inds = []
-
-        for cls_id in sample(self._classes, self._num_epoch_classes):
-            all_cls_inds = find_value_ids(self._labels, cls_id)
-
-            # we've checked in __init__ that this value must be > 1
-            num_samples_exists = len(all_cls_inds)
-
-            if num_samples_exists < self._k:
-                selected_inds = sample(
-                    all_cls_inds, k=num_samples_exists
-                ) + choices(all_cls_inds, k=self._k - num_samples_exists)
-            else:
-                selected_inds = sample(all_cls_inds, k=self._k)
-
-            inds.extend(selected_inds)
-
-        return iter(inds)
+        return iter(self.get_indices().tolist())
 
 
 class DynamicBalanceClassSampler(Sampler):
@@ -266,8 +400,8 @@ class DynamicBalanceClassSampler(Sampler):
         self.max_d = max_d
         self.epoch = start_epoch
         labels = np.array(labels)
-        samples_per_class = Counter(labels)
-        self.min_class_size = min(samples_per_class.values())
+        self._label_index = _LabelIndex(labels)
+        self.min_class_size = int(self._label_index.counts.min())
 
         if self.min_class_size < 100 and not ignore_warning:
             logger = logging.getLogger(__name__)
@@ -275,18 +409,17 @@ class DynamicBalanceClassSampler(Sampler):
                 f"the smallest class contains only"
                 f" {self.min_class_size} examples. At the end of"
                 f" training, epochs will contain only"
-                f" {self.min_class_size * len(samples_per_class)}"
+                f" {self.min_class_size * len(self._label_index)}"
                 f" examples"
             )
 
-        self.original_d = {
-            key: value / self.min_class_size
-            for key, value in samples_per_class.items()
-        }
-        self.label2idxes = {
-            label: np.arange(len(labels))[labels == label].tolist()
-            for label in set(labels)
-        }
+        # class distribution, aligned with the sorted unique labels
+        self._original_d = self._label_index.counts / self.min_class_size
+        self.original_d = dict(
+            zip(self._label_index.classes.tolist(), self._original_d.tolist())
+        )
+        # built on the first access, sampling uses the labels index
+        self._label2idxes = None
 
         if isinstance(mode, int):
             self.min_class_size = mode
@@ -296,42 +429,62 @@ class DynamicBalanceClassSampler(Sampler):
         self.labels = labels
         self._update()
 
+    @property
+    def label2idxes(self) -> Dict[Any, List[int]]:
+        """
+        Returns:
+            mapping from the label to the indices of its samples
+        """
+        if self._label2idxes is None:
+            self._label2idxes = _get_label_to_indices(self._label_index)
+        return self._label2idxes
+
     def _update(self) -> None:
         """
         Update d coefficients
         Returns: None
         """
-        current_d = {
-            key: min(value ** self._exp_scheduler(), self.max_d)
-            for key, value in self.original_d.items()
-        }
-        samples_per_classes = {
-            key: int(value * self.min_class_size)
-            for key, value in current_d.items()
-        }
-        self.samples_per_classes = samples_per_classes
-        self.length = np.sum(list(samples_per_classes.values()))
+        current_d = np.minimum(
+            self._original_d ** self._exp_scheduler(), self.max_d
+        )
+        self._samples_per_classes = (current_d * self.min_class_size).astype(
+            np.int64
+        )
+        self.samples_per_classes = dict(
+            zip(
+                self._label_index.classes.tolist(),
+                self._samples_per_classes.tolist(),
+            )
+        )
+        self.length = int(self._samples_per_classes.sum())
         self.epoch += 1
 
     def _exp_scheduler(self) -> float:
         return self.exp_lambda ** self.epoch
 
-    def __iter__(self) -> Iterator[int]:
+    def get_indices(self) -> np.ndarray:
         """
-        Yields:
-            indices of stratified sample
+        Returns:
+            np.ndarray: indices of stratified sample,
+            the class distribution is updated for the next epoch
         """
-        indices = []
-        for key in sorted(self.label2idxes):
-            samples_per_class = self.samples_per_classes[key]
-            replace_flag = samples_per_class > len(self.label2idxes[key])
-            indices += np.random.choice(
-                self.label2idxes[key], samples_per_class, replace=replace_flag
-            ).tolist()
+        indices = _sample_from_classes(
+            self._label_index,
+            class_indices=np.arange(len(self._label_index)),
+            num_samples=self._samples_per_classes,
+            replace=self._samples_per_classes > self._label_index.counts,
+        )
         assert len(indices) == self.length
         np.random.shuffle(indices)
         self._update()
-        return iter(indices)
+        return indices
+
+    def __iter__(self) -> Iterator[int]:
+        """
+        Yields:
+            indices of stratified sample
+        """
+        return iter(self.get_indices().tolist())
 
     def __len__(self) -> int:
         """
@@ -412,11 +565,10 @@ class MiniEpochSampler(Sampler):
                     self._indices, self.mini_epoch_len, replace=True
                 )
 
-    def __iter__(self) -> Iterator[int]:
-        """Iterate over sampler.
-
+    def get_indices(self) -> np.ndarray:
+        """
         Returns:
-            python iterator
+            np.ndarray: indices of the next mini epoch
         """
         self.state_i = self.state_i % self.divider
         self.shuffle()
@@ -427,10 +579,18 @@ class MiniEpochSampler(Sampler):
             if (self.state_i == self.steps)
             else (self.state_i + 1) * self.mini_epoch_len
         )
-        indices = self.indices[start:stop].tolist()
+        indices = self.indices[start:stop].copy()
 
         self.state_i += 1
-        return iter(indices)
+        return indices
+
+    def __iter__(self) -> Iterator[int]:
+        """Iterate over sampler.
+
+        Returns:
+            python iterator
+        """
+        return iter(self.get_indices().tolist())
 
     def __len__(self) -> int:
         """
@@ -519,6 +679,368 @@ class DynamicLenBatchSampler(BatchSampler):
         )
 
 
+class BucketBatchSampler(Sampler):
+    """
+    Batch sampler, that groups samples of the similar length
+    into the same batches to reduce the padding.
+
+    Samples are assigned to the buckets by the precomputed lengths
+    (the dataset is not accessed during the sampling),
+    shuffled within the buckets, split into the batches
+    and then the batches are shuffled across the buckets.
+    Batch size could be fixed with ``batch_size``
+    or computed per bucket from the ``max_tokens`` budget:
+    ``max_tokens // bucket_max_length`` samples per batch.
+
+    The shuffle depends only on the ``seed`` and the epoch,
+    epoch is incremented after every ``__iter__`` call
+    or could be set with ``set_epoch``.
+
+    Example:
+        >>> lengths = [len(tokens) for tokens in tokenized_texts]
+        >>> sampler = BucketBatchSampler(
+        >>>     lengths, max_tokens=4096, bucket_boundaries=[16, 32, 64, 128]
+        >>> )
+        >>> loader = DataLoader(
+        >>>     dataset, batch_sampler=sampler, collate_fn=pad_collate_fn
+        >>> )
+    """
+
+    def __init__(
+        self,
+        lengths: Union[Sequence[int], np.ndarray, Callable[[int], int]],
+        batch_size: int = None,
+        max_tokens: int = None,
+        bucket_boundaries: Sequence[int] = None,
+        shuffle: bool = True,
+        drop_last: bool = False,
+        seed: int = 0,
+        data_len: int = None,
+    ):
+        """
+        Args:
+            lengths: lengths of the dataset samples
+                or callback to get the length by the sample index,
+                the callback is called once per sample
+                during the initialisation
+            batch_size: maximum number of samples in the batch
+            max_tokens: maximum number of the tokens in the padded batch,
+                a sample longer than ``max_tokens`` forms its own batch
+            bucket_boundaries: sorted lengths, that split samples
+                into the buckets, bucket ``i`` contains samples with
+                ``bucket_boundaries[i - 1] <= length < bucket_boundaries[i]``,
+                if None, boundaries are the length deciles
+            shuffle: if True, shuffles samples within the buckets
+                and batches across the buckets
+            drop_last: if True, drops the last incomplete batch
+                of every bucket
+            seed: random seed for the shuffle
+            data_len: dataset size, required for the lengths callback
+        """
+        super().__init__(None)
+        if batch_size is None and max_tokens is None:
+            raise ValueError("batch_size or max_tokens should be specified")
+        if callable(lengths):
+            if data_len is None:
+                raise ValueError("data_len is required for lengths callback")
+            lengths = np.fromiter(
+                (lengths(index) for index in range(data_len)),
+                dtype=np.int64,
+                count=data_len,
+            )
+        self.lengths = np.asarray(lengths, dtype=np.int64)
+        if bucket_boundaries is None:
+            bucket_boundaries = np.unique(
+                np.quantile(self.lengths, np.linspace(0, 1, 11)[1:-1])
+            )
+        self.bucket_boundaries = np.sort(np.asarray(bucket_boundaries))
+        self.batch_size = batch_size
+        self.max_tokens = max_tokens
+        self.shuffle = shuffle
+        self.drop_last = drop_last
+        self.seed = seed
+        self.epoch = 0
+
+        bucket_ids = np.searchsorted(
+            self.bucket_boundaries, self.lengths, side="right"
+        )
+        counts = np.bincount(bucket_ids)
+        offsets = np.concatenate([[0], np.cumsum(counts)])
+        order = np.argsort(bucket_ids, kind="stable")
+        self._buckets = [
+            order[start:end]
+            for start, end in zip(offsets[:-1], offsets[1:])
+            if end > start
+        ]
+        self._bucket_batch_sizes = [
+            self._get_batch_size(self.lengths[bucket].max())
+            for bucket in self._buckets
+        ]
+        self._num_batches = sum(
+            len(bucket) // batch_size
+            if drop_last
+            else -(-len(bucket) // batch_size)
+            for bucket, batch_size in zip(
+                self._buckets, self._bucket_batch_sizes
+            )
+        )
+
+    def _get_batch_size(self, max_length: int) -> int:
+        batch_sizes = []
+        if self.batch_size is not None:
+            batch_sizes.append(self.batch_size)
+        if self.max_tokens is not None:
+            batch_sizes.append(max(1, self.max_tokens // max(1, max_length)))
+        return min(batch_sizes)
+
+    def set_epoch(self, epoch: int) -> None:
+        """Sets the epoch for the shuffle.
+
+        Args:
+            epoch: epoch number
+        """
+        self.epoch = epoch
+
+    def _get_batches(self) -> List[np.ndarray]:
+        """
+        Returns:
+            list of the batches indices arrays for the current epoch
+        """
+        random_state = np.random.RandomState(self.seed + self.epoch)
+        self.epoch += 1
+        batches = []
+        for bucket, batch_size in zip(self._buckets, self._bucket_batch_sizes):
+            if self.shuffle:
+                bucket = random_state.permutation(bucket)
+            end = (
+                len(bucket) - len(bucket) % batch_size
+                if self.drop_last
+                else len(bucket)
+            )
+            batches.extend(
+                bucket[start : start + batch_size]
+                for start in range(0, end, batch_size)
+            )
+        if self.shuffle:
+            order = random_state.permutation(len(batches))
+            batches = [batches[i] for i in order]
+        return batches
+
+    def __iter__(self) -> Iterator[List[int]]:
+        """
+        Yields:
+            indices of the batch samples
+        """
+        for batch in self._get_batches():
+            yield batch.tolist()
+
+    def __len__(self) -> int:
+        """
+        Returns:
+            int: number of batches
+        """
+        return self._num_batches
+
+
+class DistributedBucketBatchSampler(BucketBatchSampler):
+    """
+    Distributed version of the ``BucketBatchSampler``.
+
+    Every process generates the same batches from the shared ``seed``
+    and epoch and takes every ``num_replicas``-th batch,
+    the batches are repeated to make their number evenly divisible.
+
+    .. note::
+        ``runner`` calls ``set_epoch`` before every loader run.
+    """
+
+    def __init__(
+        self,
+        lengths: Union[Sequence[int], np.ndarray, Callable[[int], int]],
+        num_replicas: Optional[int] = None,
+        rank: Optional[int] = None,
+        **kwargs,
+    ):
+        """
+        Args:
+            lengths: lengths of the dataset samples
+                or callback to get the length by the sample index
+            num_replicas: number of processes participating in
+                distributed training, if None, the world size is used
+            rank: rank of the current process within ``num_replicas``,
+                if None, the current process rank is used
+            **kwargs: ``BucketBatchSampler`` params
+        """
+        super().__init__(lengths, **kwargs)
+        if num_replicas is None:
+            num_replicas = torch.distributed.get_world_size()
+        if rank is None:
+            rank = torch.distributed.get_rank()
+        self.num_replicas = num_replicas
+        self.rank = rank
+
+    def _get_batches(self) -> List[np.ndarray]:
+        batches = super()._get_batches()
+        total_size = len(self) * self.num_replicas
+        ids = np.arange(self.rank, total_size, self.num_replicas)
+        return [batches[i % len(batches)] for i in ids]
+
+    def __len__(self) -> int:
+        """
+        Returns:
+            int: number of batches of the current process
+        """
+        return -(-self._num_batches // self.num_replicas)
+
+
+@contextmanager
+def _random_seed(seed: int) -> Iterator[None]:
+    """Seeds python, numpy and torch CPU random generators
+    and restores their states on exit.
+    CUDA generators are left untouched."""
+    python_state = random.getstate()
+    numpy_state = np.random.get_state()
+    torch_state = torch.get_rng_state()
+    random.seed(seed)
+    np.random.seed(seed)
+    # ``torch.manual_seed`` would reseed the CUDA generators too
+    torch.default_generator.manual_seed(seed)
+    try:
+        yield
+    finally:
+        random.setstate(python_state)
+        np.random.set_state(numpy_state)
+        torch.set_rng_state(torch_state)
+
+
+class ShardShuffleSampler(Sampler):
+    """
+    Sampler, that shuffles the samples with the storage locality:
+    the shards are read one by one in the random order,
+    the samples are shuffled within the shard.
+
+    With ``block_size > 1`` the shard is split into the blocks
+    of the consecutive samples, the blocks are shuffled within the shard
+    and the samples are shuffled within the block,
+    so the reads are almost sequential
+    (e.g. for the ``RecordDataset`` with ``readahead``).
+
+    The shuffle depends only on the ``seed`` and the epoch,
+    epoch is incremented after every ``__iter__`` call
+    or could be set with ``set_epoch``.
+
+    Example:
+        >>> dataset = RecordDataset("./data/records", open_fn=open_fn)
+        >>> sampler = ShardShuffleSampler(dataset.shard_ids)
+        >>> loader = DataLoader(dataset, sampler=sampler, batch_size=32)
+
+    .. note::
+        For the distributed training use
+        ``DistributedSamplerWrapper(sampler, shuffle=False)``
+        to keep the shards order.
+    """
+
+    def __init__(
+        self,
+        shard_ids: Union[Sequence[int], np.ndarray],
+        block_size: int = 1,
+        shuffle_shards: bool = True,
+        seed: int = 0,
+    ):
+        """
+        Args:
+            shard_ids: shard of every sample
+            block_size: number of the consecutive samples of the shard,
+                that are read together
+            shuffle_shards: if True, shuffles the shards order
+            seed: random seed for the shuffle
+        """
+        super().__init__(None)
+        self.shard_ids = np.asarray(shard_ids, dtype=np.int64)
+        self.block_size = max(block_size, 1)
+        self.shuffle_shards = shuffle_shards
+        self.seed = seed
+        self.epoch = 0
+
+        # global block of every sample in the shard-major order
+        order = np.argsort(self.shard_ids, kind="stable")
+        sorted_shards = self.shard_ids[order]
+        starts = np.flatnonzero(np.diff(sorted_shards, prepend=-1))
+        positions = np.arange(len(order)) - np.repeat(
+            starts, np.diff(np.append(starts, len(order)))
+        )
+        is_block_start = (positions % self.block_size == 0).astype(np.int64)
+        self._block_ids = np.empty(len(order), dtype=np.int64)
+        self._block_ids[order] = np.cumsum(is_block_start) - 1
+        self._num_shards = int(self.shard_ids.max(initial=-1)) + 1
+
+    def set_epoch(self, epoch: int) -> None:
+        """Sets the epoch for the shuffle.
+
+        Args:
+            epoch: epoch number
+        """
+        self.epoch = epoch
+
+    def get_indices(self) -> np.ndarray:
+        """
+        Returns:
+            np.ndarray: indices of the samples for the current epoch
+        """
+        random_state = np.random.RandomState(self.seed + self.epoch)
+        self.epoch += 1
+        shard_keys = (
+            random_state.permutation(self._num_shards)
+            if self.shuffle_shards
+            else np.arange(self._num_shards)
+        )
+        num_blocks = int(self._block_ids.max(initial=-1)) + 1
+        block_keys = random_state.permutation(num_blocks)
+        sample_keys = random_state.permutation(len(self.shard_ids))
+        return np.lexsort(
+            (
+                sample_keys,
+                block_keys[self._block_ids],
+                shard_keys[self.shard_ids],
+            )
+        )
+
+    def __iter__(self) -> Iterator[int]:
+        """
+        Returns:
+            iterator over the samples indices
+        """
+        return iter(self.get_indices().tolist())
+
+    def __len__(self) -> int:
+        """
+        Returns:
+            int: length of the dataset
+        """
+        return len(self.shard_ids)
+
+
+def _iter_stride(
+    iterator: Iterator[int], rank: int, num_replicas: int, num_samples: int
+) -> Iterator[int]:
+    """
+    Yields every ``num_replicas``-th index starting from the ``rank``-th one.
+    Indices are wrapped around to yield ``num_samples`` indices,
+    so only the first ``num_replicas`` indices are stored.
+    """
+    head = []
+    length = 0
+    for position, index in enumerate(iterator):
+        if position < num_replicas:
+            head.append(index)
+        if position % num_replicas == rank:
+            yield index
+        length = position + 1
+    for position in range(length, num_samples * num_replicas):
+        if position % num_replicas == rank:
+            yield head[(position - length) % length]
+
+
 class DistributedSamplerWrapper(DistributedSampler):
     """
     Wrapper over `Sampler` for distributed training.
@@ -530,8 +1052,17 @@ class DistributedSamplerWrapper(DistributedSampler):
     sampler, and load a subset of subsampled data of the original dataset
     that is exclusive to it.
 
+    Every process samples the same epoch indices
+    with the random generators seeded by ``seed`` and epoch,
+    and takes every ``num_replicas``-th index.
+    Samplers with the ``get_indices`` method
+    (``BalanceClassSampler``, ``DynamicBalanceClassSampler``,
+    ``MiniEpochSampler``) are sharded as numpy arrays,
+    the other samplers are iterated with the stride,
+    so only the process shard is stored.
+
     .. note::
-        Sampler is assumed to be of constant size.
+        Sampler is assumed to be of the same size for all processes.
     """
 
     def __init__(
@@ -540,6 +1071,7 @@ class DistributedSamplerWrapper(DistributedSampler):
         num_replicas: Optional[int] = None,
         rank: Optional[int] = None,
         shuffle: bool = True,
+        seed: int = 0,
     ):
         """
 
@@ -551,6 +1083,7 @@ class DistributedSamplerWrapper(DistributedSampler):
               within ``num_replicas``
             shuffle (bool, optional): If true (default),
               sampler will shuffle the indices
+            seed: random seed shared by the processes
         """
         super(DistributedSamplerWrapper, self).__init__(
             DatasetFromSampler(sampler),
@@ -559,20 +1092,66 @@ class DistributedSamplerWrapper(DistributedSampler):
             shuffle=shuffle,
         )
         self.sampler = sampler
+        self.seed = seed
+
+    def _get_shard(self) -> np.ndarray:
+        if hasattr(self.sampler, "get_indices"):
+            # the epoch is sampled jointly by all processes,
+            # so only the strided view of it is copied
+            # and the padding is taken from the epoch start
+            indices = np.asarray(self.sampler.get_indices())
+            shard = indices[self.rank :: self.num_replicas]
+            # the epoch length is used, as samplers could update
+            # their length for the next epoch in ``get_indices``
+            num_samples = -(-len(indices) // self.num_replicas)
+            total_size = num_samples * self.num_replicas
+            padding_positions = np.arange(
+                self.rank + len(shard) * self.num_replicas,
+                total_size,
+                self.num_replicas,
+            )
+            return np.concatenate(
+                [shard, indices[padding_positions % len(indices)]]
+            )
 
-    def __iter__(self):
-        """@TODO: Docs. Contribution is welcome."""
-        self.dataset = DatasetFromSampler(self.sampler)
-        indexes_of_indexes = super().__iter__()
-        subsampler_indexes = self.dataset
-        return iter(itemgetter(*indexes_of_indexes)(subsampler_indexes))
+        return np.fromiter(
+            _iter_stride(
+                iter(self.sampler),
+                rank=self.rank,
+                num_replicas=self.num_replicas,
+                num_samples=len(self),
+            ),
+            dtype=np.int64,
+            count=len(self),
+        )
+
+    def __iter__(self) -> Iterator[int]:
+        """
+        Returns:
+            iterator over the current process indices
+        """
+        with _random_seed(self.seed + self.epoch):
+            indices = self._get_shard()
+            if self.shuffle:
+                np.random.shuffle(indices)
+        return iter(indices.tolist())
+
+    def __len__(self) -> int:
+        """
+        Returns:
+            int: number of the current process indices
+        """
+        return -(-len(self.sampler) // self.num_replicas)
 
 
 __all__ = [
     "BalanceClassSampler",
     "BalanceBatchSampler",
+    "BucketBatchSampler",
+    "DistributedBucketBatchSampler",
     "DistributedSamplerWrapper",
     "DynamicBalanceClassSampler",
     "DynamicLenBatchSampler",
     "MiniEpochSampler",
+    "ShardShuffleSampler",
 ]
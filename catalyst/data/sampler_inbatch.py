@@ -1,8 +1,6 @@
 from typing import List, Tuple, Union
 from abc import ABC, abstractmethod
 from collections import Counter
-from itertools import combinations, product
-from random import sample
 from sys import maxsize
 
 import numpy as np
@@ -16,8 +14,85 @@ from catalyst.utils.torch import convert_labels2list, normalize
 # order in the triplets: (anchor, positive, negative)
 TTriplets = Tuple[Tensor, Tensor, Tensor]
 TTripletsIds = Tuple[List[int], List[int], List[int]]
+TTripletsTensorIds = Tuple[Tensor, Tensor, Tensor]
 TLabels = Union[List[int], Tensor]
 
+# bigger sets of the triplets are sampled with the rejection
+_MAX_RANDPERM_SIZE = 2 ** 24
+
+
+def _get_labels_tensor(labels: TLabels, device: torch.device) -> Tensor:
+    return torch.as_tensor(labels, dtype=torch.long, device=device)
+
+
+def _get_ids_tensor(ids: List[int], device: torch.device) -> Tensor:
+    return torch.as_tensor(ids, dtype=torch.long, device=device)
+
+
+def _get_ids_lists(ids: TTripletsTensorIds) -> TTripletsIds:
+    ids_anchor, ids_pos, ids_neg = ids
+    return ids_anchor.tolist(), ids_pos.tolist(), ids_neg.tolist()
+
+
+def _get_triplets_masks(labels: Tensor) -> Tuple[Tensor, Tensor]:
+    """
+    Args:
+        labels: labels of the samples in the batch, shape (batch_size,)
+
+    Returns:
+        positives and negatives masks of shape (batch_size, batch_size),
+        mask[i, j] is True if j-th sample is a positive (negative)
+        for the i-th anchor
+    """
+    same_mask = labels.view(-1, 1) == labels.view(1, -1)
+    eye = torch.eye(len(labels), dtype=torch.bool, device=labels.device)
+    return same_mask & ~eye, ~same_mask
+
+
+def _searchsorted_right(sorted_sequence: Tensor, values: Tensor) -> Tensor:
+    if hasattr(torch, "searchsorted"):
+        return torch.searchsorted(sorted_sequence, values, right=True)
+    # torch < 1.6
+    return (sorted_sequence.view(1, -1) <= values.view(-1, 1)).sum(dim=1)
+
+
+def _sample_without_replacement(
+    population_size: int, num_samples: int, device: torch.device
+) -> Tensor:
+    """
+    Samples ``num_samples`` distinct random integers
+    from ``[0, population_size)``.
+
+    Args:
+        population_size: number of integers to sample from
+        num_samples: number of integers to sample
+        device: device for the sampled integers
+
+    Returns:
+        tensor of the sampled integers
+    """
+    use_randperm = (
+        population_size <= _MAX_RANDPERM_SIZE
+        or 2 * num_samples > population_size
+    )
+    if use_randperm:
+        return torch.randperm(population_size, device=device)[:num_samples]
+
+    samples = torch.empty(0, dtype=torch.long, device=device)
+    while len(samples) < num_samples:
+        samples = torch.unique(
+            torch.cat(
+                [
+                    samples,
+                    torch.randint(
+                        population_size, (num_samples,), device=device
+                    ),
+                ]
+            )
+        )
+    ids = torch.randperm(len(samples), device=device)[:num_samples]
+    return samples[ids]
+
 
 class IInbatchTripletSampler(ABC):
     """
@@ -99,6 +174,27 @@ class InBatchTripletsSampler(IInbatchTripletSampler):
         """
         raise NotImplementedError
 
+    def _sample_ids(
+        self, features: Tensor, labels: List[int]
+    ) -> TTripletsTensorIds:
+        """
+        Same as ``_sample``, but the indices are returned as tensors.
+        Override it to keep the sampling on the features device
+        without the transfer of the indices to the host.
+
+        Args:
+            features: has the shape of [batch_size, feature_size]
+            labels: labels of the samples in the batch
+
+        Returns: indices of the batch samples to forming triplets.
+        """
+        ids_anchor, ids_pos, ids_neg = self._sample(features, labels=labels)
+        return (
+            _get_ids_tensor(ids_anchor, features.device),
+            _get_ids_tensor(ids_pos, features.device),
+            _get_ids_tensor(ids_neg, features.device),
+        )
+
     def sample(self, features: Tensor, labels: TLabels) -> TTriplets:
         """
         Args:
@@ -113,7 +209,9 @@ class InBatchTripletsSampler(IInbatchTripletSampler):
         labels = convert_labels2list(labels)
         self._check_input_labels(labels=labels)
 
-        ids_anchor, ids_pos, ids_neg = self._sample(features, labels=labels)
+        ids_anchor, ids_pos, ids_neg = self._sample_ids(
+            features, labels=labels
+        )
 
         return features[ids_anchor], features[ids_pos], features[ids_neg]
 
@@ -133,30 +231,65 @@ class AllTripletsSampler(InBatchTripletsSampler):
         """
         self._max_out_triplets = max_output_triplets
 
-    def _sample(self, *_: Tensor, labels: List[int]) -> TTripletsIds:
+    def _sample(self, *features: Tensor, labels: List[int]) -> TTripletsIds:
         """
         Args:
             labels: labels of the samples in the batch
-            *_: note, that we ignore features argument
+            *features: note, that features are used only
+                to get the device for the sampling
 
         Returns: indeces of triplets
         """
-        num_labels = len(labels)
+        features = features[0] if features else torch.empty(len(labels))
+        return _get_ids_lists(self._sample_ids(features, labels=labels))
 
-        triplets = []
-        for label in set(labels):
-            ids_pos_cur = set(find_value_ids(labels, label))
-            ids_neg_cur = set(range(num_labels)) - ids_pos_cur
+    def _sample_ids(
+        self, features: Tensor, labels: List[int]
+    ) -> TTripletsTensorIds:
+        """
+        Samples random triplets without building all of them:
+        every triplet is a pair of the positives (anchor index is
+        less than the positive index) and one of the anchor negatives,
+        so the triplets are enumerated by pairs and negatives ranks
+        and only the sampled triplets ids are decoded.
 
-            pos_pairs = list(combinations(ids_pos_cur, r=2))
+        Args:
+            features: has the shape of [batch_size, feature_size],
+                used only to get the device for the sampling
+            labels: labels of the samples in the batch
 
-            tri = [(a, p, n) for (a, p), n in product(pos_pairs, ids_neg_cur)]
-            triplets.extend(tri)
+        Returns: indeces of triplets
+        """
+        labels = _get_labels_tensor(labels, features.device)
+        pos_mask, neg_mask = _get_triplets_masks(labels)
+        ids = torch.arange(len(labels), device=labels.device)
 
-        triplets = sample(triplets, min(len(triplets), self._max_out_triplets))
-        ids_anchor, ids_pos, ids_neg = zip(*triplets)
+        pairs = (pos_mask & (ids.view(-1, 1) < ids.view(1, -1))).nonzero()
+        ids_anchor, ids_pos = pairs[:, 0], pairs[:, 1]
 
-        return list(ids_anchor), list(ids_pos), list(ids_neg)
+        # every pair forms a triplet with every negative of the anchor
+        num_negatives = neg_mask.sum(dim=1)[ids_anchor]
+        ends = num_negatives.cumsum(dim=0)
+        num_triplets = int(ends[-1])
+
+        triplets_ids = _sample_without_replacement(
+            num_triplets,
+            min(num_triplets, self._max_out_triplets),
+            device=labels.device,
+        )
+        pairs_ids = _searchsorted_right(ends, triplets_ids)
+        negatives_ranks = (
+            triplets_ids - ends[pairs_ids] + num_negatives[pairs_ids]
+        )
+
+        # sorts every row so, that the negatives go first
+        negatives_order = torch.argsort(
+            (~neg_mask).long() * len(labels) + ids.view(1, -1), dim=1
+        )
+        ids_anchor = ids_anchor[pairs_ids]
+        ids_neg = negatives_order[ids_anchor, negatives_ranks]
+
+        return ids_anchor, ids_pos[pairs_ids], ids_neg
 
 
 class HardTripletsSampler(InBatchTripletsSampler):
@@ -179,10 +312,33 @@ class HardTripletsSampler(InBatchTripletsSampler):
         """
         self._norm_required = norm_required
 
+    def _get_distmat(self, features: Tensor) -> Tensor:
+        if self._norm_required:
+            features = normalize(samples=features.detach())
+
+        return torch.cdist(x1=features, x2=features, p=2)
+
     def _sample(self, features: Tensor, labels: List[int]) -> TTripletsIds:
         """
         This method samples the hardest triplets inside the batch.
 
+        Args:
+            features: has the shape of [batch_size, feature_size]
+            labels: labels of the samples in the batch
+
+        Returns:
+            the batch of the triplets in the order below:
+            (anchor, positive, negative)
+        """
+        return _get_ids_lists(self._sample_ids(features, labels=labels))
+
+    def _sample_ids(
+        self, features: Tensor, labels: List[int]
+    ) -> TTripletsTensorIds:
+        """
+        This method samples the hardest triplets inside the batch
+        on the features device.
+
         Args:
             features: has the shape of [batch_size, feature_size]
             labels: labels of the samples in the batch
@@ -193,14 +349,31 @@ class HardTripletsSampler(InBatchTripletsSampler):
         """
         assert features.shape[0] == len(labels)
 
-        if self._norm_required:
-            features = normalize(samples=features.detach())
+        dist_mat = self._get_distmat(features)
+        labels = _get_labels_tensor(labels, features.device)
 
-        dist_mat = torch.cdist(x1=features, x2=features, p=2)
+        return self._sample_ids_from_distmat(distmat=dist_mat, labels=labels)
 
-        ids_anchor, ids_pos, ids_neg = self._sample_from_distmat(
-            distmat=dist_mat, labels=labels
-        )
+    @staticmethod
+    def _sample_ids_from_distmat(
+        distmat: Tensor, labels: Tensor
+    ) -> TTripletsTensorIds:
+        """
+        Masked argmax/argmin version of the ``_sample_from_distmat``.
+
+        Args:
+            distmat: matrix of distances between the features
+            labels: labels of the samples in the batch
+
+        Returns:
+            the batch of triplets in the order below:
+            (anchor, positive, negative)
+        """
+        pos_mask, neg_mask = _get_triplets_masks(labels)
+
+        ids_anchor = torch.arange(len(labels), device=distmat.device)
+        ids_pos = distmat.masked_fill(~pos_mask, float("-inf")).argmax(dim=1)
+        ids_neg = distmat.masked_fill(~neg_mask, float("inf")).argmin(dim=1)
 
         return ids_anchor, ids_pos, ids_neg
 
@@ -221,25 +394,91 @@ class HardTripletsSampler(InBatchTripletsSampler):
             the batch of triplets in the order below:
             (anchor, positive, negative)
         """
-        ids_all = set(range(len(labels)))
+        return _get_ids_lists(
+            HardTripletsSampler._sample_ids_from_distmat(
+                distmat=distmat,
+                labels=_get_labels_tensor(labels, distmat.device),
+            )
+        )
+
+
+class SemiHardTripletsSampler(HardTripletsSampler):
+    """
+    This sampler selects semi-hard triplets based on distances
+    between features, as proposed in `FaceNet`_:
+    every pair of the samples with the same label forms a triplet
+    with the closest negative sample, that is farther
+    from the anchor than the positive one.
+    If there are no such negatives, the farthest negative is used.
+
+    Semi-hard triplets are less prone to the collapse of the features
+    than the hardest ones at the beginning of the training.
+
+    .. _`FaceNet`: https://arxiv.org/abs/1503.03832
+    """
+
+    @staticmethod
+    def _sample_ids_from_distmat(
+        distmat: Tensor, labels: Tensor
+    ) -> TTripletsTensorIds:
+        """
+        Masked argmin version of the ``_sample_from_distmat``.
 
-        ids_anchor, ids_pos, ids_neg = [], [], []
+        Args:
+            distmat: matrix of distances between the features
+            labels: labels of the samples in the batch
 
-        for i_anch, label in enumerate(labels):
-            ids_label = set(find_value_ids(it=labels, value=label))
+        Returns:
+            the batch of triplets in the order below:
+            (anchor, positive, negative)
+        """
+        pos_mask, neg_mask = _get_triplets_masks(labels)
 
-            ids_pos_cur = np.array(list(ids_label - {i_anch}), int)
-            ids_neg_cur = np.array(list(ids_all - ids_label), int)
+        pairs = pos_mask.nonzero()
+        ids_anchor, ids_pos = pairs[:, 0], pairs[:, 1]
 
-            i_pos = ids_pos_cur[distmat[i_anch, ids_pos_cur].argmax()]
-            i_neg = ids_neg_cur[distmat[i_anch, ids_neg_cur].argmin()]
+        dist_pos = distmat[ids_anchor, ids_pos].view(-1, 1)
+        dist_anchor = distmat[ids_anchor]
+        neg_mask = neg_mask[ids_anchor]
+        semihard_mask = neg_mask & (dist_anchor > dist_pos)
 
-            ids_anchor.append(i_anch)
-            ids_pos.append(i_pos)
-            ids_neg.append(i_neg)
+        ids_semihard = dist_anchor.masked_fill(
+            ~semihard_mask, float("inf")
+        ).argmin(dim=1)
+        ids_easiest = dist_anchor.masked_fill(
+            ~neg_mask, float("-inf")
+        ).argmax(dim=1)
+        ids_neg = torch.where(
+            semihard_mask.any(dim=1), ids_semihard, ids_easiest
+        )
 
         return ids_anchor, ids_pos, ids_neg
 
+    @staticmethod
+    def _sample_from_distmat(
+        distmat: Tensor, labels: List[int]
+    ) -> TTripletsIds:
+        """
+        This method samples the semi-hard triplets based on the given
+        distances matrix. It chooses each pair of the samples
+        with the same label as an anchor and a positive
+        and then finds the semi-hard negative.
+
+        Args:
+            distmat: matrix of distances between the features
+            labels: labels of the samples in the batch
+
+        Returns:
+            the batch of triplets in the order below:
+            (anchor, positive, negative)
+        """
+        return _get_ids_lists(
+            SemiHardTripletsSampler._sample_ids_from_distmat(
+                distmat=distmat,
+                labels=_get_labels_tensor(labels, distmat.device),
+            )
+        )
+
 
 class HardClusterSampler(IInbatchTripletSampler):
     """
@@ -404,5 +643,6 @@ __all__ = [
     "InBatchTripletsSampler",
     "AllTripletsSampler",
     "HardTripletsSampler",
+    "SemiHardTripletsSampler",
     "HardClusterSampler",
 ]
@@ -1,8 +1,27 @@
 # flake8: noqa
 from typing import Union
 from pathlib import Path
+import pickle
 
-from catalyst.data.dataset import PathsDataset
+import numpy as np
+import pytest
+
+import torch
+from torch.utils.data import DataLoader
+
+from catalyst.data.collate_fn import InteractionsCollateFn
+from catalyst.data.dataset import (
+    CachedDataset,
+    ColumnarData,
+    get_cached_datasets,
+    InteractionsDataset,
+    ListDataset,
+    MergeDataset,
+    NumpyDataset,
+    PathsDataset,
+    RecordDataset,
+    write_records,
+)
 
 
 def test_PathsDataset() -> None:
@@ -24,3 +43,219 @@ def test_PathsDataset() -> None:
     for data, target in zip(dataset.data, targets):
         result &= data["targets"] == target
         assert result
+
+
+def test_ColumnarData() -> None:
+    records = [
+        {"path": "image_0.jpg", "targets": 0, "weight": 0.5, "bbox": [1, 2]},
+        {"path": "изображение.jpg", "targets": 1, "weight": 1.0, "bbox": None},
+        {"path": "", "targets": 2, "weight": 2.0, "bbox": (3, 4)},
+    ]
+
+    data = ColumnarData.from_records(records)
+
+    assert len(data) == len(records)
+    assert data.to_list() == records
+    assert data[-1] == records[-1]
+    assert isinstance(data.columns["targets"], np.ndarray)
+    assert isinstance(data[0]["targets"], int)
+    with pytest.raises(IndexError):
+        data[len(records)]
+    with pytest.raises(ValueError):
+        ColumnarData.from_records([{"a": 1}, {"b": 2}])
+
+
+def test_ColumnarData_pickle() -> None:
+    data = ColumnarData({"path": ["a", "b"], "targets": [0, 1]})
+
+    data_restored = pickle.loads(pickle.dumps(data))
+
+    assert data_restored.to_list() == data.to_list()
+
+
+def test_ListDataset_columnar() -> None:
+    records = [{"path": f"{i}.jpg", "targets": i} for i in range(10)]
+
+    dataset = ListDataset(
+        ColumnarData.from_records(records), open_fn=lambda x: x
+    )
+
+    assert len(dataset) == len(records)
+    assert [dataset[i] for i in range(len(dataset))] == records
+
+
+class _DecodeCounter:
+    def __init__(self):
+        self.num_calls = 0
+
+    def __call__(self, row):
+        self.num_calls += 1
+        size = row["size"]
+        return {"image": np.full((size, 3), size, dtype=np.uint8)}
+
+
+def _get_list_dataset(open_fn) -> ListDataset:
+    return ListDataset([{"size": size} for size in range(1, 11)], open_fn)
+
+
+def test_cached_dataset_freeze():
+    open_fn = _DecodeCounter()
+    dataset = CachedDataset(
+        _get_list_dataset(open_fn),
+        capacity=4 * 1024,
+        page_size=128,
+        dict_transform=lambda item: {"image": item["image"] + 1},
+    )
+
+    for _ in range(3):
+        for index in range(len(dataset)):
+            size = index + 1
+            image = dataset[index]["image"]
+            assert image.shape == (size, 3)
+            assert np.all(image == size + 1)
+
+    stats = dataset.get_stats()
+    assert open_fn.num_calls == 10
+    assert stats["misses"] == 10 and stats["hits"] == 20
+    assert stats["items"] == 10
+
+
+def test_cached_dataset_lru():
+    open_fn = _DecodeCounter()
+    # every item takes 2 pages, so only 3 items fit
+    dataset = CachedDataset(
+        _get_list_dataset(open_fn), capacity=6 * 128, page_size=128,
+        policy="lru",
+    )
+
+    for index in [0, 1, 2, 0, 3, 0, 1]:
+        assert dataset[index]["image"].shape == (index + 1, 3)
+
+    # 1 was evicted by 3, 0 was used recently
+    assert open_fn.num_calls == 5
+    assert dataset.get_stats()["items"] == 3
+
+
+def test_cached_dataset_workers():
+    open_fn = _DecodeCounter()
+    cached_dataset = CachedDataset(
+        _get_list_dataset(open_fn), capacity=64 * 1024
+    )
+    dataset = MergeDataset(
+        cached_dataset,
+        NumpyDataset(np.arange(10).reshape(10, 1), numpy_key="targets"),
+    )
+    loader = DataLoader(dataset, batch_size=None, num_workers=2)
+
+    for _ in range(2):
+        for index, item in enumerate(loader):
+            assert item["image"].shape == (index + 1, 3)
+            assert item["targets"].tolist() == [index]
+
+    assert get_cached_datasets(dataset) == [cached_dataset]
+    stats = cached_dataset.get_stats()
+    # the second epoch is read from the cache filled by the workers
+    assert stats["misses"] == 10 and stats["hits"] == 10
+
+
+def _open_record(row):
+    return {"size": len(row["filepath"]), **row}
+
+
+def test_record_dataset(tmp_path):
+    """Checks that the records are packed in order with the files content."""
+    rows = []
+    for index in range(10):
+        filepath = tmp_path / f"{index}.bin"
+        filepath.write_bytes(bytes([index]) * 1000)
+        rows.append({"filepath": filepath.name, "label": index})
+    # every shard contains 2 records
+    write_records(
+        rows,
+        tmp_path / "records",
+        file_columns=["filepath"],
+        rootpath=str(tmp_path),
+        shard_size=2500,
+        num_workers=2,
+    )
+
+    dataset = RecordDataset(
+        tmp_path / "records",
+        open_fn=_open_record,
+        readahead=4096,
+    )
+    assert len(dataset) == 10
+    assert dataset.shard_ids.tolist() == [0, 0, 1, 1, 2, 2, 3, 3, 4, 4]
+    assert dataset.meta["num_shards"] == 5
+    for index in [3, 0, 9, 3]:
+        item = dataset[index]
+        assert item["filepath"] == bytes([index]) * 1000
+        assert item["label"] == index and item["size"] == 1000
+
+    # the memory maps are reopened by the workers
+    dataset = pickle.loads(pickle.dumps(dataset))
+    loader = DataLoader(dataset, batch_size=None, num_workers=2)
+    assert [item["label"] for item in loader] == list(range(10))
+
+
+def test_interactions_dataset():
+    """Checks the CSR construction and the sparse rows."""
+    dataset = InteractionsDataset.from_coo(
+        users=[2, 0, 2, 0, 2, 0],
+        items=[3, 1, 0, 1, 4, 1],
+        values=[5, 2, 4, 3, 1, 4],
+        num_users=4,
+        num_items=6,
+        min_value=2,
+    )
+
+    assert len(dataset) == 4 and dataset.num_items == 6
+    assert dataset.indptr.tolist() == [0, 1, 1, 3, 3]
+    # the last duplicate is kept
+    assert dataset[0]["items"].tolist() == [1]
+    assert dataset[0]["values"].tolist() == [4.0]
+    assert dataset[2]["items"].tolist() == [0, 3]
+    assert dataset[3]["items"].tolist() == []
+
+    dense = dataset.to_sparse_tensor().to_dense()
+    assert dense.shape == (4, 6) and dense[2, 3] == 5
+    restored = InteractionsDataset.from_sparse_tensor(
+        dataset.to_sparse_tensor()
+    )
+    assert restored.indptr.tolist() == dataset.indptr.tolist()
+    assert restored.indices.tolist() == dataset.indices.tolist()
+
+
+def test_interactions_collate_fn():
+    """Checks the sparse targets and the negatives sampling."""
+    torch.manual_seed(42)
+    num_items = 10
+    dataset = InteractionsDataset.from_coo(
+        users=np.repeat(np.arange(4), 2),
+        items=np.concatenate([np.arange(2) + user for user in range(4)]),
+        num_items=num_items,
+    )
+    loader = DataLoader(
+        dataset,
+        batch_size=3,
+        collate_fn=InteractionsCollateFn(num_items, num_negatives=20),
+    )
+
+    batches = list(loader)
+
+    assert [len(batch["users"]) for batch in batches] == [3, 1]
+    for batch in batches:
+        targets = batch["targets"]
+        assert targets.is_sparse and targets.shape[1] == num_items
+        dense = targets.to_dense()
+        for row, user in enumerate(batch["users"].tolist()):
+            assert dense[row].nonzero().view(-1).tolist() == list(
+                range(user, user + 2)
+            )
+            assert dense[row, batch["negatives"][row]].sum() == 0
+
+    dense_batch = InteractionsCollateFn(num_items, dense=True)(
+        [dataset[0], dataset[3]]
+    )
+    assert dense_batch["targets"].shape == (2, num_items)
+    assert "negatives" not in dense_batch
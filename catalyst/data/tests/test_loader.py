@@ -0,0 +1,72 @@
+# flake8: noqa
+import numpy as np
+import pytest
+
+import torch
+from torch.utils.data import DataLoader, TensorDataset
+
+from catalyst.data.loader import BatchPrefetchLoaderWrapper
+
+
+def _get_loader(num_samples: int = 100, batch_size: int = 8) -> DataLoader:
+    features = torch.arange(num_samples, dtype=torch.float).view(-1, 1)
+    targets = torch.arange(num_samples)
+    return DataLoader(
+        TensorDataset(features, targets), batch_size=batch_size
+    )
+
+
+def test_prefetch_cpu():
+    loader = _get_loader()
+    prefetch_loader = BatchPrefetchLoaderWrapper(
+        loader, num_prefetches=2, device="cpu"
+    )
+
+    assert len(prefetch_loader) == len(loader)
+    for _ in range(2):
+        batches = list(prefetch_loader)
+        assert len(batches) == len(loader)
+        for (x, y), (x_true, y_true) in zip(batches, loader):
+            assert torch.equal(x, x_true)
+            assert torch.equal(y, y_true)
+
+
+def test_prefetch_early_stop():
+    prefetch_loader = BatchPrefetchLoaderWrapper(
+        _get_loader(), num_prefetches=1, device="cpu"
+    )
+
+    iterator = iter(prefetch_loader)
+    next(iterator)
+    iterator.close()
+
+    assert len(list(prefetch_loader)) == len(prefetch_loader)
+
+
+def test_prefetch_exception():
+    def loader():
+        yield torch.zeros(1)
+        raise ValueError("loader error")
+
+    with pytest.raises(ValueError, match="loader error"):
+        list(BatchPrefetchLoaderWrapper(loader(), device="cpu"))
+
+
+@pytest.mark.skipif(not torch.cuda.is_available(), reason="CUDA required")
+def test_prefetch_cuda():
+    records = np.zeros(4, dtype=[("x", np.float32, (2,)), ("y", np.int64)])
+    records["y"] = np.arange(4)
+    loader = [
+        {"records": records, "features": torch.rand(4, 3), "name": "batch"}
+        for _ in range(5)
+    ]
+    prefetch_loader = BatchPrefetchLoaderWrapper(
+        loader, num_prefetches=2, num_streams=2
+    )
+
+    for batch, batch_true in zip(prefetch_loader, loader):
+        assert batch["features"].is_cuda
+        assert torch.equal(batch["features"].cpu(), batch_true["features"])
+        assert batch["records"]["x"].shape == (4, 2)
+        assert batch["records"]["y"].tolist() == [0, 1, 2, 3]
+        assert batch["name"] == "batch"
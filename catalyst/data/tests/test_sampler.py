@@ -2,13 +2,24 @@ from typing import List, Tuple
 from collections import Counter
 from operator import itemgetter
 from random import randint, shuffle
+from unittest.mock import patch
 
 import numpy as np
 import pytest
 
 from catalyst.data.sampler import (
+    _get_label_to_indices,
+    _LabelIndex,
+    _random_seed,
+    _sample_from_classes,
     BalanceBatchSampler,
+    BalanceClassSampler,
+    BucketBatchSampler,
+    DistributedBucketBatchSampler,
+    DistributedSamplerWrapper,
     DynamicBalanceClassSampler,
+    MiniEpochSampler,
+    ShardShuffleSampler,
 )
 
 TLabelsPK = List[Tuple[List[int], int, int]]
@@ -188,3 +199,246 @@ def test_dynamic_balance_class_sampler(
     """
     for labels, exp_l in input_for_dynamic_balance_class_sampler:
         check_dynamic_balance_class_sampler(labels, exp_l)
+
+
+def test_label_index():
+    """Checks that the index groups the samples by the labels."""
+    labels = np.array([2, 0, 2, 1, 0, 2])
+    index = _LabelIndex(labels)
+
+    assert index.classes.tolist() == [0, 1, 2]
+    assert index.counts.tolist() == [2, 1, 3]
+    assert index.get_class_indices(0).tolist() == [1, 4]
+    assert index.get_class_indices(1).tolist() == [3]
+    assert index.get_class_indices(2).tolist() == [0, 2, 5]
+
+
+def test_sample_from_classes():
+    """Checks the per class sampling with and without replacement."""
+    labels = np.array([0] * 10 + [1] * 3 + [2] * 5)
+    index = _LabelIndex(labels)
+
+    indices = _sample_from_classes(
+        index,
+        class_indices=np.array([2, 0, 1]),
+        num_samples=np.array([5, 4, 7]),
+        replace=np.array([False, False, True]),
+    )
+
+    assert labels[indices].tolist() == [2] * 5 + [0] * 4 + [1] * 7
+    assert sorted(indices[:5].tolist()) == list(range(13, 18))
+    assert len(set(indices[5:9].tolist())) == 4
+
+
+def test_balance_class_sampler():
+    """Checks the classes sizes for the balancing modes."""
+    labels = np.array([0] * 30 + [1] * 10 + [2] * 5)
+    for mode, samples_per_class in [
+        ("downsampling", 5),
+        ("upsampling", 30),
+        (7, 7),
+    ]:
+        sampler = BalanceClassSampler(labels, mode=mode)
+        indices = list(sampler)
+        counter = Counter(labels[indices].tolist())
+
+        assert len(indices) == len(sampler)
+        assert all(
+            value == samples_per_class for value in counter.values()
+        )
+        if mode == "downsampling":
+            assert len(set(indices)) == len(indices)
+
+    with patch(
+        "catalyst.data.sampler._get_label_to_indices",
+        wraps=_get_label_to_indices,
+    ) as get_label_to_indices:
+        sampler = BalanceClassSampler(labels)
+        list(sampler)
+        # the mapping is not needed for the sampling
+        get_label_to_indices.assert_not_called()
+
+        assert sampler.lbl2idx == {
+            0: list(range(30)),
+            1: list(range(30, 40)),
+            2: list(range(40, 45)),
+        }
+        assert sampler.lbl2idx is sampler.lbl2idx
+        get_label_to_indices.assert_called_once()
+
+
+def test_dynamic_balance_class_sampler_attributes():
+    """Checks the per class attributes of the sampler."""
+    labels = np.array([1] * 30 + [0] * 10 + [2] * 5)
+    with patch(
+        "catalyst.data.sampler._get_label_to_indices",
+        wraps=_get_label_to_indices,
+    ) as get_label_to_indices:
+        sampler = DynamicBalanceClassSampler(labels, ignore_warning=True)
+        # the mapping is not needed for the sampling
+        get_label_to_indices.assert_not_called()
+
+        assert sampler.label2idxes == {
+            0: list(range(30, 40)),
+            1: list(range(30)),
+            2: list(range(40, 45)),
+        }
+        assert sampler.label2idxes is sampler.label2idxes
+        get_label_to_indices.assert_called_once()
+    assert sampler.original_d == {0: 2.0, 1: 6.0, 2: 1.0}
+    assert sampler.samples_per_classes == {0: 10, 1: 30, 2: 5}
+    assert len(sampler) == 45
+
+
+def test_bucket_batch_sampler():
+    """Checks that batches cover the dataset and fit the tokens budget."""
+    lengths = np.random.randint(1, 200, size=1000)
+    sampler = BucketBatchSampler(
+        lengths,
+        batch_size=32,
+        max_tokens=2048,
+        bucket_boundaries=[16, 32, 64, 128],
+    )
+
+    batches = list(sampler)
+
+    assert len(batches) == len(sampler)
+    assert sorted(sum(batches, [])) == list(range(len(lengths)))
+    for batch in batches:
+        assert len(batch) <= 32
+        assert len(batch) * lengths[batch].max() <= 2048
+    assert batches != list(sampler)
+
+    sampler.set_epoch(0)
+    assert batches == list(sampler)
+
+
+def test_bucket_batch_sampler_callback():
+    """Checks the lengths callback and ``drop_last``."""
+    lengths = np.random.randint(1, 200, size=1000)
+    sampler = BucketBatchSampler(
+        lambda index: lengths[index],
+        batch_size=10,
+        drop_last=True,
+        data_len=len(lengths),
+    )
+
+    batches = list(sampler)
+
+    assert len(batches) == len(sampler)
+    assert all(len(batch) == 10 for batch in batches)
+
+
+def test_distributed_bucket_batch_sampler():
+    """Checks that replicas get disjoint batches of the same epoch."""
+    lengths = np.random.randint(1, 200, size=1000)
+    num_replicas = 3
+    samplers = [
+        DistributedBucketBatchSampler(
+            lengths, num_replicas=num_replicas, rank=rank, batch_size=32
+        )
+        for rank in range(num_replicas)
+    ]
+
+    batches = [list(sampler) for sampler in samplers]
+
+    assert all(len(b) == len(samplers[0]) for b in batches)
+    indices = [index for b in batches for batch in b for index in batch]
+    assert set(indices) == set(range(len(lengths)))
+
+
+def test_distributed_sampler_wrapper_indices():
+    """Checks sharding of the samplers with ``get_indices``."""
+    labels = np.random.randint(0, 5, size=1000)
+    num_replicas = 3
+
+    with _random_seed(1):
+        indices = BalanceClassSampler(labels, mode=100).get_indices()
+
+    shards = []
+    for rank in range(num_replicas):
+        sampler = DistributedSamplerWrapper(
+            BalanceClassSampler(labels, mode=100),
+            num_replicas=num_replicas,
+            rank=rank,
+            shuffle=False,
+            seed=1,
+        )
+        shards.append(list(sampler))
+        assert len(shards[-1]) == len(sampler) == 167
+
+    padded = indices.tolist() + indices[:1].tolist()
+    assert np.array(shards).T.reshape(-1).tolist() == padded
+
+
+def test_distributed_sampler_wrapper_stride():
+    """Checks sharding of the samplers without ``get_indices``."""
+    num_replicas = 4
+    shards = [
+        list(
+            DistributedSamplerWrapper(
+                list(range(10)),
+                num_replicas=num_replicas,
+                rank=rank,
+                shuffle=False,
+            )
+        )
+        for rank in range(num_replicas)
+    ]
+
+    assert shards == [[0, 4, 8], [1, 5, 9], [2, 6, 0], [3, 7, 1]]
+
+    # the same padding for the samplers with ``get_indices``
+    shards = [
+        list(
+            DistributedSamplerWrapper(
+                MiniEpochSampler(10, mini_epoch_len=10, shuffle=None),
+                num_replicas=num_replicas,
+                rank=rank,
+                shuffle=False,
+            )
+        )
+        for rank in range(num_replicas)
+    ]
+
+    assert shards == [[0, 4, 8], [1, 5, 9], [2, 6, 0], [3, 7, 1]]
+
+
+def test_distributed_sampler_wrapper_shuffle():
+    """Checks that the shards are deterministic and cover the epoch."""
+    num_replicas = 2
+    samplers = [
+        DistributedSamplerWrapper(
+            MiniEpochSampler(100, mini_epoch_len=50, shuffle="per_epoch"),
+            num_replicas=num_replicas,
+            rank=rank,
+        )
+        for rank in range(num_replicas)
+    ]
+    for sampler in samplers:
+        sampler.set_epoch(3)
+
+    shards = [list(sampler) for sampler in samplers]
+
+    assert len(set(shards[0] + shards[1])) == 50
+
+
+def test_shard_shuffle_sampler():
+    """Checks that the shards are read one by one."""
+    shard_ids = np.repeat(np.arange(5), [10, 3, 7, 1, 9])
+    sampler = ShardShuffleSampler(shard_ids, block_size=4, seed=42)
+
+    indices = list(sampler)
+
+    assert sorted(indices) == list(range(len(shard_ids)))
+    # every shard is a contiguous chunk
+    shards = shard_ids[indices]
+    assert np.count_nonzero(np.diff(shards)) == 4
+    # every block is a contiguous chunk within the shard
+    positions = np.asarray(indices) - np.searchsorted(shard_ids, shards)
+    blocks = shards * 100 + positions // 4
+    assert np.count_nonzero(np.diff(blocks)) == len(np.unique(blocks)) - 1
+    assert indices != list(sampler)
+
+    sampler.set_epoch(0)
+    assert indices == list(sampler)
@@ -15,6 +15,7 @@ from catalyst.data.sampler_inbatch import (
     AllTripletsSampler,
     HardClusterSampler,
     HardTripletsSampler,
+    SemiHardTripletsSampler,
     TLabels,
 )
 from catalyst.data.tests.test_sampler import generate_valid_labels
@@ -208,6 +209,103 @@ def test_hard_sampler_from_dist(distmats_and_labels) -> None:  # noqa: WPS442
         assert len(labels) == len(ids_a)
 
 
+def test_semihard_sampler_from_dist(
+    distmats_and_labels,  # noqa: WPS442
+) -> None:
+    """
+    Args:
+        distmats_and_labels:
+            list of distance matrices and valid labels
+    """
+    sampler = SemiHardTripletsSampler()
+
+    for distmat, labels in distmats_and_labels:
+        ids_a, ids_p, ids_n = sampler._sample_from_distmat(  # noqa: WPS437
+            distmat=distmat, labels=labels
+        )
+
+        check_triplets_consistency(
+            ids_anchor=ids_a, ids_pos=ids_p, ids_neg=ids_n, labels=labels
+        )
+
+        counts = Counter(labels).values()
+        n_pairs = sum(count * (count - 1) for count in counts)
+        assert len(ids_a) == n_pairs
+
+        for i_a, i_p, i_n in zip(ids_a, ids_p, ids_n):
+            ids_neg_cur = [i for i, x in enumerate(labels) if x != labels[i_a]]
+            dists_neg = distmat[i_a, ids_neg_cur]
+            dists_semihard = dists_neg[dists_neg > distmat[i_a, i_p]]
+            if len(dists_semihard) > 0:
+                assert distmat[i_a, i_n] == dists_semihard.min()
+            else:
+                assert distmat[i_a, i_n] == dists_neg.max()
+
+
+def test_semihard_sampler_manual() -> None:
+    """
+    Test on manual example.
+    """
+    labels = [0, 0, 1, 1]
+
+    dist_mat = torch.tensor(
+        [
+            [0.0, 0.3, 0.2, 0.4],
+            [0.3, 0.0, 0.4, 0.8],
+            [0.2, 0.4, 0.0, 0.5],
+            [0.4, 0.8, 0.5, 0.0],
+        ]
+    )
+
+    gt = {(0, 1, 3), (1, 0, 2), (2, 3, 1), (3, 2, 1)}
+
+    sampler = SemiHardTripletsSampler()
+
+    ids_a, ids_p, ids_n = sampler._sample_from_distmat(  # noqa: WPS437
+        distmat=dist_mat, labels=labels
+    )
+
+    assert set(zip(ids_a, ids_p, ids_n)) == gt
+
+
+def test_all_triplets_sampler_rejection(monkeypatch) -> None:
+    """
+    Checks sampling of the triplets ids with the rejection.
+    """
+    monkeypatch.setattr(
+        "catalyst.data.sampler_inbatch._MAX_RANDPERM_SIZE", 0
+    )
+    labels = [0] * 8 + [1] * 8 + [2] * 8
+    sampler = AllTripletsSampler(max_output_triplets=100)
+
+    ids_a, ids_p, ids_n = sampler._sample(labels=labels)  # noqa: WPS437
+
+    assert len(ids_a) == 100
+    check_triplets_consistency(
+        ids_anchor=ids_a, ids_pos=ids_p, ids_neg=ids_n, labels=labels
+    )
+
+
+def test_all_triplets_sampler_all() -> None:
+    """
+    Checks that all the triplets are selected without the limit.
+    """
+    labels = [0, 1, 0, 2, 1, 2, 2]
+    sampler = AllTripletsSampler()
+
+    ids_a, ids_p, ids_n = sampler._sample(labels=labels)  # noqa: WPS437
+
+    gt = {
+        (a, p, n)
+        for a in range(len(labels))
+        for p in range(a + 1, len(labels))
+        for n in range(len(labels))
+        if labels[a] == labels[p] and labels[a] != labels[n]
+    }
+    assert set(zip(ids_a, ids_p, ids_n)) == gt
+    assert len(ids_a) == len(gt)
+
+
 def test_hard_sampler_manual() -> None:
     """
     Test on manual example.
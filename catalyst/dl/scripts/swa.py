@@ -27,6 +27,27 @@ def build_args(parser: ArgumentParser):
         default="./swa.pth",
         help="Path to save averaged model",
     )
+    parser.add_argument(
+        "--mode",
+        type=str,
+        default="mean",
+        choices=["mean", "ema"],
+        help="Averaging mode: (weighted) mean or exponential moving average",
+    )
+    parser.add_argument(
+        "--decay",
+        type=float,
+        default=None,
+        help="EMA decay, required for the ``ema`` mode",
+    )
+    parser.add_argument(
+        "--weights",
+        type=float,
+        nargs="+",
+        default=None,
+        help="Weights of the models (in the sorted paths order) "
+        "for the ``mean`` mode",
+    )
 
     return parser
 
@@ -46,7 +67,11 @@ def main(args, _):
     output_path: Path = args.output_path
 
     averaged_weights = get_averaged_weights_by_path_mask(
-        path_mask=models_mask, logdir=logdir
+        path_mask=models_mask,
+        logdir=logdir,
+        mode=args.mode,
+        decay=args.decay,
+        weights=args.weights,
     )
 
     torch.save(averaged_weights, str(output_path))
@@ -127,3 +127,59 @@ def test_epoch_increasing():
     )
 
     shutil.rmtree(logdir, ignore_errors=True)
+
+
+def test_callbacks_dispatch_table():
+    class BatchEndCounterCallback(Callback):
+        def __init__(self):
+            super().__init__(CallbackOrder.Internal)
+            self.num_batches = 0
+
+        def on_batch_end(self, runner):
+            self.num_batches += 1
+
+    # experiment_setup
+    logdir = "./logs/core_runner"
+
+    # data
+    num_samples, num_features = int(1e3), int(1e1)
+    X = torch.rand(num_samples, num_features)
+    y = torch.randint(0, 5, size=[num_samples])
+    dataset = TensorDataset(X, y)
+    loader = DataLoader(dataset, batch_size=100, num_workers=1)
+    loaders = {"train": loader, "valid": loader}
+
+    # model, criterion, optimizer
+    model = torch.nn.Linear(num_features, 5)
+    criterion = torch.nn.CrossEntropyLoss()
+    optimizer = torch.optim.Adam(model.parameters())
+    runner = SupervisedRunner()
+
+    counter = BatchEndCounterCallback()
+    runner.train(
+        model=model,
+        criterion=criterion,
+        optimizer=optimizer,
+        loaders=loaders,
+        logdir=logdir,
+        num_epochs=2,
+        verbose=False,
+        callbacks={"counter": counter},
+    )
+
+    dispatch_table = runner._callbacks_dispatch_table
+    assert counter.num_batches == 2 * 2 * 10
+    assert counter.on_batch_end in dispatch_table["on_batch_end"]
+    assert all(
+        getattr(handler, "__self__", None) is not counter
+        for event, handlers in dispatch_table.items()
+        if event != "on_batch_end"
+        for handler in handlers
+    )
+    # events outside of the table fall back to the dynamic lookup
+    del dispatch_table["on_batch_end"]
+    handlers = runner._get_event_handlers("on_batch_end")
+    assert len(handlers) == len(runner.callbacks)
+    assert counter.on_batch_end in handlers
+
+    shutil.rmtree(logdir, ignore_errors=True)
@@ -78,6 +78,8 @@ class ConfigExperiment(IExperiment):
         self.stages_config: Dict = self._get_stages_config(
             self._config["stages"]
         )
+        # (stage, data_params, loaders) of the previous stage
+        self._loaders_cache: tuple = None
 
     def _get_logdir(self, config: Dict) -> str:
         timestamp = get_utcnow_time()
@@ -417,14 +419,41 @@ class ConfigExperiment(IExperiment):
     def get_loaders(
         self, stage: str, epoch: int = None,
     ) -> "OrderedDict[str, DataLoader]":
-        """Returns the loaders for a given stage."""
+        """Returns the loaders for a given stage.
+
+        With ``persistent_workers: True`` in the ``data_params``
+        the loaders (and their worker processes) are cached for the stage.
+        With ``reuse_stage_loaders: True`` in the ``data_params``
+        the previous stage loaders are reused
+        if the stage ``data_params`` are the same,
+        so ``get_datasets`` should return the same datasets for both stages.
+        """
         data_params = dict(self.stages_config[stage]["data_params"])
+        reuse_stage_loaders = data_params.pop("reuse_stage_loaders", False)
+        persistent_workers = data_params.get("persistent_workers", False)
+        # datasets could be stage-specific even with the same data_params
+        cache_key = (
+            None if reuse_stage_loaders else stage,
+            data_params,
+        )
+        if (
+            persistent_workers
+            and self._loaders_cache is not None
+            and self._loaders_cache[:2] == cache_key
+        ):
+            return self._loaders_cache[2]
+
+        # loaders params are consumed during the loaders creation
+        cache_key = deepcopy(cache_key)
         loaders = get_loaders_from_params(
             get_datasets_fn=self.get_datasets,
             initial_seed=self.initial_seed,
             stage=stage,
             **data_params,
         )
+        self._loaders_cache = (
+            (*cache_key, loaders) if persistent_workers else None
+        )
         return loaders
 
     @staticmethod
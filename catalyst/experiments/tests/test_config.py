@@ -171,3 +171,45 @@ def test_not_implemented_datasets():
         exp.get_loaders("train")
     with pytest.raises(NotImplementedError):
         exp.get_datasets("train")
+
+
+class _StageDatasetsExperiment(ConfigExperiment):
+    """Experiment with the stage-specific datasets."""
+
+    def get_datasets(self, stage: str, **kwargs):
+        """Returns the datasets of the stage size."""
+        num_samples = 4 if stage == "stage1" else 8
+        return {
+            "train": torch.utils.data.TensorDataset(torch.zeros(num_samples))
+        }
+
+
+@pytest.mark.parametrize("reuse_stage_loaders", [False, True])
+def test_loaders_cache(reuse_stage_loaders):
+    """
+    Test on the ``persistent_workers`` loaders cache:
+    loaders are cached for the stage
+    and reused for the other stages only with ``reuse_stage_loaders``.
+    """
+    config = DEFAULT_MINIMAL_CONFIG.copy()
+    config["stages"] = {
+        "data_params": {
+            "num_workers": 0,
+            "persistent_workers": True,
+            "reuse_stage_loaders": reuse_stage_loaders,
+        },
+        "stage1": {},
+        "stage2": {},
+    }
+    exp = _StageDatasetsExperiment(config=config)
+
+    loaders = exp.get_loaders("stage1")
+    assert exp.get_loaders("stage1") is loaders
+    assert len(loaders["train"].dataset) == 4
+
+    stage2_loaders = exp.get_loaders("stage2")
+    if reuse_stage_loaders:
+        assert stage2_loaders is loaders
+    else:
+        assert stage2_loaders is not loaders
+        assert len(stage2_loaders["train"].dataset) == 8
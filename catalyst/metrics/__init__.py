@@ -3,6 +3,7 @@ from catalyst.metrics.functional import (
     check_consistent_length,
     process_multilabel_components,
     process_recsys_components,
+    get_sparse_rows_topk,
     get_binary_statistics,
     get_multiclass_statistics,
     get_multilabel_statistics,
@@ -14,7 +15,7 @@ from catalyst.metrics.functional import (
 from catalyst.metrics.classification import precision_recall_fbeta_support
 
 from catalyst.metrics.accuracy import accuracy, multilabel_accuracy
-from catalyst.metrics.auc import auc
+from catalyst.metrics.auc import auc, auc_from_histograms, get_auc_histograms
 from catalyst.metrics.avg_precision import (
     avg_precision,
     mean_avg_precision,
@@ -29,3 +30,15 @@ from catalyst.metrics.mrr import reciprocal_rank, mrr
 from catalyst.metrics.ndcg import dcg, ndcg
 from catalyst.metrics.precision import average_precision, precision
 from catalyst.metrics.recall import recall
+from catalyst.metrics.recsys import (
+    get_discounts,
+    get_gains,
+    recsys_metrics_from_relevance,
+    recsys_metrics,
+)
+from catalyst.metrics.retrieval import (
+    get_retrieval_topk,
+    get_retrieval_relevance,
+    retrieval_metrics_from_relevance,
+    retrieval_metrics,
+)
@@ -1,62 +1,153 @@
 from typing import Tuple
 
-import numpy as np
-
 import torch
 from torch.nn import functional as F
 
 
-def _binary_auc(
-    scores: torch.Tensor, targets: torch.Tensor
-) -> Tuple[float, np.ndarray, np.ndarray]:
+def _process_auc_components(
+    outputs: torch.Tensor, targets: torch.Tensor
+) -> Tuple[torch.Tensor, torch.Tensor]:
+    """
+    Preprocess input for AUC computation.
+
+    Args:
+        outputs: [data_len; num_classes] estimated scores from a model.
+        targets: [data_len; num_classes] ground truth (correct) target values
+            or [data_len] class indices.
+
+    Returns:
+        Tuple[torch.Tensor, torch.Tensor]: outputs and targets
+        with [data_len; num_classes] shape
+    """
+    if len(outputs.shape) < 2:
+        outputs.unsqueeze_(dim=1)
+    num_classes = outputs.shape[1]
+
+    if len(targets.shape) < 2:
+        targets = (
+            F.one_hot(targets.long(), num_classes).float()
+            if num_classes > 1
+            else targets.unsqueeze_(dim=1)
+        )
+
+    assert outputs.shape == targets.shape
+    return outputs, targets
+
+
+def _auc_from_groups(
+    positives: torch.Tensor, negatives: torch.Tensor
+) -> torch.Tensor:
+    """
+    Computes AUC from the numbers of positives and negatives
+    for the groups of equal scores.
+
+    The area under the ROC curve, built on the groups,
+    is computed with trapezoidal rule,
+    so the tied scores are counted as a half.
+
+    Args:
+        positives: [num_classes; num_groups] number of positives per group,
+            groups should be sorted by descending score
+        negatives: [num_classes; num_groups] number of negatives per group,
+            groups should be sorted by descending score
+
+    Returns:
+        torch.Tensor: Tensor with [num_classes] shape of per-class-aucs
+    """
+    # number of positives with a higher score for each group
+    positives_before = positives.cumsum(dim=1) - positives
+    area = (negatives * (positives_before + positives / 2.0)).sum(dim=1)
+    num_positives = positives.sum(dim=1)
+    num_negatives = negatives.sum(dim=1)
+    return area / (num_positives * num_negatives)
+
+
+# max number of (class, sample) pairs processed at once by ``_batched_auc``,
+# limits the peak memory of the K x N intermediate tensors
+_AUC_CHUNK_NUMEL = 2 ** 22
+
+
+def _chunk_auc(scores: torch.Tensor, targets: torch.Tensor) -> torch.Tensor:
     """
-    Binary AUC computation.
+    AUC computation with one sort for the chunk of classes.
 
     Args:
-        scores: estimated scores from a model.
-        targets:ground truth (correct) target values.
+        scores: [num_classes; data_len] estimated scores from a model.
+        targets: [num_classes; data_len] ground truth (correct) target values.
 
     Returns:
-        Tuple[float, np.ndarray, np.ndarray]: measured roc-auc,
-        true positive rate, false positive rate
+        torch.Tensor: Tensor with [num_classes] shape of per-class-aucs
     """
-    targets = targets.numpy()
+    num_classes, num_samples = scores.shape
+    scores, sortind = torch.sort(scores, dim=1, descending=True)
+    targets = targets.gather(dim=1, index=sortind).to(torch.float64)
+    del sortind
+
+    # group ids for the tied scores, unique across the classes
+    groups = torch.ones(
+        (num_classes, num_samples), dtype=torch.long, device=scores.device
+    )
+    groups[:, 1:] = scores[:, 1:] != scores[:, :-1]
+    del scores
+    groups = groups.cumsum_(dim=1).sub_(1)
+    groups += (
+        torch.arange(num_classes, device=groups.device).view(-1, 1)
+        * num_samples
+    )
+    groups = groups.view(-1)
+
+    positives = torch.zeros(
+        num_classes * num_samples, dtype=torch.float64, device=groups.device
+    )
+    positives.scatter_add_(0, groups, targets.view(-1))
+    # targets are not needed anymore, so they are reused for negatives
+    negatives = torch.zeros_like(positives)
+    negatives.scatter_add_(0, groups, targets.view(-1).neg_().add_(1.0))
+    del groups, targets
 
-    # sorting the arrays
-    scores, sortind = torch.sort(scores, dim=0, descending=True)
-    scores = scores.numpy()
-    sortind = sortind.numpy()
+    return _auc_from_groups(
+        positives.view(num_classes, num_samples),
+        negatives.view(num_classes, num_samples),
+    )
 
-    # creating the roc curve
-    tpr = np.zeros(shape=(scores.size + 1), dtype=np.float64)
-    fpr = np.zeros(shape=(scores.size + 1), dtype=np.float64)
 
-    for i in range(1, scores.size + 1):
-        if targets[sortind[i - 1]] == 1:
-            tpr[i] = tpr[i - 1] + 1
-            fpr[i] = fpr[i - 1]
-        else:
-            tpr[i] = tpr[i - 1]
-            fpr[i] = fpr[i - 1] + 1
+def _batched_auc(scores: torch.Tensor, targets: torch.Tensor) -> torch.Tensor:
+    """
+    Batched AUC computation with one sort per chunk of classes.
 
-    tpr /= targets.sum() * 1.0  # noqa: WPS345
-    fpr /= (targets - 1.0).sum() * -1.0
+    Classes are processed in chunks of ``_AUC_CHUNK_NUMEL`` elements,
+    so peak memory stays bounded for the large ``data_len``.
 
-    # calculating area under curve using trapezoidal rule
-    n = tpr.shape[0]
-    h = fpr[1:n] - fpr[: n - 1]
-    sum_h = np.zeros(fpr.shape)
-    sum_h[: n - 1] = h
-    sum_h[1:n] += h
-    area = (sum_h * tpr).sum() / 2.0
+    Args:
+        scores: [num_classes; data_len] estimated scores from a model.
+        targets: [num_classes; data_len] ground truth (correct) target values.
 
-    return area, tpr, fpr
+    Returns:
+        torch.Tensor: Tensor with [num_classes] shape of per-class-aucs
+    """
+    num_classes, num_samples = scores.shape
+    chunk_size = max(1, _AUC_CHUNK_NUMEL // max(1, num_samples))
+    if chunk_size >= num_classes:
+        return _chunk_auc(scores, targets)
+    return torch.cat(
+        [
+            _chunk_auc(
+                scores[start : start + chunk_size],
+                targets[start : start + chunk_size],
+            )
+            for start in range(0, num_classes, chunk_size)
+        ]
+    )
 
 
 def auc(outputs: torch.Tensor, targets: torch.Tensor) -> torch.Tensor:
     """
     AUC metric.
 
+    Classes are computed with batched sorts over the chunks of classes,
+    on the device where ``outputs`` are.
+    Tied scores are counted as a half.
+
     Args:
         outputs: [data_len; num_classes] estimated scores from a model.
         targets: [data_len; num_classes] ground truth (correct) target values.
@@ -107,28 +198,82 @@ def auc(outputs: torch.Tensor, targets: torch.Tensor) -> torch.Tensor:
     if len(outputs) == 0:
         return 0.5
 
-    if len(outputs.shape) < 2:
-        outputs.unsqueeze_(dim=1)
-    if torch.max(outputs) > 1:
-        outputs = torch.sigmoid(outputs)
+    outputs, targets = _process_auc_components(outputs, targets)
+    output = _batched_auc(outputs.t(), targets.t())
+    return output.float()
+
+
+def get_auc_histograms(
+    outputs: torch.Tensor, targets: torch.Tensor, num_bins: int = 1000,
+) -> Tuple[torch.Tensor, torch.Tensor]:
+    """
+    Computes per-class histograms of positive and negative scores
+    with ``num_bins`` equal bins over [0; 1].
+    Histograms could be summed over the batches
+    for the streaming AUC computation with ``auc_from_histograms``.
+
+    Args:
+        outputs: [data_len; num_classes] estimated probabilities
+            from a model, values are clipped to [0; 1]
+        targets: [data_len; num_classes] ground truth (correct) target values
+            or [data_len] class indices.
+        num_bins: number of histogram bins
+
+    Returns:
+        Tuple[torch.Tensor, torch.Tensor]: positives and negatives
+        histograms with [num_classes; num_bins] shape
+    """
+    outputs, targets = _process_auc_components(outputs, targets)
     num_classes = outputs.shape[1]
 
-    if len(targets.shape) < 2:
-        targets = (
-            F.one_hot(targets, num_classes).float()
-            if num_classes > 1
-            else targets.unsqueeze_(dim=1)
-        )
+    bins = (outputs.detach().float() * num_bins).long()
+    bins = bins.clamp(min=0, max=num_bins - 1)
+    bins += torch.arange(num_classes, device=bins.device) * num_bins
+    bins = bins.view(-1)
 
-    assert outputs.shape == targets.shape
+    minlength = num_classes * num_bins
+    targets = targets.detach().to(torch.float64).view(-1)
+    positives = torch.bincount(bins, weights=targets, minlength=minlength)
+    totals = torch.bincount(bins, minlength=minlength).to(torch.float64)
+    negatives = totals - positives
+    return (
+        positives.view(num_classes, num_bins),
+        negatives.view(num_classes, num_bins),
+    )
 
-    per_class_auc = []
-    for class_i in range(outputs.shape[1]):
-        per_class_auc.append(
-            _binary_auc(outputs[:, class_i], targets[:, class_i])[0]
-        )
-    output = torch.Tensor(per_class_auc)
-    return output
+
+def auc_from_histograms(
+    positives: torch.Tensor, negatives: torch.Tensor
+) -> torch.Tensor:
+    """
+    AUC metric from the positive and negative scores histograms,
+    computed with ``get_auc_histograms``.
+
+    Scores in the same bin are treated as tied ones,
+    so the result approximates the exact AUC
+    with ``1 / num_bins`` scores resolution.
+
+    Args:
+        positives: [num_classes; num_bins] positive scores histograms
+        negatives: [num_classes; num_bins] negative scores histograms
+
+    Returns:
+        torch.Tensor: Tensor with [num_classes] shape of per-class-aucs
+
+    Example:
+        >>> positives, negatives = get_auc_histograms(
+        >>>     outputs=torch.tensor([0.9, 0.8, 0.3, 0.1]),
+        >>>     targets=torch.tensor([1, 0, 1, 0]),
+        >>>     num_bins=10,
+        >>> )
+        >>> auc_from_histograms(positives, negatives)
+        tensor([0.7500])
+    """
+    # bins should be sorted by descending score
+    output = _auc_from_groups(
+        positives.flip(dims=[1]), negatives.flip(dims=[1])
+    )
+    return output.float()
 
 
-__all__ = ["auc"]
+__all__ = ["auc", "get_auc_histograms", "auc_from_histograms"]
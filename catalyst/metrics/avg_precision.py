@@ -5,7 +5,7 @@ from typing import List
 
 import torch
 
-from catalyst.metrics.functional import process_recsys_components
+from catalyst.metrics.recsys import recsys_metrics
 
 
 def avg_precision(
@@ -61,19 +61,13 @@ def avg_precision(
         >>> )
         tensor([0.6222, 0.4429])
     """
-    targets_sort_by_outputs = process_recsys_components(outputs, targets)
-    precisions = torch.zeros_like(targets_sort_by_outputs)
-
-    for index in range(outputs.size(1)):
-        precisions[:, index] = torch.sum(
-            targets_sort_by_outputs[:, : (index + 1)], dim=1
-        ) / float(index + 1)
-
-    only_relevant_precision = precisions * targets_sort_by_outputs
-    ap_score = only_relevant_precision.sum(dim=1) / (
-        (only_relevant_precision != 0).sum(dim=1)
-    )
-    ap_score[torch.isnan(ap_score)] = 0
+    ap_score = recsys_metrics(
+        outputs,
+        targets,
+        [outputs.size(1)],
+        metrics=["map"],
+        reduction="none",
+    )["map"][0]
     return ap_score
 
 
@@ -121,12 +115,7 @@ def mean_avg_precision(
         >>> )
         [tensor(0.5325)]
     """
-    results = []
-    for k in topk:
-        k = min(outputs.size(1), k)
-        results.append(torch.mean(avg_precision(outputs, targets)[:k]))
-
-    return results
+    return recsys_metrics(outputs, targets, topk, metrics=["map"])["map"]
 
 
 __all__ = ["mean_avg_precision", "avg_precision"]
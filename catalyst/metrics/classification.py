@@ -5,6 +5,34 @@ import torch
 from catalyst.metrics.functional import get_multiclass_statistics
 
 
+def _precision_recall_fbeta(
+    fp: torch.Tensor,
+    fn: torch.Tensor,
+    tp: torch.Tensor,
+    beta: float = 1,
+    eps: float = 1e-6,
+) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
+    """
+    Counts precision, recall, fbeta_score from the classification stats.
+
+    Args:
+        fp: number of false positives per class
+        fn: number of false negatives per class
+        tp: number of true positives per class
+        beta: beta param for f_score
+        eps: epsilon to avoid zero division
+
+    Returns:
+        tuple of precision, recall, fbeta_score
+    """
+    precision = (tp + eps) / (fp + tp + eps)
+    recall = (tp + eps) / (fn + tp + eps)
+    numerator = (1 + beta ** 2) * precision * recall
+    denominator = beta ** 2 * precision + recall
+    fbeta = numerator / denominator
+    return precision, recall, fbeta
+
+
 def precision_recall_fbeta_support(
     outputs: torch.Tensor,
     targets: torch.Tensor,
@@ -62,10 +90,7 @@ def precision_recall_fbeta_support(
         argmax_dim=argmax_dim,
         num_classes=num_classes,
     )
-    precision = (tp + eps) / (fp + tp + eps)
-    recall = (tp + eps) / (fn + tp + eps)
-    numerator = (1 + beta ** 2) * precision * recall
-    denominator = beta ** 2 * precision + recall
-    fbeta = numerator / denominator
-
+    precision, recall, fbeta = _precision_recall_fbeta(
+        fp=fp, fn=fn, tp=tp, beta=beta, eps=eps
+    )
     return precision, recall, fbeta, support
@@ -8,6 +8,10 @@ import torch
 from torch import Tensor
 from torch.nn import functional as F
 
+from catalyst.tools.meters.multiclass_statistics_meter import (
+    _get_multiclass_confusion_matrix,
+    _get_multiclass_statistics_from_confusion_matrix,
+)
 from catalyst.utils.torch import get_activation_fn
 
 # @TODO:
@@ -86,8 +90,70 @@ def process_multiclass_components(
     return outputs, targets, num_classes
 
 
+def _gather_sparse(targets: torch.Tensor, index: torch.Tensor) -> Tensor:
+    """
+    Gathers the sparse ``[batch_size; slate_length]`` targets
+    by the ``[batch_size; k]`` index without the dense targets.
+    """
+    if not hasattr(torch, "searchsorted"):
+        # torch < 1.6
+        return torch.gather(targets.to_dense(), dim=-1, index=index)
+    targets = targets.coalesce()
+    rows, cols = targets.indices()
+    values = targets.values()
+    result = torch.zeros(index.shape, dtype=values.dtype, device=index.device)
+    if values.numel() == 0:
+        return result
+    # coalesced indices are sorted by the rows and the columns
+    num_cols = targets.shape[1]
+    keys = rows * num_cols + cols
+    batch_rows = torch.arange(index.shape[0], device=index.device)
+    queries = (batch_rows.view(-1, 1) * num_cols + index).view(-1)
+    positions = torch.searchsorted(keys, queries).clamp(max=len(keys) - 1)
+    is_found = (keys[positions] == queries).view(index.shape)
+    found_values = values[positions].view(index.shape)
+    return torch.where(is_found, found_values, result)
+
+
+def get_sparse_rows_topk(targets: torch.Tensor, k: int) -> Tensor:
+    """
+    Finds the ``k`` largest values of the every row
+    of the sparse ``[batch_size; slate_length]`` tensor,
+    the missing values are zeros.
+
+    Args:
+        targets: sparse tensor with the non-negative values
+        k: number of the largest values
+
+    Returns:
+        torch.Tensor: [batch_size; k] dense tensor
+        with the values sorted in the descending order
+    """
+    targets = targets.coalesce()
+    rows = targets.indices()[0]
+    values = targets.values()
+    result = torch.zeros(
+        (targets.shape[0], k), dtype=values.dtype, device=values.device
+    )
+    if values.numel() == 0:
+        return result
+    # sort by the row and by the value in the descending order
+    value_ranks = torch.empty_like(rows)
+    value_ranks[torch.argsort(values, descending=True)] = torch.arange(
+        len(values), device=values.device
+    )
+    order = torch.argsort(rows * len(values) + value_ranks)
+    rows, values = rows[order], values[order]
+    counts = torch.bincount(rows, minlength=targets.shape[0])
+    starts = torch.cumsum(counts, dim=0) - counts
+    positions = torch.arange(len(rows), device=rows.device) - starts[rows]
+    mask = positions < k
+    result[rows[mask], positions[mask]] = values[mask]
+    return result
+
+
 def process_recsys_components(
-    outputs: torch.Tensor, targets: torch.Tensor
+    outputs: torch.Tensor, targets: torch.Tensor, topk: int = None
 ) -> torch.Tensor:
     """
     General pre-processing for calculation recsys metrics
@@ -102,14 +168,26 @@ def process_recsys_components(
             1 means the item is relevant
             for the user and 0 not relevant
             size: [batch_szie, slate_length]
-            ground truth, labels
+            ground truth, labels,
+            dense or sparse (COO) tensor
+        topk: number of the top items to keep,
+            the partial ``torch.topk`` sort is used instead of
+            the full slate sort, if None, all items are sorted
 
     Returns:
         targets_sorted_by_outputs (torch.Tensor):
             targets tensor sorted by outputs
+            size: [batch_size, min(topk, slate_length)]
     """
     check_consistent_length(outputs, targets)
-    outputs_order = torch.argsort(outputs, descending=True, dim=-1)
+    if topk is None:
+        outputs_order = torch.argsort(outputs, descending=True, dim=-1)
+    else:
+        _, outputs_order = torch.topk(
+            outputs, k=min(topk, outputs.shape[-1]), dim=-1, sorted=True
+        )
+    if targets.is_sparse:
+        return _gather_sparse(targets, outputs_order)
     targets_sorted_by_outputs = torch.gather(
         targets, dim=-1, index=outputs_order
     )
@@ -239,6 +317,10 @@ def get_multiclass_statistics(
     Returns:
         Tuple[Tensor, Tensor, Tensor, Tensor, Tensor]: stats
 
+    .. note::
+        All classes are computed at once from the confusion matrix,
+        in ``O(N + K^2)`` time on the ``outputs`` device.
+
     Example:
 
         >>> y_pred = torch.tensor([1, 2, 3, 0])
@@ -255,24 +337,10 @@ def get_multiclass_statistics(
         num_classes=num_classes,
     )
 
-    tn = torch.zeros((num_classes,), device=outputs.device)
-    fp = torch.zeros((num_classes,), device=outputs.device)
-    fn = torch.zeros((num_classes,), device=outputs.device)
-    tp = torch.zeros((num_classes,), device=outputs.device)
-    support = torch.zeros((num_classes,), device=outputs.device)
-
-    for class_index in range(num_classes):
-        (
-            tn[class_index],
-            fp[class_index],
-            fn[class_index],
-            tp[class_index],
-            support[class_index],
-        ) = get_binary_statistics(
-            outputs=outputs, targets=targets, label=class_index
-        )
-
-    return tn, fp, fn, tp, support
+    confusion_matrix = _get_multiclass_confusion_matrix(
+        outputs=outputs, targets=targets, num_classes=num_classes
+    )
+    return _get_multiclass_statistics_from_confusion_matrix(confusion_matrix)
 
 
 def get_multilabel_statistics(
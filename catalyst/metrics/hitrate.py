@@ -6,7 +6,7 @@ from typing import List
 
 import torch
 
-from catalyst.metrics.functional import process_recsys_components
+from catalyst.metrics.recsys import recsys_metrics
 
 
 def hitrate(
@@ -41,15 +41,9 @@ def hitrate(
         hitrate_at_k (List[torch.Tensor]):
             the hit rate score
     """
-    results = []
-
-    targets_sort_by_outputs = process_recsys_components(outputs, targets)
-    for k in topk:
-        k = min(outputs.size(1), k)
-        hits_score = torch.sum(targets_sort_by_outputs[:, :k], dim=1) / k
-        results.append(torch.mean(hits_score))
-
-    return results
+    return recsys_metrics(outputs, targets, topk, metrics=["hitrate"])[
+        "hitrate"
+    ]
 
 
 __all__ = ["hitrate"]
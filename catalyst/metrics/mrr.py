@@ -2,7 +2,7 @@ from typing import List
 
 import torch
 
-from catalyst.metrics.functional import process_recsys_components
+from catalyst.metrics.recsys import recsys_metrics
 
 
 def reciprocal_rank(
@@ -56,17 +56,10 @@ def reciprocal_rank(
         >>> )
         tensor([[0.5000], [1.0000]])
     """
-    k = min(outputs.size(1), k)
-    targets_sort_by_outputs_at_k = process_recsys_components(outputs, targets)[
-        :, :k
-    ]
-    values, indices = torch.max(targets_sort_by_outputs_at_k, dim=1)
-    indices = indices.type_as(values).unsqueeze(dim=0).t()
-    mrr_score = torch.tensor(1.0) / (indices + torch.tensor(1.0))
-
-    zero_sum_mask = values == 0.0
-    mrr_score[zero_sum_mask] = 0.0
-    return mrr_score
+    mrr_score = recsys_metrics(
+        outputs, targets, [k], metrics=["mrr"], reduction="none"
+    )["mrr"][0]
+    return mrr_score.view(-1, 1)
 
 
 def mrr(
@@ -113,11 +106,7 @@ def mrr(
         >>> )
         [tensor(0.5000), tensor(0.7500)]
     """
-    results = []
-    for k in topk:
-        results.append(torch.mean(reciprocal_rank(outputs, targets, k)))
-
-    return results
+    return recsys_metrics(outputs, targets, topk, metrics=["mrr"])["mrr"]
 
 
 __all__ = ["reciprocal_rank", "mrr"]
@@ -3,6 +3,7 @@ from typing import List
 import torch
 
 from catalyst.metrics.functional import process_recsys_components
+from catalyst.metrics.recsys import get_discounts, get_gains, recsys_metrics
 
 
 def dcg(
@@ -79,37 +80,12 @@ def dcg(
         tensor(5.3928)
     """
     targets_sort_by_outputs = process_recsys_components(outputs, targets)
-    target_device = targets_sort_by_outputs.device
-
-    if gain_function == "exp_rank":
-        gain_function = lambda x: torch.pow(2, x) - 1
-        gains = gain_function(targets_sort_by_outputs)
-        discounts = torch.tensor(1) / torch.log2(
-            torch.arange(
-                targets_sort_by_outputs.shape[1],
-                dtype=torch.float,
-                device=target_device,
-            )
-            + 2.0
-        )
-        discounted_gains = gains * discounts
-
-    elif gain_function == "linear_rank":
-        discounts = torch.tensor(1) / torch.log2(
-            torch.arange(
-                targets_sort_by_outputs.shape[1],
-                dtype=torch.float,
-                device=target_device,
-            )
-            + 1.0
-        )
-        discounts[0] = 1
-        discounted_gains = targets_sort_by_outputs * discounts
-
-    else:
-        raise ValueError("gain function can be either exp_rank or linear_rank")
-
-    dcg_score = discounted_gains
+    discounts = get_discounts(
+        targets_sort_by_outputs.shape[1],
+        gain_function,
+        device=targets_sort_by_outputs.device,
+    )
+    dcg_score = get_gains(targets_sort_by_outputs, gain_function) * discounts
     return dcg_score
 
 
@@ -169,17 +145,13 @@ def ndcg(
         >>> )
         [tensor(0.5000)]
     """
-    results = []
-    for k in topk:
-        ideal_dcgs = dcg(targets, targets, gain_function)[:, :k]
-        predicted_dcgs = dcg(outputs, targets, gain_function)[:, :k]
-        ideal_dcgs_score = torch.sum(ideal_dcgs, dim=1)
-        predicted_dcgs_score = torch.sum(predicted_dcgs, dim=1)
-        ndcg_score = predicted_dcgs_score / ideal_dcgs_score
-        idcg_mask = ideal_dcgs_score == 0
-        ndcg_score[idcg_mask] = 0.0
-        results.append(torch.mean(ndcg_score))
-    return results
+    return recsys_metrics(
+        outputs,
+        targets,
+        topk,
+        metrics=["ndcg"],
+        gain_function=gain_function,
+    )["ndcg"]
 
 
 __all__ = ["dcg", "ndcg"]
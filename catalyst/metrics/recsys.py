@@ -0,0 +1,233 @@
+"""
+Ranking metrics for the recommender systems with the single top-k pass.
+"""
+from typing import Dict, List, Sequence
+
+import torch
+
+from catalyst.metrics.functional import (
+    get_sparse_rows_topk,
+    process_recsys_components,
+)
+
+RECSYS_METRICS = ("hitrate", "mrr", "ndcg", "map")
+REDUCTIONS = ("mean", "sum", "none")
+
+
+def get_gains(relevance: torch.Tensor, gain_function: str) -> torch.Tensor:
+    """
+    Computes the DCG gains of the relevance labels.
+
+    Args:
+        relevance: relevance labels
+        gain_function: ``exp_rank`` (``2 ** x - 1``) or ``linear_rank`` (``x``)
+
+    Returns:
+        torch.Tensor: gains
+
+    Raises:
+        ValueError: gain function can be either `exp_rank` or `linear_rank`
+    """
+    relevance = relevance.float()
+    if gain_function == "exp_rank":
+        return torch.pow(2, relevance) - 1
+    elif gain_function == "linear_rank":
+        return relevance
+    raise ValueError("gain function can be either exp_rank or linear_rank")
+
+
+def get_discounts(
+    num_positions: int, gain_function: str, device: torch.device = None
+) -> torch.Tensor:
+    """
+    Computes the DCG discounts of the ranking positions.
+
+    Args:
+        num_positions: number of the ranking positions
+        gain_function: ``exp_rank`` (``1 / log2(rank + 1)``)
+            or ``linear_rank`` (``1 / log2(rank)`` and 1 for the first rank)
+        device: discounts device
+
+    Returns:
+        torch.Tensor: [num_positions] discounts
+
+    Raises:
+        ValueError: gain function can be either `exp_rank` or `linear_rank`
+    """
+    positions = torch.arange(num_positions, dtype=torch.float, device=device)
+    if gain_function == "exp_rank":
+        return 1.0 / torch.log2(positions + 2.0)
+    elif gain_function == "linear_rank":
+        discounts = 1.0 / torch.log2(positions + 1.0)
+        discounts[0] = 1.0
+        return discounts
+    raise ValueError("gain function can be either exp_rank or linear_rank")
+
+
+def _reduce(value: torch.Tensor, reduction: str) -> torch.Tensor:
+    if reduction == "mean":
+        return value.mean()
+    elif reduction == "sum":
+        return value.sum()
+    return value
+
+
+def recsys_metrics_from_relevance(
+    relevance: torch.Tensor,
+    topk_args: Sequence[int],
+    ideal_relevance: torch.Tensor = None,
+    metrics: Sequence[str] = RECSYS_METRICS,
+    gain_function: str = "exp_rank",
+    reduction: str = "mean",
+) -> Dict[str, List[torch.Tensor]]:
+    """
+    Computes HR@k, MRR@k, NDCG@k and MAP@k for all ``k``
+    from the cumulative sums over the ranked relevance,
+    so every metric is computed with the single pass for all ``k``.
+
+    HR@k is the fraction of the relevant items in the top-k ones,
+    MRR@k is the reciprocal rank of the first relevant item
+    in the top-k ones (0 if there is no such item),
+    MAP@k is the precision averaged over the relevant items
+    in the top-k ones, as in ``catalyst.metrics.avg_precision``.
+
+    Args:
+        relevance: [batch_size; topk] relevance of the items
+            sorted by the model outputs,
+            e.g. ``process_recsys_components(outputs, targets, topk)``
+        topk_args: list of ``k`` to compute metrics for
+        ideal_relevance: [batch_size; topk] relevance sorted
+            in the descending order, required for the NDCG@k
+        metrics: metrics to compute,
+            subset of ``hitrate``, ``mrr``, ``ndcg`` and ``map``
+        gain_function: NDCG gain function,
+            ``exp_rank`` or ``linear_rank``
+        reduction: reduction over the batch:
+            ``mean``, ``sum`` or ``none``
+
+    Returns:
+        Dict[str, List[torch.Tensor]]: metrics for every ``k``
+        from ``topk_args``
+
+    Raises:
+        ValueError: if the metric or reduction is unknown
+    """
+    unknown_metrics = set(metrics) - set(RECSYS_METRICS)
+    if unknown_metrics:
+        raise ValueError(f"unknown metrics {sorted(unknown_metrics)}")
+    if reduction not in REDUCTIONS:
+        raise ValueError(f"reduction should be one of {REDUCTIONS}")
+
+    num_positions = relevance.shape[1]
+    ranks = torch.arange(
+        1, num_positions + 1, dtype=torch.float, device=relevance.device
+    )
+    is_relevant = (relevance > 0).float()
+    hits = is_relevant.cumsum(dim=1)
+
+    cumulative = {}
+    if "mrr" in metrics:
+        is_first_hit = is_relevant * (hits == 1).float()
+        cumulative["mrr"] = (is_first_hit / ranks).cumsum(dim=1)
+    if "map" in metrics:
+        relevant_precisions = hits / ranks * is_relevant
+        cumulative["map"] = relevant_precisions.cumsum(dim=1)
+    if "ndcg" in metrics:
+        if ideal_relevance is None:
+            raise ValueError("ideal_relevance is required for ndcg")
+        discounts = get_discounts(
+            num_positions, gain_function, device=relevance.device
+        )
+        cumulative["dcg"] = (
+            get_gains(relevance, gain_function) * discounts
+        ).cumsum(dim=1)
+        cumulative["idcg"] = (
+            get_gains(ideal_relevance, gain_function)
+            * discounts[: ideal_relevance.shape[1]]
+        ).cumsum(dim=1)
+
+    results = {metric: [] for metric in metrics}
+    for k in topk_args:
+        k = min(k, num_positions)
+        num_hits = hits[:, k - 1]
+        for metric in metrics:
+            if metric == "hitrate":
+                value = num_hits / k
+            elif metric == "mrr":
+                value = cumulative["mrr"][:, k - 1]
+            elif metric == "map":
+                value = cumulative["map"][:, k - 1] / num_hits.clamp(min=1)
+            else:
+                idcg = cumulative["idcg"][:, k - 1]
+                value = torch.where(
+                    idcg > 0,
+                    cumulative["dcg"][:, k - 1] / idcg.clamp(min=1e-12),
+                    torch.zeros_like(idcg),
+                )
+            results[metric].append(_reduce(value, reduction))
+    return results
+
+
+def recsys_metrics(
+    outputs: torch.Tensor,
+    targets: torch.Tensor,
+    topk_args: Sequence[int],
+    metrics: Sequence[str] = RECSYS_METRICS,
+    gain_function: str = "exp_rank",
+    reduction: str = "mean",
+) -> Dict[str, List[torch.Tensor]]:
+    """
+    Computes HR@k, MRR@k, NDCG@k and MAP@k with the single ``torch.topk``
+    up to the largest ``k`` instead of the full slate sort per metric.
+
+    Args:
+        outputs: [batch_size; slate_length] model outputs, logits
+        targets: [batch_size; slate_length] ground truth, labels,
+            binary (or graded for the NDCG) relevance,
+            dense or sparse (COO) tensor, e.g. ``InteractionsCollateFn``
+            targets, the sparse targets are never densified
+        topk_args: list of ``k`` to compute metrics for
+        metrics: metrics to compute,
+            subset of ``hitrate``, ``mrr``, ``ndcg`` and ``map``
+        gain_function: NDCG gain function,
+            ``exp_rank`` or ``linear_rank``
+        reduction: reduction over the batch:
+            ``mean``, ``sum`` or ``none``
+
+    Returns:
+        Dict[str, List[torch.Tensor]]: metrics for every ``k``
+        from ``topk_args``
+
+    Example:
+        >>> recsys_metrics(
+        >>>     outputs=torch.tensor([[4.0, 2.0, 3.0, 1.0]]),
+        >>>     targets=torch.tensor([[0.0, 0.0, 1.0, 1.0]]),
+        >>>     topk_args=[1, 3],
+        >>>     metrics=["hitrate", "mrr"],
+        >>> )
+        {'hitrate': [tensor(0.), tensor(0.3333)],
+         'mrr': [tensor(0.), tensor(0.5000)]}
+    """
+    max_k = min(max(topk_args), outputs.shape[1])
+    relevance = process_recsys_components(outputs, targets, topk=max_k)
+    ideal_relevance = None
+    if "ndcg" in metrics and targets.is_sparse:
+        ideal_relevance = get_sparse_rows_topk(targets, k=max_k)
+    elif "ndcg" in metrics:
+        ideal_relevance, _ = torch.topk(targets, k=max_k, dim=1)
+    return recsys_metrics_from_relevance(
+        relevance,
+        topk_args,
+        ideal_relevance=ideal_relevance,
+        metrics=metrics,
+        gain_function=gain_function,
+        reduction=reduction,
+    )
+
+
+__all__ = [
+    "get_discounts",
+    "get_gains",
+    "recsys_metrics",
+    "recsys_metrics_from_relevance",
+]
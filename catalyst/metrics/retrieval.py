@@ -0,0 +1,275 @@
+"""
+Retrieval metrics for the large query and gallery sets.
+"""
+from typing import Dict, List, Sequence, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor
+
+import torch
+
+Device = Union[str, torch.device]
+
+
+def _get_tile_topk(
+    query_embeddings: torch.Tensor,
+    gallery_embeddings: torch.Tensor,
+    topk: int,
+    gallery_tile_size: int,
+    device: Device = None,
+) -> Tuple[torch.Tensor, torch.Tensor]:
+    """
+    Finds the ``topk`` closest gallery items for the queries tile,
+    going through the gallery with ``gallery_tile_size`` tiles
+    and merging the running top-k with the top-k of every tile.
+
+    Args:
+        query_embeddings: [tile_size; embedding_dim] queries tile
+        gallery_embeddings: [gallery_size; embedding_dim] gallery
+        topk: number of the closest items to find
+        gallery_tile_size: number of gallery items per tile
+        device: device for the distances computation,
+            if None, the ``query_embeddings`` device is used
+
+    Returns:
+        Tuple[torch.Tensor, torch.Tensor]: distances and gallery indices
+        with [tile_size; topk] shape, sorted by the distance
+    """
+    query_embeddings = query_embeddings.to(device)
+    best_distances, best_indices = None, None
+    for start in range(0, gallery_embeddings.shape[0], gallery_tile_size):
+        gallery_tile = gallery_embeddings[start : start + gallery_tile_size]
+        distances = torch.cdist(
+            query_embeddings, gallery_tile.to(device).float()
+        )
+        distances, indices = torch.topk(
+            distances,
+            k=min(topk, distances.shape[1]),
+            dim=1,
+            largest=False,
+            sorted=True,
+        )
+        indices += start
+        if best_distances is not None:
+            distances = torch.cat([best_distances, distances], dim=1)
+            indices = torch.cat([best_indices, indices], dim=1)
+            distances, order = torch.topk(
+                distances,
+                k=min(topk, distances.shape[1]),
+                dim=1,
+                largest=False,
+                sorted=True,
+            )
+            indices = indices.gather(dim=1, index=order)
+        best_distances, best_indices = distances, indices
+    return best_distances, best_indices
+
+
+def get_retrieval_topk(
+    query_embeddings: torch.Tensor,
+    gallery_embeddings: torch.Tensor,
+    topk: int,
+    query_tile_size: int = 1024,
+    gallery_tile_size: int = 65536,
+    num_workers: int = 1,
+    device: Device = None,
+) -> Tuple[torch.Tensor, torch.Tensor]:
+    """
+    Finds the ``topk`` closest (by euclidean distance) gallery items
+    for every query.
+
+    Queries and gallery are processed with tiles,
+    so only [query_tile_size; gallery_tile_size] distances
+    and running [query_tile_size; topk] closest items are stored
+    instead of the full query-gallery distance matrix.
+
+    Args:
+        query_embeddings: [n_queries; embedding_dim] query embeddings
+        gallery_embeddings: [n_gallery; embedding_dim] gallery embeddings
+        topk: number of the closest items to find
+        query_tile_size: number of queries per tile
+        gallery_tile_size: number of gallery items per tile
+        num_workers: number of threads to process query tiles with,
+            used only for the CPU computation
+        device: device for the distances computation,
+            if None, the ``query_embeddings`` device is used,
+            tiles are moved to this device on demand
+
+    Returns:
+        Tuple[torch.Tensor, torch.Tensor]: distances and gallery indices
+        with [n_queries; min(topk, n_gallery)] shape,
+        sorted by the distance
+
+    Example:
+        >>> distances, indices = get_retrieval_topk(
+        >>>     query_embeddings=torch.tensor([[0.0], [1.0]]),
+        >>>     gallery_embeddings=torch.tensor([[1.1], [0.1], [5.0]]),
+        >>>     topk=2,
+        >>>     gallery_tile_size=2,
+        >>> )
+        >>> indices
+        tensor([[1, 0],
+                [0, 1]])
+    """
+    if device is None:
+        device = query_embeddings.device
+    device = torch.device(device)
+    num_queries = query_embeddings.shape[0]
+    topk = min(topk, gallery_embeddings.shape[0])
+
+    distances = torch.empty(
+        (num_queries, topk), dtype=torch.float, device=device
+    )
+    indices = torch.empty((num_queries, topk), dtype=torch.long, device=device)
+
+    def process_tile(start: int) -> None:
+        end = start + query_tile_size
+        tile_distances, tile_indices = _get_tile_topk(
+            query_embeddings=query_embeddings[start:end].float(),
+            gallery_embeddings=gallery_embeddings,
+            topk=topk,
+            gallery_tile_size=gallery_tile_size,
+            device=device,
+        )
+        distances[start:end] = tile_distances
+        indices[start:end] = tile_indices
+
+    starts = range(0, num_queries, query_tile_size)
+    if device.type == "cpu" and num_workers > 1:
+        # torch operations release GIL,
+        # so the query tiles are processed in parallel
+        with ThreadPoolExecutor(max_workers=num_workers) as executor:
+            list(executor.map(process_tile, starts))
+    else:
+        for start in starts:
+            process_tile(start)
+    return distances, indices
+
+
+def get_retrieval_relevance(
+    query_labels: torch.Tensor,
+    gallery_labels: torch.Tensor,
+    indices: torch.Tensor,
+) -> torch.Tensor:
+    """
+    Marks retrieved gallery items with the same label as a query
+    as the relevant ones.
+
+    Args:
+        query_labels: [n_queries] query labels
+        gallery_labels: [n_gallery] gallery labels
+        indices: [n_queries; topk] gallery indices
+            from ``get_retrieval_topk``
+
+    Returns:
+        torch.Tensor: [n_queries; topk] binary relevance matrix
+    """
+    gallery_labels = gallery_labels.to(indices.device)
+    query_labels = query_labels.to(indices.device)
+    relevance = gallery_labels[indices] == query_labels.view(-1, 1)
+    return relevance.float()
+
+
+def retrieval_metrics_from_relevance(
+    relevance: torch.Tensor, topk_args: Sequence[int]
+) -> Dict[str, List[float]]:
+    """
+    Computes CMC@k, precision@k and mAP@k from the relevance
+    of the retrieved items.
+
+    Average precision@k is averaged over the relevant items
+    in the top-k ones, as in ``catalyst.metrics.avg_precision``.
+
+    Args:
+        relevance: [n_queries; topk] binary relevance of the retrieved items
+            sorted by the distance
+        topk_args: list of ``k`` to compute metrics for,
+            ``k`` should be not greater than the number of retrieved items
+
+    Returns:
+        Dict[str, List[float]]: ``cmc``, ``precision`` and ``map``
+        metrics for every ``k`` from ``topk_args``
+    """
+    ranks = torch.arange(
+        1, relevance.shape[1] + 1, dtype=torch.float, device=relevance.device
+    )
+    hits = relevance.cumsum(dim=1)
+    precisions = hits / ranks
+    # running sum of the precisions at the relevant positions
+    relevant_precisions = (precisions * relevance).cumsum(dim=1)
+
+    metrics = {"cmc": [], "precision": [], "map": []}
+    for k in topk_args:
+        k = min(k, relevance.shape[1])
+        num_hits = hits[:, k - 1]
+        metrics["cmc"].append((num_hits > 0).float().mean().item())
+        metrics["precision"].append((num_hits / k).mean().item())
+        avg_precision = relevant_precisions[:, k - 1] / num_hits.clamp(min=1)
+        metrics["map"].append(avg_precision.mean().item())
+    return metrics
+
+
+def retrieval_metrics(
+    query_embeddings: torch.Tensor,
+    gallery_embeddings: torch.Tensor,
+    query_labels: torch.Tensor,
+    gallery_labels: torch.Tensor,
+    topk_args: Sequence[int],
+    query_tile_size: int = 1024,
+    gallery_tile_size: int = 65536,
+    num_workers: int = 1,
+    device: Device = None,
+) -> Dict[str, List[float]]:
+    """
+    Computes CMC@k, precision@k and mAP@k for the queries
+    in the bounded memory:
+    only ``max(topk_args)`` closest gallery items are kept for every query.
+
+    Args:
+        query_embeddings: [n_queries; embedding_dim] query embeddings
+        gallery_embeddings: [n_gallery; embedding_dim] gallery embeddings
+        query_labels: [n_queries] query labels
+        gallery_labels: [n_gallery] gallery labels
+        topk_args: list of ``k`` to compute metrics for
+        query_tile_size: number of queries per tile
+        gallery_tile_size: number of gallery items per tile
+        num_workers: number of threads to process query tiles with,
+            used only for the CPU computation
+        device: device for the distances computation,
+            if None, the ``query_embeddings`` device is used
+
+    Returns:
+        Dict[str, List[float]]: ``cmc``, ``precision`` and ``map``
+        metrics for every ``k`` from ``topk_args``
+
+    Example:
+        >>> retrieval_metrics(
+        >>>     query_embeddings=torch.tensor([[0.0], [1.0]]),
+        >>>     gallery_embeddings=torch.tensor([[1.1], [0.1], [5.0]]),
+        >>>     query_labels=torch.tensor([0, 0]),
+        >>>     gallery_labels=torch.tensor([1, 0, 0]),
+        >>>     topk_args=[1, 2],
+        >>> )
+        {'cmc': [0.5, 1.0], 'precision': [0.5, 0.5], 'map': [0.5, 0.75]}
+    """
+    _, indices = get_retrieval_topk(
+        query_embeddings=query_embeddings,
+        gallery_embeddings=gallery_embeddings,
+        topk=max(topk_args),
+        query_tile_size=query_tile_size,
+        gallery_tile_size=gallery_tile_size,
+        num_workers=num_workers,
+        device=device,
+    )
+    relevance = get_retrieval_relevance(
+        query_labels=query_labels,
+        gallery_labels=gallery_labels,
+        indices=indices,
+    )
+    return retrieval_metrics_from_relevance(relevance, topk_args)
+
+
+__all__ = [
+    "get_retrieval_topk",
+    "get_retrieval_relevance",
+    "retrieval_metrics_from_relevance",
+    "retrieval_metrics",
+]
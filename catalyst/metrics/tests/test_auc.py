@@ -1,9 +1,10 @@
 # flake8: noqa
 import math
+import sys
 
 import torch
 
-from catalyst.metrics.auc import auc
+from catalyst.metrics.auc import auc, auc_from_histograms, get_auc_histograms
 
 
 def test_auc():
@@ -40,3 +41,79 @@ def test_auc():
 
     val = auc(scores, targets)
     assert math.fabs(val - 1.0) < 0.0001, "AUC test2 failed"
+
+
+def _brute_force_auc(scores, targets):
+    positives = scores[targets == 1]
+    negatives = scores[targets == 0]
+    greater = (positives.view(-1, 1) > negatives.view(1, -1)).sum()
+    equal = (positives.view(-1, 1) == negatives.view(1, -1)).sum()
+    return (greater.item() + 0.5 * equal.item()) / (
+        len(positives) * len(negatives)
+    )
+
+
+def test_auc_ties():
+    """
+    Tests for catalyst.metrics.auc metric with tied scores.
+    """
+    torch.manual_seed(42)
+    num_samples, num_classes = 500, 7
+    outputs = torch.randint(0, 10, size=(num_samples, num_classes)).float()
+    outputs = outputs / 10.0
+    targets = torch.randint(0, 2, size=(num_samples, num_classes))
+
+    per_class_auc = auc(outputs, targets)
+    assert per_class_auc.shape == (num_classes,)
+    for class_i in range(num_classes):
+        expected = _brute_force_auc(
+            outputs[:, class_i], targets[:, class_i]
+        )
+        assert math.fabs(per_class_auc[class_i].item() - expected) < 1e-6
+
+
+def test_auc_chunks(monkeypatch):
+    """
+    Tests for catalyst.metrics.auc metric computed over the class chunks.
+    """
+    torch.manual_seed(42)
+    num_samples, num_classes = 100, 7
+    outputs = torch.randint(0, 10, size=(num_samples, num_classes)).float()
+    targets = torch.randint(0, 2, size=(num_samples, num_classes))
+
+    expected = auc(outputs, targets)
+    # 2 classes per chunk, the last one is smaller
+    # ``catalyst.metrics.auc`` attribute is shadowed by the function
+    auc_module = sys.modules["catalyst.metrics.auc"]
+    monkeypatch.setattr(auc_module, "_AUC_CHUNK_NUMEL", 2 * num_samples)
+    assert torch.allclose(auc(outputs, targets), expected)
+
+
+def test_auc_histograms():
+    """
+    Tests for catalyst.metrics.auc_from_histograms metric.
+    """
+    torch.manual_seed(42)
+    num_samples, num_classes = 500, 3
+    # scores in the bins centers, so binning does not change the order
+    outputs = torch.randint(0, 10, size=(num_samples, num_classes)).float()
+    outputs = outputs + 0.5
+    outputs = outputs / 10.0
+    targets = torch.randint(0, num_classes, size=(num_samples,))
+
+    positives, negatives = None, None
+    for batch_outputs, batch_targets in zip(
+        outputs.split(64), targets.split(64)
+    ):
+        batch_positives, batch_negatives = get_auc_histograms(
+            batch_outputs, batch_targets, num_bins=10
+        )
+        if positives is None:
+            positives, negatives = batch_positives, batch_negatives
+        else:
+            positives += batch_positives
+            negatives += batch_negatives
+
+    assert torch.allclose(
+        auc_from_histograms(positives, negatives), auc(outputs, targets)
+    )
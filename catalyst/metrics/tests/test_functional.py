@@ -171,3 +171,20 @@ def test_check_consistent_length(outputs, targets):
     with pytest.raises(ValueError) as execinfo:
         check_consistent_length(outputs, targets)
     assert str(execinfo.value) == "Inconsistent numbers of samples"
+
+
+@pytest.mark.parametrize("num_classes", [2, 7])
+def test_get_multiclass_statistics_matches_binary(num_classes):
+    torch.manual_seed(42)
+    outputs = torch.randint(-1, num_classes + 1, size=(100,))
+    targets = torch.randint(0, num_classes + 1, size=(100,))
+
+    tn, fp, fn, tp, support = get_multiclass_statistics(
+        outputs, targets, num_classes=num_classes
+    )
+
+    assert tn.shape == (num_classes,)
+    for class_index in range(num_classes):
+        stats = get_binary_statistics(outputs, targets, label=class_index)
+        for value, value_true in zip((tn, fp, fn, tp, support), stats):
+            assert value[class_index].item() == value_true.item()
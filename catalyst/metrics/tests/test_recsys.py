@@ -0,0 +1,127 @@
+# flake8: noqa
+from types import SimpleNamespace
+import math
+
+import numpy as np
+import pytest
+
+import torch
+
+from catalyst.callbacks.metrics.recsys import RecSysMetricsCallback
+from catalyst.metrics.functional import process_recsys_components
+from catalyst.metrics.recsys import recsys_metrics
+
+
+def _naive_metrics(outputs, targets, k):
+    """Per-user metrics with the full slate sort."""
+    results = {"hitrate": [], "mrr": [], "ndcg": [], "map": []}
+    for scores, relevance in zip(outputs.tolist(), targets.tolist()):
+        order = sorted(range(len(scores)), key=lambda i: -scores[i])
+        ranked = [relevance[i] for i in order[:k]]
+        ideal = sorted(relevance, reverse=True)[:k]
+        hits = [index for index, value in enumerate(ranked) if value > 0]
+
+        results["hitrate"].append(len(hits) / k)
+        results["mrr"].append(1 / (hits[0] + 1) if hits else 0.0)
+        precisions = [
+            (number + 1) / (index + 1) for number, index in enumerate(hits)
+        ]
+        results["map"].append(np.mean(precisions) if hits else 0.0)
+        dcg, idcg = (
+            sum(
+                (2 ** value - 1) / math.log2(index + 2)
+                for index, value in enumerate(values)
+            )
+            for values in (ranked, ideal)
+        )
+        results["ndcg"].append(dcg / idcg if idcg > 0 else 0.0)
+    return {key: np.mean(value) for key, value in results.items()}
+
+
+def test_process_recsys_components_topk():
+    """Checks that the partial sort keeps the top of the full sort."""
+    torch.manual_seed(42)
+    outputs = torch.rand(8, 100)
+    targets = torch.randint(0, 3, (8, 100))
+
+    full = process_recsys_components(outputs, targets)
+    partial = process_recsys_components(outputs, targets, topk=10)
+
+    assert partial.shape == (8, 10)
+    assert torch.equal(partial, full[:, :10])
+
+
+def test_recsys_metrics():
+    """Checks all metrics with the single top-k pass."""
+    torch.manual_seed(42)
+    outputs = torch.rand(16, 50)
+    targets = (torch.rand(16, 50) > 0.8).float()
+    targets[0] = 0
+    topk_args = [1, 5, 10, 100]
+
+    metrics = recsys_metrics(outputs, targets, topk_args)
+
+    for index, k in enumerate(topk_args):
+        expected = _naive_metrics(outputs, targets, min(k, 50))
+        for name, value in expected.items():
+            assert np.isclose(metrics[name][index].item(), value, atol=1e-5)
+
+
+def test_recsys_metrics_sparse():
+    """Checks that the sparse targets give the dense targets metrics."""
+    torch.manual_seed(42)
+    outputs = torch.rand(16, 200)
+    targets = (torch.rand(16, 200) > 0.9).float() * torch.randint(
+        1, 5, (16, 200)
+    )
+    targets[3] = 0
+
+    sparse_metrics = recsys_metrics(outputs, targets.to_sparse(), [1, 10])
+    dense_metrics = recsys_metrics(outputs, targets, [1, 10])
+
+    for name, values in dense_metrics.items():
+        for sparse_value, dense_value in zip(sparse_metrics[name], values):
+            assert torch.isclose(sparse_value, dense_value)
+
+
+def test_recsys_metrics_reduction():
+    """Checks the per-user values and the unknown arguments."""
+    outputs = torch.tensor([[4.0, 2.0, 3.0, 1.0], [1.0, 2.0, 3.0, 4.0]])
+    targets = torch.tensor([[0.0, 0.0, 1.0, 1.0], [0.0, 0.0, 1.0, 1.0]])
+
+    metrics = recsys_metrics(
+        outputs, targets, [1, 3], metrics=["mrr"], reduction="none"
+    )
+
+    assert list(metrics) == ["mrr"]
+    assert metrics["mrr"][0].tolist() == [0.0, 1.0]
+    assert metrics["mrr"][1].tolist() == [0.5, 1.0]
+    with pytest.raises(ValueError):
+        recsys_metrics(outputs, targets, [1], metrics=["auc"])
+    with pytest.raises(ValueError):
+        recsys_metrics(outputs, targets, [1], reduction="max")
+
+
+def test_recsys_metrics_callback():
+    """Checks that the loader metrics are the means over all users."""
+    torch.manual_seed(42)
+    outputs = torch.rand(10, 20)
+    targets = (torch.rand(10, 20) > 0.7).float()
+    callback = RecSysMetricsCallback(topk_args=[1, 5], prefix="valid_")
+    runner = SimpleNamespace(loader_metrics={})
+
+    callback.on_loader_start(runner)
+    for start in range(0, 10, 4):
+        runner.input = {"targets": targets[start : start + 4]}
+        runner.output = {"logits": outputs[start : start + 4]}
+        callback.on_batch_end(runner)
+    callback.on_loader_end(runner)
+
+    metrics = recsys_metrics(outputs, targets, [1, 5])
+    assert len(runner.loader_metrics) == 8
+    for name in ("hitrate", "mrr", "ndcg", "map"):
+        for index, k in enumerate([1, 5]):
+            assert np.isclose(
+                runner.loader_metrics[f"valid_{name}{k:02}"],
+                metrics[name][index].item(),
+            )
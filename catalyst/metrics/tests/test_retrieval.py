@@ -0,0 +1,73 @@
+# flake8: noqa
+import numpy as np
+import pytest
+
+import torch
+
+from catalyst.metrics.avg_precision import avg_precision
+from catalyst.metrics.cmc_score import cmc_score
+from catalyst.metrics.retrieval import get_retrieval_topk, retrieval_metrics
+
+
+@pytest.mark.parametrize(
+    "query_tile_size,gallery_tile_size,num_workers",
+    [(1000, 1000, 1), (7, 13, 1), (7, 13, 4)],
+)
+def test_get_retrieval_topk(query_tile_size, gallery_tile_size, num_workers):
+    torch.manual_seed(42)
+    query_embeddings = torch.rand(50, 8)
+    gallery_embeddings = torch.rand(120, 8)
+
+    distances, indices = get_retrieval_topk(
+        query_embeddings=query_embeddings,
+        gallery_embeddings=gallery_embeddings,
+        topk=5,
+        query_tile_size=query_tile_size,
+        gallery_tile_size=gallery_tile_size,
+        num_workers=num_workers,
+    )
+
+    distances_true, indices_true = torch.topk(
+        torch.cdist(query_embeddings, gallery_embeddings),
+        k=5,
+        dim=1,
+        largest=False,
+    )
+    assert torch.allclose(distances, distances_true)
+    assert torch.equal(indices, indices_true)
+
+
+def test_retrieval_metrics():
+    torch.manual_seed(42)
+    query_embeddings = torch.rand(40, 4)
+    gallery_embeddings = torch.rand(100, 4)
+    query_labels = torch.randint(0, 5, size=(40,))
+    gallery_labels = torch.randint(0, 5, size=(100,))
+    topk_args = [1, 3, 10]
+
+    metrics = retrieval_metrics(
+        query_embeddings=query_embeddings,
+        gallery_embeddings=gallery_embeddings,
+        query_labels=query_labels,
+        gallery_labels=gallery_labels,
+        topk_args=topk_args,
+        query_tile_size=16,
+        gallery_tile_size=32,
+    )
+
+    conformity_matrix = gallery_labels == query_labels.view(-1, 1)
+    distances = torch.cdist(query_embeddings, gallery_embeddings)
+    for i, k in enumerate(topk_args):
+        cmc_true = cmc_score(
+            query_embeddings, gallery_embeddings, conformity_matrix, topk=k
+        )
+        assert np.isclose(metrics["cmc"][i], cmc_true)
+
+        topk_indices = torch.argsort(distances, dim=1)[:, :k]
+        relevance = conformity_matrix.gather(1, topk_indices).float()
+        precision_true = relevance.mean().item()
+        assert np.isclose(metrics["precision"][i], precision_true)
+
+        scores = -distances.gather(1, topk_indices)
+        map_true = avg_precision(scores, relevance).mean().item()
+        assert np.isclose(metrics["map"][i], map_true)
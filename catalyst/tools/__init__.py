@@ -1,5 +1,12 @@
 # flake8: noqa
+from catalyst.tools.async_writer import AsyncWriter
 from catalyst.tools.frozen_class import FrozenClass
+from catalyst.tools.metrics_writer import (
+    BufferedMetricsWriter,
+    CSVColumnsWriter,
+    ParquetColumnsWriter,
+)
+from catalyst.tools.tensor_buffer import TensorBuffer
 from catalyst.tools.time_manager import TimeManager
 
 from catalyst.tools.meters import *
@@ -0,0 +1,89 @@
+"""
+Background writer thread.
+"""
+from typing import Callable, Optional
+import queue
+import threading
+
+
+class AsyncWriter(object):
+    """
+    Executes the submitted write jobs in the background thread
+    one-by-one in the submission order.
+
+    The jobs queue is bounded with ``max_queue_size``,
+    so ``submit`` blocks if the writer falls behind
+    and the pending jobs do not pile up in the memory.
+    Exceptions raised by the jobs are re-raised
+    on the next ``submit`` or ``flush`` call.
+
+    Example:
+        >>> writer = AsyncWriter(max_queue_size=1)
+        >>> writer.submit(torch.save, checkpoint, "checkpoint.pth")
+        >>> # training goes on, while the checkpoint is written
+        >>> writer.flush()  # waits for all submitted jobs
+    """
+
+    def __init__(self, max_queue_size: int = 1):
+        """
+        Args:
+            max_queue_size: maximum number of the pending jobs
+        """
+        if max_queue_size < 1:
+            raise ValueError(
+                f"max_queue_size should be positive, got {max_queue_size}"
+            )
+        self.max_queue_size = max_queue_size
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue_size)
+        self._thread: Optional[threading.Thread] = None
+        self._exception: Optional[BaseException] = None
+
+    def _run(self) -> None:
+        while True:
+            job = self._queue.get()
+            try:
+                if job is None:
+                    return
+                fn, args, kwargs = job
+                fn(*args, **kwargs)
+            except BaseException as ex:  # noqa: WPS424
+                if self._exception is None:
+                    self._exception = ex
+            finally:
+                self._queue.task_done()
+
+    def _raise_exception(self) -> None:
+        exception, self._exception = self._exception, None
+        if exception is not None:
+            raise exception
+
+    def submit(self, fn: Callable, *args, **kwargs) -> None:
+        """Adds the job to the queue, blocks if the queue is full.
+
+        Args:
+            fn: function to call in the background thread
+            *args: ``fn`` args
+            **kwargs: ``fn`` kwargs
+        """
+        self._raise_exception()
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+        self._queue.put((fn, args, kwargs))
+
+    def flush(self) -> None:
+        """Waits for all submitted jobs to complete."""
+        if self._thread is not None:
+            self._queue.join()
+        self._raise_exception()
+
+    def close(self) -> None:
+        """Waits for all submitted jobs and stops the background thread."""
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+        self._thread = None
+        self._raise_exception()
+
+
+__all__ = ["AsyncWriter"]
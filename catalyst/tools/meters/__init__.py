@@ -1,5 +1,11 @@
 # flake8: noqa
 from catalyst.tools.meters.meter import Meter
 from catalyst.tools.meters.averagevaluemeter import AverageValueMeter
+from catalyst.tools.meters.tensoraveragevaluemeter import (
+    TensorAverageValueMeter,
+)
 from catalyst.tools.meters.confusionmeter import ConfusionMeter
 from catalyst.tools.meters.ppv_tpr_f1_meter import PrecisionRecallF1ScoreMeter
+from catalyst.tools.meters.multiclass_statistics_meter import (
+    MulticlassStatisticsMeter,
+)
@@ -0,0 +1,175 @@
+"""
+Streaming multiclass classification statistics.
+"""
+from typing import Tuple
+
+import torch
+
+from catalyst.tools.meters import meter
+
+
+def _get_multiclass_confusion_matrix(
+    outputs: torch.Tensor, targets: torch.Tensor, num_classes: int,
+) -> torch.Tensor:
+    """
+    Computes the confusion matrix with one ``bincount`` call
+    for the multiclass predictions.
+
+    Labels out of the ``[0; num_classes)`` range are counted
+    in the extra last row/column, so they are still taken into account
+    as false positives/negatives and the total number of samples.
+
+    Args:
+        outputs: predicted class indices, broadcastable with ``targets``
+        targets: ground truth class indices
+        num_classes: number of classes
+
+    Returns:
+        torch.Tensor: [num_classes + 1; num_classes + 1] confusion matrix
+        with the targets along the rows and the predictions along the columns
+    """
+    outputs, targets = torch.broadcast_tensors(outputs, targets)
+    outputs = outputs.reshape(-1).long()
+    targets = targets.reshape(-1).long()
+    outputs = outputs.masked_fill(
+        (outputs < 0) | (outputs >= num_classes), num_classes
+    )
+    targets = targets.masked_fill(
+        (targets < 0) | (targets >= num_classes), num_classes
+    )
+    size = num_classes + 1
+    confusion_matrix = torch.bincount(
+        targets * size + outputs, minlength=size * size
+    )
+    return confusion_matrix.view(size, size)
+
+
+def _get_multiclass_statistics_from_confusion_matrix(
+    confusion_matrix: torch.Tensor,
+) -> Tuple[
+    torch.Tensor, torch.Tensor, torch.Tensor, torch.Tensor, torch.Tensor
+]:
+    """
+    Computes the number of true negative, false positive,
+    false negative, true positive and support for every class
+    from the confusion matrix of ``_get_multiclass_confusion_matrix``.
+
+    Args:
+        confusion_matrix: [num_classes + 1; num_classes + 1] confusion matrix
+
+    Returns:
+        Tuple[Tensor, Tensor, Tensor, Tensor, Tensor]: stats
+    """
+    num_classes = confusion_matrix.shape[0] - 1
+    confusion_matrix = confusion_matrix.float()
+    num_samples = confusion_matrix.sum()
+    tp = confusion_matrix.diagonal()[:num_classes]
+    support = confusion_matrix.sum(dim=1)[:num_classes]
+    fp = confusion_matrix.sum(dim=0)[:num_classes] - tp
+    fn = support - tp
+    tn = num_samples - tp - fp - fn
+    return tn, fp, fn, tp, support
+
+
+class MulticlassStatisticsMeter(meter.Meter):
+    """
+    Accumulates the confusion matrix for a multiclass classification problem
+    and computes tn/fp/fn/tp/support for all classes from it.
+
+    The confusion matrix is updated with one ``bincount`` per batch
+    on the outputs' device, so meter updates do not require
+    device-host synchronization,
+    and distributed reduction is one ``all_reduce`` call
+    with ``synchronize``.
+
+    Example:
+        >>> meter = MulticlassStatisticsMeter(num_classes=3)
+        >>> meter.add(torch.tensor([0, 1, 2]), torch.tensor([0, 1, 1]))
+        >>> meter.add(torch.tensor([2, 2]), torch.tensor([2, 0]))
+        >>> tn, fp, fn, tp, support = meter.value()
+        >>> tp
+        tensor([1., 1., 1.])
+    """
+
+    def __init__(self, num_classes: int, argmax_dim: int = -1):
+        """
+        Args:
+            num_classes: number of classes
+            argmax_dim: int, that specifies dimension for argmax transformation
+                in case of scores/probabilities in ``outputs``
+        """
+        super(MulticlassStatisticsMeter, self).__init__()
+        self.num_classes = num_classes
+        self.argmax_dim = argmax_dim
+        self.confusion_matrix = None
+        self.reset()
+
+    def reset(self) -> None:
+        """Resets the accumulated confusion matrix."""
+        self.confusion_matrix = None
+
+    def add(self, outputs: torch.Tensor, targets: torch.Tensor) -> None:
+        """Updates the confusion matrix with a new batch.
+
+        Args:
+            outputs: predicted class indices
+                or [bs; ..., num_classes] scores/probabilities
+            targets: ground truth class indices
+        """
+        outputs, targets = outputs.detach(), targets.detach()
+        if outputs.dim() == targets.dim() + 1:
+            outputs = torch.argmax(outputs, dim=self.argmax_dim)
+        confusion_matrix = _get_multiclass_confusion_matrix(
+            outputs=outputs, targets=targets, num_classes=self.num_classes
+        )
+        if self.confusion_matrix is None:
+            self.confusion_matrix = confusion_matrix
+        else:
+            self.confusion_matrix += confusion_matrix
+
+    def synchronize(self) -> None:
+        """Sums the accumulated confusion matrix over all distributed nodes.
+
+        Should be called once all nodes have finished the updates,
+        for example, at the loader end.
+        """
+        if self.confusion_matrix is None:
+            size = self.num_classes + 1
+            self.confusion_matrix = torch.zeros((size, size), dtype=torch.long)
+        if not (
+            torch.distributed.is_available()
+            and torch.distributed.is_initialized()
+        ):
+            return
+        # ``nccl`` reduces only the CUDA tensors
+        if torch.distributed.get_backend() == "nccl":
+            reduce_device = torch.device(f"cuda:{torch.cuda.current_device()}")
+        else:
+            reduce_device = torch.device("cpu")
+        device = self.confusion_matrix.device
+        confusion_matrix = self.confusion_matrix.to(device=reduce_device)
+        torch.distributed.all_reduce(confusion_matrix)
+        self.confusion_matrix = confusion_matrix.to(device=device)
+
+    def value(
+        self,
+    ) -> Tuple[
+        torch.Tensor, torch.Tensor, torch.Tensor, torch.Tensor, torch.Tensor
+    ]:
+        """Returns the accumulated statistics.
+
+        Returns:
+            Tuple[Tensor, Tensor, Tensor, Tensor, Tensor]: tn, fp, fn, tp
+            and support with [num_classes] shape
+        """
+        if self.confusion_matrix is None:
+            size = self.num_classes + 1
+            confusion_matrix = torch.zeros((size, size), dtype=torch.long)
+        else:
+            confusion_matrix = self.confusion_matrix
+        return _get_multiclass_statistics_from_confusion_matrix(
+            confusion_matrix
+        )
+
+
+__all__ = ["MulticlassStatisticsMeter"]
@@ -0,0 +1,86 @@
+"""
+Tensor average value meter
+"""
+from typing import Tuple, Union
+
+import torch
+
+from catalyst.tools.meters import meter
+
+
+class TensorAverageValueMeter(meter.Meter):
+    """
+    Average value meter stores mean and standard deviation
+    for population of input values.
+    Unlike ``AverageValueMeter``, the statistics are accumulated
+    as PyTorch tensors on the values' device,
+    so meter updates do not require device-host synchronization.
+    Use ``float(meter.mean)`` to get the value on the host.
+    """
+
+    def __init__(self):
+        """Constructor method for the ``TensorAverageValueMeter`` class."""
+        super(TensorAverageValueMeter, self).__init__()
+        self.n = 0
+        self.val = 0.0
+        self.n_samples = 0
+        self.sum = 0.0
+        self.sum_sq = 0.0
+
+    @property
+    def mean(self) -> Union[float, torch.Tensor]:
+        """Weighted mean of the values."""
+        if self.n == 0:
+            return float("nan")
+        return self.sum / self.n_samples
+
+    @property
+    def std(self) -> Union[float, torch.Tensor]:
+        """Weighted standard deviation of the values."""
+        if self.n == 0:
+            return float("nan")
+        if self.n == 1 or self.n_samples <= 1:
+            return 0.0 * self.sum
+        m_s = self.sum_sq - self.sum * self.sum / self.n_samples
+        if torch.is_tensor(m_s):
+            m_s = m_s.clamp(min=0.0)
+            return torch.sqrt(m_s / (self.n_samples - 1.0))
+        return (max(m_s, 0.0) / (self.n_samples - 1.0)) ** 0.5
+
+    def add(self, value, batch_size) -> None:
+        """Add a new observation.
+
+        Args:
+            value: value for update,
+                can be scalar number or PyTorch tensor
+            batch_size: batch size for update
+        """
+        if torch.is_tensor(value):
+            value = value.detach().to(dtype=torch.float64)
+        else:
+            value = float(value)
+        self.val = value
+        self.n += 1
+        self.n_samples += batch_size
+        self.sum = self.sum + value * batch_size
+        self.sum_sq = self.sum_sq + value * value * batch_size
+
+    def value(self) -> Tuple:
+        """Returns meter values.
+
+        Returns:
+            Tuple[Tensor, Tensor]: tuple of mean and std
+            that have been accumulated on the device.
+        """
+        return self.mean, self.std
+
+    def reset(self):
+        """Resets the meter to default settings."""
+        self.n = 0
+        self.val = 0.0
+        self.n_samples = 0
+        self.sum = 0.0
+        self.sum_sq = 0.0
+
+
+__all__ = ["TensorAverageValueMeter"]
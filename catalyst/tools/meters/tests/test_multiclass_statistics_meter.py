@@ -0,0 +1,30 @@
+# flake8: noqa
+
+import torch
+
+from catalyst.metrics.functional import get_multiclass_statistics
+from catalyst.tools import meters
+
+
+def test_multiclass_statistics_meter():
+    """Test for ``catalyst.tools.meters.MulticlassStatisticsMeter``."""
+    num_classes = 5
+    meter = meters.MulticlassStatisticsMeter(num_classes=num_classes)
+    torch.manual_seed(42)
+    logits = torch.rand(95, num_classes)
+    targets = torch.randint(0, num_classes, size=(95,))
+
+    for i in range(0, len(logits), 10):
+        meter.add(logits[i : i + 10], targets[i : i + 10])
+    meter.synchronize()
+
+    stats_true = get_multiclass_statistics(
+        logits, targets, num_classes=num_classes
+    )
+    for value, value_true in zip(meter.value(), stats_true):
+        assert torch.equal(value, value_true)
+
+    meter.reset()
+    tn, fp, fn, tp, support = meter.value()
+    assert tn.sum().item() == 0
+    assert support.shape == (num_classes,)
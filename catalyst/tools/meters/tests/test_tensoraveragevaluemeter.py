@@ -0,0 +1,36 @@
+# flake8: noqa
+
+import torch
+
+from catalyst.tools import meters
+
+
+def test_tensoraveragevaluemeter():
+    """Test for ``catalyst.tools.meters.TensorAverageValueMeter``."""
+    meter_instance = meters.TensorAverageValueMeter()
+    reference_instance = meters.AverageValueMeter()
+
+    def batch_generator(length, batch_size=10):
+        data = torch.rand(length)
+        for i in range(length // batch_size):
+            yield data[i * batch_size : (i + 1) * batch_size]
+        if length % batch_size:
+            yield data[-(length % batch_size) :]
+
+    def test(meter, reference, length, batch_size):
+        for batch in batch_generator(length, batch_size):
+            bs = batch.shape[0]
+            meter.add(batch.mean(), bs)
+            reference.add(batch.mean(), bs)
+            assert torch.is_tensor(meter.mean)
+        assert torch.allclose(
+            torch.tensor(reference.value(), dtype=torch.float64),
+            torch.stack(meter.value()),
+            atol=1e-06,
+        )
+        meter.reset()
+        reference.reset()
+
+    confs = ((100, 1), (100, 10), (100, 16), (1024, 53), (10, 16), (100, 100))
+    for conf in confs:
+        test(meter_instance, reference_instance, *conf)
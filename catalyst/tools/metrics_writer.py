@@ -0,0 +1,324 @@
+"""
+Buffered columnar metrics writers.
+"""
+from typing import Callable, Dict, Mapping, Optional, Sequence
+import os
+
+import numpy as np
+
+from catalyst.tools.async_writer import AsyncWriter
+
+AGGREGATIONS = ("last", "mean", "min", "max")
+# (steps, columns) -> None
+ColumnsWriteFn = Callable[[np.ndarray, Dict[str, np.ndarray]], None]
+
+
+class BufferedMetricsWriter(object):
+    """
+    Collects the per-batch metrics into the preallocated columnar buffers
+    (``step`` and one float64 array per metric)
+    and writes the full buffers with the ``write_fn``
+    in the background :py:class:`catalyst.tools.AsyncWriter` thread,
+    so the logging does not format or write anything per batch.
+
+    Every ``log_period`` added metrics are reduced
+    into the single row with the ``aggregation``:
+    ``last`` (sampling), ``mean``, ``min`` or ``max``.
+    Metrics missing in the row are NaNs.
+
+    Example:
+        >>> writer = BufferedMetricsWriter(
+        >>>     CSVColumnsWriter("./logs/batch_metrics.csv"),
+        >>>     log_period=10,
+        >>>     aggregation="mean",
+        >>> )
+        >>> for step, batch in enumerate(loader):
+        >>>     ...
+        >>>     writer.add({"loss": loss.item()}, step=step)
+        >>> writer.close()
+    """
+
+    def __init__(
+        self,
+        write_fn: ColumnsWriteFn,
+        buffer_size: int = 1024,
+        log_period: int = 1,
+        aggregation: str = "last",
+        metric_names: Optional[Sequence[str]] = None,
+        writer: Optional[AsyncWriter] = None,
+    ):
+        """
+        Args:
+            write_fn: function to write the ``(steps, columns)`` buffer,
+                e.g. :py:class:`CSVColumnsWriter`,
+                it is called in the background thread
+            buffer_size: number of the rows to buffer before the write
+            log_period: number of the added metrics per row
+            aggregation: metrics aggregation over the ``log_period``,
+                one of ``last``, ``mean``, ``min`` or ``max``
+            metric_names: metrics to log, if None - logs everything
+            writer: background writer, could be shared among the buffers,
+                the new one is created if None
+
+        Raises:
+            ValueError: if the aggregation is unknown
+                or the sizes are not positive
+        """
+        if aggregation not in AGGREGATIONS:
+            raise ValueError(f"aggregation should be one of {AGGREGATIONS}")
+        if buffer_size < 1 or log_period < 1:
+            raise ValueError("buffer_size and log_period should be positive")
+        self.write_fn = write_fn
+        self.buffer_size = buffer_size
+        self.log_period = log_period
+        self.aggregation = aggregation
+        self.metric_names = (
+            list(metric_names) if metric_names is not None else None
+        )
+        self._own_writer = writer is None
+        if writer is None:
+            writer = AsyncWriter(max_queue_size=4)
+        self.writer = writer
+
+        self._size = 0
+        self._steps = np.empty(buffer_size, dtype=np.int64)
+        self._columns: Dict[str, np.ndarray] = {}
+        self._num_added = 0
+        self._last_step = 0
+        # metric -> [aggregated value, count] over the current period
+        self._period: Dict[str, list] = {}
+
+    def _get_names(self, metrics: Mapping[str, float]) -> Sequence[str]:
+        if self.metric_names is None:
+            return list(metrics.keys())
+        return [name for name in self.metric_names if name in metrics]
+
+    def _append_row(self, values: Mapping[str, float], step: int) -> None:
+        row = self._size
+        self._steps[row] = step
+        for name, value in values.items():
+            column = self._columns.get(name)
+            if column is None:
+                column = np.full(self.buffer_size, np.nan)
+                self._columns[name] = column
+            column[row] = value
+        self._size += 1
+        if self._size == self.buffer_size:
+            self._submit()
+
+    def _aggregate(self, metrics: Mapping[str, float]) -> None:
+        for name in self._get_names(metrics):
+            value = float(metrics[name])
+            state = self._period.get(name)
+            if state is None:
+                self._period[name] = [value, 1]
+            elif self.aggregation == "last":
+                state[0] = value
+            elif self.aggregation == "mean":
+                state[0] += value
+                state[1] += 1
+            elif self.aggregation == "min":
+                state[0] = min(state[0], value)
+            else:
+                state[0] = max(state[0], value)
+
+    def _append_period(self, step: int) -> None:
+        values = {
+            name: value / count if self.aggregation == "mean" else value
+            for name, (value, count) in self._period.items()
+        }
+        self._period = {}
+        self._append_row(values, step)
+
+    def _submit(self) -> None:
+        if self._size == 0:
+            return
+        size = self._size
+        steps = self._steps[:size]
+        columns = {
+            name: column[:size] for name, column in self._columns.items()
+        }
+        # the filled buffers are handed over to the background thread
+        self._steps = np.empty(self.buffer_size, dtype=np.int64)
+        self._columns = {
+            name: np.full(self.buffer_size, np.nan) for name in self._columns
+        }
+        self._size = 0
+        self.writer.submit(self.write_fn, steps, columns)
+
+    def add(self, metrics: Mapping[str, float], step: int) -> None:
+        """Adds the metrics.
+
+        Args:
+            metrics: metrics to log
+            step: metrics step
+        """
+        self._num_added += 1
+        self._last_step = step
+        if self.log_period == 1:
+            values = {
+                name: float(metrics[name]) for name in self._get_names(metrics)
+            }
+            self._append_row(values, step)
+            return
+        self._aggregate(metrics)
+        if self._num_added % self.log_period == 0:
+            self._append_period(step)
+
+    def flush(self) -> None:
+        """Writes the buffered rows and waits for the writes,
+        the metrics of the incomplete period are kept."""
+        self._submit()
+        self.writer.flush()
+
+    def close(self) -> None:
+        """Writes all the metrics and closes the ``write_fn``."""
+        if self._period:
+            self._append_period(self._last_step)
+        self._submit()
+        close_fn = getattr(self.write_fn, "close", None)
+        if close_fn is not None:
+            self.writer.submit(close_fn)
+        if self._own_writer:
+            self.writer.close()
+        else:
+            self.writer.flush()
+
+
+class CSVColumnsWriter(object):
+    """
+    Writes the metrics columns to the csv file with one buffered write
+    per columns chunk, the header is the ``step`` and the metrics names
+    (from the first chunk if ``metric_names`` is None).
+    """
+
+    def __init__(
+        self,
+        path: str,
+        metric_names: Optional[Sequence[str]] = None,
+        float_format: str = "%.10g",
+    ):
+        """
+        Args:
+            path: csv file path
+            metric_names: columns of the csv file,
+                if None - metrics of the first written chunk
+            float_format: metrics values format
+        """
+        self.path = path
+        self.metric_names = (
+            list(metric_names) if metric_names is not None else None
+        )
+        self.float_format = float_format
+        self._file = None
+
+    def __call__(self, steps: np.ndarray, columns: Dict[str, np.ndarray]):
+        """Writes the columns chunk.
+
+        Args:
+            steps: [num_rows] metrics steps
+            columns: metric -> [num_rows] values
+        """
+        if self._file is None:
+            if self.metric_names is None:
+                self.metric_names = list(columns.keys())
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            self._file = open(self.path, "w", buffering=2 ** 20)
+            self._file.write(",".join(["step"] + self.metric_names) + "\n")
+        missing = np.full(len(steps), np.nan)
+        values = np.column_stack(
+            [steps]
+            + [columns.get(name, missing) for name in self.metric_names]
+        )
+        np.savetxt(
+            self._file,
+            values,
+            fmt=["%d"] + [self.float_format] * len(self.metric_names),
+            delimiter=",",
+        )
+
+    def close(self) -> None:
+        """Closes the file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class ParquetColumnsWriter(object):
+    """
+    Writes the metrics columns to the parquet file
+    as the row group per columns chunk,
+    the schema is the ``step`` and the metrics names
+    (from the first chunk if ``metric_names`` is None).
+
+    Requires ``pyarrow``, the file is readable after the ``close``.
+    """
+
+    def __init__(
+        self, path: str, metric_names: Optional[Sequence[str]] = None,
+    ):
+        """
+        Args:
+            path: parquet file path
+            metric_names: columns of the parquet file,
+                if None - metrics of the first written chunk
+
+        Raises:
+            ImportError: if pyarrow is not available
+        """
+        try:
+            import pyarrow  # noqa: F401
+            import pyarrow.parquet  # noqa: F401
+        except ImportError as ex:
+            raise ImportError(
+                "pyarrow is required for the parquet metrics logs, "
+                "to install pyarrow, run `pip install pyarrow`."
+            ) from ex
+        self.path = path
+        self.metric_names = (
+            list(metric_names) if metric_names is not None else None
+        )
+        self._writer = None
+
+    def __call__(self, steps: np.ndarray, columns: Dict[str, np.ndarray]):
+        """Writes the columns chunk.
+
+        Args:
+            steps: [num_rows] metrics steps
+            columns: metric -> [num_rows] values
+        """
+        import pyarrow
+        import pyarrow.parquet
+
+        if self._writer is None:
+            if self.metric_names is None:
+                self.metric_names = list(columns.keys())
+            schema = pyarrow.schema(
+                [("step", pyarrow.int64())]
+                + [(name, pyarrow.float64()) for name in self.metric_names]
+            )
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            self._writer = pyarrow.parquet.ParquetWriter(self.path, schema)
+        missing = np.full(len(steps), np.nan)
+        table = pyarrow.Table.from_arrays(
+            [pyarrow.array(steps)]
+            + [
+                pyarrow.array(columns.get(name, missing))
+                for name in self.metric_names
+            ],
+            schema=self._writer.schema,
+        )
+        self._writer.write_table(table)
+
+    def close(self) -> None:
+        """Closes the file."""
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+
+__all__ = [
+    "BufferedMetricsWriter",
+    "CSVColumnsWriter",
+    "ParquetColumnsWriter",
+]
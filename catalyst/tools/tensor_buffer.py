@@ -0,0 +1,221 @@
+"""
+Growable tensor buffer.
+"""
+from typing import List, Optional, Tuple, Union
+import tempfile
+
+import numpy as np
+
+import torch
+
+Device = Union[str, torch.device]
+
+_MIN_CHUNK_SIZE = 1024
+
+
+class TensorBuffer(object):
+    """
+    Growable buffer to accumulate tensor batches along the first dimension.
+
+    The storage is preallocated with chunks of ``capacity`` rows
+    on the ``device`` (or in the pinned CPU memory),
+    so every batch is copied in-place without extra allocations
+    and without device-host synchronization for the device storage.
+    If the buffer is full, a new chunk is allocated, so it could grow
+    beyond the ``capacity``.
+    After the ``reset`` allocated chunks are reused.
+
+    With ``memmap_dir`` the storage is spilled to the memory-mapped
+    temporary file in the ``memmap_dir``, which is resized on demand,
+    so the accumulated data is not limited by the RAM size.
+
+    Example:
+        >>> buffer = TensorBuffer(capacity=100, device="cpu")
+        >>> for batch in torch.rand(10, 10, 3):
+        >>>     buffer.append(batch)
+        >>> buffer.get().shape
+        torch.Size([100, 3])
+    """
+
+    def __init__(
+        self,
+        capacity: int = None,
+        device: Device = None,
+        pin_memory: bool = False,
+        memmap_dir: str = None,
+    ):
+        """
+        Args:
+            capacity: expected number of rows to accumulate,
+                if None, the buffer grows from the small chunk
+            device: storage device, if None, the device of the first batch
+                is used
+            pin_memory: flag to store data in the pinned CPU memory,
+                so the copies from the GPU are asynchronous
+            memmap_dir: directory for the memory-mapped storage,
+                if None, data is stored in the memory
+        """
+        is_cpu_device = device is None or torch.device(device).type == "cpu"
+        if memmap_dir is not None and (pin_memory or not is_cpu_device):
+            raise ValueError(
+                "memory-mapped storage is supported only for CPU device"
+                " without memory pinning"
+            )
+        self.capacity = capacity
+        self.device = torch.device(device) if device is not None else None
+        self.pin_memory = pin_memory
+        self.memmap_dir = memmap_dir
+
+        self._dtype: torch.dtype = None
+        self._item_shape: Tuple[int, ...] = None
+        self._chunks: List[torch.Tensor] = []
+        self._memmap_file = None
+        self._chunk_idx = 0
+        self._chunk_pos = 0
+        self._size = 0
+        self._need_synchronize = False
+
+    def __len__(self) -> int:
+        """Returns number of accumulated rows."""
+        return self._size
+
+    @property
+    def allocated(self) -> int:
+        """Number of preallocated rows."""
+        return sum(chunk.shape[0] for chunk in self._chunks)
+
+    def _init_storage(self, value: torch.Tensor) -> None:
+        self._dtype = value.dtype
+        self._item_shape = tuple(value.shape[1:])
+        if self.device is None:
+            self.device = value.device
+
+    def _allocate_memmap(self, num_rows: int) -> torch.Tensor:
+        np_dtype = torch.empty(0, dtype=self._dtype).numpy().dtype
+        shape = (num_rows,) + self._item_shape
+        num_bytes = int(np.prod(shape)) * np_dtype.itemsize
+        if self._memmap_file is None:
+            self._memmap_file = tempfile.TemporaryFile(dir=self.memmap_dir)
+        # the file is only extended, so the accumulated data is kept
+        self._memmap_file.truncate(num_bytes)
+        array = np.memmap(
+            self._memmap_file, dtype=np_dtype, mode="r+", shape=shape
+        )
+        return torch.from_numpy(array)
+
+    def _add_chunk(self, min_rows: int) -> None:
+        allocated = self.allocated
+        num_rows = max(
+            min_rows, allocated, (self.capacity or 0) - allocated,
+        )
+        if allocated == 0:
+            num_rows = max(num_rows, self.capacity or _MIN_CHUNK_SIZE)
+
+        if self.memmap_dir is not None:
+            # memory-mapped storage is always one contiguous chunk
+            chunk = self._allocate_memmap(allocated + num_rows)
+            self._chunks = [chunk]
+            self._chunk_idx = 0
+            self._chunk_pos = allocated
+            return
+
+        chunk = torch.empty(
+            (num_rows,) + self._item_shape,
+            dtype=self._dtype,
+            device=self.device,
+            pin_memory=self.pin_memory and self.device.type == "cpu",
+        )
+        self._chunks.append(chunk)
+
+    def append(self, value: torch.Tensor) -> None:
+        """Copies the batch to the buffer.
+
+        Args:
+            value: tensor with [batch_size; *item_shape] shape
+
+        Raises:
+            ValueError: if the batch shape differs from the previous ones
+        """
+        if not torch.is_tensor(value):
+            value = torch.as_tensor(value)
+        value = value.detach()
+        if value.dim() == 0:
+            value = value.unsqueeze(0)
+        if self._item_shape is None:
+            self._init_storage(value)
+        if tuple(value.shape[1:]) != self._item_shape:
+            raise ValueError(
+                f"Expected batch with {self._item_shape} item shape,"
+                f" got {tuple(value.shape[1:])}"
+            )
+
+        non_blocking = self.device.type != "cpu" or self.pin_memory
+        if value.is_cuda and self.device.type == "cpu" and self.pin_memory:
+            self._need_synchronize = True
+
+        offset, num_rows = 0, value.shape[0]
+        while offset < num_rows:
+            if self._chunk_idx == len(self._chunks):
+                self._add_chunk(num_rows - offset)
+            chunk = self._chunks[self._chunk_idx]
+            step = min(num_rows - offset, chunk.shape[0] - self._chunk_pos)
+            chunk[self._chunk_pos : self._chunk_pos + step].copy_(
+                value[offset : offset + step], non_blocking=non_blocking
+            )
+            offset += step
+            self._chunk_pos += step
+            if self._chunk_pos == chunk.shape[0]:
+                self._chunk_idx += 1
+                self._chunk_pos = 0
+        self._size += num_rows
+
+    def get(self) -> Optional[torch.Tensor]:
+        """Returns accumulated data.
+
+        If the data fits into one chunk, the chunk view is returned
+        without copy, so it is valid only till the next ``reset``.
+
+        Returns:
+            tensor with [len(buffer); *item_shape] shape
+            or None if nothing was accumulated yet
+        """
+        if self._item_shape is None:
+            return None
+        if self._need_synchronize:
+            torch.cuda.synchronize()
+            self._need_synchronize = False
+
+        filled = self._chunks[: self._chunk_idx]
+        if self._chunk_pos > 0:
+            filled.append(self._chunks[self._chunk_idx][: self._chunk_pos])
+        if len(filled) == 0:
+            return torch.empty(
+                (0,) + self._item_shape, dtype=self._dtype, device=self.device
+            )
+        elif len(filled) == 1:
+            return filled[0]
+        return torch.cat(filled, dim=0)
+
+    def reset(self, capacity: int = None) -> None:
+        """Resets the buffer, allocated storage is kept for the reuse.
+
+        Args:
+            capacity: new expected number of rows to accumulate,
+                if None, the previous one is used
+        """
+        if capacity is not None:
+            self.capacity = capacity
+        self._chunk_idx = 0
+        self._chunk_pos = 0
+        self._size = 0
+
+    def release(self) -> None:
+        """Releases all allocated storage."""
+        self.reset()
+        self._chunks = []
+        if self._memmap_file is not None:
+            self._memmap_file.close()
+            self._memmap_file = None
+
+
+__all__ = ["TensorBuffer"]
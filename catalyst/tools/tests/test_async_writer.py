@@ -0,0 +1,35 @@
+# flake8: noqa
+import time
+
+import pytest
+
+from catalyst.tools.async_writer import AsyncWriter
+
+
+def test_async_writer_order():
+    writer = AsyncWriter(max_queue_size=2)
+    results = []
+
+    def job(value):
+        time.sleep(0.01)
+        results.append(value)
+
+    for i in range(5):
+        writer.submit(job, i)
+    writer.flush()
+    assert results == list(range(5))
+    writer.close()
+
+
+def test_async_writer_exception():
+    writer = AsyncWriter()
+
+    def job():
+        raise RuntimeError("write failed")
+
+    writer.submit(job)
+    with pytest.raises(RuntimeError):
+        writer.flush()
+    # exception is raised once
+    writer.flush()
+    writer.close()
@@ -0,0 +1,122 @@
+# flake8: noqa
+import numpy as np
+import pytest
+
+from catalyst.tools.async_writer import AsyncWriter
+from catalyst.tools.metrics_writer import (
+    BufferedMetricsWriter,
+    CSVColumnsWriter,
+)
+
+
+class ColumnsCollector:
+    def __init__(self):
+        self.chunks = []
+        self.closed = False
+
+    def __call__(self, steps, columns):
+        self.chunks.append((steps, columns))
+
+    def close(self):
+        self.closed = True
+
+    def get_column(self, name):
+        return np.concatenate([columns[name] for _, columns in self.chunks])
+
+    def get_steps(self):
+        return np.concatenate([steps for steps, _ in self.chunks])
+
+
+def test_buffered_metrics_writer_chunks():
+    collector = ColumnsCollector()
+    writer = BufferedMetricsWriter(collector, buffer_size=3)
+    for step in range(7):
+        metrics = {"loss": step / 2}
+        if step >= 4:
+            metrics["accuracy"] = step
+        writer.add(metrics, step=step)
+    writer.flush()
+    # the incomplete buffer is written on flush
+    assert [len(steps) for steps, _ in collector.chunks] == [3, 3, 1]
+    writer.close()
+
+    assert collector.closed
+    assert np.allclose(collector.get_column("loss"), np.arange(7) / 2)
+    accuracy = collector.chunks[1][1]["accuracy"]
+    assert np.isnan(accuracy[0]) and np.allclose(accuracy[1:], [4, 5])
+    assert collector.get_steps().tolist() == list(range(7))
+
+
+@pytest.mark.parametrize(
+    "aggregation,expected",
+    [
+        ("last", [2, 5, 7]),
+        ("mean", [1, 4, 6.5]),
+        ("min", [0, 3, 6]),
+        ("max", [2, 5, 7]),
+    ],
+)
+def test_buffered_metrics_writer_aggregation(aggregation, expected):
+    collector = ColumnsCollector()
+    writer = BufferedMetricsWriter(
+        collector, buffer_size=2, log_period=3, aggregation=aggregation
+    )
+    for step in range(8):
+        writer.add({"loss": float(step)}, step=step)
+    writer.close()
+
+    assert np.allclose(collector.get_column("loss"), expected)
+    # the incomplete period is written on close with the last step
+    assert collector.get_steps().tolist() == [2, 5, 7]
+
+
+def test_buffered_metrics_writer_metric_names():
+    collector = ColumnsCollector()
+    writer = BufferedMetricsWriter(collector, metric_names=["loss"])
+    writer.add({"loss": 1.0, "accuracy": 0.5}, step=0)
+    writer.close()
+    assert list(collector.chunks[0][1].keys()) == ["loss"]
+
+
+def test_buffered_metrics_writer_shared_writer():
+    async_writer = AsyncWriter(max_queue_size=1)
+    collectors = [ColumnsCollector(), ColumnsCollector()]
+    writers = [
+        BufferedMetricsWriter(collector, buffer_size=2, writer=async_writer)
+        for collector in collectors
+    ]
+    for step in range(5):
+        for index, writer in enumerate(writers):
+            writer.add({"loss": float(step + index)}, step=step)
+    for writer in writers:
+        writer.close()
+    async_writer.close()
+
+    assert np.allclose(collectors[0].get_column("loss"), np.arange(5))
+    assert np.allclose(collectors[1].get_column("loss"), np.arange(1, 6))
+
+
+def test_buffered_metrics_writer_wrong_params():
+    with pytest.raises(ValueError):
+        BufferedMetricsWriter(ColumnsCollector(), aggregation="median")
+    with pytest.raises(ValueError):
+        BufferedMetricsWriter(ColumnsCollector(), log_period=0)
+
+
+def test_csv_columns_writer(tmpdir):
+    path = str(tmpdir / "logs" / "batch_logs.csv")
+    writer = BufferedMetricsWriter(CSVColumnsWriter(path), buffer_size=2)
+    writer.add({"loss": 0.5, "accuracy": 1.0}, step=32)
+    writer.add({"loss": 0.25}, step=64)
+    # new metrics are not added to the csv columns
+    writer.add({"loss": 0.125, "accuracy": 0.75, "lr": 0.1}, step=96)
+    writer.close()
+
+    with open(path) as fin:
+        lines = fin.read().splitlines()
+    assert lines == [
+        "step,loss,accuracy",
+        "32,0.5,1",
+        "64,0.25,nan",
+        "96,0.125,0.75",
+    ]
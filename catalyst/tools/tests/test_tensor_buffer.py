@@ -0,0 +1,51 @@
+# flake8: noqa
+import pytest
+
+import torch
+
+from catalyst.tools.tensor_buffer import TensorBuffer
+
+
+@pytest.mark.parametrize("capacity", [None, 10, 64, 100])
+def test_tensor_buffer(capacity):
+    """Test for ``catalyst.tools.TensorBuffer``."""
+    data = torch.rand(100, 3)
+    buffer = TensorBuffer(capacity=capacity)
+    for _ in range(2):
+        buffer.reset()
+        for batch in data.split(16):
+            buffer.append(batch)
+        assert len(buffer) == 100
+        assert torch.equal(buffer.get(), data)
+
+
+def test_tensor_buffer_reuse():
+    """Test for ``catalyst.tools.TensorBuffer`` storage reuse."""
+    buffer = TensorBuffer(capacity=100)
+    buffer.append(torch.rand(100, 3))
+    storage = buffer.get().data_ptr()
+    buffer.reset()
+    data = torch.rand(50, 3)
+    buffer.append(data)
+    assert buffer.get().data_ptr() == storage
+    assert buffer.allocated == 100
+    assert torch.equal(buffer.get(), data)
+
+
+def test_tensor_buffer_memmap(tmpdir):
+    """Test for ``catalyst.tools.TensorBuffer`` with memory-mapped storage."""
+    data = torch.randint(0, 10, size=(100, 2, 2))
+    buffer = TensorBuffer(capacity=10, memmap_dir=str(tmpdir))
+    for batch in data.split(7):
+        buffer.append(batch)
+    assert len(buffer) == 100
+    assert torch.equal(buffer.get(), data)
+    buffer.release()
+
+
+def test_tensor_buffer_shape_check():
+    """Test for ``catalyst.tools.TensorBuffer`` item shape check."""
+    buffer = TensorBuffer()
+    buffer.append(torch.rand(4, 3))
+    with pytest.raises(ValueError):
+        buffer.append(torch.rand(4, 2))
@@ -8,11 +8,19 @@ All utils are gathered in :py:mod:`catalyst.utils` for easier access.
 
 
 from catalyst.utils.checkpoint import (
+    get_checkpoint_snapshot,
     load_checkpoint,
     pack_checkpoint,
     save_checkpoint,
     unpack_checkpoint,
 )
+from catalyst.utils.sharded_checkpoint import (
+    LazyCheckpoint,
+    is_sharded_checkpoint,
+    load_sharded_checkpoint,
+    remove_unused_shards,
+    save_sharded_checkpoint,
+)
 from catalyst.utils.components import process_components
 from catalyst.utils.config import load_config, save_config
 from catalyst.utils.distributed import (
@@ -20,8 +28,15 @@ from catalyst.utils.distributed import (
     get_slurm_params,
     get_distributed_params,
     get_distributed_env,
+    get_distributed_backend,
+    get_distributed_device,
+    get_numa_nodes_cpus,
+    get_worker_cpus,
     get_rank,
     get_distributed_mean,
+    get_distributed_sum,
+    MetricsReduction,
+    reduce_metrics,
     check_ddp_wrapped,
     check_torch_distributed_initialized,
     check_slurm_available,
@@ -31,6 +46,7 @@ from catalyst.utils.distributed import (
     assert_fp16_available,
 )
 from catalyst.utils.loaders import (
+    check_persistent_workers_available,
     get_loaders_from_params,
     validate_loaders,
     get_loader,
@@ -70,6 +86,7 @@ from catalyst.utils.scripts import (
     distributed_cmd_run,
 )
 from catalyst.utils.swa import (
+    WeightsAverager,
     average_weights,
     get_averaged_weights_by_path_mask,
 )
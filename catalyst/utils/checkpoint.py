@@ -1,4 +1,5 @@
-from typing import Callable, Dict, Union
+from typing import Any, Callable, Dict, Union
+import copy
 import os
 from pathlib import Path
 import shutil
@@ -8,6 +9,11 @@ from torch import nn
 
 from catalyst.utils.distributed import get_nn_from_ddp_module
 from catalyst.utils.misc import maybe_recursive_call
+from catalyst.utils.sharded_checkpoint import (
+    is_sharded_checkpoint,
+    load_sharded_checkpoint,
+    save_sharded_checkpoint,
+)
 
 
 def pack_checkpoint(
@@ -108,6 +114,79 @@ def unpack_checkpoint(
             dict2load.load_state_dict(checkpoint[name2load])
 
 
+def get_checkpoint_snapshot(checkpoint: Dict, pin_memory: bool = True) -> Dict:
+    """Copies all checkpoint tensors to the CPU memory,
+    so the checkpoint could be saved in the background,
+    while the model is updated in-place.
+
+    Args:
+        checkpoint: checkpoint to copy,
+            for example, from ``pack_checkpoint``
+        pin_memory: flag to copy CUDA tensors to the pinned CPU memory
+            with asynchronous copies, that are synchronized once
+
+    Returns:
+        checkpoint copy with the same structure
+    """
+    pin_memory = pin_memory and torch.cuda.is_available()
+    need_synchronize = False
+
+    def _snapshot(value: Any) -> Any:
+        nonlocal need_synchronize
+        if torch.is_tensor(value):
+            value = value.detach()
+            if value.is_cuda:
+                result = torch.empty(
+                    value.shape, dtype=value.dtype, pin_memory=pin_memory
+                )
+                result.copy_(value, non_blocking=pin_memory)
+                need_synchronize = need_synchronize or pin_memory
+                return result
+            elif value.device.type != "cpu":
+                return value.cpu()
+            return value.clone()
+        elif isinstance(value, dict):
+            # shallow copy keeps the dict type and state dicts' metadata
+            result = copy.copy(value)
+            for key, item in value.items():
+                result[key] = _snapshot(item)
+            return result
+        elif type(value) in (list, tuple):  # noqa: WPS516
+            return type(value)(_snapshot(item) for item in value)
+        return value
+
+    snapshot = _snapshot(checkpoint)
+    if need_synchronize:
+        torch.cuda.synchronize()
+    return snapshot
+
+
+def _save_file(saver_fn: Callable, data: Any, filename: str) -> None:
+    """Saves data to the temporary file and atomically renames it,
+    so the other links to the previous file content stay untouched.
+    """
+    tmp_filename = f"{filename}.tmp"
+    saver_fn(data, tmp_filename)
+    # some savers (e.g. for the XLA) write the file on the master only
+    if os.path.isfile(tmp_filename):
+        os.replace(tmp_filename, filename)
+
+
+def _link_file(src: str, dst: str) -> None:
+    """Points ``dst`` to the ``src`` content with the hardlink
+    (or the copy if hardlinks are not supported)
+    and atomic rename.
+    """
+    tmp_dst = f"{dst}.tmp"
+    if os.path.lexists(tmp_dst):
+        os.remove(tmp_dst)
+    try:
+        os.link(src, tmp_dst)
+    except OSError:
+        shutil.copyfile(src, tmp_dst)
+    os.replace(tmp_dst, dst)
+
+
 def save_checkpoint(
     checkpoint: Dict,
     logdir: Union[Path, str],
@@ -116,6 +195,7 @@ def save_checkpoint(
     is_last: bool = False,
     special_suffix: str = "",
     saver_fn: Callable = torch.save,
+    sharded: bool = False,
 ) -> Union[Path, str]:
     """Saving checkpoint to a file.
 
@@ -132,17 +212,27 @@ def save_checkpoint(
             saving best/last checkpoints.
         saver_fn: function to use for saving
             data to file, default is ``torch.save``
+        sharded: if ``True`` then checkpoint is saved
+            in the sharded format with ``save_sharded_checkpoint``
+            instead of ``saver_fn``
 
     Returns:
         path to saved checkpoint
+
+    .. note::
+        The checkpoint is written to the temporary file and renamed,
+        best/last checkpoints are hardlinks to the saved file
+        (or copies if the filesystem does not support hardlinks).
     """
     os.makedirs(logdir, exist_ok=True)
     filename = f"{logdir}/{suffix}.pth"
-    saver_fn(checkpoint, filename)
+    if sharded:
+        saver_fn = save_sharded_checkpoint
+    _save_file(saver_fn, checkpoint, filename)
     if is_best:
-        shutil.copyfile(filename, f"{logdir}/best{special_suffix}.pth")
+        _link_file(filename, f"{logdir}/best{special_suffix}.pth")
     if is_last:
-        shutil.copyfile(filename, f"{logdir}/last{special_suffix}.pth")
+        _link_file(filename, f"{logdir}/last{special_suffix}.pth")
     return filename
 
 
@@ -153,8 +243,11 @@ def load_checkpoint(filepath: str):
         filepath: checkpoint file to load
 
     Returns:
-        checkpoint content
+        checkpoint content,
+        sharded checkpoints are loaded lazily (``LazyCheckpoint``)
     """
+    if is_sharded_checkpoint(filepath):
+        return load_sharded_checkpoint(filepath)
     checkpoint = torch.load(
         filepath, map_location=lambda storage, loc: storage
     )
@@ -162,6 +255,7 @@ def load_checkpoint(filepath: str):
 
 
 __all__ = [
+    "get_checkpoint_snapshot",
     "pack_checkpoint",
     "unpack_checkpoint",
     "save_checkpoint",
@@ -18,6 +18,7 @@ from catalyst.utils.distributed import (
     check_amp_available,
     check_apex_available,
     check_ddp_wrapped,
+    get_distributed_device,
     get_distributed_params,
     get_rank,
     initialize_apex,
@@ -167,7 +168,13 @@ def process_components(
         ), "Distributed training is not available for KV model"
 
         local_rank = distributed_params.pop("local_rank", 0) or 0
-        device = f"cuda:{local_rank}"
+        if get_distributed_device().type == "cuda":
+            device = torch.device(f"cuda:{local_rank}")
+            device_ids, output_device = [local_rank], local_rank
+        else:
+            # cpu workers, e.g. gloo backend
+            device = torch.device("cpu")
+            device_ids, output_device = None, None
         model = maybe_recursive_call(model, "to", device=device)
 
         syncbn = distributed_params.pop("syncbn", False)
@@ -187,7 +194,7 @@ def process_components(
                 model = torch.nn.SyncBatchNorm.convert_sync_batchnorm(model)
 
             model = nn.parallel.DistributedDataParallel(
-                model, device_ids=[local_rank], output_device=local_rank
+                model, device_ids=device_ids, output_device=output_device
             )
     # data parallel run (dp) (with apex support)
     else:
@@ -1,5 +1,6 @@
-from typing import Union
-from collections import OrderedDict
+from typing import Any, Dict, Iterator, List, Tuple, Union
+from collections import defaultdict, OrderedDict
+from glob import glob
 import os
 import random
 import socket
@@ -154,32 +155,321 @@ def get_rank() -> int:
         return -1
 
 
+def get_distributed_backend() -> str:
+    """
+    Returns the distributed backend to use,
+    could be set with the ``DDP_BACKEND`` environment variable.
+
+    Returns:
+        str: ``DDP_BACKEND`` if set, otherwise ``"nccl"`` if CUDA
+        is available and ``"gloo"`` if not
+    """
+    default_backend = "nccl" if torch.cuda.is_available() else "gloo"
+    return os.getenv("DDP_BACKEND", default_backend)
+
+
+def get_distributed_device() -> torch.device:
+    """
+    Returns the device for the collective operations
+    of the initialized process group.
+
+    Returns:
+        torch.device: current CUDA device for the ``nccl`` backend,
+        CPU otherwise
+    """
+    if (
+        check_torch_distributed_initialized()
+        and torch.distributed.get_backend() == "nccl"
+    ):
+        return torch.device(f"cuda:{torch.cuda.current_device()}")
+    return torch.device("cpu")
+
+
 def get_distributed_mean(value: Union[float, torch.Tensor]):
     """Computes distributed mean among all nodes."""
     if check_torch_distributed_initialized():
+        device = get_distributed_device()
         # Fix for runtime warning:
         # To copy construct from a tensor, it is recommended to use
         # sourceTensor.clone().detach() or
         # sourceTensor.clone().detach().requires_grad_(True),
         # rather than torch.tensor(sourceTensor).
         if torch.is_tensor(value):
-            value = (
-                value.clone()
-                .detach()
-                .to(device=f"cuda:{torch.cuda.current_device()}")
-            )
+            value = value.clone().detach().to(device=device)
         else:
             value = torch.tensor(
-                value,
-                dtype=torch.float,
-                device=f"cuda:{torch.cuda.current_device()}",
-                requires_grad=False,
+                value, dtype=torch.float, device=device, requires_grad=False,
             )
         torch.distributed.all_reduce(value)
         value = float(value.item() / torch.distributed.get_world_size())
     return value
 
 
+def get_distributed_sum(value: torch.Tensor) -> torch.Tensor:
+    """Computes distributed sum among all nodes.
+
+    Args:
+        value: tensor to reduce, could be on any device
+
+    Returns:
+        reduced tensor on the ``value`` device
+    """
+    if check_torch_distributed_initialized():
+        device = value.device
+        value = value.clone().detach().to(device=get_distributed_device())
+        torch.distributed.all_reduce(value)
+        value = value.to(device=device)
+    return value
+
+
+REDUCE_MODES = ("sum", "mean", "max", "min", "concat")
+
+
+class _PackedBucket(object):
+    """Values flattened into the single float64 tensor for one collective."""
+
+    def __init__(self):
+        self.numbers: List[Tuple[str, float]] = []
+        self.tensors: List[Tuple[str, torch.Tensor]] = []
+        self.data: torch.Tensor = None
+
+    def add(self, key: str, value: Any) -> None:
+        if torch.is_tensor(value):
+            self.tensors.append((key, value.detach()))
+        else:
+            self.numbers.append((key, float(value)))
+
+    def pack(self, device: torch.device) -> torch.Tensor:
+        # all python numbers are copied to the device at once
+        parts = [
+            torch.tensor(
+                [value for _, value in self.numbers],
+                dtype=torch.float64,
+                device=device,
+            )
+        ]
+        parts.extend(
+            value.to(device=device, dtype=torch.float64).reshape(-1)
+            for _, value in self.tensors
+        )
+        self.data = torch.cat(parts)
+        return self.data
+
+    def unpack(self) -> Iterator[Tuple[str, Any, Any]]:
+        """Yields keys, reduced values and original values."""
+        num_numbers = len(self.numbers)
+        # one device-host transfer for the python numbers
+        numbers = self.data[:num_numbers].tolist()
+        for (key, value), reduced in zip(self.numbers, numbers):
+            yield key, reduced, value
+        offset = num_numbers
+        for key, value in self.tensors:
+            reduced = self.data[offset : offset + value.numel()]
+            offset += value.numel()
+            yield key, reduced.view(value.shape), value
+
+
+class MetricsReduction(object):
+    """
+    Distributed reduction of the metrics dict with the bucketed collectives.
+
+    All ``sum`` and ``mean`` values (and the ``concat`` sizes)
+    are packed into one flat tensor and ``max`` and ``min``
+    (negated) values - into another one, so every bucket is reduced
+    with the single ``all_reduce``. ``concat`` values are gathered
+    with one ``all_gather`` per dtype after that.
+
+    Use :py:func:`reduce_metrics` to create it.
+    """
+
+    def __init__(
+        self,
+        metrics: Dict[str, Any],
+        modes: Union[str, Dict[str, str]] = "mean",
+    ):
+        """
+        Args:
+            metrics: metrics to reduce, python numbers or tensors
+            modes: reduction mode for all metrics or for every metric
+                (``mean`` for the missing keys), one of
+                ``sum``, ``mean``, ``max``, ``min`` or ``concat``
+                (tensors are concatenated along the first dimension
+                in the ranks order)
+
+        Raises:
+            ValueError: if reduction mode is unknown
+        """
+        if isinstance(modes, str):
+            modes = {key: modes for key in metrics}
+        self.modes = {key: modes.get(key, "mean") for key in metrics}
+        for key, mode in self.modes.items():
+            if mode not in REDUCE_MODES:
+                raise ValueError(
+                    f"unknown reduction mode '{mode}' for '{key}', "
+                    f"should be one of {REDUCE_MODES}"
+                )
+        self.metrics = metrics
+        self.distributed = check_torch_distributed_initialized()
+        self._sum_bucket = _PackedBucket()
+        self._max_bucket = _PackedBucket()
+        self._works = []
+        self._result: Dict[str, Any] = None
+
+    def start(self) -> "MetricsReduction":
+        """Launches the asynchronous reduction of the buckets.
+
+        Returns:
+            MetricsReduction: self
+        """
+        if not self.distributed:
+            return self
+
+        device = get_distributed_device()
+        rank = torch.distributed.get_rank()
+        world_size = torch.distributed.get_world_size()
+        for key, value in self.metrics.items():
+            mode = self.modes[key]
+            if mode == "concat":
+                # every rank fills its own slot, so the sum is all sizes
+                sizes = torch.zeros(world_size, dtype=torch.float64)
+                sizes[rank] = len(value)
+                self._sum_bucket.add(key, sizes)
+            elif mode == "min":
+                self._max_bucket.add(key, -value)
+            elif mode == "max":
+                self._max_bucket.add(key, value)
+            else:
+                self._sum_bucket.add(key, value)
+
+        for bucket, op in (
+            (self._sum_bucket, torch.distributed.ReduceOp.SUM),
+            (self._max_bucket, torch.distributed.ReduceOp.MAX),
+        ):
+            if bucket.numbers or bucket.tensors:
+                self._works.append(
+                    torch.distributed.all_reduce(
+                        bucket.pack(device), op=op, async_op=True
+                    )
+                )
+        return self
+
+    def _gather(self, sizes: Dict[str, List[int]]) -> Dict[str, torch.Tensor]:
+        """Gathers ``concat`` values with one ``all_gather`` per dtype."""
+        device = get_distributed_device()
+        world_size = torch.distributed.get_world_size()
+        keys_by_dtype = defaultdict(list)
+        for key in sizes:
+            keys_by_dtype[torch.as_tensor(self.metrics[key]).dtype].append(key)
+
+        output = {}
+        for dtype, keys in keys_by_dtype.items():
+            values = [torch.as_tensor(self.metrics[key]) for key in keys]
+            padded = []
+            for key, value in zip(keys, values):
+                value = value.to(device=device)
+                pad = max(sizes[key]) - len(value)
+                if pad > 0:
+                    value = torch.cat(
+                        [value, value.new_zeros((pad,) + value.shape[1:])]
+                    )
+                padded.append(value.reshape(-1))
+            local = torch.cat(padded)
+            gathered = [torch.empty_like(local) for _ in range(world_size)]
+            torch.distributed.all_gather(gathered, local)
+
+            for key, value in zip(keys, values):
+                row_numel = value.shape[1:].numel()
+                numel = max(sizes[key]) * row_numel
+                parts = []
+                for rank_data, size in zip(gathered, sizes[key]):
+                    parts.append(
+                        rank_data[: size * row_numel].view(
+                            (size,) + value.shape[1:]
+                        )
+                    )
+                output[key] = torch.cat(parts).to(device=value.device)
+                gathered = [rank_data[numel:] for rank_data in gathered]
+        return output
+
+    def wait(self) -> Dict[str, Any]:
+        """Waits for the reduction.
+
+        Returns:
+            Dict[str, Any]: reduced metrics, python numbers
+            for the python numbers and tensors on the original devices
+            for the tensors
+        """
+        if self._result is not None:
+            return self._result
+        if not self.distributed:
+            self._result = dict(self.metrics)
+            return self._result
+
+        for work in self._works:
+            work.wait()
+        world_size = torch.distributed.get_world_size()
+
+        output, sizes = {}, {}
+        for bucket in (self._sum_bucket, self._max_bucket):
+            if bucket.data is None:
+                continue
+            for key, reduced, value in bucket.unpack():
+                mode = self.modes[key]
+                if mode == "concat":
+                    sizes[key] = [int(size) for size in reduced.tolist()]
+                    continue
+                if mode == "mean":
+                    reduced = reduced / world_size
+                elif mode == "min":
+                    reduced = -reduced
+                if torch.is_tensor(value):
+                    dtype = value.dtype
+                    if mode == "mean" and not dtype.is_floating_point:
+                        dtype = torch.get_default_dtype()
+                    reduced = reduced.to(device=value.device, dtype=dtype)
+                output[key] = reduced
+        if sizes:
+            output.update(self._gather(sizes))
+
+        self._result = {key: output[key] for key in self.metrics}
+        return self._result
+
+
+def reduce_metrics(
+    metrics: Dict[str, Any],
+    modes: Union[str, Dict[str, str]] = "mean",
+    async_op: bool = False,
+) -> Union[Dict[str, Any], MetricsReduction]:
+    """
+    Reduces all metrics among all nodes with the single ``all_reduce``
+    per reduction operation instead of the collective per metric.
+
+    Example:
+        >>> metrics = reduce_metrics(
+        >>>     {"loss": loss, "accuracy": accuracy, "num_samples": 128},
+        >>>     modes={"num_samples": "sum"},
+        >>> )
+        >>> # overlap the reduction with the computations
+        >>> reduction = reduce_metrics(metrics, async_op=True)
+        >>> ...
+        >>> metrics = reduction.wait()
+
+    Args:
+        metrics: metrics to reduce, python numbers or tensors
+        modes: reduction mode for all metrics or for every metric
+            (``mean`` for the missing keys), one of
+            ``sum``, ``mean``, ``max``, ``min`` or ``concat``
+        async_op: if True, returns the launched reduction,
+            call its ``wait`` method to get the reduced metrics
+
+    Returns:
+        reduced metrics or ``MetricsReduction`` if ``async_op``,
+        metrics are returned as is if torch.distributed is not initialized
+    """
+    reduction = MetricsReduction(metrics, modes=modes).start()
+    return reduction if async_op else reduction.wait()
+
+
 def get_slurm_params():
     """Return slurm params for experiment run.
 
@@ -213,7 +503,13 @@ def get_distributed_params():
     os.environ["MASTER_ADDR"] = os.getenv("MASTER_ADDR", master_addr)
     os.environ["MASTER_PORT"] = os.getenv("MASTER_PORT", master_port)
 
-    workers_per_node = torch.cuda.device_count()
+    backend = get_distributed_backend()
+    workers_per_node = int(
+        os.getenv(
+            "DDP_WORKERS_PER_NODE",
+            torch.cuda.device_count() if backend == "nccl" else 1,
+        )
+    )
     start_rank = cur_node * workers_per_node
     world_size = num_nodes * workers_per_node
 
@@ -227,6 +523,8 @@ def get_distributed_params():
         start_rank=start_rank,
         rank=rank,
         world_size=world_size,
+        workers_per_node=workers_per_node,
+        backend=backend,
         master_addr=os.environ["MASTER_ADDR"],
         master_port=os.environ["MASTER_PORT"],
     )
@@ -239,6 +537,7 @@ def get_distributed_env(
     rank: int,
     world_size: int,
     use_cuda_visible_devices: bool = True,
+    num_threads: int = None,
 ):
     """Returns environment copy with extra distributed settings.
 
@@ -247,6 +546,7 @@ def get_distributed_env(
         rank: worker global rank
         world_size: worker world size
         use_cuda_visible_devices: boolean flag to use available GPU devices
+        num_threads: number of the worker OpenMP/MKL threads
 
     Returns:
         updated environment copy
@@ -255,6 +555,9 @@ def get_distributed_env(
     env["RANK"] = str(rank)
     env["WORLD_SIZE"] = str(world_size)
     env["LOCAL_RANK"] = str(local_rank)
+    if num_threads is not None:
+        env["OMP_NUM_THREADS"] = str(num_threads)
+        env["MKL_NUM_THREADS"] = str(num_threads)
     if use_cuda_visible_devices:
         available_gpus = get_available_gpus()
         env["LOCAL_RANK"] = "0"
@@ -262,6 +565,70 @@ def get_distributed_env(
     return env
 
 
+def _parse_cpulist(cpulist: str) -> List[int]:
+    """Parses the sysfs cpu list, e.g. ``"0-3,8-11"``."""
+    cpus = []
+    for part in cpulist.strip().split(","):
+        if not part:
+            continue
+        start, _, end = part.partition("-")
+        cpus.extend(range(int(start), int(end or start) + 1))
+    return cpus
+
+
+def get_numa_nodes_cpus() -> List[List[int]]:
+    """
+    Returns the CPUs of every NUMA node.
+
+    Returns:
+        List[List[int]]: CPUs ids per NUMA node,
+        empty list if the NUMA topology is not available
+    """
+    paths = glob("/sys/devices/system/node/node[0-9]*/cpulist")
+    paths = sorted(
+        paths, key=lambda path: int(path.split("/")[-2][len("node") :])
+    )
+    nodes = []
+    for path in paths:
+        with open(path) as cpulist:
+            nodes.append(_parse_cpulist(cpulist.read()))
+    return nodes
+
+
+def get_worker_cpus(local_rank: int, workers_per_node: int) -> List[int]:
+    """
+    Returns the CPUs to pin the worker to.
+
+    The available CPUs are ordered by the NUMA nodes
+    and split into ``workers_per_node`` contiguous chunks,
+    so the workers do not share cores
+    and every worker stays within one NUMA node
+    if there are more workers than nodes.
+
+    Args:
+        local_rank: worker local rank
+        workers_per_node: number of workers on the node
+
+    Returns:
+        List[int]: CPUs ids
+    """
+    if hasattr(os, "sched_getaffinity"):
+        available_cpus = os.sched_getaffinity(0)
+    else:
+        available_cpus = range(os.cpu_count() or 1)
+    cpu2node = {
+        cpu: node
+        for node, cpus in enumerate(get_numa_nodes_cpus())
+        for cpu in cpus
+    }
+    cpus = sorted(available_cpus, key=lambda cpu: (cpu2node.get(cpu, 0), cpu))
+
+    start = local_rank * len(cpus) // workers_per_node
+    end = (local_rank + 1) * len(cpus) // workers_per_node
+    # more workers than CPUs, share them
+    return cpus[start:end] or [cpus[local_rank % len(cpus)]]
+
+
 __all__ = [
     "check_ddp_wrapped",
     "check_apex_available",
@@ -272,8 +639,15 @@ __all__ = [
     "initialize_apex",
     "get_nn_from_ddp_module",
     "get_rank",
+    "get_distributed_backend",
+    "get_distributed_device",
     "get_distributed_mean",
+    "get_distributed_sum",
+    "MetricsReduction",
+    "reduce_metrics",
     "get_distributed_env",
     "get_distributed_params",
     "get_slurm_params",
+    "get_numa_nodes_cpus",
+    "get_worker_cpus",
 ]
@@ -3,6 +3,8 @@ from collections import OrderedDict
 from copy import copy
 import warnings
 
+from packaging.version import parse, Version
+
 import torch
 from torch.utils.data import DataLoader, Dataset, DistributedSampler
 from torch.utils.data.dataloader import default_collate as default_collate_fn
@@ -183,11 +185,17 @@ def validate_loaders(loaders: Dict[str, DataLoader]) -> Dict[str, DataLoader]:
     return loaders
 
 
+def check_persistent_workers_available() -> bool:
+    """Checks if ``DataLoader(persistent_workers=True)`` is available."""
+    return parse(torch.__version__) >= Version("1.7.0")
+
+
 def get_loaders_from_params(
     batch_size: int = 1,
     num_workers: int = 0,
     drop_last: bool = False,
     per_gpu_scaling: bool = False,
+    persistent_workers: bool = False,
     loaders_params: Dict[str, Any] = None,
     samplers_params: Dict[str, Any] = None,
     initial_seed: int = 42,
@@ -206,6 +214,10 @@ def get_loaders_from_params(
             from ``torch.utils.data.DataLoader``
         per_gpu_scaling: boolean flag,
             if ``True``, scales batch_size in proportion to the number of GPUs
+        persistent_workers: boolean flag, if ``True``, the loaders
+            worker processes are kept alive between the epochs
+            (requires ``torch>=1.7``), could be overridden per loader
+            with ``loaders_params``
         loaders_params (Dict[str, Any]): additional loaders parameters
         samplers_params (Dict[str, Any]): additional sampler parameters
         initial_seed: initial seed for ``torch.utils.data.DataLoader``
@@ -241,6 +253,13 @@ def get_loaders_from_params(
     distributed_rank = get_rank()
     distributed = distributed_rank > -1
 
+    if persistent_workers and not check_persistent_workers_available():
+        warnings.warn(
+            "persistent_workers requires torch>=1.7, "
+            "loaders workers are restarted every epoch"
+        )
+        persistent_workers = False
+
     if get_datasets_fn is not None:
         datasets = get_datasets_fn(**data_params)
     else:
@@ -303,6 +322,9 @@ def get_loaders_from_params(
         else:
             raise NotImplementedError
 
+        if persistent_workers and loader_params["num_workers"] > 0:
+            loader_params.setdefault("persistent_workers", True)
+
         if distributed:
             if sampler is not None:
                 if not isinstance(sampler, DistributedSampler):
@@ -335,6 +357,7 @@ def get_loaders_from_params(
 
 
 __all__ = [
+    "check_persistent_workers_available",
     "get_native_batch_from_loader",
     "get_native_batch_from_loaders",
     "get_loader",
@@ -535,11 +535,16 @@ def find_value_ids(it: Iterable[Any], value: Any) -> List[int]:
     Returns:
         indices of the all elements equal x0
     """
-    if isinstance(it, np.ndarray):
-        inds = list(np.where(it == value)[0])
-    else:  # could be very slow
-        inds = [i for i, el in enumerate(it) if el == value]
-    return inds
+    if not isinstance(it, np.ndarray):
+        it = list(it)
+    try:
+        array = np.asarray(it)
+    except ValueError:  # ragged elements
+        array = None
+    if array is not None and array.ndim == 1 and np.ndim(value) == 0:
+        return np.flatnonzero(array == value).tolist()
+    # nested elements, could be very slow
+    return [i for i, el in enumerate(it) if el == value]
 
 
 __all__ = [
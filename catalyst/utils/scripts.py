@@ -1,4 +1,4 @@
-from typing import Callable, Dict, Union
+from typing import Callable, Dict, List, Union
 import copy
 from importlib.util import module_from_spec, spec_from_file_location
 import os
@@ -15,6 +15,7 @@ from catalyst.registry import EXPERIMENTS, RUNNERS
 from catalyst.utils.distributed import (
     get_distributed_env,
     get_distributed_params,
+    get_worker_cpus,
 )
 from catalyst.utils.misc import get_utcnow_time
 
@@ -148,12 +149,31 @@ def dump_experiment_code(src: pathlib.Path, dst: pathlib.Path) -> None:
     dump_python_files(src, dst)
 
 
+def _pin_worker(cpus: List[int]) -> None:
+    """Pins the current process and its intra-op threads to the CPUs."""
+    if hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, cpus)
+    torch.set_num_threads(len(cpus))
+
+
 def distributed_cmd_run(
     worker_fn: Callable, distributed: bool = True, *args, **kwargs
 ) -> None:
     """
     Distributed run
 
+    The backend is set with the ``DDP_BACKEND`` environment variable
+    (``nccl`` by default if CUDA is available and ``gloo`` otherwise),
+    the number of the workers per node - with the ``DDP_WORKERS_PER_NODE``
+    (number of GPUs for ``nccl`` by default).
+    CPU workers are pinned to the disjoint sets of cores
+    (see :py:func:`catalyst.utils.distributed.get_worker_cpus`),
+    e.g. 4 CPU workers on a single machine:
+
+    .. code-block:: bash
+
+        DDP_BACKEND=gloo DDP_WORKERS_PER_NODE=4 catalyst-dl run --ddp ...
+
     Args:
         worker_fn: worker fn to run in distributed mode
         distributed: distributed flag
@@ -163,6 +183,9 @@ def distributed_cmd_run(
     distributed_params = get_distributed_params()
     local_rank = distributed_params["local_rank"]
     world_size = distributed_params["world_size"]
+    workers_per_node = distributed_params["workers_per_node"]
+    backend = distributed_params["backend"]
+    use_cuda = backend == "nccl"
 
     if distributed and torch.distributed.is_initialized():
         warnings.warn(
@@ -177,18 +200,32 @@ def distributed_cmd_run(
     ):
         worker_fn(*args, **kwargs)
     elif local_rank is not None:
-        torch.cuda.set_device(int(local_rank))
+        if use_cuda:
+            torch.cuda.set_device(int(local_rank))
+        else:
+            _pin_worker(get_worker_cpus(local_rank, workers_per_node))
 
         torch.distributed.init_process_group(
-            backend="nccl", init_method="env://"
+            backend=backend, init_method="env://"
         )
         worker_fn(*args, **kwargs)
     else:
         workers = []
         try:
-            for local_rank in range(torch.cuda.device_count()):
+            for local_rank in range(workers_per_node):
                 rank = distributed_params["start_rank"] + local_rank
-                env = get_distributed_env(local_rank, rank, world_size)
+                num_threads = (
+                    None
+                    if use_cuda
+                    else len(get_worker_cpus(local_rank, workers_per_node))
+                )
+                env = get_distributed_env(
+                    local_rank,
+                    rank,
+                    world_size,
+                    use_cuda_visible_devices=use_cuda,
+                    num_threads=num_threads,
+                )
                 cmd = [sys.executable] + sys.argv.copy()
                 workers.append(subprocess.Popen(cmd, env=env))
             for worker in workers:
@@ -0,0 +1,292 @@
+from typing import Any, Dict, Iterator, NamedTuple, Set, Tuple
+from collections.abc import MutableMapping
+import copy
+import hashlib
+import io
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+
+import torch
+
+SHARDED_CHECKPOINT_FORMAT = "catalyst.sharded_checkpoint"
+SHARDS_DIRNAME = "shards"
+_META_COMPONENT = "meta"
+_COMPONENT_SUFFIXES = ("_state_dict", "_metrics")
+
+
+class TensorShard(NamedTuple):
+    """Reference to the tensor stored in the separate shard file."""
+
+    shard: str
+    dtype: str
+    shape: Tuple[int, ...]
+
+
+def _get_digest(data) -> str:
+    return hashlib.blake2b(data, digest_size=20).hexdigest()
+
+
+def _write_shard(shards_dir: str, name: str, write_fn) -> None:
+    """Writes the shard if it does not exist yet,
+    so the same content is stored only once."""
+    path = os.path.join(shards_dir, name)
+    if os.path.isfile(path):
+        return
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as file:
+        write_fn(file)
+    os.replace(tmp_path, path)
+
+
+def _save_tensor(
+    tensor: torch.Tensor, shards_dir: str, shards: Set[str]
+) -> TensorShard:
+    array = tensor.detach().cpu().contiguous().numpy()
+    buffer = array.reshape(-1).view(np.uint8)
+    name = f"{_get_digest(buffer)}.bin"
+    _write_shard(shards_dir, name, buffer.tofile)
+    shards.add(name)
+    return TensorShard(
+        shard=name, dtype=array.dtype.str, shape=tuple(array.shape)
+    )
+
+
+def _is_shardable(tensor: torch.Tensor, min_shard_size: int) -> bool:
+    if tensor.layout != torch.strided or tensor.is_quantized:
+        return False
+    try:
+        # dtypes without numpy analog (e.g. bfloat16) are stored inline
+        torch.empty(0, dtype=tensor.dtype).numpy()
+    except TypeError:
+        return False
+    return tensor.numel() * tensor.element_size() >= min_shard_size
+
+
+def _externalize(
+    value: Any, shards_dir: str, shards: Set[str], min_shard_size: int
+) -> Any:
+    """Replaces large tensors with ``TensorShard`` references."""
+    if torch.is_tensor(value):
+        if _is_shardable(value, min_shard_size):
+            return _save_tensor(value, shards_dir, shards)
+        return value
+    elif isinstance(value, dict):
+        result = copy.copy(value)
+        for key, item in value.items():
+            result[key] = _externalize(
+                item, shards_dir, shards, min_shard_size
+            )
+        return result
+    elif type(value) in (list, tuple):  # noqa: WPS516
+        return type(value)(
+            _externalize(item, shards_dir, shards, min_shard_size)
+            for item in value
+        )
+    return value
+
+
+def _internalize(value: Any, shards_dir: str) -> Any:
+    """Replaces ``TensorShard`` references with memory-mapped tensors."""
+    if isinstance(value, TensorShard):
+        array = np.memmap(
+            os.path.join(shards_dir, value.shard),
+            dtype=np.dtype(value.dtype),
+            mode="c",
+            shape=tuple(value.shape),
+        )
+        return torch.from_numpy(array)
+    elif isinstance(value, dict):
+        for key, item in value.items():
+            value[key] = _internalize(item, shards_dir)
+        return value
+    elif type(value) in (list, tuple):  # noqa: WPS516
+        return type(value)(_internalize(item, shards_dir) for item in value)
+    return value
+
+
+def _get_component_name(key: str) -> str:
+    if key.endswith(_COMPONENT_SUFFIXES):
+        return key
+    return _META_COMPONENT
+
+
+def save_sharded_checkpoint(
+    checkpoint: Dict, filepath: str, min_shard_size: int = 2 ** 16,
+) -> str:
+    """Saves checkpoint in the sharded format.
+
+    Every checkpoint component (``model_state_dict``,
+    ``optimizer_state_dict``, ``valid_metrics``, etc) is stored
+    in the separate shard, the tensors larger than ``min_shard_size`` bytes
+    are stored as raw memory-mappable shards.
+    Shards are content-addressed files
+    in the ``shards`` directory near the ``filepath``,
+    so the unchanged tensors (e.g. frozen backbone)
+    are shared by the consecutive checkpoints.
+    ``filepath`` itself is a small json index.
+
+    Args:
+        checkpoint: checkpoint to save
+        filepath: path to the checkpoint index
+        min_shard_size: minimum tensor size in bytes
+            to store it in the separate shard
+
+    Returns:
+        path to the saved checkpoint
+    """
+    shards_dir = os.path.join(os.path.dirname(filepath), SHARDS_DIRNAME)
+    os.makedirs(shards_dir, exist_ok=True)
+
+    groups: Dict[str, Dict] = {}
+    for key, value in checkpoint.items():
+        groups.setdefault(_get_component_name(key), {})[key] = value
+
+    shards: Set[str] = set()
+    components = {}
+    for group_name, group in groups.items():
+        group = _externalize(group, shards_dir, shards, min_shard_size)
+        buffer = io.BytesIO()
+        torch.save(group, buffer)
+        data = buffer.getvalue()
+        name = f"{_get_digest(data)}.pth"
+        _write_shard(shards_dir, name, lambda file: file.write(data))
+        shards.add(name)
+        for key in group:
+            components[key] = name
+
+    index = {
+        "format": SHARDED_CHECKPOINT_FORMAT,
+        "version": 1,
+        "components": components,
+        "shards": sorted(shards),
+    }
+    with open(filepath, "w") as file:
+        json.dump(index, file, indent=2)
+    return filepath
+
+
+def is_sharded_checkpoint(filepath: str) -> bool:
+    """Checks if the file is the sharded checkpoint index.
+
+    Args:
+        filepath: path to the checkpoint
+
+    Returns:
+        bool: ``True`` for the sharded checkpoint
+    """
+    # torch checkpoints are zip archives or pickles,
+    # so json index is detected by the first byte
+    with open(filepath, "rb") as file:
+        return file.read(1) == b"{"
+
+
+def _read_index(filepath: str) -> Dict:
+    with open(filepath) as file:
+        index = json.load(file)
+    if index.get("format") != SHARDED_CHECKPOINT_FORMAT:
+        raise ValueError(f"{filepath} is not a sharded checkpoint")
+    return index
+
+
+class LazyCheckpoint(MutableMapping):
+    """
+    Sharded checkpoint, that loads components on the first access.
+
+    Large tensors are memory-mapped from the shards (copy-on-write),
+    so they are read from the disk only when used,
+    e.g. in the ``load_state_dict``.
+    """
+
+    def __init__(self, filepath: str):
+        """
+        Args:
+            filepath: path to the sharded checkpoint index
+        """
+        self.filepath = filepath
+        self._index = _read_index(filepath)
+        self._shards_dir = os.path.join(
+            os.path.dirname(filepath), SHARDS_DIRNAME
+        )
+        self._keys = list(self._index["components"].keys())
+        self._data: Dict[str, Any] = {}
+        self._components: Dict[str, Dict] = {}
+
+    def _load_component(self, name: str) -> Dict:
+        if name not in self._components:
+            component = torch.load(
+                os.path.join(self._shards_dir, name),
+                map_location=lambda storage, loc: storage,
+            )
+            self._components[name] = _internalize(component, self._shards_dir)
+        return self._components[name]
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._data:
+            if key not in self._index["components"]:
+                raise KeyError(key)
+            name = self._index["components"][key]
+            self._data[key] = self._load_component(name)[key]
+        return self._data[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key not in self._keys:
+            self._keys.append(key)
+        self._data[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        if key not in self._keys:
+            raise KeyError(key)
+        self._keys.remove(key)
+        self._data.pop(key, None)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._keys))
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._keys
+
+
+def load_sharded_checkpoint(filepath: str) -> LazyCheckpoint:
+    """Lazily loads the sharded checkpoint.
+
+    Args:
+        filepath: path to the sharded checkpoint index
+
+    Returns:
+        LazyCheckpoint: dict-like checkpoint
+    """
+    return LazyCheckpoint(filepath)
+
+
+def remove_unused_shards(logdir: str) -> None:
+    """Removes shards, that are not used by the checkpoints in ``logdir``.
+
+    Args:
+        logdir: directory with the sharded checkpoints
+    """
+    shards_dir = os.path.join(logdir, SHARDS_DIRNAME)
+    if not os.path.isdir(shards_dir):
+        return
+    used_shards = set()
+    for filepath in Path(logdir).glob("*.pth"):
+        if filepath.is_file() and is_sharded_checkpoint(str(filepath)):
+            used_shards.update(_read_index(str(filepath))["shards"])
+    for name in os.listdir(shards_dir):
+        if name not in used_shards and not name.endswith(".tmp"):
+            os.remove(os.path.join(shards_dir, name))
+
+
+__all__ = [
+    "LazyCheckpoint",
+    "TensorShard",
+    "is_sharded_checkpoint",
+    "load_sharded_checkpoint",
+    "remove_unused_shards",
+    "save_sharded_checkpoint",
+]
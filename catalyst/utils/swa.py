@@ -1,4 +1,4 @@
-from typing import List, Union
+from typing import Dict, Iterable, List, Sequence, Union
 from collections import OrderedDict
 import glob
 import os
@@ -25,12 +25,131 @@ def _load_weights(path: str) -> dict:
     return weights
 
 
-def average_weights(state_dicts: List[dict]) -> OrderedDict:
+class WeightsAverager(object):
+    """
+    Streaming averaging of the model weights.
+
+    The running average is kept in float64,
+    so the weights could be added one state dict at a time
+    and only one extra copy of the weights is stored.
+
+    Supported modes:
+
+    - ``"mean"`` - (weighted) arithmetic mean of the weights
+    - ``"ema"`` - exponential moving average of the weights with ``decay``
+
+    Non-floating point tensors (e.g. ``num_batches_tracked``)
+    are not averaged, the last value is used.
+
+    Example:
+        >>> averager = WeightsAverager()
+        >>> for path in ["epoch1.pth", "epoch2.pth"]:
+        >>>     averager.update(torch.load(path))
+        >>> model.load_state_dict(averager.get_weights())
+    """
+
+    def __init__(
+        self,
+        mode: str = "mean",
+        decay: float = None,
+        device: Union[str, torch.device] = None,
+    ):
+        """
+        Args:
+            mode: averaging mode, ``"mean"`` or ``"ema"``
+            decay: EMA decay, required for ``"ema"`` mode
+            device: device to keep the running average on,
+                if None, the weights' device is used
+        """
+        if mode not in {"mean", "ema"}:
+            raise ValueError(f"Unknown averaging mode {mode}")
+        if mode == "ema" and (decay is None or not 0.0 <= decay < 1.0):
+            raise ValueError("EMA averaging requires decay in [0; 1) range")
+        self.mode = mode
+        self.decay = decay
+        self.device = device
+        self.num_updates = 0
+        self._total_weight = 0.0
+        self._keys: List[str] = None
+        self._average: Dict[str, torch.Tensor] = None
+        self._dtypes: Dict[str, torch.dtype] = None
+
+    def reset(self) -> None:
+        """Resets the running average."""
+        self.num_updates = 0
+        self._total_weight = 0.0
+        self._keys = None
+        self._average = None
+        self._dtypes = None
+
+    def update(self, state_dict: Dict, weight: float = 1.0) -> None:
+        """Adds the weights to the running average.
+
+        Args:
+            state_dict: model weights
+            weight: weight of the ``state_dict`` for the ``"mean"`` mode
+
+        Raises:
+            KeyError: If states do not match
+        """
+        keys = list(state_dict.keys())
+        if self._keys is None:
+            self._keys = keys
+            self._dtypes = {key: state_dict[key].dtype for key in keys}
+            self._average = OrderedDict()
+        elif keys != self._keys:
+            raise KeyError(
+                "For checkpoint {}, expected list of params: {}, "
+                "but found: {}".format(self.num_updates, self._keys, keys)
+            )
+
+        self._total_weight += weight
+        if self.mode == "mean" and self._total_weight <= 0:
+            raise ValueError("Total weight of the weights should be positive")
+        if self.mode == "mean":
+            alpha = weight / self._total_weight
+        else:
+            alpha = 1.0 - self.decay
+        for key in keys:
+            value = state_dict[key].detach()
+            if self.device is not None:
+                value = value.to(device=self.device)
+            if not value.is_floating_point():
+                self._average[key] = value.clone()
+            elif key not in self._average:
+                self._average[key] = value.to(dtype=torch.float64, copy=True)
+            else:
+                # in-place running average update:
+                # avg = avg * (1 - alpha) + value * alpha,
+                # ``value`` is upcast to float64 inside the ``add_`` kernel
+                self._average[key].mul_(1.0 - alpha).add_(value, alpha=alpha)
+        self.num_updates += 1
+
+    def get_weights(self) -> OrderedDict:
+        """Returns the averaged weights with the original dtypes.
+
+        Returns:
+            Averaged weights
+        """
+        if self._average is None:
+            raise ValueError("No weights were added to the averager")
+        return OrderedDict(
+            (key, value.to(dtype=self._dtypes[key], copy=True))
+            for key, value in self._average.items()
+        )
+
+
+def average_weights(
+    state_dicts: Iterable[dict], weights: Sequence[float] = None
+) -> OrderedDict:
     """
     Averaging of input weights.
 
     Args:
-        state_dicts: Weights to average
+        state_dicts: Weights to average,
+            could be a generator to load them one-by-one
+        weights: weights of the ``state_dicts`` in the average,
+            if None, the ``state_dicts`` are averaged equally
 
     Raises:
         KeyError: If states do not match
@@ -39,35 +158,34 @@ def average_weights(state_dicts: List[dict]) -> OrderedDict:
         Averaged weights
     """
     # source https://gist.github.com/qubvel/70c3d5e4cddcde731408f478e12ef87b
-    params_keys = None
+    averager = WeightsAverager()
     for i, state_dict in enumerate(state_dicts):
-        model_params_keys = list(state_dict.keys())
-        if params_keys is None:
-            params_keys = model_params_keys
-        elif params_keys != model_params_keys:
-            raise KeyError(
-                "For checkpoint {}, expected list of params: {}, "
-                "but found: {}".format(i, params_keys, model_params_keys)
-            )
-
-    average_dict = OrderedDict()
-    for k in state_dicts[0].keys():
-        average_dict[k] = torch.div(
-            sum(state_dict[k] for state_dict in state_dicts), len(state_dicts),
+        averager.update(
+            state_dict, weight=1.0 if weights is None else weights[i]
         )
-
-    return average_dict
+    return averager.get_weights()
 
 
 def get_averaged_weights_by_path_mask(
-    path_mask: str, logdir: Union[str, Path] = None,
+    path_mask: str,
+    logdir: Union[str, Path] = None,
+    mode: str = "mean",
+    decay: float = None,
+    weights: Sequence[float] = None,
 ) -> OrderedDict:
     """
     Averaging of input weights and saving them.
 
+    Checkpoints are loaded one-by-one in the sorted paths order,
+    so only one checkpoint and the running average are kept in memory.
+
     Args:
         path_mask: globe-like pattern for models to average
         logdir: Path to logs directory
+        mode: averaging mode, ``"mean"`` or ``"ema"``
+        decay: EMA decay, required for ``"ema"`` mode
+        weights: weights of the checkpoints for the ``"mean"`` mode,
+            in the sorted paths order
 
     Returns:
         Averaged weights
@@ -78,11 +196,22 @@ def get_averaged_weights_by_path_mask(
         models_pathes = glob.glob(
             os.path.join(logdir, "checkpoints", path_mask)
         )
+    models_pathes = sorted(models_pathes)
+    if weights is not None and len(weights) != len(models_pathes):
+        raise ValueError(
+            f"Expected {len(models_pathes)} weights, got {len(weights)}"
+        )
 
-    all_weights = [_load_weights(path) for path in models_pathes]
-    averaged_dict = average_weights(all_weights)
-
-    return averaged_dict
+    averager = WeightsAverager(mode=mode, decay=decay)
+    for i, path in enumerate(models_pathes):
+        averager.update(
+            _load_weights(path), weight=1.0 if weights is None else weights[i]
+        )
+    return averager.get_weights()
 
 
-__all__ = ["average_weights", "get_averaged_weights_by_path_mask"]
+__all__ = [
+    "WeightsAverager",
+    "average_weights",
+    "get_averaged_weights_by_path_mask",
+]
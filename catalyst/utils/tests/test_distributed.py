@@ -0,0 +1,151 @@
+# flake8: noqa
+import os
+import socket
+
+import pytest
+
+import torch
+import torch.distributed
+import torch.multiprocessing as mp
+
+from catalyst.utils import distributed
+from catalyst.utils.distributed import (
+    _parse_cpulist,
+    get_distributed_device,
+    get_distributed_mean,
+    get_distributed_sum,
+    get_worker_cpus,
+    reduce_metrics,
+)
+
+
+def test_parse_cpulist():
+    """Checks the sysfs cpu lists parsing."""
+    assert _parse_cpulist("0-3,8-9\n") == [0, 1, 2, 3, 8, 9]
+    assert _parse_cpulist("5") == [5]
+    assert _parse_cpulist("") == []
+
+
+def test_get_worker_cpus(monkeypatch):
+    """Checks that the workers get disjoint cores within the NUMA nodes."""
+    # cores of the two NUMA nodes are interleaved
+    monkeypatch.setattr(
+        distributed,
+        "get_numa_nodes_cpus",
+        lambda: [[0, 2, 4, 6], [1, 3, 5, 7]],
+    )
+    monkeypatch.setattr(os, "sched_getaffinity", lambda pid: set(range(8)))
+
+    assert get_worker_cpus(0, 2) == [0, 2, 4, 6]
+    assert get_worker_cpus(1, 2) == [1, 3, 5, 7]
+    assert get_worker_cpus(3, 4) == [5, 7]
+    # more workers than cores
+    assert get_worker_cpus(9, 16) == [1]
+
+
+def _get_free_port() -> str:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return str(sock.getsockname()[1])
+
+
+def _reduce_worker(rank: int, world_size: int, port: str, outputs) -> None:
+    os.environ["MASTER_ADDR"] = "127.0.0.1"
+    os.environ["MASTER_PORT"] = port
+    torch.distributed.init_process_group(
+        backend="gloo", rank=rank, world_size=world_size
+    )
+    try:
+        outputs[rank] = (
+            get_distributed_device().type,
+            get_distributed_mean(float(rank)),
+            get_distributed_sum(torch.tensor([rank, 1])).tolist(),
+        )
+    finally:
+        torch.distributed.destroy_process_group()
+
+
+@pytest.mark.skipif(
+    not torch.distributed.is_available()
+    or not torch.distributed.is_gloo_available(),
+    reason="gloo backend required",
+)
+def test_gloo_reductions():
+    """Checks the metrics reductions on CPU workers."""
+    world_size = 2
+    outputs = mp.Manager().dict()
+    mp.spawn(
+        _reduce_worker,
+        args=(world_size, _get_free_port(), outputs),
+        nprocs=world_size,
+    )
+
+    for rank in range(world_size):
+        assert outputs[rank] == ("cpu", 0.5, [1, 2])
+
+
+def test_reduce_metrics_not_distributed():
+    """Checks that the metrics are returned as is without distributed."""
+    metrics = {"loss": torch.tensor(0.5), "accuracy": 0.75, "ids": [1, 2]}
+
+    assert reduce_metrics(metrics, modes={"ids": "concat"}) == metrics
+    assert reduce_metrics(metrics, async_op=True).wait() == metrics
+    with pytest.raises(ValueError):
+        reduce_metrics(metrics, modes="median")
+
+
+def _reduce_metrics_worker(rank: int, world_size: int, port: str, outputs):
+    os.environ["MASTER_ADDR"] = "127.0.0.1"
+    os.environ["MASTER_PORT"] = port
+    torch.distributed.init_process_group(
+        backend="gloo", rank=rank, world_size=world_size
+    )
+    try:
+        metrics = {
+            "mean": float(rank),
+            "sum": torch.tensor([rank, 1]),
+            "max": torch.tensor(float(rank)),
+            "min": rank + 1,
+            "concat": torch.full((rank + 1, 2), rank),
+            "concat_float": torch.tensor([rank / 2]),
+        }
+        modes = {
+            "sum": "sum",
+            "max": "max",
+            "min": "min",
+            "concat": "concat",
+            "concat_float": "concat",
+        }
+        reduced = reduce_metrics(metrics, modes=modes, async_op=True).wait()
+        outputs[rank] = {
+            key: value.tolist() if torch.is_tensor(value) else value
+            for key, value in reduced.items()
+        }
+    finally:
+        torch.distributed.destroy_process_group()
+
+
+@pytest.mark.skipif(
+    not torch.distributed.is_available()
+    or not torch.distributed.is_gloo_available(),
+    reason="gloo backend required",
+)
+def test_reduce_metrics_gloo():
+    """Checks all reduction modes on CPU workers."""
+    world_size = 2
+    outputs = mp.Manager().dict()
+    mp.spawn(
+        _reduce_metrics_worker,
+        args=(world_size, _get_free_port(), outputs),
+        nprocs=world_size,
+    )
+
+    for rank in range(world_size):
+        assert outputs[rank] == {
+            "mean": 0.5,
+            "sum": [1, 2],
+            "max": 1.0,
+            "min": 1,
+            "concat": [[0, 0], [1, 1], [1, 1]],
+            "concat_float": [0.0, 0.5],
+        }
@@ -0,0 +1,38 @@
+# flake8: noqa
+import pytest
+
+import torch
+from torch.utils.data import TensorDataset
+
+from catalyst.utils.loaders import (
+    check_persistent_workers_available,
+    get_loaders_from_params,
+)
+
+
+def _get_datasets(**kwargs):
+    features = torch.arange(16, dtype=torch.float).view(-1, 1)
+    dataset = TensorDataset(features, torch.arange(16))
+    return {"train": dataset, "valid": dataset}
+
+
+@pytest.mark.skipif(
+    not check_persistent_workers_available(),
+    reason="torch>=1.7 required",
+)
+def test_persistent_workers():
+    """Checks that the workers are kept alive between the epochs."""
+    loaders = get_loaders_from_params(
+        batch_size=4,
+        num_workers=1,
+        persistent_workers=True,
+        loaders_params={"valid": {"num_workers": 0}},
+        get_datasets_fn=_get_datasets,
+    )
+
+    assert loaders["train"].persistent_workers
+    assert not loaders["valid"].persistent_workers
+    iterator = iter(loaders["train"])
+    assert len(list(iterator)) == 4
+    # the same workers are reused for the next epoch
+    assert iter(loaders["train"]) is iterator
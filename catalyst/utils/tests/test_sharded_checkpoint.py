@@ -0,0 +1,75 @@
+# flake8: noqa
+import json
+import os
+
+import torch
+from torch import nn
+
+from catalyst.utils.checkpoint import (
+    load_checkpoint,
+    pack_checkpoint,
+    save_checkpoint,
+    unpack_checkpoint,
+)
+from catalyst.utils.sharded_checkpoint import (
+    LazyCheckpoint,
+    is_sharded_checkpoint,
+    remove_unused_shards,
+)
+
+
+def _get_model():
+    return nn.Sequential(nn.Linear(128, 256), nn.Linear(256, 10))
+
+
+def test_sharded_checkpoint(tmpdir):
+    logdir = str(tmpdir)
+    shards_dir = os.path.join(logdir, "shards")
+    model = _get_model()
+    # frozen backbone
+    for param in model[0].parameters():
+        param.requires_grad = False
+    optimizer = torch.optim.Adam(model[1].parameters())
+
+    checkpoint = pack_checkpoint(
+        model=model, optimizer=optimizer, epoch=1, valid_metrics={"loss": 1.0}
+    )
+    first_path = save_checkpoint(
+        checkpoint, logdir, suffix="first", is_best=True, sharded=True
+    )
+    first_shards = set(os.listdir(shards_dir))
+    assert is_sharded_checkpoint(first_path)
+    assert is_sharded_checkpoint(os.path.join(logdir, "best.pth"))
+
+    with torch.no_grad():
+        model[1].weight.add_(1.0)
+    checkpoint = pack_checkpoint(
+        model=model, optimizer=optimizer, epoch=2, valid_metrics={"loss": 0.5}
+    )
+    second_path = save_checkpoint(
+        checkpoint, logdir, suffix="second", sharded=True
+    )
+    second_shards = set(os.listdir(shards_dir)) - first_shards
+    # frozen backbone weight is shared, changed components are added
+    assert len(second_shards) > 0
+    second_index = set(json.load(open(second_path))["shards"])
+    assert len(first_shards & second_index) > 0
+
+    loaded = load_checkpoint(second_path)
+    assert isinstance(loaded, LazyCheckpoint)
+    assert loaded["epoch"] == 2
+    assert loaded["valid_metrics"] == {"loss": 0.5}
+    new_model = _get_model()
+    unpack_checkpoint(loaded, model=new_model)
+    for param, new_param in zip(model.parameters(), new_model.parameters()):
+        assert torch.equal(param, new_param)
+
+    os.remove(first_path)
+    remove_unused_shards(logdir)
+    # best checkpoint still references the first shards
+    assert first_shards <= set(os.listdir(shards_dir))
+    os.remove(os.path.join(logdir, "best.pth"))
+    remove_unused_shards(logdir)
+    with open(second_path) as file:
+        second_index = json.load(file)
+    assert set(os.listdir(shards_dir)) == set(second_index["shards"])
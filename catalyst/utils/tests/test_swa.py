@@ -7,7 +7,10 @@ import torch
 import torch.nn as nn
 
 from catalyst.utils.checkpoint import load_checkpoint
-from catalyst.utils.swa import get_averaged_weights_by_path_mask
+from catalyst.utils.swa import (
+    WeightsAverager,
+    get_averaged_weights_by_path_mask,
+)
 
 
 class Net(nn.Module):
@@ -48,6 +51,31 @@ class TestSwa(unittest.TestCase):
         self.assertEqual(float(model.fc.weight.data[0][1]), 3.5)
         self.assertEqual(float(model.fc.bias.data[0]), 3.5)
 
+    def test_weighted_averaging(self):
+        """Test weighted SWA."""
+        weights = get_averaged_weights_by_path_mask(
+            logdir=Path("./"), path_mask="net*", weights=[3.0, 1.0]
+        )
+        self.assertEqual(float(weights["fc.weight"][0][0]), 2.75)
+        self.assertEqual(weights["fc.weight"].dtype, torch.float32)
+
+    def test_ema_averaging(self):
+        """Test EMA of the weights."""
+        weights = get_averaged_weights_by_path_mask(
+            logdir=Path("./"), path_mask="net*", mode="ema", decay=0.9
+        )
+        self.assertAlmostEqual(float(weights["fc.bias"][0]), 2.3, places=5)
+
+    def test_averager_does_not_modify_weights(self):
+        """Test that the running average is a copy of the weights."""
+        net = Net(init_weight=1.0)
+        net.double()
+        averager = WeightsAverager()
+        averager.update(net.state_dict())
+        averager.update(Net(init_weight=3.0).double().state_dict())
+        self.assertEqual(float(net.fc.bias.data[0]), 1.0)
+        self.assertEqual(float(averager.get_weights()["fc.bias"][0]), 2.0)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,66 @@
+# flake8: noqa
+"""
+Balance samplers epoch generation.
+
+Measures the construction and the epoch indices generation time
+of the balance samplers on the large imbalanced labels::
+
+    python tests/_tests_benchmarks/balance_samplers.py --num-samples 10000000
+"""
+import argparse
+import timeit
+
+import numpy as np
+
+from catalyst.data import (
+    BalanceBatchSampler,
+    BalanceClassSampler,
+    DynamicBalanceClassSampler,
+)
+
+
+def _measure(fn, number: int, repeat: int) -> float:
+    timings = timeit.repeat(fn, number=number, repeat=repeat)
+    return min(timings) / number * 1e3
+
+
+def main(args):
+    # zipf-like class sizes
+    labels = np.random.zipf(1.5, size=args.num_samples) % args.num_classes
+    labels = np.concatenate([labels, labels[:1]])  # at least 2 per class
+
+    samplers = {}
+    constructors = {
+        "BalanceClassSampler": lambda: BalanceClassSampler(
+            labels, mode="downsampling"
+        ),
+        "DynamicBalanceClassSampler": lambda: DynamicBalanceClassSampler(
+            labels
+        ),
+        "BalanceBatchSampler": lambda: BalanceBatchSampler(
+            labels[np.isin(labels, np.flatnonzero(np.bincount(labels) > 1))],
+            p=args.p,
+            k=args.k,
+        ),
+    }
+    for name, constructor in constructors.items():
+        timing = _measure(constructor, args.number, args.repeat)
+        samplers[name] = constructor()
+        print(f"{name}, init\t{timing:.1f} ms")
+
+    for name, sampler in samplers.items():
+        timing = _measure(
+            lambda: list(sampler), args.number, args.repeat  # noqa: B023
+        )
+        print(f"{name}, epoch\t{timing:.1f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--num-samples", type=int, default=10 ** 6)
+    parser.add_argument("--num-classes", type=int, default=10 ** 4)
+    parser.add_argument("-p", type=int, default=64)
+    parser.add_argument("-k", type=int, default=4)
+    parser.add_argument("--number", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=3)
+    main(parser.parse_args())
@@ -0,0 +1,78 @@
+# flake8: noqa
+"""
+Per-batch overhead of the runner's callbacks dispatch.
+
+Runs no-op loops through ``IRunner._run_batch`` with N callbacks
+and reports microseconds per batch with and without the dispatch table::
+
+    python tests/_tests_benchmarks/callbacks_dispatch.py --num-batches 10000
+"""
+import argparse
+import timeit
+
+from catalyst import dl
+from catalyst.core.functional import sort_callbacks_by_order
+
+
+class NoopRunner(dl.IRunner):
+    def _handle_device(self, batch):
+        return batch
+
+    def _handle_batch(self, batch):
+        pass
+
+
+class BatchEndCallback(dl.Callback):
+    def __init__(self):
+        super().__init__(order=dl.CallbackOrder.metric)
+        self.counter = 0
+
+    def on_batch_end(self, runner):
+        self.counter += 1
+
+
+class LoaderEndCallback(dl.Callback):
+    def __init__(self):
+        super().__init__(order=dl.CallbackOrder.logging)
+
+    def on_loader_end(self, runner):
+        pass
+
+
+def _get_runner(num_callbacks: int) -> NoopRunner:
+    runner = NoopRunner()
+    callbacks = {}
+    for i in range(num_callbacks):
+        callback = BatchEndCallback() if i % 2 else LoaderEndCallback()
+        callbacks[f"callback_{i}"] = callback
+    runner.callbacks = sort_callbacks_by_order(callbacks)
+    runner.input = {"features": [0] * 32}
+    return runner
+
+
+def _measure(runner: NoopRunner, num_batches: int, repeat: int) -> float:
+    timings = timeit.repeat(
+        runner._run_batch, number=num_batches, repeat=repeat
+    )
+    return min(timings) / num_batches * 1e6
+
+
+def main(args):
+    print("num_callbacks\tdynamic, us/batch\tdispatch table, us/batch")
+    for num_callbacks in args.num_callbacks:
+        runner = _get_runner(num_callbacks)
+        runner._callbacks_dispatch_table = None
+        dynamic = _measure(runner, args.num_batches, args.repeat)
+        runner._prepare_callbacks_dispatch_table()
+        table = _measure(runner, args.num_batches, args.repeat)
+        print(f"{num_callbacks}\t{dynamic:.2f}\t{table:.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--num-callbacks", type=int, nargs="+", default=[1, 5, 10, 20]
+    )
+    parser.add_argument("--num-batches", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    main(parser.parse_args())
@@ -0,0 +1,93 @@
+# flake8: noqa
+"""
+Multiclass tn/fp/fn/tp/support computation.
+
+Compares the per-class loop over ``get_binary_statistics``
+with the confusion matrix based ``get_multiclass_statistics``
+and reports milliseconds per call::
+
+    python tests/_tests_benchmarks/multiclass_statistics.py --device cuda
+"""
+import argparse
+import timeit
+
+import torch
+
+from catalyst.metrics.functional import (
+    get_binary_statistics,
+    get_multiclass_statistics,
+)
+
+
+def loop_multiclass_statistics(outputs, targets, num_classes):
+    tn = torch.zeros((num_classes,), device=outputs.device)
+    fp = torch.zeros((num_classes,), device=outputs.device)
+    fn = torch.zeros((num_classes,), device=outputs.device)
+    tp = torch.zeros((num_classes,), device=outputs.device)
+    support = torch.zeros((num_classes,), device=outputs.device)
+    for class_index in range(num_classes):
+        (
+            tn[class_index],
+            fp[class_index],
+            fn[class_index],
+            tp[class_index],
+            support[class_index],
+        ) = get_binary_statistics(
+            outputs=outputs, targets=targets, label=class_index
+        )
+    return tn, fp, fn, tp, support
+
+
+def _measure(fn, device, number: int, repeat: int) -> float:
+    def run():
+        fn()
+        if device.type == "cuda":
+            torch.cuda.synchronize()
+
+    run()  # warmup
+    timings = timeit.repeat(run, number=number, repeat=repeat)
+    return min(timings) / number * 1e3
+
+
+def main(args):
+    device = torch.device(args.device)
+    print("num_classes\tloop, ms\tconfusion matrix, ms")
+    for num_classes in args.num_classes:
+        outputs = torch.randint(0, num_classes, (args.num_samples, 1))
+        targets = torch.randint(0, num_classes, (args.num_samples, 1))
+        outputs, targets = outputs.to(device), targets.to(device)
+
+        loop_stats = loop_multiclass_statistics(outputs, targets, num_classes)
+        stats = get_multiclass_statistics(
+            outputs, targets, num_classes=num_classes
+        )
+        for value, value_true in zip(stats, loop_stats):
+            assert torch.equal(value, value_true)
+
+        loop = _measure(
+            lambda: loop_multiclass_statistics(outputs, targets, num_classes),
+            device,
+            args.number,
+            args.repeat,
+        )
+        bincount = _measure(
+            lambda: get_multiclass_statistics(
+                outputs, targets, num_classes=num_classes
+            ),
+            device,
+            args.number,
+            args.repeat,
+        )
+        print(f"{num_classes}\t{loop:.3f}\t{bincount:.3f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--num-classes", type=int, nargs="+", default=[10, 100, 1000]
+    )
+    parser.add_argument("--num-samples", type=int, default=100000)
+    parser.add_argument("--device", type=str, default="cpu")
+    parser.add_argument("--number", type=int, default=3)
+    parser.add_argument("--repeat", type=int, default=3)
+    main(parser.parse_args())
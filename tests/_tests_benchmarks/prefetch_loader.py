@@ -0,0 +1,81 @@
+# flake8: noqa
+"""
+Batches prefetching throughput.
+
+Compares the plain ``DataLoader`` (batches are moved to the device
+in the training loop) with ``BatchPrefetchLoaderWrapper``
+on the synthetic model step and reports batches per second::
+
+    python tests/_tests_benchmarks/prefetch_loader.py --device cuda
+"""
+import argparse
+import time
+
+import torch
+from torch.utils.data import DataLoader, TensorDataset
+
+from catalyst.data import BatchPrefetchLoaderWrapper
+
+
+def _run_epoch(loader, device, weight, num_steps: int) -> float:
+    start = time.perf_counter()
+    for features, targets in loader:
+        features = features.to(device, non_blocking=True)
+        targets = targets.to(device, non_blocking=True)
+        outputs = features.view(features.shape[0], -1)
+        for _ in range(num_steps):
+            outputs = torch.tanh(outputs @ weight)
+        (outputs.sum() + targets.sum()).item()
+    if device.type == "cuda":
+        torch.cuda.synchronize()
+    return len(loader) / (time.perf_counter() - start)
+
+
+def main(args):
+    device = torch.device(args.device)
+    features = torch.rand(args.num_samples, args.num_features)
+    targets = torch.randint(0, 10, (args.num_samples,))
+    weight = torch.rand(args.num_features, args.num_features, device=device)
+    weight /= args.num_features
+
+    loaders = {
+        "DataLoader": DataLoader(
+            TensorDataset(features, targets),
+            batch_size=args.batch_size,
+            num_workers=args.num_workers,
+        ),
+        "DataLoader, pin_memory": DataLoader(
+            TensorDataset(features, targets),
+            batch_size=args.batch_size,
+            num_workers=args.num_workers,
+            pin_memory=device.type == "cuda",
+        ),
+    }
+    loaders["BatchPrefetchLoaderWrapper"] = BatchPrefetchLoaderWrapper(
+        loaders["DataLoader"],
+        num_prefetches=args.num_prefetches,
+        device=device,
+        num_streams=args.num_streams,
+    )
+
+    for name, loader in loaders.items():
+        _run_epoch(loader, device, weight, args.num_steps)  # warmup
+        throughput = max(
+            _run_epoch(loader, device, weight, args.num_steps)
+            for _ in range(args.repeat)
+        )
+        print(f"{name}\t{throughput:.1f} batches/s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--num-samples", type=int, default=2 ** 16)
+    parser.add_argument("--num-features", type=int, default=1024)
+    parser.add_argument("--batch-size", type=int, default=256)
+    parser.add_argument("--num-workers", type=int, default=0)
+    parser.add_argument("--num-prefetches", type=int, default=2)
+    parser.add_argument("--num-streams", type=int, default=1)
+    parser.add_argument("--num-steps", type=int, default=4)
+    parser.add_argument("--device", type=str, default="cpu")
+    parser.add_argument("--repeat", type=int, default=3)
+    main(parser.parse_args())
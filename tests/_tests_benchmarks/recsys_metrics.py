@@ -0,0 +1,62 @@
+# flake8: noqa
+"""
+RecSys metrics on the large catalog.
+
+Compares the separate metric functions
+with the single top-k pass of ``recsys_metrics``::
+
+    python tests/_tests_benchmarks/recsys_metrics.py --num-items 50000
+"""
+import argparse
+import timeit
+
+import torch
+
+from catalyst import metrics
+
+
+def _measure(fn, number: int, repeat: int) -> float:
+    timings = timeit.repeat(fn, number=number, repeat=repeat)
+    return min(timings) / number * 1e3
+
+
+def _separate_metrics(outputs, targets, topk_args):
+    metrics.hitrate(outputs, targets, topk_args)
+    metrics.mrr(outputs, targets, topk_args)
+    metrics.ndcg(outputs, targets, topk_args)
+    metrics.mean_avg_precision(outputs, targets, topk_args)
+
+
+def main(args):
+    device = torch.device(args.device)
+    outputs = torch.rand(args.num_users, args.num_items, device=device)
+    targets = (
+        torch.rand(args.num_users, args.num_items, device=device) < 1e-3
+    ).float()
+    topk_args = [int(k) for k in args.topk.split(",")]
+
+    functions = {
+        "separate metrics": lambda: _separate_metrics(
+            outputs, targets, topk_args
+        ),
+        "recsys_metrics": lambda: metrics.recsys_metrics(
+            outputs, targets, topk_args
+        ),
+        "full sort": lambda: metrics.process_recsys_components(
+            outputs, targets
+        ),
+    }
+    for name, fn in functions.items():
+        timing = _measure(fn, args.number, args.repeat)
+        print(f"{name}\t{timing:.1f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--num-users", type=int, default=256)
+    parser.add_argument("--num-items", type=int, default=50000)
+    parser.add_argument("--topk", type=str, default="1,5,10,50,100")
+    parser.add_argument("--device", type=str, default="cpu")
+    parser.add_argument("--number", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=3)
+    main(parser.parse_args())
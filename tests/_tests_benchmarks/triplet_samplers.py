@@ -0,0 +1,103 @@
+# flake8: noqa
+"""
+In-batch triplets mining.
+
+Compares the python loops over anchors with the mask based
+``HardTripletsSampler`` and ``AllTripletsSampler``
+on P x K batches and reports milliseconds per batch::
+
+    python tests/_tests_benchmarks/triplet_samplers.py --device cuda
+"""
+import argparse
+from itertools import combinations, product
+from random import sample
+import timeit
+
+import numpy as np
+
+import torch
+
+from catalyst.data import (
+    AllTripletsSampler,
+    HardTripletsSampler,
+    SemiHardTripletsSampler,
+)
+from catalyst.utils.misc import find_value_ids
+
+
+def loop_hard_triplets(features, labels):
+    distmat = torch.cdist(features, features)
+    ids_all = set(range(len(labels)))
+    ids_anchor, ids_pos, ids_neg = [], [], []
+    for i_anch, label in enumerate(labels):
+        ids_label = set(find_value_ids(it=labels, value=label))
+        ids_pos_cur = np.array(list(ids_label - {i_anch}), int)
+        ids_neg_cur = np.array(list(ids_all - ids_label), int)
+        ids_anchor.append(i_anch)
+        ids_pos.append(ids_pos_cur[distmat[i_anch, ids_pos_cur].argmax()])
+        ids_neg.append(ids_neg_cur[distmat[i_anch, ids_neg_cur].argmin()])
+    return features[ids_anchor], features[ids_pos], features[ids_neg]
+
+
+def loop_all_triplets(features, labels, max_output_triplets):
+    triplets = []
+    for label in set(labels):
+        ids_pos_cur = set(find_value_ids(labels, label))
+        ids_neg_cur = set(range(len(labels))) - ids_pos_cur
+        pos_pairs = list(combinations(ids_pos_cur, r=2))
+        triplets.extend(
+            (a, p, n) for (a, p), n in product(pos_pairs, ids_neg_cur)
+        )
+    triplets = sample(triplets, min(len(triplets), max_output_triplets))
+    ids_anchor, ids_pos, ids_neg = zip(*triplets)
+    return (
+        features[list(ids_anchor)],
+        features[list(ids_pos)],
+        features[list(ids_neg)],
+    )
+
+
+def _measure(fn, device, number: int, repeat: int) -> float:
+    def run():
+        fn()
+        if device.type == "cuda":
+            torch.cuda.synchronize()
+
+    run()  # warmup
+    timings = timeit.repeat(run, number=number, repeat=repeat)
+    return min(timings) / number * 1e3
+
+
+def main(args):
+    device = torch.device(args.device)
+    labels = [label for label in range(args.p) for _ in range(args.k)]
+    features = torch.rand(len(labels), args.features_dim, device=device)
+
+    hard = HardTripletsSampler()
+    semihard = SemiHardTripletsSampler()
+    all_triplets = AllTripletsSampler(max_output_triplets=args.max_triplets)
+    cases = {
+        "hard, loop": lambda: loop_hard_triplets(features, labels),
+        "hard, masks": lambda: hard.sample(features, labels),
+        "semihard, masks": lambda: semihard.sample(features, labels),
+        "all, loop": lambda: loop_all_triplets(
+            features, labels, args.max_triplets
+        ),
+        "all, masks": lambda: all_triplets.sample(features, labels),
+    }
+    print(f"batch size: {len(labels)}")
+    for name, fn in cases.items():
+        timing = _measure(fn, device, args.number, args.repeat)
+        print(f"{name}\t{timing:.3f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-p", type=int, default=128)
+    parser.add_argument("-k", type=int, default=4)
+    parser.add_argument("--features-dim", type=int, default=128)
+    parser.add_argument("--max-triplets", type=int, default=4096)
+    parser.add_argument("--device", type=str, default="cpu")
+    parser.add_argument("--number", type=int, default=3)
+    parser.add_argument("--repeat", type=int, default=3)
+    main(parser.parse_args())